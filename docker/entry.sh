@@ -79,4 +79,4 @@ load_secrets
 # Start API
 HOST_IP=`/sbin/ip route|awk '/default/ { print $3 }'`
 
-exec mealie
+exec mealie "$@"
@@ -1,5 +1,11 @@
 import { BaseAPI } from "../base/base-clients";
-import { AdminAboutInfo, CheckAppConfig } from "~/lib/api/types/admin";
+import {
+  AdminAboutInfo,
+  AliasIndexCacheStatistics,
+  CheckAppConfig,
+  NotificationDeliveryStatistics,
+  UserCacheStatistics,
+} from "~/lib/api/types/admin";
 
 const prefix = "/api";
 
@@ -7,6 +13,9 @@ const routes = {
   about: `${prefix}/admin/about`,
   aboutStatistics: `${prefix}/admin/about/statistics`,
   check: `${prefix}/admin/about/check`,
+  userCache: `${prefix}/admin/about/user-cache`,
+  aliasIndexCache: `${prefix}/admin/about/alias-index-cache`,
+  notifications: `${prefix}/admin/about/notifications`,
   docker: `${prefix}/admin/about/docker/validate`,
   validationFile: `${prefix}/media/docker/validate.txt`,
 };
@@ -20,6 +29,18 @@ export class AdminAboutAPI extends BaseAPI {
     return await this.requests.get(routes.aboutStatistics);
   }
 
+  async userCacheStatistics() {
+    return await this.requests.get<UserCacheStatistics>(routes.userCache);
+  }
+
+  async aliasIndexCacheStatistics() {
+    return await this.requests.get<AliasIndexCacheStatistics>(routes.aliasIndexCache);
+  }
+
+  async notificationDeliveryStatistics() {
+    return await this.requests.get<NotificationDeliveryStatistics>(routes.notifications);
+  }
+
   async checkApp() {
     return await this.requests.get<CheckAppConfig>(routes.check);
   }
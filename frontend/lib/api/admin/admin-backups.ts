@@ -1,5 +1,6 @@
 import { BaseAPI } from "../base/base-clients";
 import { AllBackups } from "~/lib/api/types/admin";
+import { JobOut } from "~/lib/api/types/jobs";
 import { ErrorResponse, FileTokenResponse, SuccessResponse } from "~/lib/api/types/response";
 
 const prefix = "/api";
@@ -16,7 +17,7 @@ export class AdminBackupsApi extends BaseAPI {
   }
 
   async create() {
-    return await this.requests.post<SuccessResponse | ErrorResponse>(routes.base, {});
+    return await this.requests.post<JobOut>(routes.base, {});
   }
 
   async get(fileName: string) {
@@ -0,0 +1,30 @@
+import { BaseAPI } from "../base/base-clients";
+import { JobOut, JobStatus } from "~/lib/api/types/jobs";
+
+const prefix = "/api";
+
+const routes = {
+  base: `${prefix}/admin/jobs`,
+  getOne: (id: string) => `${prefix}/admin/jobs/${id}`,
+  cancel: (id: string) => `${prefix}/admin/jobs/${id}/cancel`,
+  retry: (id: string) => `${prefix}/admin/jobs/${id}/retry`,
+};
+
+export class AdminJobsApi extends BaseAPI {
+  async getAll(status: JobStatus | null = null) {
+    const query = status ? `?job_status=${status}` : "";
+    return await this.requests.get<JobOut[]>(routes.base + query);
+  }
+
+  async getOne(id: string) {
+    return await this.requests.get<JobOut>(routes.getOne(id));
+  }
+
+  async cancel(id: string) {
+    return await this.requests.post<JobOut>(routes.cancel(id), {});
+  }
+
+  async retry(id: string) {
+    return await this.requests.post<JobOut>(routes.retry(id), {});
+  }
+}
@@ -1,12 +1,13 @@
 import { BaseAPI } from "../base/base-clients";
 import { SuccessResponse } from "~/lib/api/types/response";
-import { MaintenanceLogs, MaintenanceStorageDetails, MaintenanceSummary } from "~/lib/api/types/admin";
+import { MaintenanceLogs, MaintenanceStorageDetails, MaintenanceSummary, SchedulerStatus } from "~/lib/api/types/admin";
 
 const prefix = "/api";
 
 const routes = {
   base: `${prefix}/admin/maintenance`,
   storage: `${prefix}/admin/maintenance/storage`,
+  scheduler: `${prefix}/admin/maintenance/scheduler`,
   logs: (lines: number) => `${prefix}/admin/maintenance/logs?lines=${lines}`,
   cleanTemp: `${prefix}/admin/maintenance/clean/temp`,
   cleanImages: `${prefix}/admin/maintenance/clean/images`,
@@ -23,6 +24,10 @@ export class AdminMaintenanceApi extends BaseAPI {
     return await this.requests.get<MaintenanceStorageDetails>(routes.storage);
   }
 
+  async getSchedulerStatus() {
+    return await this.requests.get<SchedulerStatus>(routes.scheduler);
+  }
+
   async cleanTemp() {
     return await this.requests.post<SuccessResponse>(routes.cleanTemp, {});
   }
@@ -3,6 +3,7 @@ import { AdminUsersApi } from "./admin/admin-users";
 import { AdminHouseholdsApi } from "./admin/admin-households";
 import { AdminGroupsApi } from "./admin/admin-groups";
 import { AdminBackupsApi } from "./admin/admin-backups";
+import { AdminJobsApi } from "./admin/admin-jobs";
 import { AdminMaintenanceApi } from "./admin/admin-maintenance";
 import { AdminAnalyticsApi } from "./admin/admin-analytics";
 import { AdminDebugAPI } from "./admin/admin-debug";
@@ -14,6 +15,7 @@ export class AdminAPI {
   public households: AdminHouseholdsApi;
   public groups: AdminGroupsApi;
   public backups: AdminBackupsApi;
+  public jobs: AdminJobsApi;
   public maintenance: AdminMaintenanceApi;
   public analytics: AdminAnalyticsApi;
   public debug: AdminDebugAPI;
@@ -24,6 +26,7 @@ export class AdminAPI {
     this.households = new AdminHouseholdsApi(requests);
     this.groups = new AdminGroupsApi(requests);
     this.backups = new AdminBackupsApi(requests);
+    this.jobs = new AdminJobsApi(requests);
     this.maintenance = new AdminMaintenanceApi(requests);
     this.analytics = new AdminAnalyticsApi(requests);
     this.debug = new AdminDebugAPI(requests);
@@ -18,6 +18,7 @@ import { EmailAPI } from "./user/email";
 import { BulkActionsAPI } from "./user/recipe-bulk-actions";
 import { ToolsApi } from "./user/organizer-tools";
 import { GroupMigrationApi } from "./user/group-migrations";
+import { GroupJobsApi } from "./user/group-jobs";
 import { GroupReportsApi } from "./user/group-reports";
 import { ShoppingApi } from "./user/group-shopping-lists";
 import { MultiPurposeLabelsApi } from "./user/group-multiple-purpose-labels";
@@ -47,6 +48,7 @@ export class UserApiClient {
   public bulk: BulkActionsAPI;
   public groupMigration: GroupMigrationApi;
   public groupReports: GroupReportsApi;
+  public groupJobs: GroupJobsApi;
   public tools: ToolsApi;
   public shopping: ShoppingApi;
   public multiPurposeLabels: MultiPurposeLabelsApi;
@@ -77,6 +79,7 @@ export class UserApiClient {
     // Group
     this.groupMigration = new GroupMigrationApi(requests);
     this.groupReports = new GroupReportsApi(requests);
+    this.groupJobs = new GroupJobsApi(requests);
     this.shopping = new ShoppingApi(requests);
     this.multiPurposeLabels = new MultiPurposeLabelsApi(requests);
     this.seeders = new GroupDataSeederApi(requests);
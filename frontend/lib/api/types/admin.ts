@@ -253,6 +253,20 @@ export interface RecipeImport {
   exception?: string | null;
   slug?: string | null;
 }
+export interface ScheduledTaskStatus {
+  name: string;
+  schedule: string;
+  nextRunAt: string;
+  lastRunAt?: string | null;
+  lastDuration?: number | null;
+  lastStatus?: string | null;
+  lastError?: string | null;
+}
+export interface SchedulerStatus {
+  leader?: string | null;
+  leaseExpiresAt?: string | null;
+  tasks?: ScheduledTaskStatus[];
+}
 export interface SettingsImport {
   name: string;
   status: boolean;
@@ -263,3 +277,27 @@ export interface UserImport {
   status: boolean;
   exception?: string | null;
 }
+export interface UserCacheStatistics {
+  size: number;
+  maxSize: number;
+  ttl: number;
+  hits: number;
+  misses: number;
+}
+export interface AliasIndexCacheStatistics {
+  size: number;
+  maxSize: number;
+  ttl: number;
+  hits: number;
+  misses: number;
+}
+export interface NotificationDeliveryStatistics {
+  queued: number;
+  delivered: number;
+  retried: number;
+  failed: number;
+  dropped: number;
+  latencyP50?: number | null;
+  latencyP95?: number | null;
+  latencyMax?: number | null;
+}
@@ -54,3 +54,13 @@ export interface ReadGroupPreferences {
 export interface SeederConfig {
   locale: string;
 }
+export interface SeederResponse {
+  message: string;
+  error?: boolean;
+  inserted?: number;
+  skipped?: number;
+}
+export interface SeederResult {
+  inserted?: number;
+  skipped?: number;
+}
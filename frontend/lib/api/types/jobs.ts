@@ -0,0 +1,25 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+/* This file was automatically generated from pydantic models by running pydantic2ts.
+/* Do not modify it by hand - just update the pydantic models and then re-run the script
+*/
+
+export type JobName = "bulk_url_import" | "migration" | "recipe_export" | "backup";
+export type JobStatus = "queued" | "running" | "success" | "failure" | "cancelled";
+
+export interface JobOut {
+  id: string;
+  name: JobName;
+  status: JobStatus;
+  groupId?: string | null;
+  reportId?: string | null;
+  progress?: number;
+  total?: number | null;
+  attempts?: number;
+  cancelRequested?: boolean;
+  error?: string | null;
+  createdAt?: string | null;
+  startedAt?: string | null;
+  finishedAt?: string | null;
+}
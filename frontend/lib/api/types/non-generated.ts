@@ -22,6 +22,8 @@ export interface PaginationData<T> {
   total: number;
   total_pages: number;
   items: T[];
+  next_cursor?: string | null;
+  prev_cursor?: string | null;
 }
 
 export type RecipeOrganizer =
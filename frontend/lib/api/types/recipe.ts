@@ -43,6 +43,14 @@ export interface TagBase {
   id: string;
   slug: string;
 }
+export interface BulkActionResponse {
+  results?: BulkActionResult[];
+}
+export interface BulkActionResult {
+  slug: string;
+  success: boolean;
+  error?: string | null;
+}
 export interface CategoryIn {
   name: string;
 }
@@ -5,8 +5,10 @@
 /* Do not modify it by hand - just update the pydantic models and then re-run the script
 */
 
+export type CursorDirection = "next" | "previous";
 export type OrderByNullPosition = "first" | "last";
 export type OrderDirection = "asc" | "desc";
+export type PaginationMode = "offset" | "cursor";
 export type LogicalOperator = "AND" | "OR";
 export type RelationalKeyword = "IS" | "IS NOT" | "IN" | "NOT IN" | "CONTAINS ALL" | "LIKE" | "NOT LIKE";
 export type RelationalOperator = "=" | "<>" | ">" | "<" | ">=" | "<=";
@@ -27,6 +29,14 @@ export interface PaginationQuery {
   paginationSeed?: string | null;
   page?: number;
   perPage?: number;
+  paginationMode?: PaginationMode;
+  cursor?: string | null;
+  includeTotal?: boolean;
+}
+export interface PaginationCursor {
+  values: unknown[];
+  direction?: CursorDirection;
+  signature: string;
 }
 export interface QueryFilterJSON {
   parts?: QueryFilterJSONPart[];
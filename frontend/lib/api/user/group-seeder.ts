@@ -1,6 +1,5 @@
 import { BaseAPI } from "../base/base-clients";
-import { SuccessResponse } from "~/lib/api/types/response";
-import { SeederConfig } from "~/lib/api/types/group";
+import { SeederConfig, SeederResponse } from "~/lib/api/types/group";
 
 const prefix = "/api";
 
@@ -13,14 +12,14 @@ const routes = {
 
 export class GroupDataSeederApi extends BaseAPI {
   foods(payload: SeederConfig) {
-    return this.requests.post<SuccessResponse>(routes.foods, payload);
+    return this.requests.post<SeederResponse>(routes.foods, payload);
   }
 
   units(payload: SeederConfig) {
-    return this.requests.post<SuccessResponse>(routes.units, payload);
+    return this.requests.post<SeederResponse>(routes.units, payload);
   }
 
   labels(payload: SeederConfig) {
-    return this.requests.post<SuccessResponse>(routes.labels, payload);
+    return this.requests.post<SeederResponse>(routes.labels, payload);
   }
 }
@@ -1,10 +1,19 @@
 import { BaseAPI } from "../base/base-clients";
-import { AssignCategories, AssignSettings, AssignTags, DeleteRecipes, ExportRecipes } from "~/lib/api/types/recipe";
+import {
+  AssignCategories,
+  AssignSettings,
+  AssignTags,
+  BulkActionResponse,
+  DeleteRecipes,
+  ExportRecipes,
+} from "~/lib/api/types/recipe";
 import { GroupDataExport } from "~/lib/api/types/group";
+import { SuccessResponse } from "~/lib/api/types/response";
 
-// Many bulk actions return nothing
-// eslint-disable-next-line @typescript-eslint/no-empty-interface
-interface BulkActionResponse {}
+interface BulkExportResponse {
+  reportId: string;
+  jobId: string;
+}
 
 const prefix = "/api";
 
@@ -19,7 +28,7 @@ const routes = {
 
 export class BulkActionsAPI extends BaseAPI {
   async bulkExport(payload: ExportRecipes) {
-    return await this.requests.post<BulkActionResponse>(routes.bulkExport, payload);
+    return await this.requests.post<BulkExportResponse>(routes.bulkExport, payload);
   }
 
   async bulkCategorize(payload: AssignCategories) {
@@ -43,6 +52,6 @@ export class BulkActionsAPI extends BaseAPI {
   }
 
   async purgeExports() {
-    return await this.requests.delete<BulkActionResponse>(routes.purgeExports);
+    return await this.requests.delete<SuccessResponse>(routes.purgeExports);
   }
 }
@@ -154,7 +154,7 @@ export class RecipeAPI extends BaseCRUDAPI<CreateRecipe, Recipe, Recipe> {
   }
 
   async createManyByUrl(payload: CreateRecipeByUrlBulk) {
-    return await this.requests.post<string>(routes.recipesCreateUrlBulk, payload);
+    return await this.requests.post<{ reportId: string; jobId: string }>(routes.recipesCreateUrlBulk, payload);
   }
 
   async createOneFromImage(fileObject: Blob | File, fileName: string, translateLanguage: string | null = null) {
@@ -0,0 +1,114 @@
+"""add recipe full text search index
+
+Revision ID: f4a8c2e1d9b3
+Revises: 7cf3054cbbcc
+Create Date: 2025-03-02 10:14:27.381045
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from mealie.db.models._model_utils.guid import GUID
+
+# revision identifiers, used by Alembic.
+revision = "f4a8c2e1d9b3"
+down_revision: str | None = "7cf3054cbbcc"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def get_db_type():
+    return op.get_context().dialect.name
+
+
+def _document_columns_sql(aggregate: str, normalize: str = "{}") -> list[str]:
+    """
+    SQL for each of the indexed columns: name, description, ingredients, instructions, tags.
+    `normalize` wraps the columns that have no normalized version
+    """
+
+    instructions = normalize.format(f"{aggregate}(coalesce(s.title, '') || ' ' || coalesce(s.text, ''), ' ')")
+    tags = normalize.format(f"{aggregate}(t.name, ' ')")
+
+    return [
+        "coalesce(r.name_normalized, '')",
+        "coalesce(r.description_normalized, '')",
+        f"""coalesce((
+            SELECT {aggregate}(coalesce(i.note_normalized, '') || ' ' || coalesce(i.original_text_normalized, ''), ' ')
+            FROM recipes_ingredients i WHERE i.recipe_id = r.id
+        ), '')""",
+        f"""coalesce((
+            SELECT {instructions}
+            FROM recipe_instructions s WHERE s.recipe_id = r.id
+        ), '')""",
+        f"""coalesce((
+            SELECT {tags}
+            FROM tags t JOIN recipes_to_tags rt ON rt.tag_id = t.id WHERE rt.recipe_id = r.id
+        ), '')""",
+    ]
+
+
+def setup_sqlite_search_index():
+    # FTS5 rows can only be looked up by rowid, so each recipe's rowid is kept in a regular table
+    op.create_table(
+        "recipes_fts_rowids",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("recipe_id", GUID(), nullable=False, unique=True),
+    )
+    op.execute(
+        "CREATE VIRTUAL TABLE recipes_fts USING fts5("
+        "name, description, ingredients, instructions, tags, "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+
+    columns = ", ".join(_document_columns_sql("group_concat"))
+    op.execute("INSERT INTO recipes_fts_rowids (recipe_id) SELECT r.id FROM recipes r")
+    op.execute(
+        "INSERT INTO recipes_fts (rowid, name, description, ingredients, instructions, tags) "
+        f"SELECT m.id, {columns} FROM recipes r JOIN recipes_fts_rowids m ON m.recipe_id = r.id"
+    )
+
+
+def setup_postgres_search_index():
+    # the "simple" config doesn't fold accents, so columns without a normalized version are unaccented
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent;")
+    op.create_table(
+        "recipes_fts",
+        sa.Column("recipe_id", GUID(), sa.ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("document", postgresql.TSVECTOR(), nullable=False),
+    )
+    op.create_index(
+        "ix_recipes_fts_document_gin",
+        table_name="recipes_fts",
+        columns=["document"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    weights = ["A", "D", "C", "D", "B"]
+    document = " || ".join(
+        f"setweight(to_tsvector('simple', {column}), '{weight}')"
+        for column, weight in zip(
+            _document_columns_sql("string_agg", normalize="unaccent(lower({}))"), weights, strict=True
+        )
+    )
+    op.execute(f"INSERT INTO recipes_fts (recipe_id, document) SELECT r.id, {document} FROM recipes r")
+
+
+def upgrade():
+    if get_db_type() == "postgresql":
+        setup_postgres_search_index()
+    else:
+        setup_sqlite_search_index()
+
+
+def downgrade():
+    if get_db_type() == "postgresql":
+        op.drop_index("ix_recipes_fts_document_gin", table_name="recipes_fts")
+        op.drop_table("recipes_fts")
+        op.execute("DROP EXTENSION IF EXISTS unaccent;")
+    else:
+        op.execute("DROP TABLE IF EXISTS recipes_fts")
+        op.drop_table("recipes_fts_rowids")
@@ -0,0 +1,36 @@
+"""add recipe storage
+
+Revision ID: a88d0ede872b
+Revises: f4a8c2e1d9b3
+Create Date: 2025-03-09 11:22:05.603317
+
+"""
+
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a88d0ede872b"
+down_revision: str | None = "f4a8c2e1d9b3"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade():
+    # the table is filled in by the storage reconciliation, which runs on startup after a migration
+    op.create_table(
+        "recipe_storage",
+        sa.Column("id", mealie.db.migration_types.GUID(), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("update_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_recipe_storage_created_at"), "recipe_storage", ["created_at"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_recipe_storage_created_at"), table_name="recipe_storage")
+    op.drop_table("recipe_storage")
@@ -0,0 +1,52 @@
+"""add scheduler lease and scheduled tasks
+
+Revision ID: c257f0af352c
+Revises: a88d0ede872b
+Create Date: 2025-03-16 09:41:52.118904
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c257f0af352c"
+down_revision: str | None = "a88d0ede872b"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade():
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("update_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_scheduler_leases_created_at"), "scheduler_leases", ["created_at"], unique=False)
+
+    op.create_table(
+        "scheduled_tasks",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("schedule", sa.String(), nullable=False),
+        sa.Column("next_run_at", sa.DateTime(), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("last_duration", sa.Float(), nullable=True),
+        sa.Column("last_status", sa.String(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("update_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_scheduled_tasks_created_at"), "scheduled_tasks", ["created_at"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_scheduled_tasks_created_at"), table_name="scheduled_tasks")
+    op.drop_table("scheduled_tasks")
+    op.drop_index(op.f("ix_scheduler_leases_created_at"), table_name="scheduler_leases")
+    op.drop_table("scheduler_leases")
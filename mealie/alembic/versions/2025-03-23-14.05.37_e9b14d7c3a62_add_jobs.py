@@ -0,0 +1,53 @@
+"""add jobs
+
+Revision ID: e9b14d7c3a62
+Revises: c257f0af352c
+Create Date: 2025-03-23 14:05:37.402651
+
+"""
+
+import sqlalchemy as sa
+
+import mealie.db.migration_types
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e9b14d7c3a62"
+down_revision: str | None = "c257f0af352c"
+branch_labels: str | tuple[str, ...] | None = None
+depends_on: str | tuple[str, ...] | None = None
+
+
+def upgrade():
+    op.create_table(
+        "jobs",
+        sa.Column("id", mealie.db.migration_types.GUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("payload", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("group_id", mealie.db.migration_types.GUID(), nullable=True),
+        sa.Column("report_id", mealie.db.migration_types.GUID(), nullable=True),
+        sa.Column("progress", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("worker", sa.String(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("update_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_jobs_created_at"), "jobs", ["created_at"], unique=False)
+    op.create_index(op.f("ix_jobs_group_id"), "jobs", ["group_id"], unique=False)
+    op.create_index(op.f("ix_jobs_status"), "jobs", ["status"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_jobs_status"), table_name="jobs")
+    op.drop_index(op.f("ix_jobs_group_id"), table_name="jobs")
+    op.drop_index(op.f("ix_jobs_created_at"), table_name="jobs")
+    op.drop_table("jobs")
@@ -23,7 +23,12 @@ from mealie.core.settings.static import APP_VERSION
 from mealie.routes import router, spa, utility_routes
 from mealie.routes.handlers import register_debug_handler
 from mealie.routes.media import media_router
+from mealie.services.event_bus_service.delivery import get_notification_delivery
+from mealie.services.jobs.job_worker import get_job_worker
+from mealie.services.parser_services.nlp_pool import get_nlp_parser_pool
 from mealie.services.scheduler import SchedulerRegistry, SchedulerService, tasks
+from mealie.services.scraper.http_client import get_scraper_http_client
+from mealie.services.scraper.parse_pool import get_scraper_parse_pool
 
 settings = get_app_settings()
 
@@ -67,6 +72,9 @@ async def lifespan_fn(_: FastAPI) -> AsyncGenerator[None, None]:
 
     await start_scheduler()
 
+    if settings.JOB_WORKER_ENABLED:
+        await get_job_worker().start()
+
     logger.info("-----SYSTEM STARTUP-----")
     logger.info("------APP SETTINGS------")
     logger.info(
@@ -93,6 +101,13 @@ async def lifespan_fn(_: FastAPI) -> AsyncGenerator[None, None]:
 
     yield
 
+    await SchedulerService.stop()
+    if settings.JOB_WORKER_ENABLED:
+        await get_job_worker().stop()
+    get_nlp_parser_pool().shutdown()
+    get_notification_delivery().shutdown()
+    get_scraper_parse_pool().shutdown()
+    await get_scraper_http_client().aclose()
     logger.info("-----SYSTEM SHUTDOWN----- \n")
 
 
@@ -128,8 +143,10 @@ async def start_scheduler():
         tasks.purge_group_registration,
         tasks.purge_password_reset_tokens,
         tasks.purge_group_data_exports,
+        tasks.purge_old_jobs,
         tasks.create_mealplan_timeline_events,
         tasks.delete_old_checked_list_items,
+        tasks.reconcile_group_storage,
     )
 
     SchedulerRegistry.register_minutely(
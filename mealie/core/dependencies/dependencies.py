@@ -14,6 +14,7 @@ from sqlalchemy.orm.session import Session
 
 from mealie.core import root_logger
 from mealie.core.config import get_app_dirs, get_app_settings
+from mealie.core.dependencies.user_cache import get_user_cache
 from mealie.db.db_setup import generate_session
 from mealie.repos.all_repositories import get_repositories
 from mealie.schema.user import PrivateUser, TokenData
@@ -98,18 +99,27 @@ async def get_current_user(
 
     try:
         payload = jwt.decode(token, settings.SECRET, algorithms=[ALGORITHM])
-        user_id: str | None = payload.get("sub")
-        long_token: str | None = payload.get("long_token")
+    except PyJWTError as e:
+        raise credentials_exception from e
 
-        if long_token is not None:
-            return validate_long_live_token(session, token, payload.get("id"))
+    return get_user_cache().get_or_load(token, lambda: _load_user(session, token, payload))
+
+
+def _load_user(session: Session, token: str, payload: dict) -> PrivateUser:
+    user_id: str | None = payload.get("sub")
+    long_token: str | None = payload.get("long_token")
 
-        if user_id is None:
+    if long_token is not None:
+        token_user_id: str | None = payload.get("id")
+        if token_user_id is None:
             raise credentials_exception
 
-        token_data = TokenData(user_id=user_id)
-    except PyJWTError as e:
-        raise credentials_exception from e
+        return validate_long_live_token(session, token, token_user_id)
+
+    if user_id is None:
+        raise credentials_exception
+
+    token_data = TokenData(user_id=user_id)
 
     repos = get_repositories(session, group_id=None, household_id=None)
 
@@ -209,7 +219,7 @@ def validate_recipe_token(token: str | None = None) -> str:
 @contextmanager
 def get_temporary_zip_path(auto_unlink=True) -> Generator[Path, None, None]:
     app_dirs.TEMP_DIR.mkdir(exist_ok=True, parents=True)
-    temp_path = app_dirs.TEMP_DIR.joinpath("my_zip_archive.zip")
+    temp_path = app_dirs.TEMP_DIR.joinpath(f"{uuid4().hex}.zip")
     try:
         yield temp_path
     finally:
@@ -0,0 +1,148 @@
+"""Caches the users that tokens resolve to, until they or their group or household change, or for `ttl` seconds"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from mealie.core.config import get_app_settings
+from mealie.db.models.group.group import Group
+from mealie.db.models.household.household import Household
+from mealie.db.models.users.users import LongLiveToken, User
+from mealie.schema.user import PrivateUser
+
+_PENDING_USER_IDS_KEY = "user_cache_pending_user_ids"
+_ALL_USERS = "*"
+
+
+class UserCache:
+    """
+    A thread-safe LRU cache of resolved users, with hit and miss counters.
+
+    Users are copied on the way out, so requests can't change each other's user.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 10) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries: OrderedDict[str, tuple[float, PrivateUser]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    @staticmethod
+    def _get_key(token: str) -> str:
+        # don't keep the raw tokens in memory
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get_or_load(self, token: str, loader: Callable[[], PrivateUser]) -> PrivateUser:
+        """Returns the cached user for `token`, or calls `loader` and caches its result"""
+
+        if not self.enabled:
+            return loader()
+
+        key = self._get_key(token)
+        with self._lock:
+            if (entry := self._entries.get(key)) and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1].model_copy(deep=True)
+
+            self.misses += 1
+            generation = self._generation
+
+        user = loader()
+        with self._lock:
+            # if anything was invalidated while we were loading, our user may already be stale
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), user.model_copy(deep=True))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        return user
+
+    def invalidate(self, user_id: UUID | str | None = None) -> None:
+        """Drops the cached entries of `user_id`, or of all users if `user_id` is None"""
+
+        with self._lock:
+            self._generation += 1
+            if user_id is None:
+                self._entries.clear()
+                return
+
+            user_id = str(user_id)
+            for key in [key for key, (_, user) in self._entries.items() if str(user.id) == user_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@lru_cache
+def get_user_cache() -> UserCache:
+    settings = get_app_settings()
+    return UserCache(maxsize=settings.SECURITY_USER_CACHE_SIZE, ttl=settings.SECURITY_USER_CACHE_TTL)
+
+
+def _get_user_id(instance) -> UUID | str | None:
+    """The user whose cached entries are stale after `instance` changed, or `_ALL_USERS`"""
+
+    if isinstance(instance, User):
+        return instance.id or _ALL_USERS
+
+    if isinstance(instance, LongLiveToken):
+        return instance.user_id or _ALL_USERS
+
+    # users include their group's and household's names and slugs
+    if isinstance(instance, Group | Household):
+        return _ALL_USERS
+
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session: Session, _flush_context) -> None:
+    user_ids = {
+        user_id
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if (user_id := _get_user_id(instance)) is not None
+    }
+    if user_ids:
+        session.info.setdefault(_PENDING_USER_IDS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_user_changes(session: Session) -> None:
+    # invalidate after the commit, otherwise another request could re-cache the old user in the meantime
+    user_ids: set[UUID | str] = session.info.pop(_PENDING_USER_IDS_KEY, set())
+    if not user_ids:
+        return
+
+    user_cache = get_user_cache()
+    if _ALL_USERS in user_ids:
+        user_cache.invalidate()
+        return
+
+    for user_id in user_ids:
+        user_cache.invalidate(user_id)
@@ -13,6 +13,8 @@ class AppDirectories:
         self.TEMPLATE_DIR = data_dir.joinpath("templates")
 
         self.GROUPS_DIR = self.DATA_DIR.joinpath("groups")
+        self.JOB_DIR = self.DATA_DIR.joinpath("jobs")
+        """Files uploaded for queued jobs, kept until the job has run"""
 
         # Deprecated
         self._TEMP_DIR = data_dir.joinpath(".temp")
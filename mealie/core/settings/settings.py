@@ -173,6 +173,14 @@ class AppSettings(AppLoggingSettings):
     SECURITY_MAX_LOGIN_ATTEMPTS: int = 5
     SECURITY_USER_LOCKOUT_TIME: int = 24
     "time in hours"
+    SECURITY_USER_CACHE_TTL: int = 10
+    """
+    Time in seconds that a user is cached for after authenticating a request with their token. Changes to the
+    user are seen right away by the same process, but can take this long to be seen by other workers.
+    Set to 0 to disable the cache
+    """
+    SECURITY_USER_CACHE_SIZE: int = 1000
+    """Maximum number of tokens whose users are cached"""
 
     @field_validator("BASE_URL")
     @classmethod
@@ -421,6 +429,90 @@ class AppSettings(AppLoggingSettings):
         """Validates OpenAI settings are all set"""
         return self.OPENAI_FEATURE.enabled
 
+    # ===============================================
+    # Ingredient Parser
+
+    PARSER_NLP_WORKERS: int = 2
+    """
+    Number of processes used to run the NLP ingredient parser. Set to 0 to
+    parse in a background thread of the web worker instead
+    """
+    PARSER_NLP_CACHE_SIZE: int = 5000
+    """Number of recently parsed ingredient lines to keep in memory"""
+    PARSER_ALIAS_CACHE_TTL: int = 300
+    """
+    Time in seconds that a group's food and unit aliases are cached for. Changes to foods and units are seen
+    right away by the same process, but can take this long to be seen by other workers. Set to 0 to disable the cache
+    """
+    PARSER_ALIAS_CACHE_SIZE: int = 64
+    """Maximum number of groups whose food and unit aliases are cached"""
+
+    # ===============================================
+    # Notifications
+
+    NOTIFICATION_QUEUE_SIZE: int = 1000
+    """
+    Maximum number of webhook and Apprise notifications waiting to be sent. When the queue is full,
+    new notifications wait for space and are dropped if none frees up
+    """
+    NOTIFICATION_MAX_CONCURRENCY: int = 20
+    """Maximum number of notifications sent at the same time"""
+    NOTIFICATION_MAX_CONCURRENCY_PER_HOST: int = 4
+    """Maximum number of notifications sent to the same host at the same time"""
+    NOTIFICATION_MAX_RETRIES: int = 3
+    """Number of times a failed notification is retried, with exponential backoff"""
+
+    # ===============================================
+    # Scraper
+
+    SCRAPER_MAX_CONCURRENCY: int = 20
+    """Maximum number of recipe pages fetched at the same time, e.g. during bulk URL imports"""
+    SCRAPER_MAX_CONCURRENCY_PER_HOST: int = 4
+    """Maximum number of recipe pages fetched from the same host at the same time"""
+    SCRAPER_MAX_RESPONSE_SIZE: int = 10
+    """Maximum size (in MB) of a recipe page. Larger pages are rejected"""
+    SCRAPER_HTTP2: bool = True
+    """Whether to fetch recipe pages over HTTP/2 when the site supports it (requires the `h2` package)"""
+    SCRAPER_PARSE_WORKERS: int = 4
+    """Number of threads used to parse fetched recipe pages, so parsing doesn't block other requests"""
+    SCRAPER_PARSE_TIMEOUT: int = 30
+    """Number of seconds after which parsing a recipe page is abandoned"""
+
+    # ===============================================
+    # Images
+
+    IMAGE_ORIGINAL_MAX_SIZE: int = 0
+    """
+    Maximum width/height (in pixels) of stored recipe images, or 0 to keep the full resolution. The uploaded
+    image isn't kept, so images stored with a maximum size can't be restored to their full resolution
+    """
+    IMAGE_MINIATURE_MAX_SIZE: int = 600
+    """Maximum width/height (in pixels) of the images shown on recipe cards"""
+    IMAGE_TINY_MAX_SIZE: int = 300
+    """Maximum width/height (in pixels) of the smallest recipe image thumbnails"""
+
+    # ===============================================
+    # Scheduler
+
+    SCHEDULER_LEASE_TTL: int = 60
+    """
+    Number of seconds the worker running the scheduled tasks holds its lease for without renewing it. If that
+    worker stops without releasing the lease, another worker takes over after this long. Only used with SQLite;
+    on Postgres another worker takes over as soon as the worker's database connection closes
+    """
+
+    # ===============================================
+    # Jobs
+
+    JOB_WORKER_ENABLED: bool = True
+    """
+    Whether the web workers also run queued jobs (bulk URL imports, migrations, exports and backups). Set this
+    to False when the jobs are run by separate job workers, started with `mealie worker`
+    """
+
+    JOB_CONCURRENCY: int = 1
+    """Number of jobs each job worker runs at once"""
+
     # ===============================================
     # Web Concurrency
 
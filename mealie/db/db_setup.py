@@ -6,6 +6,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
 from mealie.core.config import get_app_settings
+from mealie.db.models._model_utils.seeded_random import register_sqlite_functions
 
 settings = get_app_settings()
 
@@ -16,6 +17,8 @@ def sql_global_init(db_url: str):
         connect_args["check_same_thread"] = False
 
     engine = sa.create_engine(db_url, echo=False, connect_args=connect_args, pool_pre_ping=True, future=True)
+    if engine.dialect.name == "sqlite":
+        sa.event.listen(engine, "connect", register_sqlite_functions)
 
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
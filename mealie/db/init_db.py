@@ -21,6 +21,7 @@ from mealie.schema.household.household import HouseholdCreate, HouseholdInDB
 from mealie.schema.user.user import GroupBase, GroupInDB
 from mealie.services.group_services.group_service import GroupService
 from mealie.services.household_services.household_service import HouseholdService
+from mealie.services.recipe.recipe_storage import reconcile_recipe_storage
 
 ALEMBIC_DIR = Path(__file__).parent.parent / "alembic"
 
@@ -66,6 +67,35 @@ def db_is_at_head(alembic_cfg: config.Config) -> bool:
         return set(context.get_current_heads()) == set(directory.get_heads())
 
 
+def get_alembic_config() -> Config:
+    alembic_cfg_path = os.getenv("ALEMBIC_CONFIG_FILE", default=str(ALEMBIC_DIR / "alembic.ini"))
+
+    if not os.path.isfile(alembic_cfg_path):
+        raise Exception("Provided alembic config path doesn't exist")
+
+    return Config(alembic_cfg_path)
+
+
+def wait_for_migrations(poll_seconds: float = 5) -> None:
+    """
+    Waits until the database has been migrated to the latest revision. Used by processes that don't migrate
+    the database themselves (e.g. `mealie worker`), so they don't start until the API has migrated it
+    """
+
+    alembic_cfg = get_alembic_config()
+    while True:
+        try:
+            if db_is_at_head(alembic_cfg):
+                logger.info("Database is up to date.")
+                return
+
+            logger.info(f"Waiting for the database to be migrated. Retrying in {poll_seconds} seconds...")
+        except Exception as e:
+            logger.error(f"Database connection failed: {e}. Retrying in {poll_seconds} seconds...")
+
+        sleep(poll_seconds)
+
+
 def safe_try(func: Callable):
     try:
         func()
@@ -101,13 +131,8 @@ def main():
             if max_retry == 0:
                 raise ConnectionError("Database connection failed - exiting application.")
 
-        alembic_cfg_path = os.getenv("ALEMBIC_CONFIG_FILE", default=str(ALEMBIC_DIR / "alembic.ini"))
-
-        if not os.path.isfile(alembic_cfg_path):
-            raise Exception("Provided alembic config path doesn't exist")
-
         run_fixes = False
-        alembic_cfg = Config(alembic_cfg_path)
+        alembic_cfg = get_alembic_config()
         if db_is_at_head(alembic_cfg):
             logger.debug("Migration not needed.")
         else:
@@ -117,6 +142,7 @@ def main():
 
         if session.get_bind().name == "postgresql":  # needed for fuzzy search and fast GIN text indices
             session.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+            session.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent;"))
 
         db = get_repositories(session, group_id=None, household_id=None)
 
@@ -126,6 +152,7 @@ def main():
                 safe_try(lambda: fix_migration_data(session))
                 safe_try(lambda: fix_slug_food_names(db))
                 safe_try(lambda: fix_group_with_no_name(session))
+                safe_try(lambda: reconcile_recipe_storage(session))
 
         else:
             logger.info("Database contains no users, initializing...")
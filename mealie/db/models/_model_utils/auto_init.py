@@ -1,16 +1,40 @@
-from functools import wraps
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from functools import cache, wraps
+from typing import Any, ParamSpec, TypeVar, cast
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select
+from sqlalchemy import Integer, select
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.orm import MANYTOMANY, MANYTOONE, ONETOMANY, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.relationships import RelationshipProperty
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.sql.base import ColumnCollection
 
 from .._model_base import SqlAlchemyBase
+from .guid import GUID
 from .helpers import safe_call
 
+_LOOKUP_CACHE_KEY = "auto_init_lookup_cache"
+_LOOKUP_BATCH_SIZE = 500
+_MULTIPLE_RESULTS = object()
+
+LookupCache = dict[tuple[type[SqlAlchemyBase], str], dict[Any, Any]]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _cache_per_class(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    `functools.cache` for functions of model classes. Classes are hashable, but mypy checks the
+    `__hash__` of their instances instead, so it doesn't consider `type[SqlAlchemyBase]` to be `Hashable`
+    """
+
+    return cast(Callable[P, R], cache(func))
+
 
 def _default_exclusion() -> set[str]:
     return {"id"}
@@ -26,9 +50,10 @@ class AutoInitConfig(BaseModel):
     # auto_create: bool = False
 
 
+@_cache_per_class
 def _get_config(relation_cls: type[SqlAlchemyBase]) -> AutoInitConfig:
     """
-    Returns the config for the given class.
+    Returns the config for the given class. The config is cached per class, so it must not be modified.
     """
     cfg = AutoInitConfig()
     cfgKeys = cfg.model_dump().keys()
@@ -45,6 +70,7 @@ def _get_config(relation_cls: type[SqlAlchemyBase]) -> AutoInitConfig:
     return cfg
 
 
+@_cache_per_class
 def get_lookup_attr(relation_cls: type[SqlAlchemyBase]) -> str:
     """Returns the primary key attribute of the related class as a string.
 
@@ -66,6 +92,110 @@ def get_lookup_attr(relation_cls: type[SqlAlchemyBase]) -> str:
     return get_attr
 
 
+def _to_uuid(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return value
+
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return value
+
+
+def _to_int(value: Any) -> Any:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+@_cache_per_class
+def _get_key_normalizer(relation_cls: type[SqlAlchemyBase], get_attr: str) -> Callable[[Any], Any]:
+    """
+    Returns a function that converts lookup values to the type loaded from the database (e.g. str ids to UUIDs),
+    so values provided by the caller can be matched against the loaded instances
+    """
+
+    column = relation_cls.__table__.columns.get(get_attr)
+    if column is None:
+        return lambda value: value
+    if isinstance(column.type, GUID):
+        return _to_uuid
+    if isinstance(column.type, Integer):
+        return _to_int
+
+    return lambda value: value
+
+
+@_cache_per_class
+def _is_primary_key(relation_cls: type[SqlAlchemyBase], get_attr: str) -> bool:
+    return relation_cls.__table__.primary_key.columns.keys() == [get_attr]
+
+
+def resolve_lookups(
+    session: Session, relation_cls: type[SqlAlchemyBase], get_attr: str, values: Iterable[Any]
+) -> dict[Any, Any]:
+    """
+    Loads the instances of `relation_cls` whose `get_attr` is one of `values`, using the session's identity map
+    where possible and otherwise a single `IN (...)` query (per batch of values). Returns the instances by their
+    normalized lookup value; values that don't exist map to None.
+
+    While a model is being initialized with `auto_init`, results are cached for the rest of the initialization.
+    """
+
+    cache: LookupCache | None = session.info.get(_LOOKUP_CACHE_KEY)
+    resolved = cache.setdefault((relation_cls, get_attr), {}) if cache is not None else {}
+
+    normalize = _get_key_normalizer(relation_cls, get_attr)
+    keys = {normalize(value) for value in values if value is not None}
+    keys = {key for key in keys if key not in resolved}
+    if not keys:
+        return resolved
+
+    if _is_primary_key(relation_cls, get_attr):
+        for key in list(keys):
+            instance = session.identity_map.get(identity_key(relation_cls, key))
+            if instance is not None and instance not in session.deleted:
+                resolved[key] = instance
+                keys.discard(key)
+
+    sorted_keys = sorted(keys, key=str)
+    column = getattr(relation_cls, get_attr)
+    for i in range(0, len(sorted_keys), _LOOKUP_BATCH_SIZE):
+        batch = sorted_keys[i : i + _LOOKUP_BATCH_SIZE]
+        stmt = select(relation_cls).where(column.in_(batch))
+        for instance in session.execute(stmt).scalars().all():
+            key = normalize(getattr(instance, get_attr))
+            # mirror `one_or_none`; only raised if the value is actually looked up
+            resolved[key] = _MULTIPLE_RESULTS if resolved.get(key) not in (None, instance) else instance
+
+    for key in keys:
+        resolved.setdefault(key, None)
+
+    return resolved
+
+
+def lookup_one(session: Session, relation_cls: type[SqlAlchemyBase], get_attr: str, value: Any) -> Any | None:
+    """Returns the instance of `relation_cls` whose `get_attr` is `value`, or None if there isn't one"""
+
+    if value is None:
+        return None
+
+    try:
+        instance = resolve_lookups(session, relation_cls, get_attr, [value]).get(
+            _get_key_normalizer(relation_cls, get_attr)(value)
+        )
+    except TypeError:
+        # unhashable values can't be batched
+        stmt = select(relation_cls).filter_by(**{get_attr: value})
+        return session.execute(stmt).scalars().one_or_none()
+
+    if instance is _MULTIPLE_RESULTS:
+        raise MultipleResultsFound(f"Multiple {relation_cls.__name__} rows were found for {get_attr}={value}")
+
+    return instance
+
+
 def handle_many_to_many(session, get_attr, relation_cls, all_elements: list[dict]):
     """
     Proxy call to `handle_one_to_many_list` for many-to-many relationships. Because functionally, they do the same
@@ -77,14 +207,20 @@ def handle_one_to_many_list(
     session: Session, get_attr, relation_cls: type[SqlAlchemyBase], all_elements: list[dict] | list[str]
 ):
     elems_to_create: list[dict] = []
-    updated_elems: list[dict] = []
+    updated_elems: list[Any] = []
 
     cfg = _get_config(relation_cls)
 
-    for elem in all_elements:
-        elem_id = elem.get(get_attr, None) if isinstance(elem, dict) else elem
-        stmt = select(relation_cls).filter_by(**{get_attr: elem_id})
-        existing_elem = session.execute(stmt).scalars().one_or_none()
+    elem_ids = [elem.get(get_attr, None) if isinstance(elem, dict) else elem for elem in all_elements]
+
+    # load all of the existing elements at once, rather than one query per element
+    try:
+        resolve_lookups(session, relation_cls, get_attr, elem_ids)
+    except TypeError:
+        pass
+
+    for elem, elem_id in zip(all_elements, elem_ids, strict=True):
+        existing_elem = lookup_one(session, relation_cls, get_attr, elem_id)
 
         if existing_elem is None and isinstance(elem, dict):
             elems_to_create.append(elem)
@@ -101,6 +237,65 @@ def handle_one_to_many_list(
     return new_elems + updated_elems
 
 
+def _collect_lookups(
+    cls: type[SqlAlchemyBase], kwargs: dict, lookups: dict[tuple[type[SqlAlchemyBase], str], list[Any]]
+) -> None:
+    """
+    Walks the data used to initialize `cls` (including nested models) and collects every value
+    that will be looked up, by related class and lookup attribute
+    """
+
+    try:
+        mapper: Mapper = cls.__mapper__
+    except AttributeError:
+        return
+
+    exclude = _get_config(cls).exclude
+    for key, val in kwargs.items():
+        if key not in mapper.relationships or val is None:
+            continue
+
+        prop: RelationshipProperty = mapper.relationships[key]
+        relation_cls: type[SqlAlchemyBase] = prop.mapper.entity
+        get_attr = get_lookup_attr(relation_cls)
+
+        if key in exclude:
+            # excluded relationships are often still created from the data by the model's own `__init__`,
+            # but their elements are always new, so only their nested models are looked up
+            for elem in val if isinstance(val, list) else [val]:
+                if isinstance(elem, dict):
+                    _collect_lookups(relation_cls, elem, lookups)
+            continue
+
+        if prop.direction == MANYTOMANY or (prop.direction == ONETOMANY and prop.uselist):
+            for elem in val:
+                if isinstance(elem, dict):
+                    lookups[(relation_cls, get_attr)].append(elem.get(get_attr))
+                    _collect_lookups(relation_cls, elem, lookups)
+                else:
+                    lookups[(relation_cls, get_attr)].append(elem)
+
+        elif prop.direction == ONETOMANY and isinstance(val, dict):
+            _collect_lookups(relation_cls, val, lookups)
+
+        elif prop.direction == MANYTOONE and not prop.uselist:
+            lookups[(relation_cls, get_attr)].append(val.get(get_attr) if isinstance(val, dict) else val)
+
+
+def _prefetch_lookups(session: Session, cls: type[SqlAlchemyBase], kwargs: dict) -> None:
+    """Resolves every lookup needed to initialize `cls` with one query per related class"""
+
+    lookups: dict[tuple[type[SqlAlchemyBase], str], list[Any]] = defaultdict(list)
+    _collect_lookups(cls, kwargs, lookups)
+
+    for (relation_cls, get_attr), values in lookups.items():
+        try:
+            resolve_lookups(session, relation_cls, get_attr, values)
+        except (TypeError, ValueError):
+            # invalid values are looked up (and fail) individually, the same as without prefetching
+            continue
+
+
 def auto_init():  # sourcery no-metrics
     """Wraps the `__init__` method of a class to automatically set the common
     attributes.
@@ -133,61 +328,74 @@ def auto_init():  # sourcery no-metrics
             if session is None:
                 raise ValueError("Session is required to initialize the model with `auto_init`")
 
-            for key, val in kwargs.items():
-                if key in exclude:
-                    continue
+            # the outermost model resolves the lookups for all of its nested models up front,
+            # which are then cached in the session until it's done
+            is_outermost = _LOOKUP_CACHE_KEY not in session.info
+            if is_outermost:
+                session.info[_LOOKUP_CACHE_KEY] = {}
 
-                if not hasattr(cls, key):
-                    continue
-                    # raise TypeError(f"Invalid keyword argument: {key}")
+            try:
+                if is_outermost:
+                    _prefetch_lookups(session, cls, kwargs)
 
-                if key in model_columns:
-                    setattr(self, key, val)
-                    continue
+                for key, val in kwargs.items():
+                    if key in exclude:
+                        continue
 
-                if key in relationships:
-                    prop: RelationshipProperty = relationships[key]
+                    if not hasattr(cls, key):
+                        continue
+                        # raise TypeError(f"Invalid keyword argument: {key}")
 
-                    # Identifies the type of relationship (ONETOMANY, MANYTOONE, many-to-one, many-to-many)
-                    relation_dir = prop.direction
+                    if key in model_columns:
+                        setattr(self, key, val)
+                        continue
 
-                    # Identifies the parent class of the related object.
-                    relation_cls: type[SqlAlchemyBase] = prop.mapper.entity
+                    if key in relationships:
+                        prop: RelationshipProperty = relationships[key]
 
-                    # Identifies if the relationship was declared with use_list=True
-                    use_list: bool = prop.uselist
+                        # Identifies the type of relationship (ONETOMANY, MANYTOONE, many-to-one, many-to-many)
+                        relation_dir = prop.direction
 
-                    get_attr = get_lookup_attr(relation_cls)
+                        # Identifies the parent class of the related object.
+                        relation_cls: type[SqlAlchemyBase] = prop.mapper.entity
 
-                    if relation_dir == ONETOMANY and use_list:
-                        instances = handle_one_to_many_list(session, get_attr, relation_cls, val)
-                        setattr(self, key, instances)
+                        # Identifies if the relationship was declared with use_list=True
+                        use_list: bool = prop.uselist
 
-                    elif relation_dir == ONETOMANY:
-                        instance = safe_call(relation_cls, val.copy() if val else None, session=session)
-                        setattr(self, key, instance)
+                        get_attr = get_lookup_attr(relation_cls)
 
-                    elif relation_dir == MANYTOONE and not use_list:
-                        if isinstance(val, dict):
-                            val = val.get(get_attr)
+                        if relation_dir == ONETOMANY and use_list:
+                            instances = handle_one_to_many_list(session, get_attr, relation_cls, val)
+                            setattr(self, key, instances)
 
-                            if val is None:
-                                raise ValueError(f"Expected 'id' to be provided for {key}")
-
-                        if isinstance(val, str | int | UUID):
-                            stmt = select(relation_cls).filter_by(**{get_attr: val})
-                            instance = session.execute(stmt).scalars().one_or_none()
+                        elif relation_dir == ONETOMANY:
+                            instance = safe_call(relation_cls, val.copy() if val else None, session=session)
                             setattr(self, key, instance)
-                        else:
-                            # If the value is not of the type defined above we assume that it isn't a valid id
-                            # and try a different approach.
-                            pass
-
-                    elif relation_dir == MANYTOMANY:
-                        instances = handle_many_to_many(session, get_attr, relation_cls, val)
-                        setattr(self, key, instances)
 
-            return init(self, *args, **kwargs)
+                        elif relation_dir == MANYTOONE and not use_list:
+                            if isinstance(val, dict):
+                                val = val.get(get_attr)
+
+                                if val is None:
+                                    raise ValueError(f"Expected 'id' to be provided for {key}")
+
+                            if isinstance(val, str | int | UUID):
+                                instance = lookup_one(session, relation_cls, get_attr, val)
+                                setattr(self, key, instance)
+                            else:
+                                # If the value is not of the type defined above we assume that it isn't a valid id
+                                # and try a different approach.
+                                pass
+
+                        elif relation_dir == MANYTOMANY:
+                            instances = handle_many_to_many(session, get_attr, relation_cls, val)
+                            setattr(self, key, instances)
+
+                # models excluded above are usually initialized by `init` itself, which can use the cache too
+                return init(self, *args, **kwargs)
+            finally:
+                if is_outermost:
+                    session.info.pop(_LOOKUP_CACHE_KEY, None)
 
         return wrapper
 
@@ -0,0 +1,50 @@
+import hashlib
+
+from sqlalchemy import String
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import GenericFunction
+
+SQLITE_FUNCTION_NAME = "mealie_seeded_random"
+
+
+def seeded_random_key(value: str, seed: str) -> str:
+    """
+    Python implementation of the `seeded_random` SQL function, registered on SQLite connections.
+
+    Hashes the seed together with the value's 32 character hex representation (the same representation
+    `GUID` uses when storing ids in SQLite), so both databases produce the same ordering for the same seed.
+    """
+    return hashlib.md5(f"{seed}{value}".encode()).hexdigest()
+
+
+class seeded_random(GenericFunction):
+    """
+    A deterministic, pseudo-random sort key for `value`, seeded with `seed`.
+
+    Ordering by `seeded_random(Model.id, seed)` shuffles the rows entirely in the database, and
+    gives the same order every time the same seed is used, so it's stable across pages.
+
+    On SQLite the function is provided by `register_sqlite_functions`.
+    """
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(seeded_random)
+def _compile_seeded_random_sqlite(element: seeded_random, compiler, **kw) -> str:
+    return f"{SQLITE_FUNCTION_NAME}({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(seeded_random, "postgresql")
+def _compile_seeded_random_postgres(element: seeded_random, compiler, **kw) -> str:
+    value, seed = list(element.clauses)
+    value_sql = compiler.process(value, **kw)
+    seed_sql = compiler.process(seed, **kw)
+
+    # postgres stores ids as native UUIDs, so we strip the dashes to match the SQLite representation
+    return f"md5(CAST({seed_sql} AS TEXT) || replace(CAST({value_sql} AS TEXT), '-', ''))"
+
+
+def register_sqlite_functions(dbapi_connection, _connection_record) -> None:
+    dbapi_connection.create_function(SQLITE_FUNCTION_NAME, 2, seeded_random_key, deterministic=True)
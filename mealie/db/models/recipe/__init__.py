@@ -1,3 +1,4 @@
+from . import search_index  # noqa: F401 - registers the search index session listeners
 from .api_extras import *
 from .assets import *
 from .category import *
@@ -10,5 +11,6 @@ from .recipe import *
 from .recipe_timeline import *
 from .settings import *
 from .shared import *
+from .storage import *
 from .tag import *
 from .tool import *
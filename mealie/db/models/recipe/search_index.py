@@ -0,0 +1,333 @@
+"""Full-text search index for recipes, using FTS5 on SQLite and weighted tsvectors on Postgres"""
+
+import re
+from collections.abc import Collection
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import Connection, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from mealie.db.models._model_utils.guid import GUID
+
+from .ingredient import RecipeIngredientModel
+from .instruction import RecipeInstruction
+from .recipe import RecipeModel
+from .tag import Tag, recipes_to_tags
+
+SEARCH_INDEX_TABLE = "recipes_fts"
+SEARCH_INDEX_ROWIDS_TABLE = "recipes_fts_rowids"
+SEARCH_INDEX_COLUMNS = ["name", "description", "ingredients", "instructions", "tags"]
+
+# column weights, in the same order as `SEARCH_INDEX_COLUMNS`
+SQLITE_BM25_WEIGHTS = [10.0, 2.0, 4.0, 1.0, 6.0]
+POSTGRES_WEIGHTS = ["A", "D", "C", "D", "B"]
+POSTGRES_TEXT_SEARCH_CONFIG = "simple"
+
+_SEARCHABLE_RECIPE_ATTRS = ["name", "description", "recipe_ingredient", "recipe_instructions", "tags"]
+_SEARCHABLE_INGREDIENT_ATTRS = ["note", "original_text", "recipe_id"]
+_SEARCHABLE_INSTRUCTION_ATTRS = ["title", "text", "recipe_id"]
+_PENDING_RECIPE_IDS_KEY = "recipe_search_index_pending_ids"
+
+_word_regex = re.compile(r"\w+", re.UNICODE)
+
+sqlite_search_index = sa.table(
+    SEARCH_INDEX_TABLE,
+    sa.column("rowid", sa.Integer),
+    *[sa.column(name, sa.String) for name in SEARCH_INDEX_COLUMNS],
+)
+sqlite_search_index_rowids = sa.table(
+    SEARCH_INDEX_ROWIDS_TABLE,
+    sa.column("id", sa.Integer),
+    sa.column("recipe_id", GUID),
+)
+postgres_search_index = sa.table(
+    SEARCH_INDEX_TABLE,
+    sa.column("recipe_id", GUID),
+    sa.column("document", postgresql.TSVECTOR),
+)
+
+
+def is_search_index_table(table_name: str) -> bool:
+    """Whether the table is part of the search index, or one of the shadow tables SQLite creates for it"""
+    return table_name == SEARCH_INDEX_TABLE or table_name.startswith(f"{SEARCH_INDEX_TABLE}_")
+
+
+def is_search_index_shadow_table(table_name: str) -> bool:
+    """Whether the table is one of the shadow tables SQLite creates (and drops) along with the search index"""
+    return is_search_index_table(table_name) and table_name not in (SEARCH_INDEX_TABLE, SEARCH_INDEX_ROWIDS_TABLE)
+
+
+def _search_document_columns(dialect_name: str) -> list[sa.ColumnElement]:
+    """Correlated expressions for each of `SEARCH_INDEX_COLUMNS`, selected from `RecipeModel`"""
+
+    def _concat(*columns: sa.ColumnElement) -> sa.ColumnElement:
+        expr = sa.func.coalesce(columns[0], "")
+        for column in columns[1:]:
+            expr = expr + " " + sa.func.coalesce(column, "")
+        return expr
+
+    ingredients = (
+        sa.select(
+            sa.func.aggregate_strings(
+                _concat(RecipeIngredientModel.note_normalized, RecipeIngredientModel.original_text_normalized), " "
+            )
+        )
+        .where(RecipeIngredientModel.recipe_id == RecipeModel.id)
+        .scalar_subquery()
+    )
+    instructions: sa.ColumnElement = (
+        sa.select(sa.func.aggregate_strings(_concat(RecipeInstruction.title, RecipeInstruction.text), " "))
+        .where(RecipeInstruction.recipe_id == RecipeModel.id)
+        .scalar_subquery()
+    )
+    tags: sa.ColumnElement = (
+        sa.select(sa.func.aggregate_strings(Tag.name, " "))
+        .join(recipes_to_tags, recipes_to_tags.c.tag_id == Tag.id)
+        .where(recipes_to_tags.c.recipe_id == RecipeModel.id)
+        .scalar_subquery()
+    )
+
+    # instructions and tags have no normalized columns. FTS5 already folds case and accents,
+    # but Postgres' "simple" config only folds case, so accents are stripped like the search is
+    if dialect_name == "postgresql":
+        instructions = sa.func.unaccent(sa.func.lower(instructions))
+        tags = sa.func.unaccent(sa.func.lower(tags))
+
+    return [
+        RecipeModel.name_normalized,
+        sa.func.coalesce(RecipeModel.description_normalized, ""),
+        sa.func.coalesce(ingredients, ""),
+        sa.func.coalesce(instructions, ""),
+        sa.func.coalesce(tags, ""),
+    ]
+
+
+def _postgres_document(columns: list[sa.ColumnElement]) -> sa.ColumnElement:
+    config = sa.literal_column(f"'{POSTGRES_TEXT_SEARCH_CONFIG}'::regconfig")
+
+    document: sa.ColumnElement | None = None
+    for column, weight in zip(columns, POSTGRES_WEIGHTS, strict=True):
+        weighted = sa.func.setweight(
+            sa.func.to_tsvector(config, column), sa.literal_column(f"'{weight}'"), type_=postgresql.TSVECTOR
+        )
+        document = weighted if document is None else document.op("||", return_type=postgresql.TSVECTOR)(weighted)
+
+    assert document is not None
+    return document
+
+
+def update_recipe_search_index(connection: Connection, recipe_ids: Collection[UUID] | None = None) -> None:
+    """
+    Re-indexes the given recipes, or every recipe if `recipe_ids` is None.
+    Recipes that no longer exist are removed from the index.
+    """
+
+    if recipe_ids is not None and not recipe_ids:
+        return
+
+    if connection.dialect.name == "postgresql":
+        _update_postgres_search_index(connection, recipe_ids)
+    else:
+        _update_sqlite_search_index(connection, recipe_ids)
+
+
+def _update_postgres_search_index(connection: Connection, recipe_ids: Collection[UUID] | None) -> None:
+    delete_stmt = postgres_search_index.delete()
+    if recipe_ids is not None:
+        delete_stmt = delete_stmt.where(postgres_search_index.c.recipe_id.in_(recipe_ids))
+    connection.execute(delete_stmt)
+
+    query = sa.select(RecipeModel.id, _postgres_document(_search_document_columns("postgresql")))
+    if recipe_ids is not None:
+        query = query.where(RecipeModel.id.in_(recipe_ids))
+
+    # upsert, in case a concurrent transaction indexed the same recipe after our delete
+    insert_stmt = postgresql.insert(postgres_search_index).from_select(["recipe_id", "document"], query)
+    connection.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=["recipe_id"], set_={"document": insert_stmt.excluded.document}
+        )
+    )
+
+
+def _update_sqlite_search_index(connection: Connection, recipe_ids: Collection[UUID] | None) -> None:
+    rowids = sqlite_search_index_rowids
+
+    if recipe_ids is None:
+        connection.execute(sqlite_search_index.delete())
+        connection.execute(rowids.delete())
+    else:
+        # FTS5 rows are deleted by rowid, so the delete doesn't have to scan the whole index
+        connection.execute(
+            sqlite_search_index.delete().where(
+                sqlite_search_index.c.rowid.in_(sa.select(rowids.c.id).where(rowids.c.recipe_id.in_(recipe_ids)))
+            )
+        )
+        connection.execute(rowids.delete().where(rowids.c.recipe_id.in_(recipe_ids)))
+
+    recipes = sa.select(RecipeModel.id)
+    if recipe_ids is not None:
+        recipes = recipes.where(RecipeModel.id.in_(recipe_ids))
+    connection.execute(sa.insert(rowids).from_select(["recipe_id"], recipes))
+
+    query = sa.select(rowids.c.id, *_search_document_columns("sqlite")).join(
+        rowids, rowids.c.recipe_id == RecipeModel.id
+    )
+    if recipe_ids is not None:
+        query = query.where(RecipeModel.id.in_(recipe_ids))
+    connection.execute(sa.insert(sqlite_search_index).from_select(["rowid", *SEARCH_INDEX_COLUMNS], query))
+
+
+def rebuild_recipe_search_index(connection: Connection) -> None:
+    update_recipe_search_index(connection, None)
+
+
+def _build_sqlite_match(search_list: list[str]) -> str:
+    """
+    Builds an FTS5 query matching any of the search terms. Single words are prefix matches
+    (so "ratat" finds "ratatouille"), and multi-word (literal) terms are phrase matches.
+    """
+
+    clauses: list[str] = []
+    for term in search_list:
+        words = _word_regex.findall(term)
+        if not words:
+            continue
+
+        phrase = '"' + " ".join(words) + '"'
+        clauses.append(f"{phrase}*" if len(words) == 1 else phrase)
+
+    return " OR ".join(clauses)
+
+
+def _build_postgres_tsquery(search_list: list[str]) -> str:
+    """The Postgres equivalent of `_build_sqlite_match`, for use with `to_tsquery`"""
+
+    clauses: list[str] = []
+    for term in search_list:
+        words = _word_regex.findall(term)
+        if not words:
+            continue
+
+        clauses.append(f"{words[0]}:*" if len(words) == 1 else "(" + " <-> ".join(words) + ")")
+
+    return " | ".join(clauses)
+
+
+def search_recipe_index(dialect_name: str, search_list: list[str]) -> sa.Subquery | None:
+    """
+    Returns a subquery of `(recipe_id, rank)` for every recipe matching any of the search terms,
+    where a lower rank is a better match. Returns None if there's nothing searchable in `search_list`.
+    """
+
+    if dialect_name == "postgresql":
+        tsquery_str = _build_postgres_tsquery(search_list)
+        if not tsquery_str:
+            return None
+
+        tsquery = sa.func.to_tsquery(
+            sa.literal_column(f"'{POSTGRES_TEXT_SEARCH_CONFIG}'::regconfig"), sa.literal(tsquery_str)
+        )
+        return (
+            sa.select(
+                postgres_search_index.c.recipe_id,
+                (-sa.func.ts_rank_cd(postgres_search_index.c.document, tsquery)).label("rank"),
+            )
+            .where(postgres_search_index.c.document.op("@@")(tsquery))
+            .subquery()
+        )
+
+    match_str = _build_sqlite_match(search_list)
+    if not match_str:
+        return None
+
+    # FTS5 exposes a hidden column with the same name as the table, used for matching and ranking
+    fts_column = sa.literal_column(SEARCH_INDEX_TABLE)
+    return (
+        sa.select(
+            sqlite_search_index_rowids.c.recipe_id,
+            sa.func.bm25(fts_column, *SQLITE_BM25_WEIGHTS).label("rank"),
+        )
+        .select_from(sqlite_search_index)
+        .join(sqlite_search_index_rowids, sqlite_search_index_rowids.c.id == sqlite_search_index.c.rowid)
+        .where(fts_column.op("MATCH")(match_str))
+        .subquery()
+    )
+
+
+def _has_changes(instance, attrs: list[str]) -> bool:
+    state = sa.inspect(instance)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_tag_changes(session: Session, _flush_context, _instances) -> None:
+    # tag changes need to be collected before the flush, since deleting a tag also deletes its recipe links
+    tag_ids = [tag.id for tag in session.deleted if isinstance(tag, Tag)]
+    tag_ids.extend(tag.id for tag in session.dirty if isinstance(tag, Tag) and _has_changes(tag, ["name"]))
+    if not tag_ids:
+        return
+
+    recipe_ids = session.connection().execute(
+        sa.select(recipes_to_tags.c.recipe_id).where(recipes_to_tags.c.tag_id.in_(tag_ids))
+    )
+    session.info.setdefault(_PENDING_RECIPE_IDS_KEY, set()).update(recipe_ids.scalars())
+
+
+@event.listens_for(Session, "after_flush")
+def _update_search_index(session: Session, _flush_context) -> None:
+    recipe_ids: set[UUID] = session.info.pop(_PENDING_RECIPE_IDS_KEY, set())
+
+    for instance in session.new:
+        if isinstance(instance, RecipeModel):
+            recipe_ids.add(instance.id)
+        elif isinstance(instance, RecipeIngredientModel | RecipeInstruction) and instance.recipe_id:
+            recipe_ids.add(instance.recipe_id)
+
+    for instance in session.dirty:
+        if isinstance(instance, RecipeModel) and _has_changes(instance, _SEARCHABLE_RECIPE_ATTRS):
+            recipe_ids.add(instance.id)
+        elif isinstance(instance, RecipeIngredientModel) and _has_changes(instance, _SEARCHABLE_INGREDIENT_ATTRS):
+            recipe_ids.update(filter(None, sa.inspect(instance).attrs.recipe_id.history.sum()))
+        elif isinstance(instance, RecipeInstruction) and _has_changes(instance, _SEARCHABLE_INSTRUCTION_ATTRS):
+            recipe_ids.update(filter(None, sa.inspect(instance).attrs.recipe_id.history.sum()))
+
+    for instance in session.deleted:
+        if isinstance(instance, RecipeModel):
+            recipe_ids.add(instance.id)
+        elif isinstance(instance, RecipeIngredientModel | RecipeInstruction) and instance.recipe_id:
+            recipe_ids.add(instance.recipe_id)
+
+    recipe_ids.discard(None)  # type: ignore[arg-type]
+    if recipe_ids:
+        update_recipe_search_index(session.connection(), recipe_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _update_search_index_on_bulk_delete(orm_execute_state: ORMExecuteState):
+    # bulk deletes bypass the flush, so the recipes they affect are looked up before running the delete
+    if not orm_execute_state.is_delete or orm_execute_state.bind_mapper is None:
+        return None
+
+    model = orm_execute_state.bind_mapper.class_
+    if model is RecipeModel:
+        recipe_id_column = RecipeModel.id
+    elif model is RecipeIngredientModel or model is RecipeInstruction:
+        recipe_id_column = model.recipe_id
+    else:
+        return None
+
+    recipe_ids_query = sa.select(recipe_id_column).distinct()
+    if orm_execute_state.statement.whereclause is not None:
+        recipe_ids_query = recipe_ids_query.where(orm_execute_state.statement.whereclause)
+
+    recipe_ids = set(orm_execute_state.session.execute(recipe_ids_query).scalars())
+    recipe_ids.discard(None)
+
+    result = orm_execute_state.invoke_statement()
+    if recipe_ids:
+        update_recipe_search_index(orm_execute_state.session.connection(), recipe_ids)
+
+    return result
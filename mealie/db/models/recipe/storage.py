@@ -0,0 +1,20 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mealie.db.models._model_base import SqlAlchemyBase
+from mealie.db.models._model_utils.guid import GUID
+
+
+class RecipeStorageModel(SqlAlchemyBase):
+    """
+    The number of bytes used by a recipe's data directory (images, assets, etc.).
+
+    There's no foreign key to the recipe, since a recipe's images can be written before the recipe
+    is created (e.g. when scraping). Rows without a recipe are left out of the group's storage.
+    """
+
+    __tablename__ = "recipe_storage"
+    id: Mapped[GUID] = mapped_column(GUID, primary_key=True)
+    """The recipe's id"""
+
+    size: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=0)
@@ -1 +1,3 @@
+from .job import *
+from .scheduler import *
 from .task import *
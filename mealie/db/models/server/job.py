@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mealie.db.models._model_base import SqlAlchemyBase
+from mealie.db.models._model_utils.datetime import NaiveDateTime, get_utc_now
+from mealie.db.models._model_utils.guid import GUID
+
+
+class JobModel(SqlAlchemyBase):
+    """
+    A long-running operation (e.g. a bulk URL import or a backup), queued to be run by a job worker.
+    Jobs aren't deleted with their group, so the group and report are only referenced by id.
+    """
+
+    __tablename__ = "jobs"
+    id: Mapped[GUID] = mapped_column(GUID, primary_key=True, default=GUID.generate)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[str] = mapped_column(String, nullable=False)
+    """The job's arguments, as JSON"""
+    status: Mapped[str] = mapped_column(String, nullable=False, index=True)
+
+    group_id: Mapped[GUID | None] = mapped_column(GUID, nullable=True, index=True)
+    report_id: Mapped[GUID | None] = mapped_column(GUID, nullable=True)
+
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    error: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    run_after: Mapped[datetime] = mapped_column(NaiveDateTime, nullable=False, default=get_utc_now)
+    """The job isn't started before this time"""
+    worker: Mapped[str | None] = mapped_column(String, nullable=True)
+    """The job worker running the job"""
+    heartbeat_at: Mapped[datetime | None] = mapped_column(NaiveDateTime, nullable=True)
+    """Last time the job's worker reported that it's still running the job"""
+    started_at: Mapped[datetime | None] = mapped_column(NaiveDateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(NaiveDateTime, nullable=True)
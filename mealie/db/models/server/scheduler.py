@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mealie.db.models._model_base import SqlAlchemyBase
+from mealie.db.models._model_utils.datetime import NaiveDateTime
+
+
+class SchedulerLeaseModel(SqlAlchemyBase):
+    """
+    The lease held by the worker that runs the scheduled tasks. On Postgres the lease is an advisory lock,
+    and this row is only kept up to date to show which worker holds it.
+    """
+
+    __tablename__ = "scheduler_leases"
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    holder: Mapped[str] = mapped_column(String, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(NaiveDateTime, nullable=False)
+
+
+class ScheduledTaskModel(SqlAlchemyBase):
+    """The schedule and last run of each scheduled task, by the name of the task's function"""
+
+    __tablename__ = "scheduled_tasks"
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    schedule: Mapped[str] = mapped_column(String, nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(NaiveDateTime, nullable=False)
+
+    last_run_at: Mapped[datetime | None] = mapped_column(NaiveDateTime, nullable=True)
+    last_duration: Mapped[float | None] = mapped_column(Float, nullable=True)
+    """Duration of the last run, in seconds"""
+    last_status: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
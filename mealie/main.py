@@ -1,10 +1,12 @@
+import argparse
+
 import uvicorn
 
 from mealie.app import settings
 from mealie.core.logger.config import log_config
 
 
-def main():
+def run_api():
     uvicorn.run(
         "mealie.app:app",
         host=settings.API_HOST,
@@ -18,5 +20,31 @@ def main():
     )
 
 
+def run_job_worker():
+    import mealie.db.init_db as init_db
+    from mealie.services.jobs.job_worker import run_worker
+
+    # the API migrates the database; starting before it has could run jobs against an old schema
+    init_db.wait_for_migrations()
+    run_worker()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="mealie")
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["api", "worker"],
+        default="api",
+        help="run the API (the default), or a job worker that only runs queued jobs",
+    )
+    args = parser.parse_args()
+
+    if args.mode == "worker":
+        run_job_worker()
+    else:
+        run_api()
+
+
 if __name__ == "__main__":
     main()
@@ -1,4 +1,6 @@
+import math
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
@@ -45,6 +47,15 @@ class MinifierOptions:
     miniature: bool = True
     tiny: bool = True
 
+    original_max_size: int = 0
+    """
+    The maximum width/height of the original image; 0 keeps the full resolution. The uploaded file is purged
+    after it's converted, so a downscaled original is all that's left of the image
+    """
+    miniature_max_size: int = 600
+    tiny_max_size: int = 300
+    quality: int = 70
+
 
 class ABCMinifier(ABC):
     def __init__(self, purge=False, opts: MinifierOptions | None = None, logger: Logger | None = None):
@@ -98,16 +109,35 @@ class PillowMinifier(ABCMinifier):
         return PillowMinifier._convert_image(image_file, WEBP, dest, quality)
 
     @staticmethod
-    def crop_center(pil_img: Image, crop_width=300, crop_height=300):
-        img_width, img_height = pil_img.size
-        return pil_img.crop(
-            (
-                (img_width - crop_width) // 2,
-                (img_height - crop_height) // 2,
-                (img_width + crop_width) // 2,
-                (img_height + crop_height) // 2,
-            )
-        )
+    def _open_image(image_file: Path, max_size: int, image_format: ImageFormat = WEBP) -> Image.Image:
+        """
+        Decodes an image once, converted to `image_format`'s mode. If the image will be shrunk to at most
+        `max_size` anyway, JPEGs are decoded at a reduced scale (draft mode), which is a lot faster
+        """
+
+        with Image.open(image_file) as img:
+            if max_size and img.format == "JPEG":
+                scale = max_size / max(img.size)
+                if scale < 1:
+                    img.draft("RGB", (math.ceil(img.width * scale), math.ceil(img.height * scale)))
+
+            transposed = ImageOps.exif_transpose(img)
+            if transposed.mode not in image_format.modes:
+                transposed = transposed.convert(image_format.modes[0])
+
+            transposed.load()
+            return transposed
+
+    @staticmethod
+    def _resize(img: Image.Image, max_size: int) -> Image.Image:
+        """Downscales an image to fit in a `max_size` square, keeping its aspect ratio. Never upscales"""
+
+        if not max_size or max(img.size) <= max_size:
+            return img
+
+        resized = img.copy()
+        resized.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        return resized
 
     def minify(self, image_file: Path, force=True):
         if not image_file.exists():
@@ -121,33 +151,54 @@ class PillowMinifier(ABCMinifier):
             self._logger.info(f"{image_file.name} already minified")
             return
 
-        success = False
-
-        if self._opts.original:
-            if not force and org_dest.exists():
+        # the size ladder, from largest to smallest
+        variants: list[tuple[Path, int]] = []
+        for enabled, dest, max_size in [
+            (self._opts.original, org_dest, self._opts.original_max_size),
+            (self._opts.miniature, min_dest, self._opts.miniature_max_size),
+            (self._opts.tiny, tiny_dest, self._opts.tiny_max_size),
+        ]:
+            if not enabled:
+                continue
+
+            if not force and dest.exists():
                 self._logger.info(f"{image_file.name} already minified")
-            else:
-                PillowMinifier.to_webp(image_file, org_dest, quality=70)
-                success = True
+                continue
 
-        if self._opts.miniature:
-            if not force and min_dest.exists():
-                self._logger.info(f"{image_file.name} already minified")
-            else:
-                PillowMinifier.to_webp(image_file, min_dest, quality=70)
-                self._logger.info(f"{image_file.name} minified")
-                success = True
+            variants.append((dest, max_size))
 
-        if self._opts.tiny:
-            if not force and tiny_dest.exists():
-                self._logger.info(f"{image_file.name} already minified")
-            else:
-                img = Image.open(image_file)
-                img = ImageOps.exif_transpose(img)
-                tiny_image = PillowMinifier.crop_center(img)
-                tiny_image.save(tiny_dest, WEBP.format, quality=70)
-                self._logger.info("Tiny image saved")
-                success = True
-
-        if self._purge and success:
+        if not variants:
+            return
+
+        # 0 means full resolution, so only decode at a reduced scale if every variant is resized
+        largest_size = 0 if any(not max_size for _, max_size in variants) else max(size for _, size in variants)
+        img = self._open_image(image_file, largest_size)
+
+        # each variant is downscaled from the previous (larger) one, rather than from the full image
+        images: list[tuple[Path, Image.Image]] = []
+        for dest, max_size in variants:
+            resized = self._resize(img, max_size)
+
+            # don't re-encode the source (e.g. when regenerating from original.webp) unless it actually shrinks
+            if dest == image_file and resized is img and image_file.suffix == WEBP.suffix:
+                continue
+
+            # saving an image isn't thread-safe, so each variant needs its own copy of an image that didn't shrink
+            if any(image is resized for _, image in images):
+                resized = resized.copy()
+
+            images.append((dest, resized))
+            img = resized
+
+        def save(dest: Path, image: Image.Image) -> None:
+            image.save(dest, WEBP.format, quality=self._opts.quality)
+
+        # encoding releases the GIL, so the variants are written in parallel
+        with ThreadPoolExecutor(max_workers=max(1, len(images))) as executor:
+            for future in [executor.submit(save, dest, image) for dest, image in images]:
+                future.result()
+
+        self._logger.info(f"{image_file.name} minified")
+
+        if self._purge:
             self.purge(image_file)
@@ -24,17 +24,29 @@ def pretty_size(size: int) -> str:
 
 def get_dir_size(path: Path | str) -> int:
     """
-    Get the size of a directory
+    Get the size of a directory, including all of its files and subdirectories
     """
     try:
         total_size = os.path.getsize(path)
     except FileNotFoundError:
         return 0
 
-    for item in os.listdir(path):
-        itempath = os.path.join(path, item)
-        if os.path.isfile(itempath):
-            total_size += os.path.getsize(itempath)
-        elif os.path.isdir(itempath):
-            total_size += get_dir_size(itempath)
+    # os.scandir gets each entry's type from the directory listing, so each entry only
+    # needs a single stat call for its size
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            total_size += entry.stat().st_size
+                        elif entry.is_dir():
+                            total_size += entry.stat().st_size
+                            stack.append(entry.path)
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            continue
+
     return total_size
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import random
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from math import ceil
@@ -8,18 +7,32 @@ from typing import Any, Generic, TypeVar
 
 from fastapi import HTTPException
 from pydantic import UUID4, BaseModel
-from sqlalchemy import ColumnElement, Select, case, delete, func, nulls_first, nulls_last, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    false,
+    func,
+    nulls_first,
+    nulls_last,
+    or_,
+    select,
+)
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql import sqltypes
 
 from mealie.core.root_logger import get_logger
 from mealie.db.models._model_base import SqlAlchemyBase
+from mealie.db.models._model_utils.seeded_random import seeded_random
 from mealie.schema._mealie import MealieModel
 from mealie.schema.response.pagination import (
+    CursorDirection,
     OrderByNullPosition,
     OrderDirection,
     PaginationBase,
+    PaginationCursor,
     PaginationQuery,
     RequestQuery,
 )
@@ -329,6 +342,13 @@ class RepositoryGeneric(Generic[Schema, Model]):
             # default ordering if not searching
             pagination_result.order_by = "created_at"
 
+        if pagination_result.is_cursor_mode:
+            data, cursor_page = self.execute_cursor_pagination_query(q, pagination_result, eff_schema.loader_options())
+            return PaginationBase(
+                **cursor_page.model_dump(exclude={"items"}),
+                items=[eff_schema.model_validate(s) for s in data],
+            )
+
         q, count, total_pages = self.add_pagination_to_query(q, pagination_result)
 
         # Apply options late, so they do not get used for counting
@@ -347,6 +367,22 @@ class RepositoryGeneric(Generic[Schema, Model]):
             items=[eff_schema.model_validate(s) for s in data],
         )
 
+    def _add_query_filter_to_query(self, query: Select, pagination: PaginationQuery) -> Select:
+        if not pagination.query_filter:
+            return query
+
+        try:
+            query_filter_builder = QueryFilterBuilder(pagination.query_filter)
+            return query_filter_builder.filter_query(query, model=self.model, column_aliases=self.column_aliases)
+
+        except ValueError as e:
+            self.logger.error(e)
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    def _count_query(self, query: Select) -> int:
+        count_query = select(func.count()).select_from(query.subquery())
+        return self.session.scalar(count_query) or 0
+
     def add_pagination_to_query(self, query: Select, pagination: PaginationQuery) -> tuple[Select, int, int]:
         """
         Adds pagination data to an existing query.
@@ -357,19 +393,8 @@ class RepositoryGeneric(Generic[Schema, Model]):
             - total_pages - the total number of pages in the query
         """
 
-        if pagination.query_filter:
-            try:
-                query_filter_builder = QueryFilterBuilder(pagination.query_filter)
-                query = query_filter_builder.filter_query(query, model=self.model, column_aliases=self.column_aliases)
-
-            except ValueError as e:
-                self.logger.error(e)
-                raise HTTPException(status_code=400, detail=str(e)) from e
-
-        count_query = select(func.count()).select_from(query.subquery())
-        count = self.session.scalar(count_query)
-        if not count:
-            count = 0
+        query = self._add_query_filter_to_query(query, pagination)
+        count = self._count_query(query)
 
         # interpret -1 as "get_all"
         if pagination.per_page == -1:
@@ -391,6 +416,204 @@ class RepositoryGeneric(Generic[Schema, Model]):
         query = self.add_order_by_to_query(query, pagination)
         return query.limit(pagination.per_page).offset((pagination.page - 1) * pagination.per_page), count, total_pages
 
+    def execute_cursor_pagination_query(
+        self, query: Select, pagination: PaginationQuery, loader_options: list
+    ) -> tuple[list[Model], PaginationBase[Any]]:
+        """
+        Executes a keyset (cursor) paginated query. Rather than counting every matching row and skipping
+        `OFFSET` rows, the page is selected with a `WHERE (order_by..., id) > (cursor values...)` predicate,
+        so every page costs about the same as the first one.
+
+        The total count is only calculated when `include_total` is set on the pagination query.
+
+        :returns:
+            - data - the model instances for this page
+            - page - pagination metadata (with no items) including the next/previous cursors
+        """
+
+        query = self._add_query_filter_to_query(query, pagination)
+        count = total_pages = -1
+        if pagination.include_total:
+            count = self._count_query(query)
+
+        # keyset pagination relies on a strict ordering, so we drop any ordering applied by search
+        query = query.order_by(None)
+        if not pagination.order_by:
+            pagination.order_by = "created_at"
+
+        query, sort_keys = self._get_cursor_sort_keys(query, pagination)
+        signature = self._get_cursor_signature(pagination)
+
+        cursor: PaginationCursor | None = None
+        if pagination.cursor:
+            try:
+                cursor = PaginationCursor.decode(pagination.cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+
+            if cursor.signature != signature or len(cursor.values) != len(sort_keys):
+                raise HTTPException(status_code=400, detail="pagination cursor does not match the requested ordering")
+
+        # when paging backwards, we walk the ordering in reverse and flip the results afterwards
+        backwards = cursor is not None and cursor.direction is CursorDirection.previous
+        if backwards:
+            sort_keys = [
+                (
+                    expr,
+                    OrderDirection.asc if order_dir is OrderDirection.desc else OrderDirection.desc,
+                    OrderByNullPosition.first if null_pos is OrderByNullPosition.last else OrderByNullPosition.last,
+                )
+                for expr, order_dir, null_pos in sort_keys
+            ]
+
+        if cursor is not None:
+            query = query.where(self._get_keyset_filter(sort_keys, cursor.values))
+
+        for expr, order_dir, null_pos in sort_keys:
+            order_expr = expr.asc() if order_dir is OrderDirection.asc else expr.desc()
+            query = query.order_by(
+                nulls_first(order_expr) if null_pos is OrderByNullPosition.first else nulls_last(order_expr)
+            )
+
+        # select the sort keys alongside the model so we can build cursors from the page boundaries
+        query = query.add_columns(*[expr.label(f"cursor_key_{i}") for i, (expr, _, _) in enumerate(sort_keys)])
+
+        # fetch one extra row to find out if there's another page without counting
+        if pagination.per_page > 0:
+            query = query.limit(pagination.per_page + 1)
+
+        query = query.options(*loader_options)
+        try:
+            rows = list(self.session.execute(query).unique().all())
+        except Exception as e:
+            self._log_exception(e)
+            self.session.rollback()
+            raise e
+
+        has_more = pagination.per_page > 0 and len(rows) > pagination.per_page
+        if has_more:
+            rows = rows[: pagination.per_page]
+        if backwards:
+            rows.reverse()
+
+        def build_cursor(row, direction: CursorDirection) -> str:
+            return PaginationCursor(values=list(row[1:]), direction=direction, signature=signature).encode()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if has_more or backwards:
+                next_cursor = build_cursor(rows[-1], CursorDirection.next)
+            if (has_more and backwards) or (cursor is not None and not backwards):
+                prev_cursor = build_cursor(rows[0], CursorDirection.previous)
+
+        if count >= 0:
+            try:
+                total_pages = ceil(count / pagination.per_page) if pagination.per_page > 0 else int(bool(count))
+            except ZeroDivisionError:
+                total_pages = 0
+
+        page: PaginationBase[Any] = PaginationBase(
+            page=pagination.page,
+            per_page=pagination.per_page,
+            total=count,
+            total_pages=total_pages,
+            items=[],
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+        return [row[0] for row in rows], page
+
+    def _get_cursor_signature(self, pagination: PaginationQuery) -> str:
+        null_position = pagination.order_by_null_position or OrderByNullPosition.last
+        signature = f"{pagination.order_by}|{pagination.order_direction.value}|{null_position.value}"
+        if pagination.order_by == "random":
+            signature += f"|{pagination.pagination_seed}"
+
+        return signature
+
+    def _get_cursor_sort_keys(
+        self, query: Select, pagination: PaginationQuery
+    ) -> tuple[Select, list[tuple[ColumnElement, OrderDirection, OrderByNullPosition]]]:
+        """
+        Resolves the order_by string into the list of expressions the keyset is built from. The primary key
+        is always appended as a tiebreaker, and nulls are placed explicitly so the ordering is identical
+        across databases.
+        """
+
+        # databases disagree on where nulls go by default, so cursor mode always picks a side
+        null_position = pagination.order_by_null_position or OrderByNullPosition.last
+
+        sort_keys: list[tuple[ColumnElement, OrderDirection, OrderByNullPosition]] = []
+        if pagination.order_by == "random":
+            random_key = seeded_random(self.model.id, pagination.pagination_seed or self._random_seed())
+            sort_keys.append((random_key, OrderDirection.asc, null_position))
+            sort_keys.append((self.model.id, OrderDirection.asc, null_position))
+            return query, sort_keys
+
+        for order_by_val in (pagination.order_by or "").split(","):
+            try:
+                order_by, order_dir = self._parse_order_by_value(order_by_val, pagination)
+                _, order_attr, query = QueryFilterBuilder.get_model_and_model_attr_from_attr_string(
+                    order_by, self.model, query=query
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f'Invalid order_by statement "{pagination.order_by}": "{order_by_val}" is invalid',
+                ) from e
+
+            sort_keys.append((self._get_order_attr_expression(order_attr), order_dir, null_position))
+
+        tiebreaker_dir = sort_keys[-1][1] if sort_keys else pagination.order_direction
+        sort_keys.append((self.model.id, tiebreaker_dir, null_position))
+        return query, sort_keys
+
+    @staticmethod
+    def _get_keyset_filter(
+        sort_keys: list[tuple[ColumnElement, OrderDirection, OrderByNullPosition]], values: list[Any]
+    ) -> ColumnElement:
+        """
+        Builds the row-value comparison `(k1, k2, ..., id) > (v1, v2, ..., id)` by hand, since it needs
+        to respect mixed directions and null positions:
+
+        `(k1 after v1) OR (k1 = v1 AND k2 after v2) OR ...`
+        """
+
+        def is_after(expr: ColumnElement, order_dir: OrderDirection, null_pos: OrderByNullPosition, value: Any):
+            if value is None:
+                return expr.is_not(None) if null_pos is OrderByNullPosition.first else false()
+
+            after = expr > value if order_dir is OrderDirection.asc else expr < value
+            return or_(after, expr.is_(None)) if null_pos is OrderByNullPosition.last else after
+
+        def is_equal(expr: ColumnElement, value: Any):
+            return expr.is_(None) if value is None else expr == value
+
+        clauses: list[ColumnElement] = []
+        for i, (expr, order_dir, null_pos) in enumerate(sort_keys):
+            equal_to_previous = [is_equal(prev_expr, values[j]) for j, (prev_expr, _, _) in enumerate(sort_keys[:i])]
+            clauses.append(and_(*equal_to_previous, is_after(expr, order_dir, null_pos, values[i])))
+
+        return or_(*clauses)
+
+    def _get_order_attr_expression(self, order_attr: InstrumentedAttribute) -> ColumnElement:
+        order_attr = self.column_aliases.get(order_attr.key, order_attr)
+
+        # queries handle uppercase and lowercase differently, which is undesirable
+        if isinstance(order_attr.type, sqltypes.String):
+            order_attr = func.lower(order_attr)
+
+        return order_attr
+
+    @staticmethod
+    def _parse_order_by_value(order_by_val: str, request_query: RequestQuery) -> tuple[str, OrderDirection]:
+        order_by_val = order_by_val.strip()
+        if ":" in order_by_val:
+            order_by, order_dir_val = order_by_val.split(":")
+            return order_by, OrderDirection(order_dir_val)
+
+        return order_by_val, request_query.order_direction
+
     def add_order_attr_to_query(
         self,
         query: Select,
@@ -398,11 +621,7 @@ class RepositoryGeneric(Generic[Schema, Model]):
         order_dir: OrderDirection,
         order_by_null: OrderByNullPosition | None,
     ) -> Select:
-        order_attr = self.column_aliases.get(order_attr.key, order_attr)
-
-        # queries handle uppercase and lowercase differently, which is undesirable
-        if isinstance(order_attr.type, sqltypes.String):
-            order_attr = func.lower(order_attr)
+        order_attr = self._get_order_attr_expression(order_attr)
 
         if order_dir is OrderDirection.asc:
             order_attr = order_attr.asc()
@@ -421,31 +640,12 @@ class RepositoryGeneric(Generic[Schema, Model]):
             return query
 
         elif request_query.order_by == "random":
-            # randomize outside of database, since not all db's can set random seeds
-            # this solution is db-independent & stable to paging
-            temp_query = query.with_only_columns(self.model.id)
-            allids = self.session.execute(temp_query).scalars().all()  # fast because id is indexed
-            if not allids:
-                return query
-
-            order = list(range(len(allids)))
-            random.seed(request_query.pagination_seed)
-            random.shuffle(order)
-            random_dict = dict(zip(allids, order, strict=True))
-            case_stmt = case(random_dict, value=self.model.id)
-            return query.order_by(case_stmt)
+            return self.add_random_order_to_query(query, request_query.pagination_seed or self._random_seed())
 
         else:
             for order_by_val in request_query.order_by.split(","):
                 try:
-                    order_by_val = order_by_val.strip()
-                    if ":" in order_by_val:
-                        order_by, order_dir_val = order_by_val.split(":")
-                        order_dir = OrderDirection(order_dir_val)
-                    else:
-                        order_by = order_by_val
-                        order_dir = request_query.order_direction
-
+                    order_by, order_dir = self._parse_order_by_value(order_by_val, request_query)
                     _, order_attr, query = QueryFilterBuilder.get_model_and_model_attr_from_attr_string(
                         order_by, self.model, query=query
                     )
@@ -462,6 +662,14 @@ class RepositoryGeneric(Generic[Schema, Model]):
 
             return query
 
+    def add_random_order_to_query(self, query: Select, seed: str) -> Select:
+        """
+        Shuffles the query in the database by ordering on a hash of each row's id and the seed.
+        Not all databases can seed their random function, but this is db-independent, stable across
+        pages for the same seed, and doesn't need to load the matching ids into memory.
+        """
+        return query.order_by(seeded_random(self.model.id, seed), self.model.id)
+
     def add_search_to_query(self, query: Select, schema: type[Schema], search: str) -> Select:
         search_filter = SearchFilter(self.session, search, schema._normalize_search)
         return search_filter.filter_query_by_search(query, schema, self.model)
@@ -1,5 +1,6 @@
 import re as re
 from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
 from random import randint
 from typing import Self, cast
 from uuid import UUID
@@ -12,11 +13,12 @@ from sqlalchemy import orm
 from sqlalchemy.exc import IntegrityError
 
 from mealie.db.models.household import Household, HouseholdToRecipe
-from mealie.db.models.recipe.category import Category
+from mealie.db.models.recipe.category import Category, recipes_to_categories
 from mealie.db.models.recipe.ingredient import RecipeIngredientModel, households_to_ingredient_foods
 from mealie.db.models.recipe.recipe import RecipeModel
+from mealie.db.models.recipe.search_index import update_recipe_search_index
 from mealie.db.models.recipe.settings import RecipeSettings
-from mealie.db.models.recipe.tag import Tag
+from mealie.db.models.recipe.tag import Tag, recipes_to_tags
 from mealie.db.models.recipe.tool import Tool, households_to_tools, recipes_to_tools
 from mealie.db.models.users.user_to_recipe import UserToRecipe
 from mealie.db.models.users.users import User
@@ -103,6 +105,58 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
                 if i >= max_retries:
                     raise
 
+    def _add_in_savepoint(self, document: Recipe) -> RecipeModel:
+        """Adds a new recipe in a savepoint, renaming it like `create` if its slug is already taken"""
+
+        max_retries = 10
+        original_name: str = document.name  # type: ignore
+
+        retries = 0
+        while True:
+            try:
+                with self.session.begin_nested():
+                    new_document = self.model(session=self.session, **document.model_dump())
+                    self.session.add(new_document)
+
+                return new_document
+            except IntegrityError:
+                retries += 1
+                if retries > max_retries:
+                    raise
+
+                document.name = f"{original_name} ({retries})"
+                document.slug = slugify(document.name)
+
+    def create_batch(self, documents: Iterable[Recipe]) -> list[Recipe | Exception]:
+        """
+        Creates the recipes in a single transaction. Each recipe is added in its own savepoint, so a recipe that
+        fails to save doesn't affect the others; its exception is returned in place of the recipe.
+        """
+
+        new_documents: list[RecipeModel | Exception] = []
+        for document in documents:
+            try:
+                new_documents.append(self._add_in_savepoint(document))
+            except Exception as e:
+                self._log_exception(e)
+                new_documents.append(e)
+
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # load the new recipes together, rather than refreshing (and lazy loading) them one at a time
+        ids = [document.id for document in new_documents if isinstance(document, RecipeModel)]
+        stmt = self._query().where(self.model.id.in_(ids)).execution_options(populate_existing=True)
+        recipes = {recipe.id: recipe for recipe in self.session.execute(stmt).unique().scalars()}
+
+        return [
+            document if isinstance(document, Exception) else self.schema.model_validate(recipes[document.id])
+            for document in new_documents
+        ]
+
     def _delete_recipe(self, recipe: RecipeModel) -> Recipe:
         recipe_as_model = self.schema.model_validate(recipe)
 
@@ -133,14 +187,20 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
     def delete_many(self, values: Iterable) -> list[Recipe]:
         query = self._query().filter(self.model.id.in_(values))
         recipes_in_db = self.session.execute(query).unique().scalars().all()
-        results: list[Recipe] = []
-
-        # we create a delete statement for each row
-        # we don't delete the whole query in one statement because postgres doesn't cascade correctly
-        for recipe_in_db in recipes_in_db:
-            results.append(self._delete_recipe(recipe_in_db))
+        results = [self.schema.model_validate(recipe) for recipe in recipes_in_db]
 
         try:
+            # first remove UserToRecipe entries (and expire the recipes) so we don't run into stale data errors
+            recipe_ids = [recipe.id for recipe in recipes_in_db]
+            self.session.execute(sa.delete(UserToRecipe).where(UserToRecipe.recipe_id.in_(recipe_ids)))
+            for recipe_in_db in recipes_in_db:
+                self.session.expire(recipe_in_db)
+
+            # we create a delete statement for each row
+            # we don't delete the whole query in one statement because postgres doesn't cascade correctly
+            for recipe_in_db in recipes_in_db:
+                self.session.delete(recipe_in_db)
+
             self.session.commit()
         except Exception as e:
             self.session.rollback()
@@ -148,6 +208,79 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
 
         return results
 
+    def get_ids_by_slugs(self, slugs: Sequence[str]) -> dict[str, UUID4]:
+        """Maps each of `slugs` to its recipe's id; slugs that aren't found are left out"""
+
+        if not slugs:
+            return {}
+
+        stmt = sa.select(RecipeModel.slug, RecipeModel.id).filter(RecipeModel.slug.in_(slugs))
+        if self.group_id:
+            stmt = stmt.filter(RecipeModel.group_id == self.group_id)
+        if self.household_id:
+            stmt = stmt.filter(RecipeModel.household_id == self.household_id)
+
+        return dict(self.session.execute(stmt).tuples().all())
+
+    def _touch(self, recipe_ids: Sequence[UUID4]) -> None:
+        stmt = sa.update(RecipeModel).where(RecipeModel.id.in_(recipe_ids)).values(date_updated=datetime.now(UTC))
+        self.session.execute(stmt, execution_options={"synchronize_session": False})
+
+    def _add_to_collection(
+        self,
+        table: sa.Table,
+        column: str,
+        model: type[Category] | type[Tag],
+        recipe_ids: Sequence[UUID4],
+        item_ids: Sequence[UUID4],
+        update_search_index: bool = False,
+    ) -> None:
+        """
+        Links every recipe to every item (a category or tag) with a single `INSERT ... SELECT`, skipping
+        links that already exist and items from other groups.
+
+        The insert bypasses the ORM, so the search index isn't updated by its flush listeners;
+        set `update_search_index` if the items are indexed
+        """
+
+        exists = sa.exists().where(table.c.recipe_id == RecipeModel.id, table.c[column] == model.id)
+        links = sa.select(RecipeModel.id, model.id).where(
+            RecipeModel.id.in_(recipe_ids),
+            model.id.in_(item_ids),
+            model.group_id == RecipeModel.group_id,
+            ~exists,
+        )
+
+        try:
+            self.session.execute(sa.insert(table).from_select(["recipe_id", column], links))
+            self._touch(recipe_ids)
+            if update_search_index:
+                update_recipe_search_index(self.session.connection(), recipe_ids)
+
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def add_categories(self, recipe_ids: Sequence[UUID4], category_ids: Sequence[UUID4]) -> None:
+        self._add_to_collection(recipes_to_categories, "category_id", Category, recipe_ids, category_ids)
+
+    def add_tags(self, recipe_ids: Sequence[UUID4], tag_ids: Sequence[UUID4]) -> None:
+        self._add_to_collection(recipes_to_tags, "tag_id", Tag, recipe_ids, tag_ids, update_search_index=True)
+
+    def update_settings(self, recipe_ids: Sequence[UUID4], settings: dict[str, bool]) -> None:
+        """Sets the given settings columns on all recipes in one statement"""
+
+        stmt = sa.update(RecipeSettings).where(RecipeSettings.recipe_id.in_(recipe_ids)).values(**settings)
+
+        try:
+            self.session.execute(stmt, execution_options={"synchronize_session": False})
+            self._touch(recipe_ids)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
     def update_image(self, slug: str, _: str | None = None) -> int:
         entry: RecipeModel = self._query_one(match_value=slug)
         entry.image = randint(0, 255)
@@ -207,7 +340,15 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
         require_all_tools=True,
         require_all_foods=True,
         search: str | None = None,
+        lean: bool = False,
     ) -> RecipePagination:
+        """
+        Pages through the recipes as `RecipeSummary`s. With `lean`, only the columns that `RecipeSummary`
+        serializes are loaded; the returned models are the same either way
+        """
+
+        loader_options = RecipeSummary.lean_loader_options() if lean else RecipeSummary.loader_options()
+
         # Copy this, because calling methods (e.g. tests) might rely on it not getting mutated
         pagination_result = pagination.model_copy()
         q = sa.select(self.model)
@@ -246,10 +387,18 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
             # default ordering if not searching
             pagination_result.order_by = "created_at"
 
+        if pagination_result.is_cursor_mode:
+            self.logger.debug(f"Recipe Cursor Pagination Query: {pagination_result}")
+            data, cursor_page = self.execute_cursor_pagination_query(q, pagination_result, loader_options)
+            return RecipePagination(
+                **cursor_page.model_dump(exclude={"items"}),
+                items=[RecipeSummary.model_validate(item) for item in data],
+            )
+
         q, count, total_pages = self.add_pagination_to_query(q, pagination_result)
 
         # Apply options late, so they do not get used for counting
-        q = q.options(*RecipeSummary.loader_options())
+        q = q.options(*loader_options)
         try:
             self.logger.debug(f"Recipe Pagination Query: {pagination_result}")
             data = self.session.execute(q).scalars().unique().all()
@@ -330,7 +479,7 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
         return fltr
 
     def get_random(self, limit=1) -> list[Recipe]:
-        stmt = sa.select(RecipeModel).order_by(sa.func.random()).limit(limit)  # Postgres and SQLite specific
+        stmt = self.add_random_order_to_query(sa.select(RecipeModel), self._random_seed()).limit(limit)
         if self.group_id:
             stmt = stmt.filter(RecipeModel.group_id == self.group_id)
         if self.household_id:
@@ -345,6 +494,16 @@ class RepositoryRecipes(HouseholdRepositoryGeneric[Recipe, RecipeModel]):
             return None
         return self.schema.model_validate(dbrecipe)
 
+    def get_by_slugs(self, group_id: UUID4, slugs: Sequence[str]) -> list[Recipe]:
+        """Loads the recipes matching `slugs` in one query; slugs that aren't found are left out"""
+
+        if not slugs:
+            return []
+
+        fltr = self._filter_builder(group_id=group_id)
+        stmt = self._query().filter_by(**fltr).filter(RecipeModel.slug.in_(slugs))
+        return [self.schema.model_validate(x) for x in self.session.execute(stmt).unique().scalars().all()]
+
     def all_ids(self, group_id: UUID4) -> Sequence[UUID4]:
         stmt = sa.select(RecipeModel.id).filter(RecipeModel.group_id == group_id)
         return self.session.execute(stmt).scalars().all()
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
 from logging import Logger
 from pathlib import Path
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
 
 from mealie.core.root_logger import get_logger
+from mealie.db.models._model_base import SqlAlchemyBase
+from mealie.db.models.recipe.ingredient import IngredientFoodModel, IngredientUnitModel
 from mealie.repos.repository_factory import AllRepositories
+from mealie.schema.group.group_seeder import SeederResult
+from mealie.services.parser_services.alias_index import get_alias_index_cache
 
 
 class AbstractSeeder(ABC):
@@ -21,5 +28,35 @@ class AbstractSeeder(ABC):
         self.logger = logger or get_logger("Data Seeder")
         self.resources = Path(__file__).parent / "resources"
 
+    def insert_many(self, model: type[SqlAlchemyBase], rows: list[dict[str, Any]]) -> tuple[SeederResult, list]:
+        """
+        Inserts the rows with multi-row INSERT statements, skipping any row that conflicts with an existing one
+        (i.e. the group already has an item with the same name). Returns the counts, and the ids of the new rows.
+
+        The rows are inserted as-is, so they must include any values that the model's `__init__` would compute
+        (e.g. the normalized names). They also bypass the ORM events that invalidate the parser's alias index
+        cache, so new foods and units invalidate it here.
+        """
+        if not rows:
+            return SeederResult(), []
+
+        session = self.repos.session
+        insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+        # executing with a list of rows lets SQLAlchemy batch them into as few multi-row statements as possible
+        stmt = insert(model.__table__).on_conflict_do_nothing().returning(model.__table__.c.id)
+        try:
+            ids = list(session.execute(stmt, rows).scalars())
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        if ids and model in (IngredientFoodModel, IngredientUnitModel):
+            for group_id in {row["group_id"] for row in rows}:
+                get_alias_index_cache().invalidate(group_id)
+
+        return SeederResult(inserted=len(ids), skipped=len(rows) - len(ids)), ids
+
     @abstractmethod
-    def seed(self, locale: str | None = None) -> None: ...
+    def seed(self, locale: str | None = None) -> SeederResult: ...
@@ -1,9 +1,15 @@
 import json
 import pathlib
 from collections.abc import Generator
-from functools import cached_property
+from functools import cached_property, lru_cache
+from typing import Any
 
-from mealie.schema.labels import MultiPurposeLabelSave
+from sqlalchemy import select
+
+from mealie.db.models.labels import MultiPurposeLabel
+from mealie.db.models.recipe.ingredient import IngredientFoodModel, IngredientUnitModel
+from mealie.schema.group.group_seeder import SeederResult
+from mealie.schema.labels import MultiPurposeLabelOut, MultiPurposeLabelSave
 from mealie.schema.recipe.recipe_ingredient import SaveIngredientFood, SaveIngredientUnit
 from mealie.services.group_services.labels_service import MultiPurposeLabelService
 
@@ -11,6 +17,12 @@ from ._abstract_seeder import AbstractSeeder
 from .resources import foods, labels, units
 
 
+@lru_cache
+def load_resource(file: pathlib.Path) -> Any:
+    """Parses a seed file. The result is shared between groups, so it must not be modified"""
+    return json.loads(file.read_text(encoding="utf-8"))
+
+
 class MultiPurposeLabelSeeder(AbstractSeeder):
     @cached_property
     def service(self):
@@ -24,7 +36,7 @@ class MultiPurposeLabelSeeder(AbstractSeeder):
         file = self.get_file(locale)
 
         seen_label_names = set()
-        for label in json.loads(file.read_text(encoding="utf-8")):
+        for label in load_resource(file):
             if label["name"] in seen_label_names:
                 continue
 
@@ -34,13 +46,18 @@ class MultiPurposeLabelSeeder(AbstractSeeder):
                 group_id=self.repos.group_id,
             )
 
-    def seed(self, locale: str | None = None) -> None:
+    def seed(self, locale: str | None = None) -> SeederResult:
         self.logger.info("Seeding MultiPurposeLabel")
-        for label in self.load_data(locale):
-            try:
-                self.service.create_one(label)
-            except Exception as e:
-                self.logger.error(e)
+        rows = [label.model_dump(include={"name", "color", "group_id"}) for label in self.load_data(locale)]
+        result, ids = self.insert_many(MultiPurposeLabel, rows)
+
+        if ids:
+            stmt = select(MultiPurposeLabel).where(MultiPurposeLabel.id.in_(ids))
+            new_labels = [MultiPurposeLabelOut.model_validate(x) for x in self.repos.session.scalars(stmt)]
+            self.service.update_shopping_list_label_references(new_labels)
+
+        self.logger.info(f"Seeded {result.inserted} labels ({result.skipped} already existed)")
+        return result
 
 
 class IngredientUnitsSeeder(AbstractSeeder):
@@ -52,7 +69,7 @@ class IngredientUnitsSeeder(AbstractSeeder):
         file = self.get_file(locale)
 
         seen_unit_names = set()
-        for unit in json.loads(file.read_text(encoding="utf-8")).values():
+        for unit in load_resource(file).values():
             if unit["name"] in seen_unit_names:
                 continue
 
@@ -66,13 +83,21 @@ class IngredientUnitsSeeder(AbstractSeeder):
                 plural_abbreviation=unit.get("plural_abbreviation"),
             )
 
-    def seed(self, locale: str | None = None) -> None:
+    def seed(self, locale: str | None = None) -> SeederResult:
         self.logger.info("Seeding Ingredient Units")
+        rows = []
         for unit in self.load_data(locale):
-            try:
-                self.repos.ingredient_units.create(unit)
-            except Exception as e:
-                self.logger.error(e)
+            row = unit.model_dump(
+                include={"group_id", "name", "plural_name", "description", "abbreviation", "plural_abbreviation"}
+            )
+            for key in ["name", "plural_name", "abbreviation", "plural_abbreviation"]:
+                row[f"{key}_normalized"] = IngredientUnitModel.normalize(row[key]) if row[key] is not None else None
+
+            rows.append(row)
+
+        result, _ = self.insert_many(IngredientUnitModel, rows)
+        self.logger.info(f"Seeded {result.inserted} units ({result.skipped} already existed)")
+        return result
 
 
 class IngredientFoodsSeeder(AbstractSeeder):
@@ -84,7 +109,7 @@ class IngredientFoodsSeeder(AbstractSeeder):
         file = self.get_file(locale)
 
         seed_foods_names = set()
-        for food in json.loads(file.read_text(encoding="utf-8")).values():
+        for food in load_resource(file).values():
             if food["name"] in seed_foods_names:
                 continue
 
@@ -96,10 +121,16 @@ class IngredientFoodsSeeder(AbstractSeeder):
                 description="",
             )
 
-    def seed(self, locale: str | None = None) -> None:
+    def seed(self, locale: str | None = None) -> SeederResult:
         self.logger.info("Seeding Ingredient Foods")
+        rows = []
         for food in self.load_data(locale):
-            try:
-                self.repos.ingredient_foods.create(food)
-            except Exception as e:
-                self.logger.error(e)
+            row = food.model_dump(include={"group_id", "name", "plural_name", "description"})
+            for key in ["name", "plural_name"]:
+                row[f"{key}_normalized"] = IngredientFoodModel.normalize(row[key]) if row[key] is not None else None
+
+            rows.append(row)
+
+        result, _ = self.insert_many(IngredientFoodModel, rows)
+        self.logger.info(f"Seeded {result.inserted} foods ({result.skipped} already existed)")
+        return result
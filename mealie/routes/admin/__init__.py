@@ -5,6 +5,7 @@ from . import (
     admin_backups,
     admin_debug,
     admin_email,
+    admin_jobs,
     admin_maintenance,
     admin_management_groups,
     admin_management_households,
@@ -19,5 +20,6 @@ router.include_router(admin_management_households.router, tags=["Admin: Manage H
 router.include_router(admin_management_groups.router, tags=["Admin: Manage Groups"])
 router.include_router(admin_email.router, tags=["Admin: Email"])
 router.include_router(admin_backups.router, tags=["Admin: Backups"])
+router.include_router(admin_jobs.router, tags=["Admin: Jobs"])
 router.include_router(admin_maintenance.router, tags=["Admin: Maintenance"])
 router.include_router(admin_debug.router, tags=["Admin: Debug"])
@@ -1,10 +1,20 @@
 from fastapi import APIRouter
 from recipe_scrapers import __version__ as recipe_scraper_version
 
+from mealie.core.dependencies.user_cache import get_user_cache
 from mealie.core.release_checker import get_latest_version
 from mealie.core.settings.static import APP_VERSION
 from mealie.routes._base import BaseAdminController, controller
-from mealie.schema.admin.about import AdminAboutInfo, AppStatistics, CheckAppConfig
+from mealie.schema.admin.about import (
+    AdminAboutInfo,
+    AliasIndexCacheStatistics,
+    AppStatistics,
+    CheckAppConfig,
+    NotificationDeliveryStatistics,
+    UserCacheStatistics,
+)
+from mealie.services.event_bus_service.delivery import get_notification_delivery
+from mealie.services.parser_services.alias_index import get_alias_index_cache
 
 router = APIRouter(prefix="/about")
 
@@ -50,6 +60,21 @@ class AdminAboutController(BaseAdminController):
             total_groups=self.repos.groups.count_all(),
         )
 
+    @router.get("/user-cache", response_model=UserCacheStatistics)
+    def get_user_cache_statistics(self):
+        """Get the size and hit/miss counters of the cache of users authenticated by their token"""
+        return UserCacheStatistics(**get_user_cache().stats())
+
+    @router.get("/alias-index-cache", response_model=AliasIndexCacheStatistics)
+    def get_alias_index_cache_statistics(self):
+        """Get the size and hit/miss counters of the cache of food and unit aliases used by the ingredient parser"""
+        return AliasIndexCacheStatistics(**get_alias_index_cache().stats())
+
+    @router.get("/notifications", response_model=NotificationDeliveryStatistics)
+    def get_notification_delivery_statistics(self):
+        """Get the counters and recent latencies (in seconds) of webhook and Apprise notification deliveries"""
+        return NotificationDeliveryStatistics(**get_notification_delivery().metrics.snapshot())
+
     @router.get("/check", response_model=CheckAppConfig)
     def check_app_config(self):
         settings = self.settings
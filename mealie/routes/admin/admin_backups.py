@@ -10,8 +10,10 @@ from mealie.core.security import create_file_token
 from mealie.pkgs.stats.fs_stats import pretty_size
 from mealie.routes._base import BaseAdminController, controller
 from mealie.schema.admin.backup import AllBackups, BackupFile
+from mealie.schema.jobs import JobName, JobOut
 from mealie.schema.response.responses import ErrorResponse, FileTokenResponse, SuccessResponse
 from mealie.services.backups_v2.backup_v2 import BackupSchemaMismatch, BackupV2
+from mealie.services.jobs.job_queue import enqueue_job
 
 logger = get_logger()
 router = APIRouter(prefix="/backups")
@@ -37,17 +39,10 @@ class AdminBackupController(BaseAdminController):
 
         return AllBackups(imports=imports, templates=templates)
 
-    @router.post("", status_code=status.HTTP_201_CREATED, response_model=SuccessResponse)
+    @router.post("", status_code=status.HTTP_202_ACCEPTED, response_model=JobOut)
     def create_one(self):
-        backup = BackupV2()
-
-        try:
-            backup.backup()
-        except Exception as e:
-            logger.exception(e)
-            raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR) from e
-
-        return SuccessResponse.respond("Backup created successfully")
+        """Queues a job to create a backup; the backup is listed once the returned job has finished"""
+        return enqueue_job(self.session, JobName.backup, {})
 
     @router.get("/{file_name}", response_model=FileTokenResponse)
     def get_one(self, file_name: str):
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, HTTPException, status
+from pydantic import UUID4
+
+from mealie.routes._base import BaseAdminController, controller
+from mealie.schema.jobs import JobOut, JobStatus
+from mealie.schema.response.responses import ErrorResponse
+from mealie.services.jobs.job_queue import cancel_job, get_job, get_jobs, retry_job
+
+router = APIRouter(prefix="/jobs")
+
+
+@controller(router)
+class AdminJobsController(BaseAdminController):
+    @router.get("", response_model=list[JobOut])
+    def get_all(self, job_status: JobStatus | None = None):
+        """Gets the most recent jobs of all groups, including jobs that don't belong to a group (e.g. backups)"""
+        return get_jobs(self.session, status=job_status)
+
+    @router.get("/{item_id}", response_model=JobOut)
+    def get_one(self, item_id: UUID4):
+        job = get_job(self.session, item_id)
+        if job is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, ErrorResponse.respond("Job not found"))
+
+        return job
+
+    @router.post("/{item_id}/cancel", response_model=JobOut)
+    def cancel_one(self, item_id: UUID4):
+        """Cancels a queued job, or stops a running job at its next checkpoint"""
+        self.get_one(item_id)
+
+        job = cancel_job(self.session, item_id)
+        if job is None:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, ErrorResponse.respond("Job has already finished"))
+
+        return job
+
+    @router.post("/{item_id}/retry", response_model=JobOut)
+    def retry_one(self, item_id: UUID4):
+        """Queues a failed or cancelled job to be run again"""
+        self.get_one(item_id)
+
+        job = retry_job(self.session, item_id)
+        if job is None:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST, ErrorResponse.respond("Only failed or cancelled jobs can be retried")
+            )
+
+        return job
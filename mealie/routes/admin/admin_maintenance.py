@@ -8,7 +8,9 @@ from mealie.pkgs.stats import fs_stats
 from mealie.routes._base import BaseAdminController, controller
 from mealie.schema.admin import MaintenanceSummary
 from mealie.schema.admin.maintenance import MaintenanceStorageDetails
+from mealie.schema.admin.scheduler import SchedulerStatus
 from mealie.schema.response import ErrorResponse, SuccessResponse
+from mealie.services.scheduler.scheduler_service import get_scheduler_status
 
 router = APIRouter(prefix="/maintenance")
 
@@ -86,6 +88,13 @@ class AdminMaintenanceController(BaseAdminController):
             user_dir_size=fs_stats.pretty_size(fs_stats.get_dir_size(self.folders.USER_DIR)),
         )
 
+    @router.get("/scheduler", response_model=SchedulerStatus)
+    def get_scheduler_status(self):
+        """
+        Get the worker running the scheduled tasks, and the last and next run of each task
+        """
+        return get_scheduler_status(self.repos.session)
+
     @router.post("/clean/images", response_model=SuccessResponse)
     def clean_images(self):
         """
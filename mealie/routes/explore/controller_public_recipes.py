@@ -77,6 +77,7 @@ class PublicRecipesController(BasePublicHouseholdExploreController):
             require_all_tools=search_query.require_all_tools,
             require_all_foods=search_query.require_all_foods,
             search=search_query.search,
+            lean=True,
         )
 
         # merge default pagination with the request's query params
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, HTTPException, status
+from pydantic import UUID4
+
+from mealie.routes._base.base_controllers import BaseUserController
+from mealie.routes._base.controller import controller
+from mealie.schema.jobs import JobOut, JobStatus
+from mealie.schema.response.responses import ErrorResponse
+from mealie.services.jobs.job_queue import cancel_job, get_job, get_jobs, retry_job
+
+router = APIRouter(prefix="/groups/jobs", tags=["Groups: Jobs"])
+
+
+@controller(router)
+class GroupJobsController(BaseUserController):
+    @router.get("", response_model=list[JobOut])
+    def get_all(self, job_status: JobStatus | None = None):
+        return get_jobs(self.session, group_id=self.group_id, status=job_status)
+
+    @router.get("/{item_id}", response_model=JobOut)
+    def get_one(self, item_id: UUID4):
+        job = get_job(self.session, item_id, group_id=self.group_id)
+        if job is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, ErrorResponse.respond("Job not found"))
+
+        return job
+
+    @router.post("/{item_id}/cancel", response_model=JobOut)
+    def cancel_one(self, item_id: UUID4):
+        """Cancels a queued job, or stops a running job at its next checkpoint"""
+        self.get_one(item_id)
+
+        job = cancel_job(self.session, item_id, group_id=self.group_id)
+        if job is None:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, ErrorResponse.respond("Job has already finished"))
+
+        return job
+
+    @router.post("/{item_id}/retry", response_model=JobOut)
+    def retry_one(self, item_id: UUID4):
+        """Queues a failed or cancelled job to be run again"""
+        self.get_one(item_id)
+
+        job = retry_job(self.session, item_id, group_id=self.group_id)
+        if job is None:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST, ErrorResponse.respond("Only failed or cancelled jobs can be retried")
+            )
+
+        return job
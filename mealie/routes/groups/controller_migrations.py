@@ -1,25 +1,15 @@
 import shutil
+from uuid import uuid4
 
-from fastapi import File, Form
+from fastapi import File, Form, Header
 from fastapi.datastructures import UploadFile
 
-from mealie.core.dependencies import get_temporary_zip_path
 from mealie.routes._base import BaseUserController, controller
 from mealie.routes._base.routers import UserAPIRouter
 from mealie.schema.group.group_migration import SupportedMigrations
-from mealie.schema.reports.reports import ReportSummary
-from mealie.services.migrations import (
-    BaseMigrator,
-    ChowdownMigrator,
-    CopyMeThatMigrator,
-    MealieAlphaMigrator,
-    MyRecipeBoxMigrator,
-    NextcloudMigrator,
-    PaprikaMigrator,
-    PlanToEatMigrator,
-    RecipeKeeperMigrator,
-    TandoorMigrator,
-)
+from mealie.schema.jobs import JobName
+from mealie.schema.reports.reports import ReportCategory, ReportCreate, ReportSummary, ReportSummaryStatus
+from mealie.services.jobs.job_queue import enqueue_job
 
 router = UserAPIRouter(prefix="/groups/migrations", tags=["Groups: Migrations"])
 
@@ -32,41 +22,42 @@ class GroupMigrationController(BaseUserController):
         add_migration_tag: bool = Form(False),
         migration_type: SupportedMigrations = Form(...),
         archive: UploadFile = File(...),
+        accept_language: str | None = Header(None),
     ):
-        with get_temporary_zip_path() as temp_path:
-            # Save archive to temp_path
-            with temp_path.open("wb") as buffer:
-                shutil.copyfileobj(archive.file, buffer)
-
-            args = {
-                "archive": temp_path,
-                "db": self.repos,
-                "session": self.session,
-                "user_id": self.user.id,
-                "household_id": self.household_id,
-                "group_id": self.group_id,
+        """
+        Queues a job to import the recipes in the archive. The migration's progress and results are
+        added to the returned report as it runs.
+        """
+        report = self.repos.group_reports.create(
+            ReportCreate(
+                name=f"{migration_type.value.title()} Migration",
+                category=ReportCategory.migration,
+                status=ReportSummaryStatus.in_progress,
+                group_id=self.group_id,
+            )
+        )
+
+        # the archive is kept until the job has run, in a directory shared with the job workers
+        self.folders.JOB_DIR.mkdir(parents=True, exist_ok=True)
+        job_path = self.folders.JOB_DIR / f"{uuid4().hex}.zip"
+        with job_path.open("wb") as buffer:
+            shutil.copyfileobj(archive.file, buffer)
+
+        enqueue_job(
+            self.session,
+            JobName.migration,
+            {
+                "migration_type": migration_type.value,
+                "archive": str(job_path),
                 "add_migration_tag": add_migration_tag,
-                "translator": self.translator,
-            }
-
-            table: dict[SupportedMigrations, type[BaseMigrator]] = {
-                SupportedMigrations.chowdown: ChowdownMigrator,
-                SupportedMigrations.copymethat: CopyMeThatMigrator,
-                SupportedMigrations.mealie_alpha: MealieAlphaMigrator,
-                SupportedMigrations.nextcloud: NextcloudMigrator,
-                SupportedMigrations.paprika: PaprikaMigrator,
-                SupportedMigrations.tandoor: TandoorMigrator,
-                SupportedMigrations.plantoeat: PlanToEatMigrator,
-                SupportedMigrations.myrecipebox: MyRecipeBoxMigrator,
-                SupportedMigrations.recipekeeper: RecipeKeeperMigrator,
-            }
-
-            constructor = table.get(migration_type, None)
-
-            if constructor is None:
-                raise ValueError(f"Unsupported migration type: {migration_type}")
-
-            migrator = constructor(**args)
-
-            migration_result = migrator.migrate(f"{migration_type.value.title()} Migration")
-        return migration_result
+                "user_id": str(self.user.id),
+                "household_id": str(self.household_id),
+                "group_id": str(self.group_id),
+                "report_id": str(report.id),
+                "locale": accept_language,
+            },
+            group_id=self.group_id,
+            report_id=report.id,
+        )
+
+        return report
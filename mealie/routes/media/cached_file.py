@@ -0,0 +1,96 @@
+"""Serves media files with validators and cache headers, and answers conditional requests"""
+
+import os
+import stat
+from datetime import UTC
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+from fastapi import HTTPException, Request, Response, status
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def get_etag(stat_result: os.stat_result) -> str:
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def is_not_modified(request_headers: Headers, etag: str, stat_result: os.stat_result) -> bool:
+    """Whether the client's cached copy is still current, per the `If-None-Match` or `If-Modified-Since` header"""
+
+    if (if_none_match := request_headers.get("if-none-match")) is not None:
+        # If-None-Match takes precedence and uses the weak comparison
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if (if_modified_since := request_headers.get("if-modified-since")) is not None:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        # HTTP dates are always GMT, but dates with a "-0000" offset are parsed as naive datetimes
+        if modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=UTC)
+
+        return int(stat_result.st_mtime) <= modified_since.timestamp()
+
+    return False
+
+
+def _drop_request_header(request: Request, name: str) -> None:
+    """Removes a header from the request, so the response doesn't act on it"""
+
+    raw_name = name.lower().encode("latin-1")
+    request.scope["headers"] = [(key, value) for key, value in request.scope["headers"] if key.lower() != raw_name]
+
+
+def _handle_if_range(request: Request, etag: str, last_modified: str) -> None:
+    """
+    A range is only served if the `If-Range` validator matches the current file, otherwise the whole file is sent.
+    ETags use the strong comparison, so weak ETags never match
+    """
+
+    if "range" not in request.headers or (if_range := request.headers.get("if-range")) is None:
+        return
+
+    if if_range.strip() in (etag, last_modified):
+        _drop_request_header(request, "if-range")
+    else:
+        _drop_request_header(request, "range")
+
+
+def cached_file_response(
+    request: Request, path: Path, media_type: str | None = None, version: str | None = None
+) -> Response:
+    """
+    Returns `path` as a cacheable `FileResponse`, or an empty 304 response if the client's copy is current.
+    The response is only cached as immutable if the request's `version` query param matches `version`.
+    Raises a 404 if the file doesn't exist
+    """
+
+    try:
+        stat_result = os.stat(path)
+    except OSError as e:
+        raise HTTPException(status.HTTP_404_NOT_FOUND) from e
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+    etag = get_etag(stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    is_current_version = bool(version) and request.query_params.get("version") == version
+    headers = {
+        "etag": etag,
+        "last-modified": last_modified,
+        "cache-control": IMMUTABLE_CACHE_CONTROL if is_current_version else REVALIDATE_CACHE_CONTROL,
+    }
+
+    if is_not_modified(request.headers, etag, stat_result):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    _handle_if_range(request, etag, last_modified)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
@@ -1,12 +1,18 @@
 from enum import Enum
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Request
 from pydantic import UUID4
-from starlette.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
+from mealie.db.db_setup import generate_session
+from mealie.db.models.recipe.recipe import RecipeModel
 from mealie.schema.recipe import Recipe
 from mealie.schema.recipe.recipe_timeline_events import RecipeTimelineEventOut
 
+from .cached_file import cached_file_response
+
 router = APIRouter(prefix="/recipes")
 
 
@@ -16,23 +22,34 @@ class ImageType(str, Enum):
     tiny = "tiny-original.webp"
 
 
+def _get_image_version(session: Session, recipe_id: str) -> str | None:
+    try:
+        return session.scalar(select(RecipeModel.image).where(RecipeModel.id == UUID(recipe_id)))
+    except ValueError:
+        return None
+
+
 @router.get("/{recipe_id}/images/{file_name}")
-async def get_recipe_img(recipe_id: str, file_name: ImageType = ImageType.original):
+def get_recipe_img(
+    request: Request,
+    recipe_id: str,
+    file_name: ImageType = ImageType.original,
+    session: Session = Depends(generate_session),
+):
     """
     Takes in a recipe id, returns the static image. This route is proxied in the docker image
     and should not hit the API in production
     """
     recipe_image = Recipe.directory_from_id(recipe_id).joinpath("images", file_name.value)
 
-    if recipe_image.exists():
-        return FileResponse(recipe_image, media_type="image/webp")
-    else:
-        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    # only versioned URLs can be cached as immutable, so the version is only looked up if one was requested
+    version = _get_image_version(session, recipe_id) if request.query_params.get("version") else None
+    return cached_file_response(request, recipe_image, media_type="image/webp", version=version)
 
 
 @router.get("/{recipe_id}/images/timeline/{timeline_event_id}/{file_name}")
 async def get_recipe_timeline_event_img(
-    recipe_id: str, timeline_event_id: str, file_name: ImageType = ImageType.original
+    request: Request, recipe_id: str, timeline_event_id: str, file_name: ImageType = ImageType.original
 ):
     """
     Takes in a recipe id and event timeline id, returns the static image. This route is proxied in the docker image
@@ -41,19 +58,11 @@ async def get_recipe_timeline_event_img(
     timeline_event_image = RecipeTimelineEventOut.image_dir_from_id(recipe_id, timeline_event_id).joinpath(
         file_name.value
     )
-
-    if timeline_event_image.exists():
-        return FileResponse(timeline_event_image, media_type="image/webp")
-    else:
-        raise HTTPException(status.HTTP_404_NOT_FOUND)
+    return cached_file_response(request, timeline_event_image, media_type="image/webp")
 
 
 @router.get("/{recipe_id}/assets/{file_name}")
-async def get_recipe_asset(recipe_id: UUID4, file_name: str):
+async def get_recipe_asset(request: Request, recipe_id: UUID4, file_name: str):
     """Returns a recipe asset"""
     file = Recipe.directory_from_id(recipe_id).joinpath("assets", file_name)
-
-    try:
-        return FileResponse(file)
-    except Exception as e:
-        raise HTTPException(status.HTTP_404_NOT_FOUND) from e
+    return cached_file_response(request, file)
@@ -3,50 +3,85 @@ from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
 
-from mealie.core.dependencies.dependencies import get_temporary_zip_path
 from mealie.core.security import create_file_token
-from mealie.routes._base import BaseUserController, controller
+from mealie.routes._base import BaseCrudController, controller
 from mealie.schema.group.group_exports import GroupDataExport
+from mealie.schema.jobs import JobName
 from mealie.schema.recipe.recipe_bulk_actions import (
     AssignCategories,
     AssignSettings,
     AssignTags,
+    BulkActionResponse,
     DeleteRecipes,
     ExportRecipes,
 )
 from mealie.schema.response.responses import SuccessResponse
+from mealie.services.event_bus_service.event_types import EventOperation, EventRecipeBulkData, EventTypes
+from mealie.services.jobs.job_queue import enqueue_job
 from mealie.services.recipe.recipe_bulk_service import RecipeBulkActionsService
 
 router = APIRouter(prefix="/bulk-actions")
 
 
 @controller(router)
-class RecipeBulkActionsController(BaseUserController):
+class RecipeBulkActionsController(BaseCrudController):
     @cached_property
     def service(self) -> RecipeBulkActionsService:
         return RecipeBulkActionsService(self.repos, self.user, self.group)
 
-    # TODO Should these actions return some success response?
-    @router.post("/tag")
+    def publish_bulk_event(self, event_type: EventTypes, operation: EventOperation, response: BulkActionResponse):
+        if not (slugs := response.succeeded):
+            return
+
+        self.publish_event(
+            event_type=event_type,
+            document_data=EventRecipeBulkData(operation=operation, recipe_slugs=slugs),
+            group_id=self.group_id,
+            household_id=self.household_id,
+        )
+
+    @router.post("/tag", response_model=BulkActionResponse)
     def bulk_tag_recipes(self, tag_data: AssignTags):
-        self.service.assign_tags(tag_data.recipes, tag_data.tags)
+        response = self.service.assign_tags(tag_data.recipes, tag_data.tags)
+        self.publish_bulk_event(EventTypes.recipe_updated, EventOperation.update, response)
+        return response
 
-    @router.post("/settings")
+    @router.post("/settings", response_model=BulkActionResponse)
     def bulk_settings_recipes(self, settings_data: AssignSettings):
-        self.service.set_settings(settings_data.recipes, settings_data.settings)
+        response = self.service.set_settings(settings_data.recipes, settings_data.settings)
+        self.publish_bulk_event(EventTypes.recipe_updated, EventOperation.update, response)
+        return response
 
-    @router.post("/categorize")
+    @router.post("/categorize", response_model=BulkActionResponse)
     def bulk_categorize_recipes(self, assign_cats: AssignCategories):
-        self.service.assign_categories(assign_cats.recipes, assign_cats.categories)
+        response = self.service.assign_categories(assign_cats.recipes, assign_cats.categories)
+        self.publish_bulk_event(EventTypes.recipe_updated, EventOperation.update, response)
+        return response
 
-    @router.post("/delete")
+    @router.post("/delete", response_model=BulkActionResponse)
     def bulk_delete_recipes(self, delete_recipes: DeleteRecipes):
-        self.service.delete_recipes(delete_recipes.recipes)
+        response = self.service.delete_recipes(delete_recipes.recipes)
+        self.publish_bulk_event(EventTypes.recipe_deleted, EventOperation.delete, response)
+        return response
 
     @router.post("/export", status_code=202)
     def bulk_export_recipes(self, export_recipes: ExportRecipes):
-        with get_temporary_zip_path() as temp_path:
-            self.service.export_recipes(temp_path, export_recipes.recipes)
+        """Queues a job to export the recipes; the export's progress is available from the returned job and report"""
+        report_id = self.service.get_export_report_id()
+        job = enqueue_job(
+            self.session,
+            JobName.recipe_export,
+            {
+                "slugs": export_recipes.recipes,
+                "user_id": str(self.user.id),
+                "household_id": str(self.household_id),
+                "report_id": str(report_id),
+            },
+            group_id=self.group_id,
+            report_id=report_id,
+        )
+
+        return {"reportId": report_id, "jobId": job.id}
 
     @router.get("/export/download")
     def get_exported_data_token(self, path: Path):
@@ -1,14 +1,13 @@
 from collections import defaultdict
-from shutil import copyfileobj
 from uuid import UUID
 
 import orjson
 import sqlalchemy
 from fastapi import (
-    BackgroundTasks,
     Depends,
     File,
     Form,
+    Header,
     HTTPException,
     Path,
     Query,
@@ -28,6 +27,7 @@ from mealie.repos.all_repositories import get_repositories
 from mealie.routes._base import controller
 from mealie.routes._base.routers import MealieCrudRoute, UserAPIRouter
 from mealie.schema.cookbook.cookbook import ReadCookBook
+from mealie.schema.jobs import JobName
 from mealie.schema.make_dependable import make_dependable
 from mealie.schema.recipe import Recipe, ScrapeRecipe, ScrapeRecipeData
 from mealie.schema.recipe.recipe import (
@@ -54,19 +54,17 @@ from mealie.services.event_bus_service.event_types import (
     EventRecipeData,
     EventTypes,
 )
+from mealie.services.jobs.job_queue import enqueue_job
 from mealie.services.recipe.recipe_data_service import (
     InvalidDomainError,
     NotAnImageError,
     RecipeDataService,
 )
+from mealie.services.scraper.http_client import ForceTimeoutException, ResponseTooLargeException
 from mealie.services.scraper.recipe_bulk_scraper import RecipeBulkScraperService
 from mealie.services.scraper.scraped_extras import ScraperContext
 from mealie.services.scraper.scraper import create_from_html
-from mealie.services.scraper.scraper_strategies import (
-    ForceTimeoutException,
-    RecipeScraperOpenAI,
-    RecipeScraperPackage,
-)
+from mealie.services.scraper.scraper_strategies import RecipeScraperOpenAI, RecipeScraperPackage
 
 from ._base import BaseRecipeController, JSONBytes
 
@@ -108,6 +106,10 @@ class RecipeController(BaseRecipeController):
             raise HTTPException(
                 status_code=408, detail=ErrorResponse.respond(message="Recipe Scraping Timed Out")
             ) from e
+        except ResponseTooLargeException as e:
+            raise HTTPException(
+                status_code=413, detail=ErrorResponse.respond(message="Recipe Page Is Too Large")
+            ) from e
 
         return "recipe_scrapers was unable to scrape this URL"
 
@@ -140,6 +142,10 @@ class RecipeController(BaseRecipeController):
             raise HTTPException(
                 status_code=408, detail=ErrorResponse.respond(message="Recipe Scraping Timed Out")
             ) from e
+        except ResponseTooLargeException as e:
+            raise HTTPException(
+                status_code=413, detail=ErrorResponse.respond(message="Recipe Page Is Too Large")
+            ) from e
 
         if req.include_tags:
             ctx = ScraperContext(self.repos)
@@ -164,11 +170,26 @@ class RecipeController(BaseRecipeController):
         return new_recipe.slug
 
     @router.post("/create/url/bulk", status_code=202)
-    def parse_recipe_url_bulk(self, bulk: CreateRecipeByUrlBulk, bg_tasks: BackgroundTasks):
-        """Takes in a URL and attempts to scrape data and load it into the database"""
+    def parse_recipe_url_bulk(self, bulk: CreateRecipeByUrlBulk, accept_language: str | None = Header(None)):
+        """
+        Queues a job to scrape a list of URLs and load them into the database.
+        The import's progress and results are available from the returned job and report.
+        """
         bulk_scraper = RecipeBulkScraperService(self.service, self.repos, self.group, self.translator)
         report_id = bulk_scraper.get_report_id()
-        bg_tasks.add_task(bulk_scraper.scrape, bulk)
+        job = enqueue_job(
+            self.session,
+            JobName.bulk_url_import,
+            {
+                "bulk": bulk.model_dump(mode="json"),
+                "user_id": str(self.user.id),
+                "household_id": str(self.household_id),
+                "report_id": str(report_id),
+                "locale": accept_language,
+            },
+            group_id=self.group_id,
+            report_id=report_id,
+        )
 
         self.publish_event(
             event_type=EventTypes.recipe_created,
@@ -177,7 +198,7 @@ class RecipeController(BaseRecipeController):
             household_id=self.household_id,
         )
 
-        return {"reportId": report_id}
+        return {"reportId": report_id, "jobId": job.id}
 
     # ==================================================================================================================
     # Other Create Operations
@@ -269,6 +290,7 @@ class RecipeController(BaseRecipeController):
             require_all_tools=search_query.require_all_tools,
             require_all_foods=search_query.require_all_foods,
             search=search_query.search,
+            lean=True,
         )
 
         # merge default pagination with the request's query params
@@ -561,8 +583,8 @@ class RecipeController(BaseRecipeController):
                 detail=f"File name {file_name} or extension {extension} not valid",
             )
 
-        with dest.open("wb") as buffer:
-            copyfileobj(file.file, buffer)
+        data_service = RecipeDataService(recipe.id)
+        dest = data_service.write_asset(file_name, file.file)
 
         if not dest.is_file():
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -115,6 +115,8 @@ class RecipeTimelineEventsController(BaseCrudController):
             except FileNotFoundError:
                 pass
 
+            RecipeDataService(event.recipe_id).update_storage()
+
         recipe = self.group_recipes.get_one(event.recipe_id, "id")
         if recipe:
             self.publish_event(
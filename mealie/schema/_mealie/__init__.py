@@ -1,5 +1,6 @@
 # This file is auto-generated by gen_schema_exports.py
 from .datetime_parse import DateError, DateTimeError, DurationError, TimeError
+from .loader_profile import LoaderProfile
 from .mealie_model import HasUUID, MealieModel, SearchType
 
 __all__ = [
@@ -7,6 +8,7 @@ __all__ = [
     "DateTimeError",
     "DurationError",
     "TimeError",
+    "LoaderProfile",
     "HasUUID",
     "MealieModel",
     "SearchType",
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy.orm import QueryableAttribute, joinedload, load_only, selectinload, subqueryload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+@dataclass(frozen=True)
+class LoaderProfile:
+    """
+    Declares how a schema's relationships are loaded when it's read from the database.
+
+    Collections belong in `selectin` (or `subquery`), which loads each of them with one extra query for the
+    whole page. Joining several collections in the same query returns the product of their rows for every
+    parent row (e.g. categories × tags × tools per recipe), so `joined` is meant for many-to-one and
+    one-to-one relationships only.
+
+    `columns`, if set, restricts the parent's own columns to the ones the schema reads ("lean" loading).
+    Anything accessing a column that isn't listed triggers an extra query per row, so only use it for
+    schemas that are validated straight from the query results.
+    """
+
+    joined: Sequence[QueryableAttribute] = ()
+    selectin: Sequence[QueryableAttribute] = ()
+    subquery: Sequence[QueryableAttribute] = ()
+    columns: Sequence[QueryableAttribute] = ()
+    options: Callable[[], Sequence[LoaderOption]] | None = None
+    """
+    Builds additional options, e.g. for nested relationships or partially loaded related models. Building loader
+    options configures the mappers, so they're only built when they're used, not when the schema is defined
+    """
+
+    def loader_options(self, lean: bool = False) -> list[LoaderOption]:
+        options: list[LoaderOption] = [
+            *(joinedload(attr) for attr in self.joined),
+            *(selectinload(attr) for attr in self.selectin),
+            *(subqueryload(attr) for attr in self.subquery),
+            *(self.options() if self.options else ()),
+        ]
+
+        if lean and self.columns:
+            options.append(load_only(*self.columns))
+
+        return options
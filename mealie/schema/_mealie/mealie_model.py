@@ -14,6 +14,8 @@ from sqlalchemy.orm.interfaces import LoaderOption
 
 from mealie.db.models._model_base import SqlAlchemyBase
 
+from .loader_profile import LoaderProfile
+
 T = TypeVar("T", bound=BaseModel)
 
 HOUR_ONLY_TZ_PATTERN = re.compile(r"[+-]\d{2}$")
@@ -52,6 +54,8 @@ class MealieModel(BaseModel):
     Searchable properties for the search API.
     The first property will be used for sorting (order_by)
     """
+    _loader_profile: ClassVar[LoaderProfile | None] = None
+    """How relationships are loaded when reading this schema from the database, see `loader_options`"""
     model_config = ConfigDict(alias_generator=camelize, populate_by_name=True)
 
     @model_validator(mode="before")
@@ -133,7 +137,16 @@ class MealieModel(BaseModel):
 
     @classmethod
     def loader_options(cls) -> list[LoaderOption]:
-        return []
+        return cls._loader_profile.loader_options() if cls._loader_profile else []
+
+    @classmethod
+    def lean_loader_options(cls) -> list[LoaderOption]:
+        """
+        Like `loader_options`, but only loads the columns the schema's loader profile lists (if any).
+        Only use this when the results are validated into this schema and nothing else
+        """
+
+        return cls._loader_profile.loader_options(lean=True) if cls._loader_profile else cls.loader_options()
 
     @classmethod
     def filter_search_query(
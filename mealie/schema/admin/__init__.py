@@ -1,5 +1,15 @@
 # This file is auto-generated by gen_schema_exports.py
-from .about import AdminAboutInfo, AppInfo, AppStartupInfo, AppStatistics, AppTheme, CheckAppConfig
+from .about import (
+    AdminAboutInfo,
+    AliasIndexCacheStatistics,
+    AppInfo,
+    AppStartupInfo,
+    AppStatistics,
+    AppTheme,
+    CheckAppConfig,
+    NotificationDeliveryStatistics,
+    UserCacheStatistics,
+)
 from .backup import AllBackups, BackupFile, BackupOptions, CreateBackup, ImportJob
 from .debug import DebugResponse
 from .email import EmailReady, EmailSuccess, EmailTest
@@ -15,6 +25,7 @@ from .restore import (
     SettingsImport,
     UserImport,
 )
+from .scheduler import ScheduledTaskStatus, SchedulerStatus
 from .settings import CustomPageBase, CustomPageOut
 
 __all__ = [
@@ -25,6 +36,8 @@ __all__ = [
     "MigrationFile",
     "MigrationImport",
     "Migrations",
+    "ScheduledTaskStatus",
+    "SchedulerStatus",
     "CustomPageBase",
     "CustomPageOut",
     "CommentImport",
@@ -41,11 +54,14 @@ __all__ = [
     "CreateBackup",
     "ImportJob",
     "AdminAboutInfo",
+    "AliasIndexCacheStatistics",
     "AppInfo",
     "AppStartupInfo",
     "AppStatistics",
     "AppTheme",
     "CheckAppConfig",
+    "NotificationDeliveryStatistics",
+    "UserCacheStatistics",
     "EmailReady",
     "EmailSuccess",
     "EmailTest",
@@ -10,6 +10,33 @@ class AppStatistics(MealieModel):
     untagged_recipes: int
 
 
+class UserCacheStatistics(MealieModel):
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+
+
+class AliasIndexCacheStatistics(MealieModel):
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+
+
+class NotificationDeliveryStatistics(MealieModel):
+    queued: int
+    delivered: int
+    retried: int
+    failed: int
+    dropped: int
+    latency_p50: float | None = None
+    latency_p95: float | None = None
+    latency_max: float | None = None
+
+
 class AppInfo(MealieModel):
     production: bool
     version: str
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from mealie.schema._mealie import MealieModel
+
+
+class ScheduledTaskStatus(MealieModel):
+    name: str
+    schedule: str
+    next_run_at: datetime
+    last_run_at: datetime | None = None
+    last_duration: float | None = None
+    """Duration of the last run, in seconds"""
+    last_status: str | None = None
+    last_error: str | None = None
+
+
+class SchedulerStatus(MealieModel):
+    leader: str | None = None
+    """The worker running the scheduled tasks, if any"""
+    lease_expires_at: datetime | None = None
+    tasks: list[ScheduledTaskStatus] = []
@@ -3,7 +3,7 @@ from .group import GroupAdminUpdate
 from .group_exports import GroupDataExport
 from .group_migration import DataMigrationCreate, SupportedMigrations
 from .group_preferences import CreateGroupPreferences, ReadGroupPreferences, UpdateGroupPreferences
-from .group_seeder import SeederConfig
+from .group_seeder import SeederConfig, SeederResponse, SeederResult
 from .group_statistics import GroupStorage
 
 __all__ = [
@@ -15,5 +15,7 @@ __all__ = [
     "DataMigrationCreate",
     "SupportedMigrations",
     "SeederConfig",
+    "SeederResponse",
+    "SeederResult",
     "GroupAdminUpdate",
 ]
@@ -2,6 +2,7 @@ from pydantic import field_validator
 
 from mealie.schema._mealie.mealie_model import MealieModel
 from mealie.schema._mealie.validators import validate_locale
+from mealie.schema.response.responses import SuccessResponse
 
 
 class SeederConfig(MealieModel):
@@ -12,3 +13,14 @@ class SeederConfig(MealieModel):
         if not validate_locale(v):
             raise ValueError("invalid locale")
         return v
+
+
+class SeederResult(MealieModel):
+    inserted: int = 0
+    skipped: int = 0
+    """Number of items that weren't inserted, since the group already has an item with the same name"""
+
+
+class SeederResponse(SuccessResponse):
+    inserted: int = 0
+    skipped: int = 0
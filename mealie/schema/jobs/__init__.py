@@ -0,0 +1,8 @@
+# This file is auto-generated by gen_schema_exports.py
+from .jobs import JobName, JobOut, JobStatus
+
+__all__ = [
+    "JobName",
+    "JobOut",
+    "JobStatus",
+]
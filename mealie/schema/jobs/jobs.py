@@ -0,0 +1,43 @@
+import datetime
+import enum
+
+from pydantic import UUID4, ConfigDict
+
+from mealie.schema._mealie import MealieModel
+
+
+class JobName(str, enum.Enum):
+    bulk_url_import = "bulk_url_import"
+    migration = "migration"
+    recipe_export = "recipe_export"
+    backup = "backup"
+
+
+class JobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    success = "success"
+    failure = "failure"
+    cancelled = "cancelled"
+
+
+class JobOut(MealieModel):
+    id: UUID4
+    name: JobName
+    status: JobStatus
+    group_id: UUID4 | None = None
+    report_id: UUID4 | None = None
+    """The report the job adds its results to, if any"""
+
+    progress: int = 0
+    total: int | None = None
+    """Number of items the job processes, if it's known"""
+
+    attempts: int = 0
+    cancel_requested: bool = False
+    error: str | None = None
+
+    created_at: datetime.datetime | None = None
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
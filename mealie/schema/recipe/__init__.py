@@ -19,6 +19,8 @@ from .recipe_bulk_actions import (
     AssignCategories,
     AssignSettings,
     AssignTags,
+    BulkActionResponse,
+    BulkActionResult,
     DeleteRecipes,
     ExportBase,
     ExportRecipes,
@@ -167,6 +169,8 @@ __all__ = [
     "AssignCategories",
     "AssignSettings",
     "AssignTags",
+    "BulkActionResponse",
+    "BulkActionResult",
     "DeleteRecipes",
     "ExportBase",
     "ExportRecipes",
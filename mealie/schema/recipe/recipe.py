@@ -9,13 +9,12 @@ from uuid import uuid4
 from pydantic import UUID4, BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
 from slugify import slugify
-from sqlalchemy import Select, desc, func, or_, select, text
+from sqlalchemy import Select, false, or_, text
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy.orm.interfaces import LoaderOption
 
 from mealie.core.config import get_app_dirs
 from mealie.db.models.users.users import User
-from mealie.schema._mealie import MealieModel, SearchType
+from mealie.schema._mealie import LoaderProfile, MealieModel, SearchType
 from mealie.schema._mealie.mealie_model import UpdatedAtField
 from mealie.schema.response.pagination import PaginationBase
 
@@ -25,7 +24,9 @@ from ...db.models.recipe import (
     RecipeIngredientModel,
     RecipeInstruction,
     RecipeModel,
+    Tool,
 )
+from ...db.models.recipe.search_index import search_recipe_index
 from .recipe_asset import RecipeAsset
 from .recipe_comments import RecipeCommentOut
 from .recipe_notes import RecipeNote
@@ -62,6 +63,8 @@ class RecipeTool(RecipeTag):
     id: UUID4
     households_with_tool: list[str] = []
 
+    _loader_profile: ClassVar[LoaderProfile] = LoaderProfile(selectin=[Tool.households_with_tool])
+
     @field_validator("households_with_tool", mode="before")
     def convert_households_to_slugs(cls, v):
         if not v:
@@ -126,6 +129,38 @@ class RecipeSummary(MealieModel):
     last_made: datetime.datetime | None = None
     model_config = ConfigDict(from_attributes=True)
 
+    _loader_profile: ClassVar[LoaderProfile] = LoaderProfile(
+        selectin=[RecipeModel.recipe_category, RecipeModel.tags],
+        options=lambda: [
+            selectinload(RecipeModel.tools).options(*RecipeTool.loader_options()),
+            joinedload(RecipeModel.user).load_only(User.household_id),
+        ],
+        # everything serialized above; household_id comes from the user
+        columns=[
+            RecipeModel.id,
+            RecipeModel.user_id,
+            RecipeModel.group_id,
+            RecipeModel.name,
+            RecipeModel.slug,
+            RecipeModel.image,
+            RecipeModel.recipe_servings,
+            RecipeModel.recipe_yield_quantity,
+            RecipeModel.recipe_yield,
+            RecipeModel.total_time,
+            RecipeModel.prep_time,
+            RecipeModel.cook_time,
+            RecipeModel.perform_time,
+            RecipeModel.description,
+            RecipeModel.rating,
+            RecipeModel.org_url,
+            RecipeModel.date_added,
+            RecipeModel.date_updated,
+            RecipeModel.created_at,
+            RecipeModel.update_at,
+            RecipeModel.last_made,
+        ],
+    )
+
     @field_validator("recipe_yield", "total_time", "prep_time", "cook_time", "perform_time", mode="before")
     def clean_strings(val: Any):
         if val is None:
@@ -139,15 +174,6 @@ class RecipeSummary(MealieModel):
     def recipe_yield_display(self) -> str:
         return f"{self.recipe_yield_quantity} {self.recipe_yield}".strip()
 
-    @classmethod
-    def loader_options(cls) -> list[LoaderOption]:
-        return [
-            joinedload(RecipeModel.recipe_category),
-            joinedload(RecipeModel.tags),
-            joinedload(RecipeModel.tools),
-            joinedload(RecipeModel.user).load_only(User.household_id),
-        ]
-
 
 class RecipePagination(PaginationBase):
     items: list[RecipeSummary]
@@ -166,6 +192,30 @@ class Recipe(RecipeSummary):
 
     comments: list[RecipeCommentOut] | None = []
 
+    _loader_profile: ClassVar[LoaderProfile] = LoaderProfile(
+        joined=[RecipeModel.nutrition, RecipeModel.settings],
+        selectin=[
+            RecipeModel.assets,
+            RecipeModel.extras,
+            RecipeModel.recipe_category,
+            RecipeModel.tags,
+            RecipeModel.notes,
+        ],
+        options=lambda: [
+            selectinload(RecipeModel.tools).options(*RecipeTool.loader_options()),
+            joinedload(RecipeModel.user).load_only(User.household_id),
+            selectinload(RecipeModel.comments).joinedload(RecipeComment.user),
+            selectinload(RecipeModel.recipe_ingredient).joinedload(RecipeIngredientModel.unit),
+            selectinload(RecipeModel.recipe_ingredient)
+            .joinedload(RecipeIngredientModel.food)
+            .joinedload(IngredientFoodModel.extras),
+            selectinload(RecipeModel.recipe_ingredient)
+            .joinedload(RecipeIngredientModel.food)
+            .joinedload(IngredientFoodModel.label),
+            selectinload(RecipeModel.recipe_instructions).joinedload(RecipeInstruction.ingredient_references),
+        ],
+    )
+
     @staticmethod
     def _get_dir(dir: Path) -> Path:
         """Gets a directory and creates it if it doesn't exist"""
@@ -282,91 +332,44 @@ class Recipe(RecipeSummary):
     def validate_nutrition(cls, v):
         return v or None
 
-    @classmethod
-    def loader_options(cls) -> list[LoaderOption]:
-        return [
-            selectinload(RecipeModel.assets),
-            selectinload(RecipeModel.comments).joinedload(RecipeComment.user),
-            selectinload(RecipeModel.extras),
-            joinedload(RecipeModel.recipe_category),
-            selectinload(RecipeModel.tags),
-            selectinload(RecipeModel.tools),
-            selectinload(RecipeModel.recipe_ingredient).joinedload(RecipeIngredientModel.unit),
-            selectinload(RecipeModel.recipe_ingredient)
-            .joinedload(RecipeIngredientModel.food)
-            .joinedload(IngredientFoodModel.extras),
-            selectinload(RecipeModel.recipe_ingredient)
-            .joinedload(RecipeIngredientModel.food)
-            .joinedload(IngredientFoodModel.label),
-            selectinload(RecipeModel.recipe_instructions).joinedload(RecipeInstruction.ingredient_references),
-            joinedload(RecipeModel.nutrition),
-            joinedload(RecipeModel.settings),
-            # for whatever reason, joinedload can mess up the order here, so use selectinload just this once
-            selectinload(RecipeModel.notes),
-        ]
-
     @classmethod
     def filter_search_query(
         cls, db_model, query: Select, session: Session, search_type: SearchType, search: str, search_list: list[str]
     ) -> Select:
         """
-        1. token search looks for any individual exact hit in name, description, and ingredients
-        2. fuzzy search looks for trigram hits in name, description, and ingredients
-        3. Sort order is determined by closeness to the recipe name
-        Should search also look at tags?
+        1. token search looks up each term (as a prefix) or literal phrase in the full text search index,
+           which covers the name, description, ingredients, instructions, and tags. Terms only match
+           the start of a word, so "tom" finds "tomato", but "mato" doesn't
+        2. fuzzy search does the same, but also includes trigram hits on the recipe name to tolerate typos
+        3. Sort order is determined by the search rank, weighted towards the recipe name
+        4. A search without any searchable terms (e.g. only punctuation) matches nothing
         """
 
-        if search_type is SearchType.fuzzy:
-            # I would prefer to just do this in the recipe_ingredient.any part of the main query,
-            # but it turns out that at least sqlite wont use indexes for that correctly anymore and
-            # takes a big hit, so prefiltering it is
-            ingredient_ids = (
-                session.execute(
-                    select(RecipeIngredientModel.id).filter(
-                        or_(
-                            RecipeIngredientModel.note_normalized.op("%>")(search),
-                            RecipeIngredientModel.original_text_normalized.op("%>")(search),
-                        )
-                    )
-                )
-                .scalars()
-                .all()
-            )
+        matches = search_recipe_index(session.get_bind().name, search_list)
+        if matches is None and not search:
+            return query.filter(false())
 
+        if search_type is SearchType.fuzzy:
             session.execute(text(f"set pg_trgm.word_similarity_threshold = {cls._fuzzy_similarity_threshold};"))
-            return query.filter(
-                or_(
-                    RecipeModel.name_normalized.op("%>")(search),
-                    RecipeModel.description_normalized.op("%>")(search),
-                    RecipeModel.recipe_ingredient.any(RecipeIngredientModel.id.in_(ingredient_ids)),
-                )
-            ).order_by(  # trigram ordering could be too slow on million record db, but is fine with thousands.
-                func.least(
+            name_similarity = RecipeModel.name_normalized.op("%>")(search)
+
+            if matches is None:
+                return query.filter(name_similarity).order_by(RecipeModel.name_normalized.op("<->>")(search))
+
+            return (
+                query.outerjoin(matches, matches.c.recipe_id == RecipeModel.id)
+                .filter(or_(matches.c.recipe_id.is_not(None), name_similarity))
+                .order_by(  # trigram ordering could be too slow on million record db, but is fine with thousands.
+                    matches.c.rank.nulls_last(),
                     RecipeModel.name_normalized.op("<->>")(search),
                 )
             )
 
         else:
-            ingredient_ids = (
-                session.execute(
-                    select(RecipeIngredientModel.id).filter(
-                        or_(
-                            *[RecipeIngredientModel.note_normalized.like(f"%{ns}%") for ns in search_list],
-                            *[RecipeIngredientModel.original_text_normalized.like(f"%{ns}%") for ns in search_list],
-                        )
-                    )
-                )
-                .scalars()
-                .all()
-            )
+            if matches is None:
+                return query.filter(false())
 
-            return query.filter(
-                or_(
-                    *[RecipeModel.name_normalized.like(f"%{ns}%") for ns in search_list],
-                    *[RecipeModel.description_normalized.like(f"%{ns}%") for ns in search_list],
-                    RecipeModel.recipe_ingredient.any(RecipeIngredientModel.id.in_(ingredient_ids)),
-                )
-            ).order_by(desc(RecipeModel.name_normalized.like(f"%{search}%")))
+            return query.join(matches, matches.c.recipe_id == RecipeModel.id).order_by(matches.c.rank)
 
 
 class RecipeLastMade(BaseModel):
@@ -31,3 +31,17 @@ class AssignSettings(ExportBase):
 
 class DeleteRecipes(ExportBase):
     pass
+
+
+class BulkActionResult(MealieModel):
+    slug: str
+    success: bool
+    error: str | None = None
+
+
+class BulkActionResponse(MealieModel):
+    results: list[BulkActionResult] = []
+
+    @property
+    def succeeded(self) -> list[str]:
+        return [result.slug for result in self.results if result.success]
@@ -2,7 +2,7 @@ from pydantic import UUID4, ConfigDict
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 
-from mealie.db.models.recipe import RecipeModel, Tag
+from mealie.db.models.recipe import Tag
 from mealie.schema._mealie import MealieModel
 
 
@@ -54,9 +54,7 @@ class RecipeTagResponse(RecipeCategoryResponse):
     @classmethod
     def loader_options(cls) -> list[LoaderOption]:
         return [
-            selectinload(Tag.recipes).joinedload(RecipeModel.recipe_category),
-            selectinload(Tag.recipes).joinedload(RecipeModel.tags),
-            selectinload(Tag.recipes).joinedload(RecipeModel.tools),
+            selectinload(Tag.recipes).options(*RecipeSummary.loader_options()),
         ]
 
 
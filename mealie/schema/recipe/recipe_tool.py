@@ -2,7 +2,7 @@ from pydantic import UUID4, ConfigDict, field_validator
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 
-from mealie.db.models.recipe import RecipeModel, Tool
+from mealie.db.models.recipe import Tool
 from mealie.schema._mealie import MealieModel
 
 
@@ -50,9 +50,7 @@ class RecipeToolResponse(RecipeToolOut):
     def loader_options(cls) -> list[LoaderOption]:
         return [
             selectinload(Tool.households_with_tool),
-            selectinload(Tool.recipes).joinedload(RecipeModel.recipe_category),
-            selectinload(Tool.recipes).joinedload(RecipeModel.tags),
-            selectinload(Tool.recipes).joinedload(RecipeModel.tools),
+            selectinload(Tool.recipes).options(*RecipeSummary.loader_options()),
         ]
 
 
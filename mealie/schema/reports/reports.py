@@ -16,6 +16,7 @@ class ReportCategory(str, enum.Enum):
     restore = "restore"
     migration = "migration"
     bulk_import = "bulk_import"
+    export = "export"
 
 
 class ReportSummaryStatus(str, enum.Enum):
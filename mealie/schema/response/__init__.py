@@ -1,8 +1,11 @@
 # This file is auto-generated by gen_schema_exports.py
 from .pagination import (
+    CursorDirection,
     OrderByNullPosition,
     OrderDirection,
     PaginationBase,
+    PaginationCursor,
+    PaginationMode,
     PaginationQuery,
     RecipeSearchQuery,
     RequestQuery,
@@ -29,9 +32,12 @@ __all__ = [
     "RelationalKeyword",
     "RelationalOperator",
     "ValidationResponse",
+    "CursorDirection",
     "OrderByNullPosition",
     "OrderDirection",
     "PaginationBase",
+    "PaginationCursor",
+    "PaginationMode",
     "PaginationQuery",
     "RecipeSearchQuery",
     "RequestQuery",
@@ -1,7 +1,13 @@
+import base64
+import binascii
 import enum
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Annotated, Any, Generic, TypeVar
 from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+from uuid import UUID
 
+import orjson
 from humps import camelize
 from pydantic import UUID4, BaseModel, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -21,6 +27,81 @@ class OrderByNullPosition(str, enum.Enum):
     last = "last"
 
 
+class PaginationMode(str, enum.Enum):
+    offset = "offset"
+    cursor = "cursor"
+
+
+class CursorDirection(str, enum.Enum):
+    next = "next"
+    previous = "previous"
+
+
+class PaginationCursor(BaseModel):
+    """
+    Opaque keyset pagination cursor
+
+    Holds the values of the order_by columns (plus the id tiebreaker) of the row the next page
+    starts after, and a signature of the ordering so cursors can't be replayed against a different sort.
+    """
+
+    values: list[Any]
+    direction: CursorDirection = CursorDirection.next
+    signature: str
+
+    @staticmethod
+    def _encode_value(value: Any) -> Any:
+        # tag types which don't survive a JSON round-trip, so they can be bound back to the query as-is
+        if isinstance(value, datetime):
+            return {"t": "datetime", "v": value.isoformat()}
+        if isinstance(value, date):
+            return {"t": "date", "v": value.isoformat()}
+        if isinstance(value, UUID):
+            return {"t": "uuid", "v": str(value)}
+        if isinstance(value, Decimal):
+            return {"t": "decimal", "v": str(value)}
+        return value
+
+    @staticmethod
+    def _decode_value(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+
+        match value.get("t"):
+            case "datetime":
+                return datetime.fromisoformat(value["v"])
+            case "date":
+                return date.fromisoformat(value["v"])
+            case "uuid":
+                return UUID(value["v"])
+            case "decimal":
+                return Decimal(value["v"])
+            case _:
+                raise ValueError("invalid cursor value")
+
+    def encode(self) -> str:
+        payload = {
+            "v": [self._encode_value(value) for value in self.values],
+            "d": self.direction.value,
+            "s": self.signature,
+        }
+        return base64.urlsafe_b64encode(orjson.dumps(payload)).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PaginationCursor":
+        """Decodes a cursor created by `encode`. Raises a `ValueError` if the cursor is malformed."""
+
+        try:
+            payload = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            return cls(
+                values=[cls._decode_value(value) for value in payload["v"]],
+                direction=CursorDirection(payload["d"]),
+                signature=payload["s"],
+            )
+        except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError("invalid pagination cursor") from e
+
+
 class RecipeSearchQuery(MealieModel):
     cookbook: UUID4 | str | None = None
     require_all_categories: bool = False
@@ -48,6 +129,15 @@ class RequestQuery(MealieModel):
 class PaginationQuery(RequestQuery):
     page: int = 1
     per_page: int = 50
+    pagination_mode: PaginationMode = PaginationMode.offset
+    cursor: str | None = None
+    """Opaque cursor returned as `next_cursor`/`prev_cursor` by a previous cursor-mode page"""
+    include_total: bool = False
+    """In cursor mode the total count is skipped unless this is set; offset mode always counts"""
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.pagination_mode is PaginationMode.cursor or bool(self.cursor)
 
 
 class PaginationBase(BaseModel, Generic[DataT]):
@@ -58,6 +148,8 @@ class PaginationBase(BaseModel, Generic[DataT]):
     items: list[DataT]
     next: str | None = None
     previous: str | None = None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
 
     def _set_next(self, route: str, query_params: dict[str, Any]) -> None:
         if self.page >= self.total_pages:
@@ -77,9 +169,25 @@ class PaginationBase(BaseModel, Generic[DataT]):
         query_params["page"] = self.page - 1
         self.previous = PaginationBase.merge_query_parameters(route, query_params)
 
+    def _set_cursor_guides(self, route: str, query_params: dict[str, Any]) -> None:
+        query_params.pop("page", None)
+        query_params["paginationMode"] = PaginationMode.cursor.value
+
+        self.next = None
+        if self.next_cursor:
+            self.next = PaginationBase.merge_query_parameters(route, query_params | {"cursor": self.next_cursor})
+
+        self.previous = None
+        if self.prev_cursor:
+            self.previous = PaginationBase.merge_query_parameters(route, query_params | {"cursor": self.prev_cursor})
+
     def set_pagination_guides(self, route: str, query_params: dict[str, Any] | None) -> None:
         valid_dict: dict[str, Any] = camelize(query_params) if query_params else {}
 
+        if valid_dict.get("cursor") or valid_dict.get("paginationMode") == PaginationMode.cursor:
+            self._set_cursor_guides(route, valid_dict)
+            return
+
         # sanitize user input
         self.page = max(self.page, 1)
         self._set_next(route, valid_dict)
@@ -0,0 +1,123 @@
+"""
+Regenerates the resized versions of every recipe and timeline image, e.g. after changing the
+IMAGE_MINIATURE_MAX_SIZE/IMAGE_TINY_MAX_SIZE settings, or for images stored before the small versions
+were actually resized. The recipes' image versions are updated afterwards, so clients don't keep showing
+the old versions.
+"""
+
+import argparse
+import dataclasses
+import itertools
+import multiprocessing
+import os
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+import mealie.db.models._all_models  # noqa: F401 - registers every model, so the recipe model's relationships resolve
+from mealie.core import root_logger
+from mealie.core.config import get_app_dirs
+from mealie.db.db_setup import session_context
+from mealie.db.models.recipe.recipe import RecipeModel
+from mealie.pkgs import cache, img
+from mealie.services.recipe.recipe_data_service import get_minifier_options
+
+VERSION_BATCH_SIZE = 500
+
+
+def find_source_images(recipe_data_dir: Path) -> list[Path]:
+    """The image that each recipe or timeline image directory was generated from"""
+
+    sources: list[Path] = []
+    for image_dir in [*recipe_data_dir.glob("*/images"), *recipe_data_dir.glob("*/images/timeline/*")]:
+        originals = [file for file in image_dir.glob("original.*") if file.suffix.lower() in img.IMAGE_EXTENSIONS]
+        if not originals:
+            continue
+
+        # prefer the uploaded file, if it wasn't purged yet
+        originals.sort(key=lambda file: file.suffix == img.WEBP.suffix)
+        sources.append(originals[0])
+
+    return sources
+
+
+def regenerate_image(image_file: Path, opts: img.MinifierOptions) -> None:
+    """
+    Regenerates the smaller versions of an image. Once the uploaded file is purged, original.webp is the only
+    copy of the image, so it's only written if it's missing, rather than re-encoded (and degraded) every time
+    """
+
+    has_original = image_file.with_name("original.webp").exists()
+    if has_original:
+        opts = dataclasses.replace(opts, original=False)
+
+    img.PillowMinifier(purge=not has_original, opts=opts).minify(image_file, force=True)
+
+
+def get_recipe_id(image_file: Path) -> UUID | None:
+    """The recipe whose image `image_file` is, or None for timeline images"""
+
+    if image_file.parent.name != "images":
+        return None
+
+    try:
+        return UUID(image_file.parent.parent.name)
+    except ValueError:
+        return None
+
+
+def update_image_versions(recipe_ids: Iterable[UUID]) -> None:
+    """Gives the recipes' images a new version, so the images (which are cached by version) are fetched again"""
+
+    ids = iter(recipe_ids)
+    with session_context() as session:
+        while batch := list(itertools.islice(ids, VERSION_BATCH_SIZE)):
+            stmt = select(RecipeModel.id).where(RecipeModel.id.in_(batch), RecipeModel.image.is_not(None))
+            rows = [{"id": recipe_id, "image": cache.cache_key.new_key()} for recipe_id in session.scalars(stmt)]
+            if rows:
+                session.execute(update(RecipeModel), rows)
+
+        session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate the resized versions of all recipe images")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of processes to use")
+    args = parser.parse_args()
+
+    logger = root_logger.get_logger()
+
+    sources = find_source_images(get_app_dirs().RECIPE_DATA_DIR)
+    opts = get_minifier_options()
+    logger.info(f"regenerating {len(sources)} recipe images with {args.workers} worker(s)")
+
+    failed = 0
+    regenerated_recipe_ids: list[UUID] = []
+    with ProcessPoolExecutor(
+        max_workers=max(1, args.workers), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(regenerate_image, source, opts): source for source in sources}
+        for i, future in enumerate(as_completed(futures), start=1):
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                logger.error(f"failed to regenerate {futures[future]}: {e}")
+            else:
+                if recipe_id := get_recipe_id(futures[future]):
+                    regenerated_recipe_ids.append(recipe_id)
+
+            if not i % 100:
+                logger.info(f"regenerated {i}/{len(sources)} images")
+
+    update_image_versions(regenerated_recipe_ids)
+    logger.info(f"regenerated {len(sources) - failed} images, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
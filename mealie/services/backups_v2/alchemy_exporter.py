@@ -1,16 +1,33 @@
 import datetime
+import json
 import os
-import uuid
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from logging import Logger
 from os import path
 from textwrap import dedent
-from typing import Any
+from typing import IO, Any
 
 from alembic import command
 from alembic.config import Config
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import Connection, ForeignKey, ForeignKeyConstraint, MetaData, Table, create_engine, insert, text
+from sqlalchemy import (
+    CHAR,
+    Column,
+    Connection,
+    Date,
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    Time,
+    Uuid,
+    create_engine,
+    insert,
+    text,
+)
 from sqlalchemy.engine import base
 from sqlalchemy.orm import sessionmaker
 
@@ -18,7 +35,13 @@ from mealie.db import init_db
 from mealie.db.fixes.fix_migration_data import fix_migration_data
 from mealie.db.init_db import ALEMBIC_DIR
 from mealie.db.models._model_utils.guid import GUID
+from mealie.db.models.recipe.search_index import (
+    is_search_index_shadow_table,
+    is_search_index_table,
+    rebuild_recipe_search_index,
+)
 from mealie.services._base_service import BaseService
+from mealie.services.backups_v2.backup_file import BackupContents
 
 
 class ForeignKeyDisabler:
@@ -51,21 +74,55 @@ class ForeignKeyDisabler:
             raise
 
 
+class ForeignKeyIndex:
+    """
+    Hash sets of the values of every column that a foreign key points to, so each foreign key value
+    can be checked in constant time instead of by scanning the referenced table's rows
+    """
+
+    def __init__(self, tables: Iterable[Table]) -> None:
+        self.referenced_columns: dict[str, set[str]] = defaultdict(set)
+        for table in tables:
+            for fk in table.foreign_keys:
+                self.referenced_columns[fk.column.table.name].add(fk.column.name)
+
+        self._values: dict[tuple[str, str], set[Any]] = defaultdict(set)
+
+    @classmethod
+    def from_dump(cls, tables: Iterable[Table], db_dump: dict[str, list[dict]]) -> "ForeignKeyIndex":
+        index = cls(tables)
+        for table_name, rows in db_dump.items():
+            index.add_rows(table_name, rows)
+
+        return index
+
+    def add_rows(self, table_name: str, rows: list[dict]) -> None:
+        for column in self.referenced_columns.get(table_name, ()):
+            self._values[(table_name, column)].update(row.get(column) for row in rows)
+
+    def is_valid(self, fk: ForeignKey, fk_value: Any) -> bool:
+        if not fk_value:
+            return True
+
+        return fk_value in self._values.get((fk.column.table.name, fk.column.name), ())
+
+
 class AlchemyExporter(BaseService):
     connection_str: str
     engine: base.Engine
     meta: MetaData
 
-    look_for_datetime = {"created_at", "update_at", "date_updated", "timestamp", "expires_at", "locked_at", "last_made"}
-    look_for_date = {"date_added", "date"}
-    look_for_time = {"scheduled_time"}
+    dump_chunk_size = 1000
+    restore_chunk_size = 1000
 
     class DateTimeParser(BaseModel):
         date: datetime.date | None = None
         dt: datetime.datetime | None = None
         time: datetime.time | None = None
 
-    def __init__(self, connection_str: str) -> None:
+    def __init__(
+        self, connection_str: str, *, dump_chunk_size: int | None = None, restore_chunk_size: int | None = None
+    ) -> None:
         super().__init__()
 
         self.connection_str = connection_str
@@ -73,77 +130,113 @@ class AlchemyExporter(BaseService):
         self.meta = MetaData()
         self.session_maker = sessionmaker(bind=self.engine)
 
-    @staticmethod
-    def is_uuid(value: Any) -> bool:
+        self.dump_chunk_size = dump_chunk_size or self.dump_chunk_size
+        self.restore_chunk_size = restore_chunk_size or self.restore_chunk_size
+
+    def _convert_guid(self, value: Any) -> Any:
         try:
-            uuid.UUID(value)
-            return True
+            # convert the data to the current database's native GUID type
+            return GUID.convert_value_to_guid(value, self.engine.dialect)
         except ValueError:
-            return False
+            return value
 
-    @staticmethod
-    def is_valid_foreign_key(db_dump: dict[str, list[dict]], fk: ForeignKey, fk_value: Any) -> bool:
-        if not fk_value:
-            return True
+    @classmethod
+    def _convert_datetime(cls, value: Any) -> Any:
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return cls.DateTimeParser(dt=value).dt
 
-        foreign_table_name = fk.column.table.name
-        foreign_field_name = fk.column.name
+    @classmethod
+    def _convert_date(cls, value: Any) -> Any:
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return cls.DateTimeParser(date=value).date
 
-        for row in db_dump.get(foreign_table_name, []):
-            if row[foreign_field_name] == fk_value:
-                return True
+    @classmethod
+    def _convert_time(cls, value: Any) -> Any:
+        try:
+            return datetime.time.fromisoformat(value)
+        except ValueError:
+            return cls.DateTimeParser(time=value).time
+
+    def get_column_converter(self, column: Column) -> Callable[[Any], Any] | None:
+        """
+        Returns the function that restores a column's json string values into their complex type,
+        or None if the column's values can be inserted as-is
+        """
+
+        column_type = column.type
 
-        return False
+        # GUIDs are reflected as Postgres' UUID type, otherwise as CHAR(32)
+        if isinstance(column_type, Uuid) or (isinstance(column_type, CHAR) and column_type.length == 32):
+            return self._convert_guid
+        if isinstance(column_type, DateTime):
+            return self._convert_datetime
+        if isinstance(column_type, Date):
+            return self._convert_date
+        if isinstance(column_type, Time):
+            return self._convert_time
 
-    def convert_types(self, data: dict) -> dict:
+        return None
+
+    def get_row_converter(self, table: Table) -> Callable[[dict], dict]:
         """
-        walks the dictionary to restore all things that look like string representations of their complex types
-        used in the context of reading a json file into a database via SQLAlchemy.
+        Builds a function that restores the string representations of a row's complex types, as read from a json
+        file, so the row can be inserted into the table via SQLAlchemy. Rows are converted in place.
         """
-        for key, value in data.items():
-            if isinstance(value, dict):
-                data = self.convert_types(value)
-            elif isinstance(value, list):  # assume that this is a list of dictionaries
-                data[key] = [self.convert_types(item) for item in value]
-            elif isinstance(value, str):
-                if self.is_uuid(value):
-                    # convert the data to the current database's native GUID type
-                    data[key] = GUID.convert_value_to_guid(value, self.engine.dialect)
-                if key in self.look_for_datetime:
-                    data[key] = self.DateTimeParser(dt=value).dt
-                if key in self.look_for_date:
-                    data[key] = self.DateTimeParser(date=value).date
-                if key in self.look_for_time:
-                    data[key] = self.DateTimeParser(time=value).time
-        return data
-
-    def clean_rows(self, db_dump: dict[str, list[dict]], table: Table, rows: list[dict]) -> list[dict]:
+
+        converters = {
+            column.name: converter for column in table.columns if (converter := self.get_column_converter(column))
+        }
+
+        def convert_row(row: dict) -> dict:
+            for column_name, converter in converters.items():
+                if isinstance(value := row.get(column_name), str):
+                    row[column_name] = converter(value)
+
+            return row
+
+        return convert_row
+
+    def clean_rows(
+        self,
+        fk_index: ForeignKeyIndex,
+        table: Table,
+        rows: list[dict],
+        removed_rows: Counter[tuple[str, str]] | None = None,
+    ) -> list[dict]:
         """
-        Checks rows against foreign key restraints and removes any rows that would violate them
+        Checks rows against foreign key restraints and removes any rows that would violate them.
+        Removed rows are counted in `removed_rows` by (table, foreign key column).
         """
 
         fks = table.foreign_keys
 
         valid_rows = []
         for row in rows:
-            is_valid_row = True
-            for fk in fks:
-                fk_value = row.get(fk.parent.name)
-                if self.is_valid_foreign_key(db_dump, fk, row.get(fk.parent.name)):
-                    continue
-
-                is_valid_row = False
-                self.logger.warning(
-                    f"Removing row from table {table.name} because of invalid foreign key {fk.parent.name}: {fk_value}"
-                )
-                self.logger.warning(f"Row: {row}")
-                break
-
-            if is_valid_row:
+            invalid_fk = next((fk for fk in fks if not fk_index.is_valid(fk, row.get(fk.parent.name))), None)
+            if invalid_fk is None:
                 valid_rows.append(row)
+                continue
+
+            self.logger.debug(
+                f"Removing row from table {table.name} because of invalid foreign key {invalid_fk.parent.name}: {row}"
+            )
+            if removed_rows is not None:
+                removed_rows[(table.name, invalid_fk.parent.name)] += 1
 
         return valid_rows
 
+    def log_removed_rows(self, removed_rows: Counter[tuple[str, str]]) -> None:
+        if not removed_rows:
+            return
+
+        self.logger.warning(f"Removed {removed_rows.total()} row(s) with invalid foreign keys:")
+        for (table_name, column_name), count in sorted(removed_rows.items()):
+            self.logger.warning(f"  {table_name}.{column_name}: {count} row(s)")
+
     def dump_schema(self) -> dict:
         """
         Returns the schema of the SQLAlchemy database as a python dictionary. This dictionary is wrapped by
@@ -152,7 +245,7 @@ class AlchemyExporter(BaseService):
         with self.engine.connect() as connection:
             self.meta.reflect(bind=self.engine)
 
-            all_tables = self.meta.tables.values()
+            all_tables = [table for table in self.meta.tables.values() if not is_search_index_table(table.name)]
 
             results = {
                 **{table.name: [] for table in all_tables},
@@ -163,12 +256,17 @@ class AlchemyExporter(BaseService):
 
             return jsonable_encoder(results)
 
-    def dump(self) -> dict[str, list[dict]]:
+    def iter_dump(self, chunk_size: int | None = None) -> Iterator[tuple[str, list[dict]]]:
         """
-        Returns the entire SQLAlchemy database as a python dictionary. This dictionary is wrapped by
-        jsonable_encoder to ensure that the object can be converted to a json string.
+        Yields the entire SQLAlchemy database as (table name, rows) pairs, `chunk_size` rows at a time, so the
+        whole database is never held in memory. A table's rows may be split across several chunks; empty tables
+        are yielded once with no rows. The alembic version is always yielded first.
+
+        Rows are wrapped by jsonable_encoder to ensure that they can be converted to a json string.
         """
 
+        chunk_size = chunk_size or self.dump_chunk_size
+
         # run database fixes first so we aren't backing up bad data
         with self.session_maker() as session:
             try:
@@ -179,17 +277,73 @@ class AlchemyExporter(BaseService):
         with self.engine.connect() as connection:
             self.meta.reflect(bind=self.engine)  #  http://docs.sqlalchemy.org/en/rel_0_9/core/reflection.html
 
-            result = {
-                table.name: [dict(row) for row in connection.execute(table.select()).mappings()]
-                for table in self.meta.sorted_tables
-            }
+            # the search index is derived from the other tables, so it's rebuilt on restore instead
+            tables = [table for table in self.meta.sorted_tables if not is_search_index_table(table.name)]
+            tables.sort(key=lambda table: table.name != "alembic_version")
+
+            for table in tables:
+                # yield_per uses a server-side cursor (where supported) and fetches rows in batches
+                result = connection.execution_options(yield_per=chunk_size).execute(table.select())
+
+                is_empty = True
+                for partition in result.mappings().partitions():
+                    is_empty = False
+                    yield table.name, jsonable_encoder([dict(row) for row in partition])
+
+                if is_empty:
+                    yield table.name, []
+
+    def dump(self) -> dict[str, list[dict]]:
+        """
+        Returns the entire SQLAlchemy database as a python dictionary. This dictionary is wrapped by
+        jsonable_encoder to ensure that the object can be converted to a json string.
+
+        This holds the whole database in memory; use `dump_to_stream` for backups.
+        """
+
+        result: dict[str, list[dict]] = {}
+        for table_name, rows in self.iter_dump():
+            result.setdefault(table_name, []).extend(rows)
 
-        return jsonable_encoder(result)
+        return result
+
+    def dump_to_stream(self, stream: IO[bytes], chunk_size: int | None = None) -> None:
+        """
+        Writes the entire SQLAlchemy database to `stream` as newline-delimited JSON. Each line is one chunk
+        of rows from a single table: `{"table": "recipes", "rows": [...]}`
+        """
+
+        for table_name, rows in self.iter_dump(chunk_size):
+            stream.write(json.dumps({"table": table_name, "rows": rows}).encode("utf-8"))
+            stream.write(b"\n")
+
+    def _scan_backup(
+        self, contents: BackupContents, row_converters: dict[str, Callable[[dict], dict]]
+    ) -> tuple[ForeignKeyIndex, Counter[str]]:
+        """
+        Reads through the backup once to count each table's rows and to index the columns that foreign keys
+        point to, so rows can be checked against their foreign keys without holding the backup in memory
+        """
+
+        fk_index = ForeignKeyIndex(self.meta.tables.values())
+        row_counts: Counter[str] = Counter()
+        for table_name, rows in contents.iter_tables():
+            row_counts[table_name] += len(rows)
+            if not (columns := fk_index.referenced_columns.get(table_name)):
+                continue
+
+            convert_row = row_converters[table_name]
+            fk_index.add_rows(
+                table_name, [convert_row({column: row.get(column) for column in columns}) for row in rows]
+            )
+
+        return fk_index, row_counts
+
+    def restore(self, contents: BackupContents) -> None:
+        """Restores all data from the backup into the database, reading the backup one chunk at a time"""
 
-    def restore(self, db_dump: dict) -> None:
         # setup alembic to run migrations up the version of the backup
-        alembic_data = db_dump["alembic_version"]
-        alembic_version = alembic_data[0]["version_num"]
+        alembic_version = contents.schema_version()
 
         alembic_cfg_path = os.getenv("ALEMBIC_CONFIG_FILE", default=str(ALEMBIC_DIR / "alembic.ini"))
 
@@ -199,21 +353,55 @@ class AlchemyExporter(BaseService):
         alembic_cfg = Config(alembic_cfg_path)
         command.upgrade(alembic_cfg, alembic_version)
 
-        del db_dump["alembic_version"]
-        """Restores all data from dictionary into the database"""
+        self.meta.reflect(bind=self.engine)
+        row_converters = {table.name: self.get_row_converter(table) for table in self.meta.tables.values()}
+
+        fk_index, row_counts = self._scan_backup(contents, row_converters)
+        tables_to_restore = [
+            table_name
+            for table_name, count in row_counts.items()
+            if count and table_name != "alembic_version" and not is_search_index_table(table_name)
+        ]
+
+        removed_rows: Counter[tuple[str, str]] = Counter()
+        read_rows: Counter[str] = Counter()
+        restored_rows: Counter[str] = Counter()
+        restored_tables = 0
+
         with self.engine.begin() as connection:
             with ForeignKeyDisabler(connection, self.engine.dialect.name, logger=self.logger):
-                data = self.convert_types(db_dump)
-
-                self.meta.reflect(bind=self.engine)
-                for table_name, rows in data.items():
-                    if not rows:
+                for table_name, rows in contents.iter_tables():
+                    if not rows or table_name == "alembic_version" or is_search_index_table(table_name):
                         continue
+
                     table = self.meta.tables[table_name]
-                    rows = self.clean_rows(db_dump, table, rows)
+                    if table_name not in read_rows:
+                        connection.execute(table.delete())
+
+                    read_rows[table_name] += len(rows)
+                    convert_row = row_converters[table_name]
+                    rows = self.clean_rows(fk_index, table, [convert_row(row) for row in rows], removed_rows)
+
+                    # a list of parameters is sent as an executemany, which SQLAlchemy batches into multi-row inserts
+                    for i in range(0, len(rows), self.restore_chunk_size):
+                        chunk = rows[i : i + self.restore_chunk_size]
+                        connection.execute(insert(table), chunk)
+                        restored_rows[table_name] += len(chunk)
+
+                    if read_rows[table_name] < row_counts[table_name]:
+                        self.logger.debug(
+                            f"restoring {table_name}: {read_rows[table_name]}/{row_counts[table_name]} rows read"
+                        )
+                        continue
+
+                    restored_tables += 1
+                    self.logger.info(
+                        f"restored {restored_rows[table_name]} rows into {table_name} "
+                        f"({restored_tables}/{len(tables_to_restore)} tables)"
+                    )
+
+                self.log_removed_rows(removed_rows)
 
-                    connection.execute(table.delete())
-                    connection.execute(insert(table), rows)
                 if self.engine.dialect.name == "postgresql":
                     # Restore postgres sequence numbers
                     sequences = [
@@ -242,6 +430,9 @@ class AlchemyExporter(BaseService):
         # Re-init database to finish migrations
         init_db.main()
 
+        with self.engine.begin() as connection:
+            rebuild_recipe_search_index(connection)
+
     def drop_all(self) -> None:
         """Drops all data from the database"""
         from sqlalchemy.engine.reflection import Inspector
@@ -257,6 +448,10 @@ class AlchemyExporter(BaseService):
             tables = []
             all_fkeys = []
             for table_name in inspector.get_table_names():
+                # SQLite's full text search shadow tables are dropped along with the search index itself
+                if is_search_index_shadow_table(table_name):
+                    continue
+
                 fkeys = []
 
                 for fkey in inspector.get_foreign_keys(table_name):
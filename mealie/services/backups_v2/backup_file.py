@@ -1,6 +1,7 @@
 import json
 import shutil
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -11,6 +12,7 @@ class BackupContents:
         self.base = self._find_base(file)
         self.data_directory = self._find_data_dir_from_base(self.base)
         self.tables = self._find_database_from_base(self.base)
+        self.tables_stream = self._find_database_stream_from_base(self.base)
 
     @classmethod
     def _find_base(cls, file: Path) -> Path:
@@ -26,9 +28,9 @@ class BackupContents:
             return file
 
         # If the backup somehow adds a __MACOSX directory alongside the data directory, rather than in the
-        # parent directory, we don't want to traverse down. We check for our database.json file, and if it exists,
+        # parent directory, we don't want to traverse down. We check for our database file, and if it exists,
         # we're already at the correct base.
-        if cls._find_database_from_base(file).exists():
+        if cls._find_database_from_base(file).exists() or cls._find_database_stream_from_base(file).exists():
             return file
 
         # This ZIP file was mangled, so we return the first non-dunder directory (if it exists).
@@ -42,6 +44,10 @@ class BackupContents:
     def _find_database_from_base(cls, base: Path) -> Path:
         return base / "database.json"
 
+    @classmethod
+    def _find_database_stream_from_base(cls, base: Path) -> Path:
+        return base / "database.ndjson"
+
     def validate(self) -> bool:
         if not self.base.is_dir():
             return False
@@ -49,23 +55,55 @@ class BackupContents:
         if not self.data_directory.is_dir():
             return False
 
-        if not self.tables.is_file():
+        if not (self.tables.is_file() or self.tables_stream.is_file()):
             return False
 
         return True
 
     def schema_version(self) -> str:
-        tables = self.read_tables()
+        # the alembic version is written first, so streamed backups don't need to be read any further
+        for table_name, rows in self.iter_tables():
+            if table_name != "alembic_version":
+                continue
+
+            if not rows:
+                return ""
+
+            return rows[0].get("version_num", "")
+
+        return ""
 
-        alembic_version = tables.get("alembic_version", [])
+    def iter_tables(self) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Yields the backed up rows as (table name, rows) pairs. Streamed backups (database.ndjson) are read
+        one chunk at a time, so a table's rows may be split across several chunks.
+        """
 
-        if not alembic_version:
-            return ""
+        if not self.tables_stream.is_file():
+            yield from self.read_tables().items()
+            return
 
-        return alembic_version[0].get("version_num", "")
+        with open(self.tables_stream, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                chunk = json.loads(line)
+                yield chunk["table"], chunk["rows"]
 
     def read_tables(self) -> dict:
-        if self._tables is None:
+        """Reads the entire backup into memory; prefer `iter_tables` for large backups"""
+
+        if self._tables is not None:
+            return self._tables
+
+        if self.tables_stream.is_file():
+            tables: dict[str, list[dict]] = {}
+            for table_name, rows in self.iter_tables():
+                tables.setdefault(table_name, []).extend(rows)
+
+            self._tables = tables
+        else:
             with open(self.tables) as f:
                 self._tables = json.load(f)
 
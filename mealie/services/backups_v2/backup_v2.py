@@ -1,5 +1,4 @@
 import datetime
-import json
 import shutil
 from pathlib import Path
 from zipfile import ZipFile
@@ -35,17 +34,17 @@ class BackupV2(BaseService):
         # sourcery skip: merge-nested-ifs, reintroduce-else, remove-redundant-continue
         exclude = {"mealie.db", "mealie.log", ".secret"}
         exclude_ext = {".zip"}
-        exclude_dirs = {"backups", ".temp"}
+        exclude_dirs = {"backups", ".temp", "jobs"}
 
         timestamp = datetime.datetime.now(datetime.UTC).strftime("%Y.%m.%d.%H.%M.%S")
 
         backup_name = f"mealie_{timestamp}.zip"
         backup_file = self.directories.BACKUP_DIR / backup_name
 
-        database_json = self.db_exporter.dump()
-
         with ZipFile(backup_file, "w") as zip_file:
-            zip_file.writestr("database.json", json.dumps(database_json))
+            # stream the database straight into the archive so it's never held in memory all at once
+            with zip_file.open("database.ndjson", "w", force_zip64=True) as database_file:
+                self.db_exporter.dump_to_stream(database_file)
 
             for data_file in self.directories.DATA_DIR.glob("**/*"):
                 if data_file.name in exclude:
@@ -82,12 +81,10 @@ class BackupV2(BaseService):
             # Validation
             if not contents.validate():
                 self.logger.error(
-                    "Invalid backup file. file does not contain required elements (data directory and database.json)"
+                    "Invalid backup file. file does not contain required elements (data directory and database file)"
                 )
                 raise ValueError("Invalid backup file")
 
-            database_json = contents.read_tables()
-
             # ================================
             # Purge Database
 
@@ -98,7 +95,7 @@ class BackupV2(BaseService):
             # Restore Database
 
             self.logger.info("importing database tables")
-            self.db_exporter.restore(database_json)
+            self.db_exporter.restore(contents)
 
             self.logger.info("database tables imported successfully")
 
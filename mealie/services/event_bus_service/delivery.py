@@ -0,0 +1,344 @@
+"""Sends webhooks and Apprise notifications in the background."""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import httpx
+
+from mealie.core.config import get_app_settings
+from mealie.core.root_logger import get_logger
+
+SendFn = Callable[[httpx.AsyncClient], Awaitable[None]]
+
+
+class DeliveryFailed(Exception):
+    """Raised by a send function when a delivery failed and should be retried"""
+
+
+class DeliveryDropped(Exception):
+    """Set on a delivery's future when it couldn't be queued"""
+
+
+@dataclass
+class Delivery:
+    destination: str
+    send: SendFn
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class DeliveryMetrics:
+    """Thread-safe counters and recent latencies (from first being queued until delivered) of all deliveries"""
+
+    def __init__(self, max_latencies: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=max_latencies)
+
+        self.queued = 0
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_delivery(self, latency: float) -> None:
+        with self._lock:
+            self.delivered += 1
+            self._latencies.append(latency)
+
+    def snapshot(self) -> dict[str, int | float | None]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counters = {
+                "queued": self.queued,
+                "delivered": self.delivered,
+                "retried": self.retried,
+                "failed": self.failed,
+                "dropped": self.dropped,
+            }
+
+        if not latencies:
+            return counters | {"latency_p50": None, "latency_p95": None, "latency_max": None}
+
+        return counters | {
+            "latency_p50": statistics.median(latencies),
+            "latency_p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            "latency_max": latencies[-1],
+        }
+
+
+def get_destination(url: str) -> str:
+    """The host that `url` is sent to, without credentials, used to limit concurrency and in logs"""
+
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.hostname or ''}"
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.UnsupportedProtocol):
+        return False
+
+    if isinstance(exc, DeliveryFailed | httpx.TransportError):
+        return True
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code >= 500 or status_code == 429
+
+    return False
+
+
+class NotificationDelivery:
+    def __init__(
+        self,
+        *,
+        queue_size: int = 1000,
+        max_concurrency: int = 20,
+        max_concurrency_per_host: int = 4,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        queue_timeout: float = 5.0,
+        request_timeout: float = 15.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.queue_size = queue_size
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.queue_timeout = queue_timeout
+        self.request_timeout = request_timeout
+        self.transport = transport
+
+        self.metrics = DeliveryMetrics()
+        self.logger = get_logger()
+
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # only used from within the delivery thread
+        self._queue: asyncio.Queue[Delivery] | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._workers: list[asyncio.Task] = []
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._retries: set[asyncio.Task] = set()
+        self._in_flight = 0
+        self._idle: asyncio.Event | None = None
+
+    # ===============================================
+    # Delivery Thread
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(loop, started), name="notification-delivery", daemon=True
+                )
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+
+            return self._loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._start_workers())
+        started.set()
+
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _start_workers(self) -> None:
+        self._queue = asyncio.Queue(maxsize=max(1, self.queue_size))
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._client = httpx.AsyncClient(
+            timeout=self.request_timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            transport=self.transport,
+        )
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(max(1, self.max_concurrency))]
+
+    async def _stop_workers(self) -> None:
+        if self._in_flight:
+            self.logger.warning(f"Notification delivery stopped with {self._in_flight} notification(s) not sent")
+
+        tasks = [*self._workers, *self._retries]
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_host_limit(self, destination: str) -> asyncio.Semaphore:
+        if (limit := self._host_limits.get(destination)) is None:
+            limit = self._host_limits[destination] = asyncio.Semaphore(max(1, self.max_concurrency_per_host))
+
+        return limit
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+
+        while True:
+            delivery = await self._queue.get()
+            try:
+                await self._deliver(delivery)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, delivery: Delivery) -> None:
+        assert self._client is not None
+
+        delivery.attempts += 1
+        try:
+            async with self._get_host_limit(delivery.destination):
+                await delivery.send(self._client)
+        except Exception as e:
+            if is_retryable(e) and delivery.attempts <= self.max_retries:
+                retry = asyncio.create_task(self._retry(delivery, e))
+                self._retries.add(retry)
+                retry.add_done_callback(self._retries.discard)
+                return
+
+            self.metrics.increment("failed")
+            self.logger.error(
+                f"Failed to send notification to {delivery.destination} after {delivery.attempts} attempt(s): {e}"
+            )
+            self._finish(delivery, e)
+            return
+
+        latency = time.monotonic() - delivery.queued_at
+        self.metrics.record_delivery(latency)
+        self.logger.debug(f"Sent notification to {delivery.destination} in {latency:.3f}s")
+        self._finish(delivery)
+
+    async def _retry(self, delivery: Delivery, exc: Exception) -> None:
+        assert self._queue is not None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (delivery.attempts - 1))
+        self.metrics.increment("retried")
+        self.logger.warning(
+            f"Failed to send notification to {delivery.destination} (attempt {delivery.attempts}), "
+            f"retrying in {delay:.1f}s: {exc}"
+        )
+
+        await asyncio.sleep(delay)
+        await self._queue.put(delivery)
+
+    async def _enqueue(self, delivery: Delivery) -> None:
+        assert self._queue is not None and self._idle is not None
+
+        await self._queue.put(delivery)
+        self._in_flight += 1
+        self._idle.clear()
+
+    def _finish(self, delivery: Delivery, exc: Exception | None = None) -> None:
+        assert self._idle is not None
+
+        self._in_flight -= 1
+        if not self._in_flight:
+            self._idle.set()
+
+        # a delivery that timed out while being queued may still have made it in at the last moment
+        if delivery.future.done():
+            return
+
+        if exc is None:
+            delivery.future.set_result(None)
+        else:
+            delivery.future.set_exception(exc)
+
+    # ===============================================
+    # Public API
+
+    @property
+    def max_delivery_time(self) -> float:
+        """How long a queued delivery can take to be sent or finally fail, including all of its retries"""
+
+        backoff = sum(min(self.max_backoff, self.backoff * 2**attempt) for attempt in range(self.max_retries))
+        return (self.max_retries + 1) * self.request_timeout + backoff
+
+    def submit(self, destination: str, send: SendFn) -> Future:
+        """
+        Queues `send` to be run against the shared HTTP client. If the queue is full, this blocks for up to
+        `queue_timeout` seconds before dropping the delivery. The returned future resolves once the delivery
+        succeeded or finally failed.
+        """
+
+        loop = self._ensure_started()
+        delivery = Delivery(get_destination(destination), send)
+
+        queued = asyncio.run_coroutine_threadsafe(self._enqueue(delivery), loop)
+        try:
+            queued.result(timeout=self.queue_timeout)
+        except FutureTimeoutError:
+            queued.cancel()
+            self.metrics.increment("dropped")
+            self.logger.error(f"Notification queue is full; dropped notification to {delivery.destination}")
+            delivery.future.set_exception(DeliveryDropped("notification queue is full"))
+            return delivery.future
+
+        self.metrics.increment("queued")
+        return delivery.future
+
+    def join(self, timeout: float | None = None) -> None:
+        """Waits until every queued notification, including retries, has been sent or has failed"""
+
+        if self._loop is None or self._idle is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._idle.wait(), self._loop).result(timeout=timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._stop_workers(), loop).result(timeout=timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=timeout)
+
+            self._queue = self._idle = None
+            self._host_limits = {}
+            self._in_flight = 0
+
+
+@lru_cache
+def get_notification_delivery() -> NotificationDelivery:
+    settings = get_app_settings()
+    return NotificationDelivery(
+        queue_size=settings.NOTIFICATION_QUEUE_SIZE,
+        max_concurrency=settings.NOTIFICATION_MAX_CONCURRENCY,
+        max_concurrency_per_host=settings.NOTIFICATION_MAX_CONCURRENCY_PER_HOST,
+        max_retries=settings.NOTIFICATION_MAX_RETRIES,
+    )
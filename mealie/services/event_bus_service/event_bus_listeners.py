@@ -25,11 +25,13 @@ class EventListenerBase(ABC):
     _session: Session | None = None
     _repos: AllRepositories | None = None
 
-    def __init__(self, group_id: UUID4, household_id: UUID4, publisher: PublisherLike) -> None:
+    def __init__(
+        self, group_id: UUID4, household_id: UUID4, publisher: PublisherLike, session: Session | None = None
+    ) -> None:
         self.group_id = group_id
         self.household_id = household_id
         self.publisher = publisher
-        self._session = None
+        self._session = session
         self._repos = None
 
     @abstractmethod
@@ -71,8 +73,8 @@ class EventListenerBase(ABC):
 
 
 class AppriseEventListener(EventListenerBase):
-    def __init__(self, group_id: UUID4, household_id: UUID4) -> None:
-        super().__init__(group_id, household_id, ApprisePublisher())
+    def __init__(self, group_id: UUID4, household_id: UUID4, session: Session | None = None) -> None:
+        super().__init__(group_id, household_id, ApprisePublisher(), session)
 
     def get_subscribers(self, event: Event) -> list[str]:
         with self.ensure_repos(self.group_id, self.household_id) as repos:
@@ -133,8 +135,8 @@ class AppriseEventListener(EventListenerBase):
 
 
 class WebhookEventListener(EventListenerBase):
-    def __init__(self, group_id: UUID4, household_id: UUID4) -> None:
-        super().__init__(group_id, household_id, WebhookPublisher())
+    def __init__(self, group_id: UUID4, household_id: UUID4, session: Session | None = None) -> None:
+        super().__init__(group_id, household_id, WebhookPublisher(), session)
 
     def get_subscribers(self, event: Event) -> list[ReadWebhook]:
         # we only care about events that contain webhook information
@@ -3,7 +3,7 @@ from pydantic import UUID4
 from sqlalchemy.orm.session import Session
 
 from mealie.core.config import get_app_settings
-from mealie.db.db_setup import generate_session
+from mealie.db.db_setup import generate_session, session_context
 from mealie.repos.all_repositories import get_repositories
 from mealie.schema.response.pagination import PaginationQuery
 from mealie.services.event_bus_service.event_bus_listeners import (
@@ -51,17 +51,22 @@ class EventBusService:
         self.bg = bg
         self.session = session
 
-    def _get_listeners(self, group_id: UUID4, household_id: UUID4) -> list[EventListenerBase]:
+    def _get_listeners(
+        self, group_id: UUID4, household_id: UUID4, session: Session | None = None
+    ) -> list[EventListenerBase]:
         return [
-            AppriseEventListener(group_id, household_id),
-            WebhookEventListener(group_id, household_id),
+            AppriseEventListener(group_id, household_id, session),
+            WebhookEventListener(group_id, household_id, session),
         ]
 
     def _publish_event(self, event: Event, group_id: UUID4, household_id: UUID4) -> None:
-        """Publishes the event to all listeners"""
-        for listener in self._get_listeners(group_id, household_id):
-            if subscribers := listener.get_subscribers(event):
-                listener.publish_to_subscribers(event, subscribers)
+        """Publishes the event to all listeners, which queue the notifications to be sent in the background"""
+
+        # the listeners share a session, rather than each opening their own
+        with session_context() as session:
+            for listener in self._get_listeners(group_id, household_id, session):
+                if subscribers := listener.get_subscribers(event):
+                    listener.publish_to_subscribers(event, subscribers)
 
     def dispatch(
         self,
@@ -1,9 +1,12 @@
+import time
+from concurrent.futures import Future
 from typing import Protocol
 
 import apprise
-import requests
+import httpx
 from fastapi.encoders import jsonable_encoder
 
+from mealie.services.event_bus_service.delivery import DeliveryFailed, NotificationDelivery, get_notification_delivery
 from mealie.services.event_bus_service.event_types import Event
 
 
@@ -11,39 +14,65 @@ class PublisherLike(Protocol):
     def publish(self, event: Event, notification_urls: list[str]): ...
 
 
+def _wait_for_deliveries(futures: list[Future], timeout: float) -> None:
+    """Waits for the deliveries to finish, raising the first failure, or `TimeoutError` after `timeout` seconds"""
+
+    deadline = time.monotonic() + timeout
+    for future in futures:
+        future.result(timeout=max(0.0, deadline - time.monotonic()))
+
+
 class ApprisePublisher:
-    def __init__(self, hard_fail=False) -> None:
-        asset = apprise.AppriseAsset(
+    def __init__(self, hard_fail=False, delivery: NotificationDelivery | None = None) -> None:
+        self.asset = apprise.AppriseAsset(
             async_mode=True,
             image_url_mask="https://raw.githubusercontent.com/mealie-recipes/mealie/9571816ac4eed5beacfc0abf6c03eff1427fd0eb/frontend/static/icons/android-chrome-maskable-512x512.png",
         )
-        self.apprise = apprise.Apprise(asset=asset)
         self.hard_fail = hard_fail
+        self.delivery = delivery or get_notification_delivery()
 
     def publish(self, event: Event, notification_urls: list[str]):
-        """Publishses a list of notification URLs"""
+        """Queues a notification to each of the notification URLs"""
 
-        tags = []
+        futures: list[Future] = []
         for dest in notification_urls:
-            # we tag the url so it only sends each notification once
-            tag = str(event.event_id)
-            tags.append(tag)
+            # each URL gets its own Apprise instance, so it's sent (and retried) independently of the others
+            notifier = apprise.Apprise(asset=self.asset)
+            status = notifier.add(dest)
 
-            status = self.apprise.add(dest, tag=tag)
+            if not status:
+                if self.hard_fail:
+                    raise Exception("Apprise URL Add Failed")
+                continue
 
-            if not status and self.hard_fail:
-                raise Exception("Apprise URL Add Failed")
+            async def send(_: httpx.AsyncClient, notifier: apprise.Apprise = notifier) -> None:
+                if not await notifier.async_notify(title=event.message.title, body=event.message.body):
+                    raise DeliveryFailed("Apprise notification failed")
 
-        self.apprise.notify(title=event.message.title, body=event.message.body, tag=tags)
+            futures.append(self.delivery.submit(dest, send))
+
+        if self.hard_fail:
+            _wait_for_deliveries(futures, self.delivery.max_delivery_time)
 
 
 class WebhookPublisher:
-    def __init__(self, hard_fail=False) -> None:
+    def __init__(self, hard_fail=False, delivery: NotificationDelivery | None = None) -> None:
         self.hard_fail = hard_fail
+        self.delivery = delivery or get_notification_delivery()
 
     def publish(self, event: Event, notification_urls: list[str]):
+        """Queues a post of the event to each of the notification URLs"""
+
         event_payload = jsonable_encoder(event)
+
+        futures: list[Future] = []
         for url in notification_urls:
-            r = requests.post(url, json=event_payload, timeout=15)
-            if self.hard_fail:
+
+            async def send(client: httpx.AsyncClient, url: str = url) -> None:
+                r = await client.post(url, json=event_payload)
                 r.raise_for_status()
+
+            futures.append(self.delivery.submit(url, send))
+
+        if self.hard_fail:
+            _wait_for_deliveries(futures, self.delivery.max_delivery_time)
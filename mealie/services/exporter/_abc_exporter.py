@@ -1,6 +1,8 @@
 import zipfile
 from abc import abstractmethod, abstractproperty
+from collections import deque
 from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from uuid import UUID
@@ -9,7 +11,6 @@ from pydantic import BaseModel
 
 from mealie.core.root_logger import get_logger
 from mealie.repos.all_repositories import AllRepositories
-from mealie.schema.reports.reports import ReportEntryCreate
 
 from .._base_service import BaseService
 
@@ -26,9 +27,20 @@ class ExportedItem:
     name: str
 
 
+def _read_file(source_file: Path, arcname: str) -> tuple[zipfile.ZipInfo, bytes]:
+    return zipfile.ZipInfo.from_file(source_file, arcname), source_file.read_bytes()
+
+
 class ABCExporter(BaseService):
     write_dir_to_zip: Callable[[Path, str, set[str] | None], None] | None = None
 
+    max_workers = 8
+    """Number of threads reading files for the zip"""
+    max_pending_files = 64
+    """Number of files that are read ahead of the zip writer, which bounds how much is held in memory"""
+    max_buffered_file_size = 1024 * 1024
+    """Larger files are streamed into the zip by the writer, rather than read into memory by a thread"""
+
     def __init__(self, db: AllRepositories, group_id: UUID) -> None:
         self.logger = get_logger()
         self.db = db
@@ -45,35 +57,68 @@ class ABCExporter(BaseService):
     def _post_export_hook(self, _: BaseModel) -> None:
         pass
 
-    def export(self, zip: zipfile.ZipFile) -> list[ReportEntryCreate]:  # type: ignore
+    def export(self, zip: zipfile.ZipFile, progress: Callable[[int], None] | None = None) -> int:
         """
         Export takes in a zip file and exports the recipes to it. Note that the zip
         file open/close is NOT handled by this method. You must handle it yourself.
 
+        Files are read by a thread pool while the calling thread writes them to the zip,
+        in the order they were read.
+
         Args:
             zip (zipfile.ZipFile): Zip file destination
+            progress (Callable[[int], None], optional): Called with the number of items exported so far
 
         Returns:
-            list[ReportEntryCreate]:
+            int: The number of items exported
         """
-        self.write_dir_to_zip = self.write_dir_to_zip_func(zip)
+        exported = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="exporter") as pool:
+            pending: deque[Future[tuple[zipfile.ZipInfo, bytes]]] = deque()
+            self.write_dir_to_zip = self.write_dir_to_zip_func(zip, pool, pending)
 
-        for item in self.items():
-            if item is None:
-                self.logger.error("Failed to export item. no item found")
-                continue
+            try:
+                for item in self.items():
+                    if item is None:
+                        self.logger.error("Failed to export item. no item found")
+                        continue
 
-            zip.writestr(f"{self.destination_dir}/{item.name}/{item.name}.json", item.model.model_dump_json())
+                    zip.writestr(f"{self.destination_dir}/{item.name}/{item.name}.json", item.model.model_dump_json())
 
-            self._post_export_hook(item.model)
+                    self._post_export_hook(item.model)
 
-        self.write_dir_to_zip = None
+                    exported += 1
+                    if progress:
+                        progress(exported)
 
-    def write_dir_to_zip_func(self, zip: zipfile.ZipFile):
+                while pending:
+                    self._write_pending(zip, pending)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+                self.write_dir_to_zip = None
+
+        return exported
+
+    @staticmethod
+    def _write_pending(zip: zipfile.ZipFile, pending: deque[Future[tuple[zipfile.ZipInfo, bytes]]]) -> None:
+        info, data = pending.popleft().result()
+        zip.writestr(info, data, compress_type=zip.compression)
+
+    def write_dir_to_zip_func(
+        self,
+        zip: zipfile.ZipFile,
+        pool: ThreadPoolExecutor,
+        pending: deque[Future[tuple[zipfile.ZipInfo, bytes]]],
+    ):
         """Returns a recursive function that writes a directory to a zip file.
 
         Args:
             zip (zipfile.ZipFile):
+            pool (ThreadPoolExecutor): Pool reading the files
+            pending (deque): Files that are being read, and are written to the zip in order
         """
 
         def func(source_dir: Path, dest_dir: str, ignore_ext: set[str] | None = None) -> None:
@@ -82,7 +127,14 @@ class ABCExporter(BaseService):
             for source_file in source_dir.iterdir():
                 if source_file.is_dir():
                     func(source_file, f"{dest_dir}/{source_file.name}")
-                elif source_file.suffix not in ignore_ext:
+                elif source_file.suffix in ignore_ext:
+                    continue
+                elif source_file.stat().st_size > self.max_buffered_file_size:
                     zip.write(source_file, f"{dest_dir}/{source_file.name}")
+                else:
+                    if len(pending) >= self.max_pending_files:
+                        self._write_pending(zip, pending)
+
+                    pending.append(pool.submit(_read_file, source_file, f"{dest_dir}/{source_file.name}"))
 
         return func
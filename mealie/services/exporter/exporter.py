@@ -1,6 +1,7 @@
 import datetime
 import shutil
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
 from uuid import UUID, uuid4
 
@@ -21,20 +22,20 @@ class Exporter(BaseService):
         self.temp_path = temp_zip
         self.exporters = exporters
 
-    def run(self, db: AllRepositories) -> GroupDataExport:
+    def run(self, db: AllRepositories, progress: Callable[[int], None] | None = None) -> GroupDataExport:
         # Create Zip File
         self.temp_path.touch()
 
         # Open Zip File
         with zipfile.ZipFile(self.temp_path, "w") as zip:
             for exporter in self.exporters:
-                exporter.export(zip)
+                exporter.export(zip, progress)
 
         export_id = uuid4()
 
         export_path = GroupInDB.get_export_directory(self.group_id) / f"{export_id}.zip"
 
-        shutil.copy(self.temp_path, export_path)
+        shutil.move(self.temp_path, export_path)
 
         group_data_export = GroupDataExport(
             id=export_id,
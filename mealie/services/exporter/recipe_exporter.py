@@ -1,6 +1,9 @@
 from collections.abc import Iterator
 from uuid import UUID
 
+from sqlalchemy.orm.util import identity_key
+
+from mealie.db.models.recipe.recipe import RecipeModel
 from mealie.repos.all_repositories import AllRepositories
 from mealie.schema.recipe import Recipe
 
@@ -8,6 +11,9 @@ from ._abc_exporter import ABCExporter, ExportedItem
 
 
 class RecipeExporter(ABCExporter):
+    batch_size = 100
+    """Number of recipes loaded from the database at once"""
+
     def __init__(self, db: AllRepositories, group_id: UUID, recipes: list[str]) -> None:
         """
         RecipeExporter is used to export a list of recipes to a zip file. The zip
@@ -21,17 +27,34 @@ class RecipeExporter(ABCExporter):
         """
         super().__init__(db, group_id)
         self.recipes = recipes
+        self.missing: list[str] = []
+        """Slugs that weren't found, populated while exporting"""
 
     @property
     def destination_dir(self) -> str:
         return "recipes"
 
     def items(self) -> Iterator[ExportedItem]:
-        for slug in self.recipes:
-            yield ExportedItem(
-                name=slug,
-                model=self.db.recipes.multi_query({"slug": slug, "group_id": self.group_id}, limit=1)[0],
-            )
+        self.missing = []
+
+        for i in range(0, len(self.recipes), self.batch_size):
+            slugs = self.recipes[i : i + self.batch_size]
+            recipes = {recipe.slug: recipe for recipe in self.db.recipes.get_by_slugs(self.group_id, slugs)}
+
+            # the recipes have been validated, so the session doesn't need to hold on to their rows.
+            # The session belongs to the caller, so only this batch's recipes (and their children) are expunged
+            session = self.db.session
+            for recipe in recipes.values():
+                if (model := session.identity_map.get(identity_key(RecipeModel, recipe.id))) is not None:
+                    session.expunge(model)
+
+            for slug in slugs:
+                if (recipe := recipes.get(slug)) is None:
+                    self.logger.error(f"Failed to export recipe {slug}, no recipe found")
+                    self.missing.append(slug)
+                    continue
+
+                yield ExportedItem(name=slug, model=recipe)
 
     def _post_export_hook(self, item: Recipe) -> None:
         """Copy recipe directory contents into the zip folder"""
@@ -11,6 +11,7 @@ from mealie.schema.household.household_preferences import CreateHouseholdPrefere
 from mealie.schema.user.user import GroupBase
 from mealie.services._base_service import BaseService
 from mealie.services.household_services.household_service import HouseholdService
+from mealie.services.recipe import recipe_storage
 
 ALLOWED_SIZE = 500 * fs_stats.megabyte
 
@@ -58,15 +59,8 @@ class GroupService(BaseService):
         a GroupStorage object.
         """
 
-        # we need all recipes from all households, not just our household
-        group_repos = get_repositories(self.repos.session, group_id=group_id, household_id=None)
-
+        # the recipe sizes are kept up to date as their files change, see `recipe_storage`
         target_id = group_id or self.group_id
-
-        all_ids = group_repos.recipes.all_ids(target_id)
-
-        used_size = sum(
-            fs_stats.get_dir_size(f"{self.directories.RECIPE_DATA_DIR}/{recipe_id!s}") for recipe_id in all_ids
-        )
+        used_size = recipe_storage.get_group_storage(self.repos.session, target_id)
 
         return GroupStorage.bytes(used_size, ALLOWED_SIZE)
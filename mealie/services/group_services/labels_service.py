@@ -14,7 +14,7 @@ class MultiPurposeLabelService:
         self.repos = repos
         self.labels = repos.group_multi_purpose_labels
 
-    def _update_shopping_list_label_references(self, new_labels: list[MultiPurposeLabelOut]) -> None:
+    def update_shopping_list_label_references(self, new_labels: list[MultiPurposeLabelOut]) -> None:
         # remove the households filter so we get all lists
         household_repos = get_repositories(self.repos.session, group_id=self.repos.group_id, household_id=None)
         shopping_lists_repo = household_repos.group_shopping_lists
@@ -36,12 +36,12 @@ class MultiPurposeLabelService:
 
     def create_one(self, data: MultiPurposeLabelCreate) -> MultiPurposeLabelOut:
         label = self.labels.create(data.cast(MultiPurposeLabelSave, group_id=self.repos.group_id))
-        self._update_shopping_list_label_references([label])
+        self.update_shopping_list_label_references([label])
         return label
 
     def create_many(self, data: list[MultiPurposeLabelCreate]) -> list[MultiPurposeLabelOut]:
         labels = self.labels.create_many(
             [label.cast(MultiPurposeLabelSave, group_id=self.repos.group_id) for label in data]
         )
-        self._update_shopping_list_label_references(labels)
+        self.update_shopping_list_label_references(labels)
         return labels
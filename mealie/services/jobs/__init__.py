@@ -0,0 +1,2 @@
+from .job_queue import *
+from .job_worker import *
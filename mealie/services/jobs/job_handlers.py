@@ -0,0 +1,149 @@
+"""The handlers that run each kind of job, each in its own database session"""
+
+from pathlib import Path
+
+from pydantic import UUID4
+
+from mealie.core.exceptions import UnexpectedNone
+from mealie.db.db_setup import session_context
+from mealie.lang.providers import local_provider
+from mealie.repos.all_repositories import get_repositories
+from mealie.repos.repository_factory import AllRepositories
+from mealie.schema.group.group_migration import SupportedMigrations
+from mealie.schema.jobs import JobName
+from mealie.schema.recipe.recipe import CreateRecipeByUrlBulk
+from mealie.schema.user.user import GroupInDB, PrivateUser
+from mealie.services.backups_v2.backup_v2 import BackupV2
+from mealie.services.migrations import (
+    BaseMigrator,
+    ChowdownMigrator,
+    CopyMeThatMigrator,
+    MealieAlphaMigrator,
+    MyRecipeBoxMigrator,
+    NextcloudMigrator,
+    PaprikaMigrator,
+    PlanToEatMigrator,
+    RecipeKeeperMigrator,
+    TandoorMigrator,
+)
+from mealie.services.recipe.recipe_bulk_service import RecipeBulkActionsService
+from mealie.services.recipe.recipe_service import RecipeService
+from mealie.services.scraper.http_client import get_scraper_http_client
+from mealie.services.scraper.recipe_bulk_scraper import RecipeBulkScraperService
+
+from .job_worker import JobContext, JobHandler
+
+MIGRATORS: dict[SupportedMigrations, type[BaseMigrator]] = {
+    SupportedMigrations.chowdown: ChowdownMigrator,
+    SupportedMigrations.copymethat: CopyMeThatMigrator,
+    SupportedMigrations.mealie_alpha: MealieAlphaMigrator,
+    SupportedMigrations.nextcloud: NextcloudMigrator,
+    SupportedMigrations.paprika: PaprikaMigrator,
+    SupportedMigrations.tandoor: TandoorMigrator,
+    SupportedMigrations.plantoeat: PlanToEatMigrator,
+    SupportedMigrations.myrecipebox: MyRecipeBoxMigrator,
+    SupportedMigrations.recipekeeper: RecipeKeeperMigrator,
+}
+
+
+def _get_user(repos: AllRepositories, user_id: UUID4) -> PrivateUser:
+    user = repos.users.get_one(user_id)
+    if user is None:
+        raise UnexpectedNone(f"Cannot find user {user_id}")
+
+    return user
+
+
+def _get_group(repos: AllRepositories, group_id: UUID4) -> GroupInDB:
+    group = repos.groups.get_one(group_id)
+    if group is None:
+        raise UnexpectedNone(f"Cannot find group {group_id}")
+
+    return group
+
+
+async def bulk_url_import(ctx: JobContext) -> None:
+    """Scrapes and saves recipes from a list of URLs"""
+
+    bulk = CreateRecipeByUrlBulk.model_validate(ctx.payload["bulk"])
+    translator = local_provider(ctx.payload.get("locale"))
+    total = len(bulk.imports)
+
+    try:
+        with session_context() as session:
+            repos = get_repositories(session, group_id=ctx.job.group_id, household_id=ctx.payload["household_id"])
+            user = _get_user(repos, ctx.payload["user_id"])
+            household = repos.households.get_one(user.household_id)
+            if household is None:
+                raise UnexpectedNone(f"Cannot find household {user.household_id}")
+
+            service = RecipeService(repos, user, household, translator=translator)
+            bulk_scraper = RecipeBulkScraperService(service, repos, _get_group(repos, user.group_id), translator)
+            bulk_scraper.load_report(ctx.payload["report_id"])
+
+            ctx.progress(0, total)
+            await bulk_scraper.scrape(bulk, lambda scraped: ctx.progress(scraped, total))
+    finally:
+        # the job runs on its own event loop, which has its own connection pool
+        await get_scraper_http_client().aclose()
+
+
+def migration(ctx: JobContext) -> None:
+    """Imports recipes from an archive uploaded from another recipe manager"""
+
+    migration_type = SupportedMigrations(ctx.payload["migration_type"])
+    archive = Path(ctx.payload["archive"])
+
+    with session_context() as session:
+        repos = get_repositories(session, group_id=ctx.job.group_id, household_id=ctx.payload["household_id"])
+        migrator = MIGRATORS[migration_type](
+            archive=archive,
+            db=repos,
+            session=session,
+            user_id=ctx.payload["user_id"],
+            household_id=ctx.payload["household_id"],
+            group_id=ctx.payload["group_id"],
+            add_migration_tag=ctx.payload["add_migration_tag"],
+            translator=local_provider(ctx.payload.get("locale")),
+        )
+
+        migrator.migrate(
+            f"{migration_type.value.title()} Migration",
+            report_id=ctx.payload["report_id"],
+            progress=ctx.progress,
+        )
+
+    # the archive is kept if the migration fails, so the job can be retried
+    archive.unlink(missing_ok=True)
+
+
+def recipe_export(ctx: JobContext) -> None:
+    """Exports recipes to a new group export"""
+
+    slugs: list[str] = ctx.payload["slugs"]
+    total = len(slugs)
+
+    with session_context() as session:
+        repos = get_repositories(session, group_id=ctx.job.group_id, household_id=ctx.payload["household_id"])
+        user = _get_user(repos, ctx.payload["user_id"])
+        service = RecipeBulkActionsService(repos, user, _get_group(repos, user.group_id))
+
+        ctx.progress(0, total)
+        service.export_recipes_with_report(
+            ctx.payload["report_id"], slugs, lambda exported: ctx.progress(exported, total)
+        )
+
+
+def backup(ctx: JobContext) -> None:
+    """Creates a backup of the database and data directory"""
+
+    ctx.check_cancelled()
+    BackupV2().backup()
+
+
+JOB_HANDLERS: dict[JobName, JobHandler] = {
+    JobName.bulk_url_import: bulk_url_import,
+    JobName.migration: migration,
+    JobName.recipe_export: recipe_export,
+    JobName.backup: backup,
+}
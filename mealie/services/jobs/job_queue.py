@@ -0,0 +1,306 @@
+"""Queues long-running operations as jobs in the database, to be run by a job worker"""
+
+import json
+from datetime import timedelta
+from typing import Any
+
+import sqlalchemy as sa
+from pydantic import UUID4
+from sqlalchemy.orm import Session
+
+from mealie.db.db_setup import session_context
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.group import ReportEntryModel, ReportModel
+from mealie.db.models.server.job import JobModel
+from mealie.schema.jobs import JobName, JobOut, JobStatus
+from mealie.schema.reports.reports import ReportSummaryStatus
+
+HEARTBEAT_SECONDS = 10
+"""How often a worker updates the heartbeat of the jobs it's running"""
+
+STALE_SECONDS = HEARTBEAT_SECONDS * 6
+"""How long a running job's heartbeat can go without being updated before the job is considered abandoned"""
+
+FINISHED_STATUSES = (JobStatus.success, JobStatus.failure, JobStatus.cancelled)
+
+
+def enqueue_job(
+    session: Session,
+    name: JobName,
+    payload: dict[str, Any],
+    *,
+    group_id: UUID4 | None = None,
+    report_id: UUID4 | None = None,
+) -> JobOut:
+    """Queues a job to be run by a job worker. The payload is stored as JSON, so it must be JSON serializable"""
+
+    job = JobModel(
+        name=name.value,
+        payload=json.dumps(payload),
+        status=JobStatus.queued.value,
+        group_id=group_id,
+        report_id=report_id,
+    )
+
+    session.add(job)
+    session.commit()
+    return JobOut.model_validate(job)
+
+
+def _get_job(session: Session, job_id: UUID4, group_id: UUID4 | None = None) -> JobModel | None:
+    stmt = sa.select(JobModel).where(JobModel.id == job_id)
+    if group_id is not None:
+        stmt = stmt.where(JobModel.group_id == group_id)
+
+    return session.scalar(stmt)
+
+
+def get_job(session: Session, job_id: UUID4, group_id: UUID4 | None = None) -> JobOut | None:
+    """Gets a job, optionally only if it belongs to the given group"""
+
+    job = _get_job(session, job_id, group_id)
+    return JobOut.model_validate(job) if job else None
+
+
+def get_jobs(
+    session: Session, group_id: UUID4 | None = None, status: JobStatus | None = None, limit: int = 100
+) -> list[JobOut]:
+    """Gets the most recent jobs, optionally only those belonging to the given group"""
+
+    stmt = sa.select(JobModel).order_by(JobModel.created_at.desc()).limit(limit)
+    if group_id is not None:
+        stmt = stmt.where(JobModel.group_id == group_id)
+    if status is not None:
+        stmt = stmt.where(JobModel.status == status.value)
+
+    return [JobOut.model_validate(job) for job in session.scalars(stmt)]
+
+
+def _update_report(session: Session, report_id: UUID4 | None, status: ReportSummaryStatus, message: str) -> None:
+    """Updates the status of a job's report, and adds an entry explaining why"""
+
+    if report_id is None or (report := session.get(ReportModel, report_id)) is None:
+        return
+
+    report.status = status.value
+    session.add(
+        ReportEntryModel(
+            report_id=report_id,
+            success=status != ReportSummaryStatus.failure,
+            message=message,
+            exception="",
+            session=session,
+        )
+    )
+
+
+def cancel_job(session: Session, job_id: UUID4, group_id: UUID4 | None = None) -> JobOut | None:
+    """
+    Cancels a job. Queued jobs are cancelled right away; running jobs are cancelled by their worker,
+    which stops the job at its next checkpoint. Returns None if the job isn't found or has already finished.
+    """
+
+    job = _get_job(session, job_id, group_id)
+    if job is None or job.status in FINISHED_STATUSES:
+        return None
+
+    if job.status == JobStatus.queued:
+        job.status = JobStatus.cancelled.value
+        job.finished_at = get_utc_now()
+        _update_report(session, job.report_id, ReportSummaryStatus.failure, "Cancelled before it started")
+    else:
+        job.cancel_requested = True
+
+    session.commit()
+    return JobOut.model_validate(job)
+
+
+def retry_job(session: Session, job_id: UUID4, group_id: UUID4 | None = None) -> JobOut | None:
+    """Queues a failed or cancelled job to be run again. Returns None if the job isn't found or can't be retried"""
+
+    job = _get_job(session, job_id, group_id)
+    if job is None or job.status not in (JobStatus.failure, JobStatus.cancelled):
+        return None
+
+    job.status = JobStatus.queued.value
+    job.attempts = 0
+    job.cancel_requested = False
+    job.error = None
+    job.progress = 0
+    job.total = None
+    job.run_after = get_utc_now()
+    job.worker = None
+    job.heartbeat_at = None
+    job.started_at = None
+    job.finished_at = None
+    _update_report(session, job.report_id, ReportSummaryStatus.in_progress, "Retrying")
+
+    session.commit()
+    return JobOut.model_validate(job)
+
+
+# =============================================================================
+# Used by the job workers
+
+
+def claim_next_job(worker: str) -> tuple[JobOut, dict[str, Any]] | None:
+    """Claims the oldest queued job for the worker, returning the job and its payload"""
+
+    with session_context() as session:
+        # another worker may claim the same job first, in which case the next job is tried
+        while True:
+            now = get_utc_now()
+            job_id = session.scalar(
+                sa.select(JobModel.id)
+                .where(JobModel.status == JobStatus.queued.value, JobModel.run_after <= now)
+                .order_by(JobModel.created_at)
+                .limit(1)
+            )
+            if job_id is None:
+                return None
+
+            result = session.execute(
+                sa.update(JobModel)
+                .where(JobModel.id == job_id, JobModel.status == JobStatus.queued.value)
+                .values(
+                    status=JobStatus.running.value,
+                    worker=worker,
+                    attempts=JobModel.attempts + 1,
+                    started_at=now,
+                    heartbeat_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+
+            if result.rowcount == 1:
+                job = session.get(JobModel, job_id)
+                if job is not None:
+                    return JobOut.model_validate(job), json.loads(job.payload)
+
+
+def heartbeat_jobs(worker: str, job_ids: list[UUID4]) -> set[UUID4]:
+    """Updates the heartbeat of the worker's running jobs, returning those that should be cancelled"""
+
+    if not job_ids:
+        return set()
+
+    with session_context() as session:
+        session.execute(
+            sa.update(JobModel)
+            .where(JobModel.id.in_(job_ids), JobModel.worker == worker)
+            .values(heartbeat_at=get_utc_now())
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+        return set(session.scalars(sa.select(JobModel.id).where(JobModel.id.in_(job_ids), JobModel.cancel_requested)))
+
+
+def set_job_progress(job_id: UUID4, progress: int, total: int | None = None) -> bool:
+    """Updates a running job's progress, returning whether the job should be cancelled"""
+
+    values: dict[str, Any] = {"progress": progress}
+    if total is not None:
+        values["total"] = total
+
+    with session_context() as session:
+        session.execute(
+            sa.update(JobModel)
+            .where(JobModel.id == job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+        return bool(session.scalar(sa.select(JobModel.cancel_requested).where(JobModel.id == job_id)))
+
+
+def _fail_report(session: Session, job: JobModel, status: JobStatus, error: str | None) -> None:
+    """Marks the job's report as failed, unless the job already finished it"""
+
+    if status == JobStatus.success or job.report_id is None:
+        return
+
+    report = session.get(ReportModel, job.report_id)
+    if report is not None and report.status == ReportSummaryStatus.in_progress.value:
+        message = "Cancelled" if status == JobStatus.cancelled else f"Failed: {error}"
+        _update_report(session, job.report_id, ReportSummaryStatus.failure, message)
+
+
+def finish_job(job_id: UUID4, worker: str, status: JobStatus, error: str | None = None) -> bool:
+    """
+    Records how a job finished. If it didn't succeed, its report (if it wasn't already finished by the job)
+    is marked as failed.
+
+    The job is only updated if it's still running on `worker`, so a worker that lost a job (e.g. because its
+    heartbeat went stale and the job was failed) can't overwrite the job's status. Returns whether it was updated.
+    """
+
+    with session_context() as session:
+        result = session.execute(
+            sa.update(JobModel)
+            .where(JobModel.id == job_id, JobModel.worker == worker, JobModel.status == JobStatus.running.value)
+            .values(status=status.value, error=error, finished_at=get_utc_now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            session.rollback()
+            return False
+
+        if (job := session.get(JobModel, job_id)) is not None:
+            _fail_report(session, job, status, error)
+
+        session.commit()
+        return True
+
+
+def fail_stale_jobs() -> int:
+    """
+    Fails running jobs whose worker stopped without finishing them, or cancels them if their cancellation was
+    requested. Returns the number of stale jobs found.
+    """
+
+    stale_before = get_utc_now() - timedelta(seconds=STALE_SECONDS)
+    is_stale = sa.and_(
+        JobModel.status == JobStatus.running.value,
+        sa.or_(JobModel.heartbeat_at.is_(None), JobModel.heartbeat_at < stale_before),
+    )
+
+    with session_context() as session:
+        jobs = session.scalars(sa.select(JobModel).where(is_stale)).all()
+
+        for job in jobs:
+            if job.cancel_requested:
+                status, error = JobStatus.cancelled, None
+            else:
+                status, error = JobStatus.failure, "The job's worker stopped while running it"
+
+            # the job may have been finished by its worker since it was loaded
+            result = session.execute(
+                sa.update(JobModel)
+                .where(JobModel.id == job.id, is_stale)
+                .values(status=status.value, error=error, worker=None, heartbeat_at=None, finished_at=get_utc_now())
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                _fail_report(session, job, status, error)
+
+        session.commit()
+        return len(jobs)
+
+
+def purge_finished_jobs(older_than: timedelta) -> int:
+    """Deletes finished jobs older than `older_than`, returning the number of jobs deleted"""
+
+    with session_context() as session:
+        result = session.execute(
+            sa.delete(JobModel)
+            .where(
+                JobModel.status.in_([status.value for status in FINISHED_STATUSES]),
+                JobModel.finished_at < get_utc_now() - older_than,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount
@@ -0,0 +1,292 @@
+"""Runs queued jobs in a background thread, either in each web worker or with `mealie worker`"""
+
+import asyncio
+import inspect
+import os
+import signal
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache, partial
+from typing import Any
+from uuid import uuid4
+
+from pydantic import UUID4
+from starlette.concurrency import run_in_threadpool
+
+from mealie.core import root_logger
+from mealie.core.config import get_app_settings
+from mealie.schema.jobs import JobName, JobOut, JobStatus
+
+from .job_queue import (
+    HEARTBEAT_SECONDS,
+    claim_next_job,
+    fail_stale_jobs,
+    finish_job,
+    heartbeat_jobs,
+    set_job_progress,
+)
+
+POLL_SECONDS = 5
+"""How often an idle worker checks for queued jobs"""
+
+PROGRESS_SECONDS = 2
+"""Minimum number of seconds between the progress updates of a job"""
+
+JobHandler = Callable[["JobContext"], None] | Callable[["JobContext"], Awaitable[None]]
+
+
+class JobCancelled(BaseException):
+    """
+    Raised in a job when it's cancelled. Like `asyncio.CancelledError`, it isn't an `Exception`,
+    so it isn't swallowed by a job's error handling
+    """
+
+
+class JobContext:
+    """The job being run, passed to its handler to read its arguments and report its progress"""
+
+    def __init__(self, job: JobOut, payload: dict[str, Any]) -> None:
+        self.job = job
+        self.payload = payload
+
+        self.cancelled = False
+        self.stopping = False
+        """Whether the worker is stopping, in which case the job is interrupted and failed"""
+
+        self._last_progress = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def job_id(self) -> UUID4:
+        return self.job.id
+
+    def check_cancelled(self) -> None:
+        """Stops the job if it was cancelled, or its worker is stopping"""
+        if self.cancelled or self.stopping:
+            raise JobCancelled()
+
+    def progress(self, progress: int, total: int | None = None) -> None:
+        """
+        Records the job's progress, and stops the job if it was cancelled. Progress is only saved every few
+        seconds, so this can be called for every item the job processes.
+        """
+        self.check_cancelled()
+
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_SECONDS and progress != total:
+            return
+
+        self._last_progress = now
+        if set_job_progress(self.job_id, progress, total):
+            self.cancelled = True
+            self.check_cancelled()
+
+    def cancel(self) -> None:
+        """Stops the job at its next checkpoint (or right away, for async jobs)"""
+        self.cancelled = True
+        self._cancel_task()
+
+    def stop(self) -> None:
+        self.stopping = True
+        self._cancel_task()
+
+    def _cancel_task(self) -> None:
+        if self._loop is None or self._task is None:
+            return
+
+        try:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        except RuntimeError:
+            # the job's event loop is already closed
+            pass
+
+    def run(self, handler: JobHandler) -> None:
+        """Runs the handler, on a new event loop if it's async. Meant to be run in a thread"""
+        if not inspect.iscoroutinefunction(handler):
+            handler(self)
+            return
+
+        async def main() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+            self.check_cancelled()
+            await handler(self)
+
+        try:
+            asyncio.run(main())
+        except asyncio.CancelledError as e:
+            raise JobCancelled() from e
+        finally:
+            self._loop = None
+            self._task = None
+
+
+class JobWorker:
+    def __init__(self, concurrency: int = 1, handlers: dict[JobName, JobHandler] | None = None) -> None:
+        self.concurrency = max(1, concurrency)
+        self.name = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        """Identifies this worker as the worker running its jobs"""
+
+        if handlers is None:
+            from .job_handlers import JOB_HANDLERS
+
+            handlers = JOB_HANDLERS
+
+        self.handlers = handlers
+        self.logger = root_logger.get_logger()
+
+        self._running: dict[UUID4, tuple[JobContext, asyncio.Task]] = {}
+        self._loops: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+
+    def run_job(self, job: JobOut, payload: dict[str, Any], context: JobContext | None = None) -> JobStatus:
+        """Runs a claimed job and records how it finished. Meant to be run in a thread"""
+
+        context = context or JobContext(job, payload)
+        handler = self.handlers.get(job.name)
+
+        status, error = JobStatus.success, None
+        start = time.perf_counter()
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job {job.name.value}")
+
+            context.run(handler)
+        except JobCancelled:
+            status = JobStatus.cancelled
+        except Exception as e:
+            self.logger.error(f"Job {job.name.value} ({job.id}) failed")
+            self.logger.exception(e)
+            status, error = JobStatus.failure, str(e)
+
+        if status == JobStatus.cancelled and context.stopping and not context.cancelled:
+            # the job may have been partway through its changes, so it's left for the user to retry
+            status, error = JobStatus.failure, "The job was interrupted because its worker stopped"
+
+        if status == JobStatus.success and context.cancelled:
+            # the job was cancelled, but it caught (or never checked for) its cancellation
+            status = JobStatus.cancelled
+
+        if not finish_job(job.id, self.name, status, error):
+            # e.g. its heartbeat went stale, and it was failed while it was still running
+            self.logger.warning(f"Job {job.name.value} ({job.id}) is no longer running here, its result wasn't saved")
+            return status
+
+        duration = time.perf_counter() - start
+        self.logger.info(f"Job {job.name.value} ({job.id}) finished with status {status.value} in {duration:.2f}s")
+        return status
+
+    def run_queued_jobs(self) -> int:
+        """Runs queued jobs one at a time until there are none left, returning the number of jobs run"""
+
+        count = 0
+        while claimed := claim_next_job(self.name):
+            self.run_job(*claimed)
+            count += 1
+
+        return count
+
+    # =========================================================================
+    # Background worker
+
+    async def start(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._loops = [
+            asyncio.create_task(self._run_jobs()),
+            asyncio.create_task(self._keep_heartbeat()),
+        ]
+
+    async def stop(self) -> None:
+        """Stops the worker. Jobs that are still running are interrupted, and failed"""
+
+        for loop in self._loops:
+            loop.cancel()
+
+        await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops = []
+
+        for context, _ in self._running.values():
+            context.stop()
+
+        # sync jobs can't be interrupted until their next checkpoint, so they're given a few seconds to stop
+        tasks = [task for _, task in self._running.values()]
+        if tasks:
+            await asyncio.wait(tasks, timeout=HEARTBEAT_SECONDS)
+
+    async def _run_jobs(self) -> None:
+        while True:
+            try:
+                await run_in_threadpool(fail_stale_jobs)
+
+                while len(self._running) < self.concurrency:
+                    claimed = await run_in_threadpool(claim_next_job, self.name)
+                    if claimed is None:
+                        break
+
+                    job, payload = claimed
+                    context = JobContext(job, payload)
+                    task = asyncio.create_task(run_in_threadpool(self.run_job, job, payload, context))
+                    task.add_done_callback(partial(self._job_done, job.id))
+                    self._running[job.id] = (context, task)
+            except Exception as e:
+                self.logger.error(f"Error running queued jobs: {e}")
+
+            if self._wakeup is not None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=POLL_SECONDS)
+                except TimeoutError:
+                    pass
+
+    def _job_done(self, job_id: UUID4, _task: asyncio.Future[JobStatus]) -> None:
+        self._running.pop(job_id, None)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _keep_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+
+            try:
+                cancelled = await run_in_threadpool(heartbeat_jobs, self.name, list(self._running))
+            except Exception as e:
+                self.logger.error(f"Failed to update the heartbeat of running jobs: {e}")
+                continue
+
+            for job_id in cancelled:
+                if running := self._running.get(job_id):
+                    running[0].cancel()
+
+
+@lru_cache
+def get_job_worker() -> JobWorker:
+    return JobWorker(get_app_settings().JOB_CONCURRENCY)
+
+
+def run_queued_jobs() -> int:
+    """Runs the queued jobs in the current thread, until there are none left"""
+    return get_job_worker().run_queued_jobs()
+
+
+def run_worker() -> None:
+    """Runs a job worker until it's stopped with SIGINT or SIGTERM. Used by `mealie worker`"""
+
+    logger = root_logger.get_logger()
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        worker = get_job_worker()
+        await worker.start()
+        logger.info(f"Job worker {worker.name} started, running {worker.concurrency} job(s) at once")
+
+        await stop.wait()
+        await worker.stop()
+        logger.info(f"Job worker {worker.name} stopped")
+
+    asyncio.run(main())
@@ -1,5 +1,8 @@
 import contextlib
+import itertools
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import TypeVar
 
 from pydantic import UUID4
 
@@ -25,14 +28,22 @@ from .._base_service import BaseService
 from .utils.database_helpers import DatabaseMigrationHelpers
 from .utils.migration_alias import MigrationAlias
 
+T = TypeVar("T")
+
 
 class BaseMigrator(BaseService):
     key_aliases: list[MigrationAlias]
 
+    batch_size = 100
+    """Number of recipes saved per transaction"""
+
     report_entries: list[ReportEntryCreate]
     report_id: UUID4
     report: ReportOut
 
+    progress: Callable[[int], None] | None = None
+    """Called with the number of recipes processed so far, after each batch"""
+
     helpers: DatabaseMigrationHelpers
 
     def __init__(
@@ -115,11 +126,18 @@ class BaseMigrator(BaseService):
         self.report = self.db.group_reports.create(report_to_save)
         self.report_id = self.report.id
 
+    def _load_report(self, report_id: UUID4) -> None:
+        report = self.db.group_reports.get_one(report_id)
+        if not report:
+            raise UnexpectedNone(f"Cannot find report {report_id}")
+
+        self.report = report
+        self.report_id = report.id
+
     def _save_all_entries(self) -> None:
         is_success = True
         is_failure = True
 
-        new_entries: list[ReportEntryOut] = []
         for entry in self.report_entries:
             if is_failure and entry.success:
                 is_failure = False
@@ -127,7 +145,7 @@ class BaseMigrator(BaseService):
             if is_success and not entry.success:
                 is_success = False
 
-            new_entries.append(self.db.group_report_entries.create(entry))
+        new_entries: list[ReportEntryOut] = self.db.group_report_entries.create_many(self.report_entries)
 
         if is_success:
             self.report.status = ReportSummaryStatus.success
@@ -141,8 +159,23 @@ class BaseMigrator(BaseService):
         self.report.entries = new_entries
         self.db.group_reports.update(self.report.id, self.report)
 
-    def migrate(self, report_name: str) -> ReportSummary:
-        self._create_report(report_name)
+    def migrate(
+        self,
+        report_name: str,
+        report_id: UUID4 | None = None,
+        progress: Callable[[int], None] | None = None,
+    ) -> ReportSummary:
+        """
+        Runs the migration, adding the results to a new report (or to `report_id`, if given, e.g. a report
+        created when the migration was queued). If given, `progress` is called with the number of recipes
+        processed so far.
+        """
+        if report_id:
+            self._load_report(report_id)
+        else:
+            self._create_report(report_name)
+
+        self.progress = progress
         self._migrate()
         self._save_all_entries()
 
@@ -153,21 +186,20 @@ class BaseMigrator(BaseService):
 
         return result
 
-    def import_recipes_to_database(self, validated_recipes: list[Recipe]) -> list[tuple[str, UUID4, bool]]:
+    def import_recipes(self, recipes: Iterable[tuple[Recipe, T]]) -> Iterator[tuple[Recipe, T, bool]]:
         """
-        Used as a single access point to process a list of Recipe objects into the
-        database in a predictable way. If an error occurs the session is rolled back
-        and the process will continue. All import information is appended to the
-        'migration_report' attribute to be returned to the frontend for display.
-
-        Args:
-            validated_recipes (list[Recipe]):
+        Used as a single access point to process Recipe objects into the database in a predictable way.
+        Each recipe is passed along with some context (e.g. the image to import for it), which is yielded
+        back with the saved recipe (or the original recipe, if it couldn't be saved) and whether it was saved.
+
+        Recipes are read lazily and saved in batches of `batch_size`, each in a single transaction, so
+        large archives never have to be held in memory. A recipe that fails to save is skipped without
+        affecting the rest of its batch. All import information is appended to the 'report_entries'
+        attribute to be returned to the frontend for display.
         """
         if self.add_migration_tag:
             migration_tag = self.helpers.get_or_set_tags([self.name])[0]
 
-        return_vars: list[tuple[str, UUID4, bool]] = []
-
         if not self.household.preferences:
             raise ValueError("Household preferences not found")
 
@@ -180,51 +212,73 @@ class BaseMigrator(BaseService):
             disable_amount=self.household.preferences.recipe_disable_amount,
         )
 
-        for recipe in validated_recipes:
-            recipe.settings = default_settings
+        recipes = iter(recipes)
+        while batch := list(itertools.islice(recipes, self.batch_size)):
+            # resolve the tags and categories of the whole batch at once
+            self.helpers.get_or_set_tags(x.name for recipe, _ in batch for x in recipe.tags or [])
+            self.helpers.get_or_set_category(x.name for recipe, _ in batch for x in recipe.recipe_category or [])
 
-            recipe.user_id = self.user.id
-            recipe.group_id = self.group.id
+            for recipe, _ in batch:
+                recipe.settings = default_settings
 
-            if recipe.tags:
-                recipe.tags = self.helpers.get_or_set_tags(x.name for x in recipe.tags)
-            else:
-                recipe.tags = []
+                recipe.user_id = self.user.id
+                recipe.group_id = self.group.id
 
-            if recipe.recipe_category:
-                recipe.recipe_category = self.helpers.get_or_set_category(x.name for x in recipe.recipe_category)
+                if recipe.tags:
+                    recipe.tags = self.helpers.get_or_set_tags(x.name for x in recipe.tags)
+                else:
+                    recipe.tags = []
 
-            if self.add_migration_tag:
-                recipe.tags.append(migration_tag)
+                if recipe.recipe_category:
+                    recipe.recipe_category = self.helpers.get_or_set_category(x.name for x in recipe.recipe_category)
 
-            exception: str | Exception = ""
-            status = False
-            try:
-                recipe = self.recipe_service.create_one(recipe)
-                status = True
+                if self.add_migration_tag:
+                    recipe.tags.append(migration_tag)
 
-            except Exception as inst:
-                exception = str(inst)
-                self.logger.exception(inst)
+            try:
+                results = self.recipe_service.create_many(recipe for recipe, _ in batch)
+            except Exception as e:
+                self.logger.exception(e)
                 self.session.rollback()
+                results = [e] * len(batch)
+
+            for (recipe, context), result in zip(batch, results, strict=True):
+                if isinstance(result, Exception):
+                    status = False
+                    exception = str(result)
+                    message = f"Failed to import {recipe.name}"
+                else:
+                    recipe = result
+                    status = True
+                    exception = ""
+                    message = f"Imported {recipe.name} successfully"
+
+                self.report_entries.append(
+                    ReportEntryCreate(
+                        report_id=self.report_id,
+                        success=status,
+                        message=message,
+                        exception=exception,
+                    )
+                )
 
-            if status:
-                message = f"Imported {recipe.name} successfully"
-            else:
-                message = f"Failed to import {recipe.name}"
+                yield recipe, context, status
 
-            return_vars.append((recipe.slug, recipe.id, status))  # type: ignore
+            if self.progress:
+                self.progress(len(self.report_entries))
 
-            self.report_entries.append(
-                ReportEntryCreate(
-                    report_id=self.report_id,
-                    success=status,
-                    message=message,
-                    exception=str(exception),
-                )
-            )
+    def import_recipes_to_database(self, validated_recipes: Iterable[Recipe]) -> list[tuple[str, UUID4, bool]]:
+        """
+        Processes Recipe objects into the database (see `import_recipes`), returning the slug and id
+        of each recipe and whether it was saved.
 
-        return return_vars
+        Args:
+            validated_recipes (Iterable[Recipe]):
+        """
+        return [
+            (recipe.slug, recipe.id, status)  # type: ignore
+            for recipe, _, status in self.import_recipes((recipe, None) for recipe in validated_recipes)
+        ]
 
     def rewrite_alias(self, recipe_dict: dict) -> dict:
         """A helper function to reassign attributes by an alias using a list
@@ -81,26 +81,24 @@ class NextcloudMigrator(BaseMigrator):
             potential_recipe_dirs = glob_walker(base_dir, glob_str="**/[!.]*.json", return_parent=True)
             nextcloud_dirs = {y.slug: y for x in potential_recipe_dirs if (y := NextcloudDir.from_dir(x))}
 
-            all_recipes = []
-            for _, nc_dir in nextcloud_dirs.items():
-                try:
-                    recipe = self.clean_recipe_dictionary(nc_dir.recipe)
-                    all_recipes.append(recipe)
-                except Exception as e:
-                    self.logger.exception(e)
-                    self.report_entries.append(
-                        ReportEntryCreate(
-                            report_id=self.report_id,
-                            success=False,
-                            message=f"Failed to import {nc_dir.name}",
-                            exception=f"{e.__class__.__name__}: {e}",
+            def recipes_with_images():
+                for nc_dir in nextcloud_dirs.values():
+                    try:
+                        recipe = self.clean_recipe_dictionary(nc_dir.recipe)
+                    except Exception as e:
+                        self.logger.exception(e)
+                        self.report_entries.append(
+                            ReportEntryCreate(
+                                report_id=self.report_id,
+                                success=False,
+                                message=f"Failed to import {nc_dir.name}",
+                                exception=f"{e.__class__.__name__}: {e}",
+                            )
                         )
-                    )
+                        continue
 
-            all_statuses = self.import_recipes_to_database(all_recipes)
+                    yield recipe, nc_dir.image
 
-            for slug, recipe_id, status in all_statuses:
-                if status:
-                    nc_dir = nextcloud_dirs[slug]
-                    if nc_dir.image:
-                        import_image(nc_dir.image, recipe_id)
+            for recipe, image, status in self.import_recipes(recipes_with_images()):
+                if status and image:
+                    import_image(image, recipe.id)
@@ -5,9 +5,7 @@ import re
 import tempfile
 import zipfile
 from gzip import GzipFile
-from pathlib import Path
-
-from slugify import slugify
+from pathlib import Path, PurePosixPath
 
 from mealie.schema.recipe import RecipeNote
 
@@ -17,13 +15,14 @@ from .utils.migration_helpers import import_image
 
 
 def paprika_recipes(file: Path):
-    """Yields all recipes inside the export file as JSON"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with zipfile.ZipFile(file) as zip_file:
-            zip_file.extractall(tmpdir)
+    """Yields all recipes inside the export file as JSON, reading them one at a time"""
+    with zipfile.ZipFile(file) as zip_file:
+        for info in zip_file.infolist():
+            name = PurePosixPath(info.filename).name
+            if info.is_dir() or name.startswith(".") or not name.endswith(".paprikarecipe"):
+                continue
 
-        for name in Path(tmpdir).glob("**/[!.]*.paprikarecipe"):
-            with open(name, "rb") as fd:
+            with zip_file.open(info) as fd:
                 with GzipFile("r", fileobj=fd) as recipe_json:
                     recipe = json.load(recipe_json)
                     yield recipe
@@ -67,32 +66,24 @@ class PaprikaMigrator(BaseMigrator):
         ]
 
     def _migrate(self) -> None:
-        recipe_image_urls = {}
-
-        recipes = []
-        for recipe in paprika_recipes(self.archive):
-            if "name" not in recipe:
-                continue
-
-            recipe_model = self.clean_recipe_dictionary(recipe)
-
-            if "photo_data" in recipe:
-                recipe_image_urls[slugify(recipe["name"])] = recipe["photo_data"]
-
-            recipes.append(recipe_model)
+        def recipes_with_images():
+            for recipe in paprika_recipes(self.archive):
+                if "name" not in recipe:
+                    continue
 
-        results = self.import_recipes_to_database(recipes)
+                yield self.clean_recipe_dictionary(recipe), recipe.get("photo_data")
 
-        for slug, recipe_id, status in results:
-            if not status:
+        for recipe, photo_data, status in self.import_recipes(recipes_with_images()):
+            if not status or not photo_data:
                 continue
 
             try:
                 # Images are stored as base64 encoded strings, so we need to decode them before importing.
-                image = io.BytesIO(base64.b64decode(recipe_image_urls[slug]))
+                image = io.BytesIO(base64.b64decode(photo_data))
                 with tempfile.NamedTemporaryFile(suffix=".jpeg") as temp_file:
                     temp_file.write(image.read())
+                    temp_file.flush()
                     path = Path(temp_file.name)
-                    import_image(path, recipe_id)
+                    import_image(path, recipe.id)
             except Exception as e:
-                self.logger.error(f"Failed to download image for {slug}: {e}")
+                self.logger.error(f"Failed to download image for {recipe.slug}: {e}")
@@ -2,9 +2,11 @@ import json
 import os
 import tempfile
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from mealie.schema.recipe import Recipe
 from mealie.schema.recipe.recipe_ingredient import RecipeIngredientBase
 from mealie.schema.reports.reports import ReportEntryCreate
 
@@ -102,52 +104,47 @@ class TandoorMigrator(BaseMigrator):
             pass
         return recipe_data
 
-    def _migrate(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with zipfile.ZipFile(self.archive) as zip_file:
-                zip_file.extractall(tmpdir)
+    def _read_recipes(self, source_dir: Path) -> Iterator[tuple[Recipe, str | None]]:
+        """Yields each recipe in the export, along with its image, extracting one recipe at a time"""
 
-            source_dir = self.get_zip_base_path(Path(tmpdir))
+        for i, recipe_zip_file in enumerate(source_dir.glob("*.zip")):
+            try:
+                recipe_dir = str(source_dir.joinpath(f"recipe_{i + 1}"))
+                os.makedirs(recipe_dir)
+
+                with zipfile.ZipFile(recipe_zip_file) as recipe_zip:
+                    recipe_zip.extractall(recipe_dir)
 
-            recipes_as_dicts: list[dict] = []
-            for i, recipe_zip_file in enumerate(source_dir.glob("*.zip")):
+                recipe_source_dir = Path(recipe_dir)
                 try:
-                    recipe_dir = str(source_dir.joinpath(f"recipe_{i + 1}"))
-                    os.makedirs(recipe_dir)
-
-                    with zipfile.ZipFile(recipe_zip_file) as recipe_zip:
-                        recipe_zip.extractall(recipe_dir)
-
-                    recipe_source_dir = Path(recipe_dir)
-                    try:
-                        recipe_json_path = next(recipe_source_dir.glob("*.json"))
-                    except StopIteration as e:
-                        raise Exception("recipe.json not found") from e
-
-                    with open(recipe_json_path) as f:
-                        recipes_as_dicts.append(self._process_recipe_document(recipe_source_dir, json.load(f)))
-
-                except Exception as e:
-                    self.report_entries.append(
-                        ReportEntryCreate(
-                            report_id=self.report_id,
-                            success=False,
-                            message="Failed to parse recipe",
-                            exception=f"{type(e).__name__}: {e}",
-                        )
+                    recipe_json_path = next(recipe_source_dir.glob("*.json"))
+                except StopIteration as e:
+                    raise Exception("recipe.json not found") from e
+
+                with open(recipe_json_path) as f:
+                    recipe_dict = self._process_recipe_document(recipe_source_dir, json.load(f))
+
+            except Exception as e:
+                self.report_entries.append(
+                    ReportEntryCreate(
+                        report_id=self.report_id,
+                        success=False,
+                        message="Failed to parse recipe",
+                        exception=f"{type(e).__name__}: {e}",
                     )
+                )
+                continue
 
-            recipes = [self.clean_recipe_dictionary(x) for x in recipes_as_dicts]
-            results = self.import_recipes_to_database(recipes)
-            recipe_lookup = {r.slug: r for r in recipes}
-            for slug, recipe_id, status in results:
-                if status:
-                    try:
-                        r = recipe_lookup.get(slug)
-                        if not r or not r.image:
-                            continue
+            image = recipe_dict.get("image")
+            yield self.clean_recipe_dictionary(recipe_dict), image
 
-                    except StopIteration:
-                        continue
+    def _migrate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with zipfile.ZipFile(self.archive) as zip_file:
+                zip_file.extractall(tmpdir)
+
+            source_dir = self.get_zip_base_path(Path(tmpdir))
 
-                    import_image(r.image, recipe_id)
+            for recipe, image, status in self.import_recipes(self._read_recipes(source_dir)):
+                if status and image:
+                    import_image(image, recipe.id)
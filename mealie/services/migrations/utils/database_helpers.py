@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 from slugify import slugify
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from mealie.repos.all_repositories import AllRepositories
@@ -12,8 +13,6 @@ from mealie.schema.recipe import RecipeCategory
 from mealie.schema.recipe.recipe import RecipeTag
 from mealie.schema.recipe.recipe_category import CategoryOut, CategorySave, TagOut, TagSave
 
-T = TypeVar("T", bound=BaseModel)
-
 if TYPE_CHECKING:
     from mealie.repos.repository_generic import RepositoryGeneric
 
@@ -23,45 +22,59 @@ class DatabaseMigrationHelpers:
         self.session = session
         self.db = db
 
+        # categories and tags by slug, for each repository, so each name is only looked up (or created) once
+        self._items_by_slug: dict[type, dict[str, dict[str, Any]]] = {}
+
     def _get_or_set_generic(
-        self, accessor: RepositoryGeneric, items: Iterable[str], create_model: type[T], out_model: type[T]
-    ) -> list[T]:
+        self,
+        accessor: RepositoryGeneric,
+        items: Iterable[str],
+        create_model: type[BaseModel],
+        out_model: type[BaseModel],
+    ) -> list[dict[str, Any]]:
         """
         Utility model for getting or setting categories or tags. This will only work for those two cases.
 
-        This is probably a bad implementation of this pattern.
+        Names that weren't seen yet are looked up with a single query, and the missing ones are created together.
         """
-        items_out = []
+        items_by_slug = self._items_by_slug.setdefault(accessor.model, {})
+        slugs = [(slugify(item_name), item_name) for item_name in items]
 
-        for item_name in items:
-            slug_lookup = slugify(item_name)
+        # dict.fromkeys dedupes while keeping the order
+        new_names = dict.fromkeys((slug, name) for slug, name in slugs if slug not in items_by_slug)
+        if new_names:
+            new_slugs = {slug for slug, _ in new_names}
+            stmt = select(accessor.model).where(
+                accessor.model.group_id == self.db.group_id, accessor.model.slug.in_(new_slugs)
+            )
+            for item in self.session.execute(stmt).scalars():
+                items_by_slug[item.slug] = out_model.model_validate(item).model_dump()
 
-            item_model = accessor.get_one(value=slug_lookup, key="slug", override_schema=out_model)
+            to_create: dict[str, BaseModel] = {}
+            for slug, name in new_names:
+                if slug not in items_by_slug and slug not in to_create:
+                    to_create[slug] = create_model(group_id=self.db.group_id, name=name, slug=slug)
 
-            if not item_model:
-                item_model = accessor.create(
-                    create_model(
-                        group_id=self.db.group_id,
-                        name=item_name,
-                        slug=slug_lookup,
-                    )
-                )
+            if to_create:
+                for item in accessor.create_many(to_create.values()):
+                    items_by_slug[item.slug] = item.model_dump()
 
-            items_out.append(item_model.model_dump())
-        return items_out
+        return [items_by_slug[slug] for slug, _ in slugs]
 
     def get_or_set_category(self, categories: Iterable[str]) -> list[RecipeCategory]:
-        return self._get_or_set_generic(
+        items = self._get_or_set_generic(
             self.db.categories,
             categories,
             CategorySave,
             CategoryOut,
         )
+        return [RecipeCategory.model_validate(item) for item in items]
 
     def get_or_set_tags(self, tags: Iterable[str]) -> list[RecipeTag]:
-        return self._get_or_set_generic(
+        items = self._get_or_set_generic(
             self.db.tags,
             tags,
             TagSave,
             TagOut,
         )
+        return [RecipeTag.model_validate(item) for item in items]
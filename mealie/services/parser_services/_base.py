@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import TypeVar
 
 from pydantic import UUID4, BaseModel
@@ -15,7 +16,9 @@ from mealie.schema.recipe.recipe_ingredient import (
     IngredientUnit,
     ParsedIngredient,
 )
-from mealie.schema.response.pagination import PaginationQuery
+
+from .alias_index import AliasIndex, get_alias_index_cache
+from .fuzzy_match_index import FuzzyMatchIndex
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -31,71 +34,83 @@ class DataMatcher:
 
         self._food_fuzzy_match_threshold = food_fuzzy_match_threshold
         self._unit_fuzzy_match_threshold = unit_fuzzy_match_threshold
-        self._foods_by_alias: dict[str, IngredientFood] | None = None
-        self._units_by_alias: dict[str, IngredientUnit] | None = None
+        self._food_index: AliasIndex[IngredientFood] | None = None
+        self._unit_index: AliasIndex[IngredientUnit] | None = None
 
     @property
-    def foods_by_alias(self) -> dict[str, IngredientFood]:
-        if self._foods_by_alias is None:
-            foods_repo = self.repos.ingredient_foods
-            query = PaginationQuery(page=1, per_page=-1)
-            all_foods = foods_repo.page_all(query).items
+    def food_index(self) -> AliasIndex[IngredientFood]:
+        if self._food_index is None:
+            self._food_index = get_alias_index_cache().get_food_index(self.repos)
 
-            foods_by_alias: dict[str, IngredientFood] = {}
-            for food in all_foods:
-                if food.name:
-                    foods_by_alias[IngredientFoodModel.normalize(food.name)] = food
-                if food.plural_name:
-                    foods_by_alias[IngredientFoodModel.normalize(food.plural_name)] = food
+        return self._food_index
 
-                for alias in food.aliases or []:
-                    if alias.name:
-                        foods_by_alias[IngredientFoodModel.normalize(alias.name)] = food
+    @property
+    def unit_index(self) -> AliasIndex[IngredientUnit]:
+        if self._unit_index is None:
+            self._unit_index = get_alias_index_cache().get_unit_index(self.repos)
 
-            self._foods_by_alias = foods_by_alias
+        return self._unit_index
 
-        return self._foods_by_alias
+    @property
+    def foods_by_alias(self) -> dict[str, IngredientFood]:
+        return self.food_index.by_alias
 
     @property
     def units_by_alias(self) -> dict[str, IngredientUnit]:
-        if self._units_by_alias is None:
-            units_repo = self.repos.ingredient_units
-            query = PaginationQuery(page=1, per_page=-1)
-            all_units = units_repo.page_all(query).items
-
-            units_by_alias: dict[str, IngredientUnit] = {}
-            for unit in all_units:
-                if unit.name:
-                    units_by_alias[IngredientUnitModel.normalize(unit.name)] = unit
-                if unit.plural_name:
-                    units_by_alias[IngredientUnitModel.normalize(unit.plural_name)] = unit
-                if unit.abbreviation:
-                    units_by_alias[IngredientUnitModel.normalize(unit.abbreviation)] = unit
-                if unit.plural_abbreviation:
-                    units_by_alias[IngredientUnitModel.normalize(unit.plural_abbreviation)] = unit
-
-                for alias in unit.aliases or []:
-                    if alias.name:
-                        units_by_alias[IngredientUnitModel.normalize(alias.name)] = unit
-
-            self._units_by_alias = units_by_alias
-
-        return self._units_by_alias
+        return self.unit_index.by_alias
 
     @classmethod
-    def find_match(cls, match_value: str, *, store_map: dict[str, T], fuzzy_match_threshold: int = 0) -> T | None:
+    def find_match(
+        cls,
+        match_value: str,
+        *,
+        store_map: Mapping[str, T],
+        fuzzy_match_threshold: int = 0,
+        fuzzy_index: FuzzyMatchIndex | None = None,
+    ) -> T | None:
         # check for literal matches
         if match_value in store_map:
             return store_map[match_value]
 
         # fuzzy match against food store
-        fuzz_result = process.extractOne(
-            match_value, store_map.keys(), scorer=fuzz.ratio, score_cutoff=fuzzy_match_threshold
-        )
-        if fuzz_result is None:
+        if fuzzy_index is not None:
+            fuzz_match = fuzzy_index.extract_one(match_value, score_cutoff=fuzzy_match_threshold)
+        else:
+            fuzz_result = process.extractOne(
+                match_value, store_map.keys(), scorer=fuzz.ratio, score_cutoff=fuzzy_match_threshold
+            )
+            fuzz_match = fuzz_result[0] if fuzz_result else None
+
+        if fuzz_match is None:
             return None
 
-        return store_map[fuzz_result[0]]
+        return store_map[fuzz_match]
+
+    @classmethod
+    def find_matches(
+        cls,
+        match_values: list[str],
+        *,
+        store_map: Mapping[str, T],
+        fuzzy_match_threshold: int = 0,
+        fuzzy_index: FuzzyMatchIndex | None = None,
+    ) -> list[T | None]:
+        """Like `find_match` for each value, but fuzzy matches all of them in one batch"""
+
+        if fuzzy_index is None:
+            fuzzy_index = FuzzyMatchIndex(store_map)
+
+        matches: list[T | None] = [store_map.get(match_value) for match_value in match_values]
+
+        unmatched = [i for i, match in enumerate(matches) if match is None]
+        fuzz_matches = fuzzy_index.extract_one_batch(
+            [match_values[i] for i in unmatched], score_cutoff=fuzzy_match_threshold
+        )
+        for i, fuzz_match in zip(unmatched, fuzz_matches, strict=True):
+            if fuzz_match is not None:
+                matches[i] = store_map[fuzz_match]
+
+        return matches
 
     def find_food_match(self, food: IngredientFood | CreateIngredientFood | str) -> IngredientFood | None:
         if isinstance(food, IngredientFood):
@@ -107,8 +122,28 @@ class DataMatcher:
             match_value,
             store_map=self.foods_by_alias,
             fuzzy_match_threshold=self._food_fuzzy_match_threshold,
+            fuzzy_index=self.food_index.fuzzy_index,
         )
 
+    def find_food_matches(
+        self, foods: Sequence[IngredientFood | CreateIngredientFood | str]
+    ) -> list[IngredientFood | None]:
+        match_values = [
+            IngredientFoodModel.normalize(food if isinstance(food, str) else food.name)
+            for food in foods
+            if not isinstance(food, IngredientFood)
+        ]
+        matches = iter(
+            self.find_matches(
+                match_values,
+                store_map=self.foods_by_alias,
+                fuzzy_match_threshold=self._food_fuzzy_match_threshold,
+                fuzzy_index=self.food_index.fuzzy_index,
+            )
+        )
+
+        return [food if isinstance(food, IngredientFood) else next(matches) for food in foods]
+
     def find_unit_match(self, unit: IngredientUnit | CreateIngredientUnit | str) -> IngredientUnit | None:
         if isinstance(unit, IngredientUnit):
             return unit
@@ -119,8 +154,28 @@ class DataMatcher:
             match_value,
             store_map=self.units_by_alias,
             fuzzy_match_threshold=self._unit_fuzzy_match_threshold,
+            fuzzy_index=self.unit_index.fuzzy_index,
         )
 
+    def find_unit_matches(
+        self, units: Sequence[IngredientUnit | CreateIngredientUnit | str]
+    ) -> list[IngredientUnit | None]:
+        match_values = [
+            IngredientUnitModel.normalize(unit if isinstance(unit, str) else unit.name)
+            for unit in units
+            if not isinstance(unit, IngredientUnit)
+        ]
+        matches = iter(
+            self.find_matches(
+                match_values,
+                store_map=self.units_by_alias,
+                fuzzy_match_threshold=self._unit_fuzzy_match_threshold,
+                fuzzy_index=self.unit_index.fuzzy_index,
+            )
+        )
+
+        return [unit if isinstance(unit, IngredientUnit) else next(matches) for unit in units]
+
 
 class ABCIngredientParser(ABC):
     """
@@ -172,3 +227,35 @@ class ABCIngredientParser(ABC):
                 ingredient.ingredient.unit = None
 
         return ingredient
+
+    def find_ingredient_matches(self, ingredients: list[ParsedIngredient]) -> list[ParsedIngredient]:
+        """Like `find_ingredient_match` for each ingredient, but matches all foods and units in batches"""
+
+        with_food = [(ingredient, food) for ingredient in ingredients if (food := ingredient.ingredient.food)]
+        food_matches = self.data_matcher.find_food_matches([food for _, food in with_food])
+        for (ingredient, _), food_match in zip(with_food, food_matches, strict=True):
+            if food_match:
+                ingredient.ingredient.food = food_match
+
+        with_unit = [(ingredient, unit) for ingredient in ingredients if (unit := ingredient.ingredient.unit)]
+        unit_matches = self.data_matcher.find_unit_matches([unit for _, unit in with_unit])
+        for (ingredient, _), unit_match in zip(with_unit, unit_matches, strict=True):
+            if unit_match:
+                ingredient.ingredient.unit = unit_match
+
+        # Parser might have wrongly split a food into a unit and food.
+        wrongly_split = [
+            ingredient
+            for ingredient in ingredients
+            if isinstance(ingredient.ingredient.food, CreateIngredientFood)
+            and isinstance(ingredient.ingredient.unit, CreateIngredientUnit)
+        ]
+        food_matches = self.data_matcher.find_food_matches(
+            [f"{ingredient.ingredient.unit.name} {ingredient.ingredient.food.name}" for ingredient in wrongly_split]  # type: ignore[union-attr]
+        )
+        for ingredient, food_match in zip(wrongly_split, food_matches, strict=True):
+            if food_match:
+                ingredient.ingredient.food = food_match
+                ingredient.ingredient.unit = None
+
+        return ingredients
@@ -0,0 +1,225 @@
+"""Caches each group's foods and units by their normalized names and aliases, until one of them changes"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from enum import Enum
+from functools import lru_cache
+from typing import Generic, TypeVar
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from mealie.core.config import get_app_settings
+from mealie.db.models.recipe.ingredient import (
+    IngredientFoodAliasModel,
+    IngredientFoodModel,
+    IngredientUnitAliasModel,
+    IngredientUnitModel,
+)
+from mealie.repos._utils import NotSet
+from mealie.repos.repository_factory import AllRepositories
+from mealie.schema.recipe.recipe_ingredient import IngredientFood, IngredientUnit
+from mealie.schema.response.pagination import PaginationQuery
+
+from .fuzzy_match_index import FuzzyMatchIndex
+
+_PENDING_GROUP_IDS_KEY = "alias_index_pending_group_ids"
+_ALL_GROUPS = "*"
+
+T = TypeVar("T")
+
+
+class AliasIndexType(Enum):
+    foods = "foods"
+    units = "units"
+
+
+def build_foods_by_alias(foods: list[IngredientFood]) -> dict[str, IngredientFood]:
+    foods_by_alias: dict[str, IngredientFood] = {}
+    for food in foods:
+        if food.name:
+            foods_by_alias[IngredientFoodModel.normalize(food.name)] = food
+        if food.plural_name:
+            foods_by_alias[IngredientFoodModel.normalize(food.plural_name)] = food
+
+        for alias in food.aliases or []:
+            if alias.name:
+                foods_by_alias[IngredientFoodModel.normalize(alias.name)] = food
+
+    return foods_by_alias
+
+
+def build_units_by_alias(units: list[IngredientUnit]) -> dict[str, IngredientUnit]:
+    units_by_alias: dict[str, IngredientUnit] = {}
+    for unit in units:
+        if unit.name:
+            units_by_alias[IngredientUnitModel.normalize(unit.name)] = unit
+        if unit.plural_name:
+            units_by_alias[IngredientUnitModel.normalize(unit.plural_name)] = unit
+        if unit.abbreviation:
+            units_by_alias[IngredientUnitModel.normalize(unit.abbreviation)] = unit
+        if unit.plural_abbreviation:
+            units_by_alias[IngredientUnitModel.normalize(unit.plural_abbreviation)] = unit
+
+        for alias in unit.aliases or []:
+            if alias.name:
+                units_by_alias[IngredientUnitModel.normalize(alias.name)] = unit
+
+    return units_by_alias
+
+
+class AliasIndex(Generic[T]):
+    """A group's foods or units by normalized name/alias, with a fuzzy match index over the aliases"""
+
+    def __init__(self, by_alias: dict[str, T]) -> None:
+        self.by_alias = by_alias
+        self._fuzzy_index: FuzzyMatchIndex | None = None
+
+    @property
+    def fuzzy_index(self) -> FuzzyMatchIndex:
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyMatchIndex(self.by_alias)
+
+        return self._fuzzy_index
+
+
+class AliasIndexCache:
+    """
+    A thread-safe LRU cache of alias indexes, shared by every `DataMatcher` in the process.
+
+    Entries are dropped when the group's foods or units change (see the session listeners below).
+    Other processes (e.g. additional web workers) can't notify this one, so they keep matching against
+    stale aliases until their entries expire after `ttl` seconds.
+
+    The cached indexes and the models in them are shared between requests, so they must not be modified.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._entries: OrderedDict[tuple[UUID, AliasIndexType], tuple[float, AliasIndex]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def _get_or_load(self, group_id: UUID, index_type: AliasIndexType, loader: Callable[[], AliasIndex]) -> AliasIndex:
+        key = (group_id, index_type)
+        with self._lock:
+            if (entry := self._entries.get(key)) and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            generation = self._generation
+
+        # load outside of the lock so slow groups don't block everyone else
+        value = loader()
+        with self._lock:
+            # if anything was invalidated while we were loading, our data may already be stale
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    @staticmethod
+    def _get_group_id(repos: AllRepositories) -> UUID | None:
+        """The group to cache the repos' data under; unscoped repos aren't cached"""
+
+        if not repos.group_id or isinstance(repos.group_id, NotSet):
+            return None
+        return UUID(str(repos.group_id))
+
+    def get_food_index(self, repos: AllRepositories) -> AliasIndex[IngredientFood]:
+        def load() -> AliasIndex[IngredientFood]:
+            foods = repos.ingredient_foods.page_all(PaginationQuery(page=1, per_page=-1)).items
+            return AliasIndex(build_foods_by_alias(foods))
+
+        if (group_id := self._get_group_id(repos)) is None:
+            return load()
+        return self._get_or_load(group_id, AliasIndexType.foods, load)
+
+    def get_unit_index(self, repos: AllRepositories) -> AliasIndex[IngredientUnit]:
+        def load() -> AliasIndex[IngredientUnit]:
+            units = repos.ingredient_units.page_all(PaginationQuery(page=1, per_page=-1)).items
+            return AliasIndex(build_units_by_alias(units))
+
+        if (group_id := self._get_group_id(repos)) is None:
+            return load()
+        return self._get_or_load(group_id, AliasIndexType.units, load)
+
+    def invalidate(self, group_id: UUID | None = None) -> None:
+        """Drops the cached indexes for `group_id`, or for all groups if `group_id` is None"""
+
+        with self._lock:
+            self._generation += 1
+            if group_id is None:
+                self._entries.clear()
+                return
+
+            for index_type in AliasIndexType:
+                self._entries.pop((group_id, index_type), None)
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+@lru_cache
+def get_alias_index_cache() -> AliasIndexCache:
+    settings = get_app_settings()
+    return AliasIndexCache(maxsize=settings.PARSER_ALIAS_CACHE_SIZE, ttl=settings.PARSER_ALIAS_CACHE_TTL)
+
+
+def _get_group_id(instance) -> UUID | str | None:
+    """The group that a changed food, unit, or alias belongs to, or `_ALL_GROUPS` if it can't be determined"""
+
+    if isinstance(instance, IngredientFoodModel | IngredientUnitModel):
+        return instance.group_id or _ALL_GROUPS
+
+    if isinstance(instance, IngredientFoodAliasModel | IngredientUnitAliasModel):
+        parent_attr = "food" if isinstance(instance, IngredientFoodAliasModel) else "unit"
+        parent = sa.inspect(instance).attrs[parent_attr].loaded_value
+        return getattr(parent, "group_id", None) or _ALL_GROUPS
+
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_alias_changes(session: Session, _flush_context) -> None:
+    group_ids = {
+        group_id
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if (group_id := _get_group_id(instance)) is not None
+    }
+    if group_ids:
+        session.info.setdefault(_PENDING_GROUP_IDS_KEY, set()).update(group_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_alias_changes(session: Session) -> None:
+    # invalidate after the commit, otherwise another request could re-cache the old data in the meantime.
+    # changes that are rolled back stay pending, which at worst causes an extra reload after the next commit
+    group_ids: set[UUID | str] = session.info.pop(_PENDING_GROUP_IDS_KEY, set())
+    if _ALL_GROUPS in group_ids:
+        get_alias_index_cache().invalidate()
+        return
+
+    for group_id in group_ids:
+        get_alias_index_cache().invalidate(group_id)  # type: ignore[arg-type]
@@ -0,0 +1,91 @@
+"""A precomputed index for fuzzy matching strings against a fixed set of choices"""
+
+from collections.abc import Iterable
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# `fuzz.ratio` is computed with floats, so keep a little slack when converting cutoffs into lengths
+_EPSILON = 1e-9
+
+
+class FuzzyMatchIndex:
+    def __init__(self, choices: Iterable[str]) -> None:
+        self.choices = list(choices)
+
+        # a stable sort keeps the original order within each length, but ties are resolved explicitly anyway
+        order = sorted(range(len(self.choices)), key=lambda i: len(self.choices[i]))
+        self._sorted_choices = [self.choices[i] for i in order]
+        self._sorted_indexes = np.array(order, dtype=np.intp)
+        self._sorted_lengths = np.array([len(choice) for choice in self._sorted_choices], dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def _candidate_range(self, value: str, score_cutoff: float) -> tuple[int, int]:
+        """The slice of `_sorted_choices` with lengths that could score at least `score_cutoff` against `value`"""
+
+        max_distance_ratio = max(0.0, 100 - score_cutoff) / 100
+        if max_distance_ratio >= 1:
+            return 0, len(self._sorted_choices)
+
+        # `fuzz.ratio` is `100 * (1 - dist / (len1 + len2))`, and the Indel distance is at least |len1 - len2|,
+        # so only choices with |len1 - len2| <= max_distance_ratio * (len1 + len2) can reach the cutoff.
+        # Choices are sorted by length, so those are a single contiguous slice
+        min_length = len(value) * (1 - max_distance_ratio) / (1 + max_distance_ratio) - _EPSILON
+        max_length = len(value) * (1 + max_distance_ratio) / (1 - max_distance_ratio) + _EPSILON
+
+        start = int(np.searchsorted(self._sorted_lengths, min_length, side="left"))
+        end = int(np.searchsorted(self._sorted_lengths, max_length, side="right"))
+        return start, end
+
+    def _best_match(self, scores: np.ndarray, start: int, end: int, score_cutoff: float) -> str | None:
+        # scores below the cutoff are zeroed out by cdist, so with a cutoff only positive scores are matches
+        best_score: float = scores.max()
+        if best_score < score_cutoff or (score_cutoff and not best_score):
+            return None
+
+        # the first of any tied choices (in the original order) wins, the same as `process.extractOne`
+        tied = self._sorted_indexes[start:end][scores == best_score]
+        return self.choices[int(tied.min())]
+
+    def extract_one(self, value: str, score_cutoff: float = 0) -> str | None:
+        """
+        Returns the best matching choice for `value`, or None if nothing scores at least `score_cutoff`.
+        Equivalent to `process.extractOne(value, choices, scorer=fuzz.ratio, score_cutoff=score_cutoff)`.
+        """
+
+        start, end = self._candidate_range(value, score_cutoff)
+        if start >= end:
+            return None
+
+        scores = process.cdist(
+            [value],
+            self._sorted_choices[start:end],
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+        )
+        return self._best_match(scores[0], start, end, score_cutoff)
+
+    def extract_one_batch(self, values: list[str], score_cutoff: float = 0) -> list[str | None]:
+        """Like `extract_one` for each value, but scores all of them in a single `process.cdist` call"""
+
+        if not values:
+            return []
+
+        ranges = [self._candidate_range(value, score_cutoff) for value in values]
+        start = min(range_start for range_start, _ in ranges)
+        end = max(range_end for _, range_end in ranges)
+        if start >= end:
+            return [None] * len(values)
+
+        # choices outside of a value's own range can't reach the cutoff, so they're scored as 0
+        scores = process.cdist(
+            values,
+            self._sorted_choices[start:end],
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+        )
+        return [self._best_match(row, start, end, score_cutoff) for row in scores]
@@ -1,6 +1,5 @@
 from fractions import Fraction
 
-from ingredient_parser import parse_ingredient
 from ingredient_parser.dataclasses import CompositeIngredientAmount, IngredientAmount
 from ingredient_parser.dataclasses import ParsedIngredient as IngredientParserParsedIngredient
 from pydantic import UUID4
@@ -18,6 +17,7 @@ from mealie.schema.recipe.recipe_ingredient import (
 
 from . import brute, openai
 from ._base import ABCIngredientParser
+from .nlp_pool import get_nlp_parser_pool
 from .parser_utils import extract_quantity_from_string
 
 logger = get_logger(__name__)
@@ -156,14 +156,15 @@ class NLPParser(ABCIngredientParser):
             ),
         )
 
-        return self.find_ingredient_match(parsed_ingredient)
+        return parsed_ingredient
 
     async def parse_one(self, ingredient_string: str) -> ParsedIngredient:
-        parsed_ingredient = parse_ingredient(ingredient_string)
-        return self._convert_ingredient(parsed_ingredient)
+        items = await self.parse([ingredient_string])
+        return items[0]
 
     async def parse(self, ingredients: list[str]) -> list[ParsedIngredient]:
-        return [await self.parse_one(ingredient) for ingredient in ingredients]
+        parsed_ingredients = await get_nlp_parser_pool().parse(ingredients)
+        return self.find_ingredient_matches([self._convert_ingredient(ingredient) for ingredient in parsed_ingredients])
 
 
 __registrar: dict[RegisteredParser, type[ABCIngredientParser]] = {
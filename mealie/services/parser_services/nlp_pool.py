@@ -0,0 +1,97 @@
+"""Runs the NLP (CRF) ingredient parser in a bounded process pool, off of the event loop"""
+
+import asyncio
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+
+from ingredient_parser import parse_ingredient
+from ingredient_parser.dataclasses import ParsedIngredient as IngredientParserParsedIngredient
+
+from mealie.core.config import get_app_settings
+
+
+def normalize_line(line: str) -> str:
+    return " ".join(line.split())
+
+
+class NLPParserPool:
+    def __init__(self, max_workers: int, cache_size: int) -> None:
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+
+        self._cache: OrderedDict[str, IngredientParserParsedIngredient] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor | None:
+        """The process pool, created on first use. None if the pool is disabled (`max_workers` < 1)"""
+
+        if self.max_workers < 1:
+            return None
+
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn instead of fork, since forking a process with running threads (e.g. the web server's) isn't safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+
+            return self._executor
+
+    def _get_cached(self, line: str) -> IngredientParserParsedIngredient | None:
+        with self._cache_lock:
+            if (parsed := self._cache.get(line)) is not None:
+                self._cache.move_to_end(line)
+
+            return parsed
+
+    def _set_cached(self, line: str, parsed: IngredientParserParsedIngredient) -> None:
+        if self.cache_size < 1:
+            return
+
+        with self._cache_lock:
+            self._cache[line] = parsed
+            self._cache.move_to_end(line)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    async def parse(self, lines: list[str]) -> list[IngredientParserParsedIngredient]:
+        """Parses each line, returning the results in the same order"""
+
+        normalized_lines = [normalize_line(line) for line in lines]
+        results: dict[str, IngredientParserParsedIngredient] = {}
+        for line in normalized_lines:
+            if line not in results and (parsed := self._get_cached(line)) is not None:
+                results[line] = parsed
+
+        # dict.fromkeys dedupes while keeping the order
+        to_parse = [line for line in dict.fromkeys(normalized_lines) if line not in results]
+        if to_parse:
+            loop = asyncio.get_running_loop()
+            parsed_lines = await asyncio.gather(
+                *(loop.run_in_executor(self.executor, parse_ingredient, line) for line in to_parse)
+            )
+
+            for line, parsed in zip(to_parse, parsed_lines, strict=True):
+                results[line] = parsed
+                self._set_cached(line, parsed)
+
+        return [results[line] for line in normalized_lines]
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache
+def get_nlp_parser_pool() -> NLPParserPool:
+    settings = get_app_settings()
+    return NLPParserPool(settings.PARSER_NLP_WORKERS, settings.PARSER_NLP_CACHE_SIZE)
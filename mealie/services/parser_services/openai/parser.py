@@ -31,7 +31,7 @@ class OpenAIParser(ABCIngredientParser):
             ingredient=ingredient,
         )
 
-        return self.find_ingredient_match(parsed_ingredient)
+        return parsed_ingredient
 
     def _get_prompt(self, service: OpenAIService) -> str:
         data_injections = [
@@ -107,4 +107,4 @@ class OpenAIParser(ABCIngredientParser):
 
     async def parse(self, ingredients: list[str]) -> list[ParsedIngredient]:
         response = await self._parse(ingredients)
-        return [self._convert_ingredient(ing) for ing in response.ingredients]
+        return self.find_ingredient_matches([self._convert_ingredient(ing) for ing in response.ingredients])
@@ -1,28 +1,102 @@
+from collections.abc import Callable
 from pathlib import Path
 
+from pydantic import UUID4
+
+from mealie.core.dependencies.dependencies import get_temporary_zip_path
 from mealie.core.exceptions import UnexpectedNone
 from mealie.repos.repository_factory import AllRepositories
 from mealie.schema.group.group_exports import GroupDataExport
 from mealie.schema.recipe import CategoryBase
+from mealie.schema.recipe.recipe_bulk_actions import BulkActionResponse, BulkActionResult
 from mealie.schema.recipe.recipe_category import TagBase
 from mealie.schema.recipe.recipe_settings import RecipeSettings
+from mealie.schema.reports.reports import ReportCategory, ReportCreate, ReportEntryCreate, ReportSummaryStatus
 from mealie.schema.user.user import GroupInDB, PrivateUser
 from mealie.services._base_service import BaseService
 from mealie.services.exporter import Exporter, RecipeExporter
 
 
 class RecipeBulkActionsService(BaseService):
+    export_progress_interval = 500
+    """Number of recipes between the progress entries added to an export's report"""
+
     def __init__(self, repos: AllRepositories, user: PrivateUser, group: GroupInDB):
         self.repos = repos
         self.user = user
         self.group = group
         super().__init__()
 
-    def export_recipes(self, temp_path: Path, slugs: list[str]) -> None:
+    def get_export_report_id(self) -> UUID4:
+        export_report = ReportCreate(
+            name="Recipe Export",
+            category=ReportCategory.export,
+            status=ReportSummaryStatus.in_progress,
+            group_id=self.group.id,
+        )
+
+        return self.repos.group_reports.create(export_report).id
+
+    def _add_report_entry(self, report_id: UUID4, message: str, success: bool = True, exception: str = "") -> None:
+        self.repos.group_report_entries.create(
+            ReportEntryCreate(report_id=report_id, success=success, message=message, exception=exception)
+        )
+
+    def export_recipes(
+        self, temp_path: Path, slugs: list[str], progress: Callable[[int], None] | None = None
+    ) -> list[str]:
+        """Exports the recipes to a new group export and returns the slugs that weren't found"""
         recipe_exporter = RecipeExporter(self.repos, self.group.id, slugs)
         exporter = Exporter(self.group.id, temp_path, [recipe_exporter])
 
-        exporter.run(self.repos)
+        exporter.run(self.repos, progress)
+        return recipe_exporter.missing
+
+    def export_recipes_with_report(
+        self, report_id: UUID4, slugs: list[str], on_progress: Callable[[int], None] | None = None
+    ) -> None:
+        """
+        Exports the recipes to a new group export, meant to be run as a background job. Progress and
+        recipes that couldn't be exported are added to the report as entries. If given, `on_progress`
+        is called with the number of recipes exported so far.
+        """
+        total = len(slugs)
+
+        def progress(exported: int) -> None:
+            if on_progress:
+                on_progress(exported)
+
+            if exported < total and not exported % self.export_progress_interval:
+                self._add_report_entry(report_id, f"Exported {exported} of {total} recipes")
+
+        exported = 0
+        try:
+            with get_temporary_zip_path() as temp_path:
+                missing = self.export_recipes(temp_path, slugs, progress)
+
+            exported = total - len(missing)
+            for slug in missing:
+                self._add_report_entry(report_id, f"Failed to export recipe {slug}, no recipe found", success=False)
+
+            self._add_report_entry(report_id, f"Exported {exported} of {total} recipes", success=bool(exported))
+        except Exception as e:
+            self.logger.error("Failed to export recipes")
+            self.logger.exception(e)
+            self._add_report_entry(report_id, "Failed to export recipes", success=False, exception=str(e))
+
+        # the report is loaded with all of its entries, so they're kept by the update
+        report = self.repos.group_reports.get_one(report_id)
+        if report is None:
+            raise UnexpectedNone(f"Failed to export recipes, no report found with id {report_id}")
+
+        if exported and exported == total:
+            report.status = ReportSummaryStatus.success
+        elif exported:
+            report.status = ReportSummaryStatus.partial
+        else:
+            report.status = ReportSummaryStatus.failure
+
+        self.repos.group_reports.update(report.id, report)
 
     def get_exports(self) -> list[GroupDataExport]:
         return self.repos.group_exports.multi_query({"group_id": self.group.id})
@@ -52,62 +126,51 @@ class RecipeBulkActionsService(BaseService):
 
         return exports_deleted
 
-    def set_settings(self, recipes: list[str], settings: RecipeSettings) -> None:
-        for slug in recipes:
-            recipe = self.repos.recipes.get_one(slug)
-
-            if recipe is None or recipe.settings is None:
-                raise UnexpectedNone(f"Failed to set settings for recipe {slug}, no recipe found")
-
-            settings.locked = recipe.settings.locked
-            recipe.settings = settings
-
-            try:
-                self.repos.recipes.update(slug, recipe)
-            except Exception as e:
-                self.logger.error(f"Failed to set settings for recipe {slug}")
-                self.logger.error(e)
-
-    def assign_tags(self, recipes: list[str], tags: list[TagBase]) -> None:
-        for slug in recipes:
-            recipe = self.repos.recipes.get_one(slug)
-
-            if recipe is None:
-                raise UnexpectedNone(f"Failed to tag recipe {slug}, no recipe found")
-
-            if recipe.tags is None:
-                recipe.tags = []
-
-            recipe.tags += tags  # type: ignore
-
-            try:
-                self.repos.recipes.update(slug, recipe)
-            except Exception as e:
-                self.logger.error(f"Failed to tag recipe {slug}")
-                self.logger.error(e)
-
-    def assign_categories(self, recipes: list[str], categories: list[CategoryBase]) -> None:
-        for slug in recipes:
-            recipe = self.repos.recipes.get_one(slug)
-
-            if recipe is None:
-                raise UnexpectedNone(f"Failed to categorize recipe {slug}, no recipe found")
-
-            if recipe.recipe_category is None:
-                recipe.recipe_category = []
-
-            recipe.recipe_category += categories  # type: ignore
-
-            try:
-                self.repos.recipes.update(slug, recipe)
-            except Exception as e:
-                self.logger.error(f"Failed to categorize recipe {slug}")
-                self.logger.error(e)
-
-    def delete_recipes(self, recipes: list[str]) -> None:
-        for slug in recipes:
+    def _run_bulk_action(
+        self, slugs: list[str], action: Callable[[list[UUID4]], object], action_name: str
+    ) -> BulkActionResponse:
+        """
+        Runs `action` once for all recipes matching `slugs`. The results say which slugs the action was
+        applied to. Slugs that don't match a recipe are reported as failed, as are all slugs if the action failed
+        """
+        recipe_ids = self.repos.recipes.get_ids_by_slugs(slugs)
+        error: str | None = None
+
+        if recipe_ids:
             try:
-                self.repos.recipes.delete(slug)
+                action(list(recipe_ids.values()))
             except Exception as e:
-                self.logger.error(f"Failed to delete recipe {slug}")
+                self.logger.error(f"Failed to {action_name} recipes")
                 self.logger.error(e)
+                error = f"failed to {action_name} recipe"
+
+        response = BulkActionResponse()
+        for slug in slugs:
+            if slug not in recipe_ids:
+                response.results.append(BulkActionResult(slug=slug, success=False, error="recipe not found"))
+            else:
+                response.results.append(BulkActionResult(slug=slug, success=error is None, error=error))
+
+        return response
+
+    def set_settings(self, recipes: list[str], settings: RecipeSettings) -> BulkActionResponse:
+        # recipes keep their current locked setting
+        values = settings.model_dump(exclude={"locked"})
+        return self._run_bulk_action(
+            recipes, lambda recipe_ids: self.repos.recipes.update_settings(recipe_ids, values), "set settings for"
+        )
+
+    def assign_tags(self, recipes: list[str], tags: list[TagBase]) -> BulkActionResponse:
+        tag_ids = [tag.id for tag in tags]
+        return self._run_bulk_action(
+            recipes, lambda recipe_ids: self.repos.recipes.add_tags(recipe_ids, tag_ids), "tag"
+        )
+
+    def assign_categories(self, recipes: list[str], categories: list[CategoryBase]) -> BulkActionResponse:
+        category_ids = [category.id for category in categories]
+        return self._run_bulk_action(
+            recipes, lambda recipe_ids: self.repos.recipes.add_categories(recipe_ids, category_ids), "categorize"
+        )
+
+    def delete_recipes(self, recipes: list[str]) -> BulkActionResponse:
+        return self._run_bulk_action(recipes, self.repos.recipes.delete_many, "delete")
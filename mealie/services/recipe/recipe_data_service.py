@@ -1,14 +1,19 @@
 import asyncio
 import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 from httpx import AsyncClient, Response
 from pydantic import UUID4
 
+from mealie.core.config import get_app_settings
+from mealie.db.db_setup import session_context
 from mealie.pkgs import img, safehttp
 from mealie.pkgs.safehttp.transport import AsyncSafeTransport
+from mealie.pkgs.stats import fs_stats
 from mealie.schema.recipe.recipe import Recipe
 from mealie.services._base_service import BaseService
+from mealie.services.recipe import recipe_storage
 from mealie.services.scraper.user_agents_manager import get_user_agents_manager
 
 
@@ -48,6 +53,15 @@ async def largest_content_len(urls: list[str]) -> tuple[str, int]:
     return largest_url, largest_len
 
 
+def get_minifier_options() -> img.MinifierOptions:
+    settings = get_app_settings()
+    return img.MinifierOptions(
+        original_max_size=settings.IMAGE_ORIGINAL_MAX_SIZE,
+        miniature_max_size=settings.IMAGE_MINIATURE_MAX_SIZE,
+        tiny_max_size=settings.IMAGE_TINY_MAX_SIZE,
+    )
+
+
 class NotAnImageError(Exception):
     pass
 
@@ -67,7 +81,7 @@ class RecipeDataService(BaseService):
         super().__init__()
 
         self.recipe_id = recipe_id
-        self.minifier = img.PillowMinifier(purge=True, logger=self.logger)
+        self.minifier = img.PillowMinifier(purge=True, opts=get_minifier_options(), logger=self.logger)
 
         self.dir_data = Recipe.directory_from_id(self.recipe_id)
         self.dir_image = self.dir_data.joinpath("images")
@@ -77,12 +91,30 @@ class RecipeDataService(BaseService):
         for dir in [self.dir_image, self.dir_image_timeline, self.dir_assets]:
             dir.mkdir(parents=True, exist_ok=True)
 
+    def update_storage(self) -> None:
+        """Records the current size of the recipe's data directory, for the group's storage"""
+        try:
+            size = fs_stats.get_dir_size(self.dir_data)
+            with session_context() as session:
+                recipe_storage.set_recipe_storage(session, {self.recipe_id: size})
+                session.commit()
+        except Exception as e:
+            # the size is corrected the next time the storage is reconciled
+            self.logger.exception(f"Failed to update recipe storage: {e}")
+
     def delete_all_data(self) -> None:
         try:
             shutil.rmtree(self.dir_data)
         except Exception as e:
             self.logger.exception(f"Failed to delete recipe data: {e}")
 
+        try:
+            with session_context() as session:
+                recipe_storage.delete_recipe_storage(session, [self.recipe_id])
+                session.commit()
+        except Exception as e:
+            self.logger.exception(f"Failed to delete recipe storage: {e}")
+
     def write_image(self, file_data: bytes | Path, extension: str, image_dir: Path | None = None) -> Path:
         if not image_dir:
             image_dir = self.dir_image
@@ -101,9 +133,18 @@ class RecipeDataService(BaseService):
                 shutil.copyfileobj(file_data, f)
 
         self.minifier.minify(image_path)
+        self.update_storage()
 
         return image_path
 
+    def write_asset(self, file_name: str, file_data: BinaryIO) -> Path:
+        asset_path = self.dir_assets.joinpath(file_name)
+        with asset_path.open("wb") as f:
+            shutil.copyfileobj(file_data, f)
+
+        self.update_storage()
+        return asset_path
+
     async def scrape_image(self, image_url: str | dict[str, str] | list[str]) -> None:
         self.logger.info(f"Image URL: {image_url}")
         user_agent = get_user_agents_manager().user_agents[0]
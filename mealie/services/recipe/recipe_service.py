@@ -1,9 +1,10 @@
 import json
 import os
 import shutil
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
-from shutil import copytree, rmtree
+from shutil import copytree
 from typing import Any
 from uuid import UUID, uuid4
 from zipfile import ZipFile
@@ -90,12 +91,14 @@ class RecipeService(RecipeServiceBase):
 
     def check_assets(self, recipe: Recipe, original_slug: str) -> None:
         """Checks if the recipe slug has changed, and if so moves the assets to a new file with the new slug."""
+        changed = False
         if original_slug != recipe.slug:
             current_dir = self.directories.RECIPE_DATA_DIR.joinpath(original_slug)
 
             try:
                 copytree(current_dir, recipe.directory, dirs_exist_ok=True)
                 self.logger.debug(f"Renaming Recipe Directory: {original_slug} -> {recipe.slug}")
+                changed = True
             except FileNotFoundError:
                 self.logger.error(f"Recipe Directory not Found: {original_slug}")
 
@@ -109,10 +112,16 @@ class RecipeService(RecipeServiceBase):
                 continue
             if file.name not in all_asset_files:
                 file.unlink()
+                changed = True
+
+        if changed and recipe.id:
+            RecipeDataService(recipe.id).update_storage()
 
     def delete_assets(self, recipe: Recipe) -> None:
-        recipe_dir = recipe.directory
-        rmtree(recipe_dir, ignore_errors=True)
+        if not recipe.id:
+            return
+
+        RecipeDataService(recipe.id).delete_all_data()
         self.logger.info(f"Recipe Directory Removed: {recipe.slug}")
 
     def _recipe_creation_factory(self, name: str, additional_attrs: dict | None = None) -> Recipe:
@@ -154,7 +163,7 @@ class RecipeService(RecipeServiceBase):
         else:
             return self._get_recipe(slug_or_id, "slug")
 
-    def create_one(self, create_data: Recipe | CreateRecipe) -> Recipe:
+    def _new_recipe_data(self, create_data: Recipe | CreateRecipe) -> Recipe:
         if create_data.name is None:
             create_data.name = "New Recipe"
 
@@ -173,23 +182,20 @@ class RecipeService(RecipeServiceBase):
             else:
                 data.settings = RecipeSettings()
 
-        rating_input = data.rating
-        data.last_made = None
-        new_recipe = self.repos.recipes.create(data)
+        return data
 
+    def _new_user_rating(self, new_recipe: Recipe, rating: float) -> UserRatingCreate:
         # convert rating into user rating
-        if rating_input:
-            self.repos.user_ratings.create(
-                UserRatingCreate(
-                    user_id=self.user.id,
-                    recipe_id=new_recipe.id,
-                    rating=rating_input,
-                    is_favorite=False,
-                )
-            )
+        return UserRatingCreate(
+            user_id=self.user.id,
+            recipe_id=new_recipe.id,
+            rating=rating,
+            is_favorite=False,
+        )
 
+    def _new_timeline_event(self, new_recipe: Recipe) -> RecipeTimelineEventCreate:
         # create first timeline entry
-        timeline_event_data = RecipeTimelineEventCreate(
+        return RecipeTimelineEventCreate(
             user_id=new_recipe.user_id,
             recipe_id=new_recipe.id,
             subject=self.t("recipe.recipe-created"),
@@ -197,9 +203,52 @@ class RecipeService(RecipeServiceBase):
             timestamp=new_recipe.created_at or datetime.now(UTC),
         )
 
-        self.repos.recipe_timeline_events.create(timeline_event_data)
+    def create_one(self, create_data: Recipe | CreateRecipe) -> Recipe:
+        data = self._new_recipe_data(create_data)
+
+        rating_input = data.rating
+        data.last_made = None
+        new_recipe = self.repos.recipes.create(data)
+
+        if rating_input:
+            self.repos.user_ratings.create(self._new_user_rating(new_recipe, rating_input))
+
+        self.repos.recipe_timeline_events.create(self._new_timeline_event(new_recipe))
         return new_recipe
 
+    def create_many(self, create_data: Iterable[Recipe | CreateRecipe]) -> list[Recipe | Exception]:
+        """
+        Creates the recipes in a single transaction, for bulk imports. A recipe that fails to save doesn't
+        affect the others; its exception is returned in place of the recipe.
+        """
+
+        recipes: list[Recipe | Exception] = []
+        for item in create_data:
+            try:
+                recipes.append(self._new_recipe_data(item))
+            except Exception as e:
+                recipes.append(e)
+
+        ratings = [recipe.rating if isinstance(recipe, Recipe) else None for recipe in recipes]
+        to_create = [recipe for recipe in recipes if isinstance(recipe, Recipe)]
+        for recipe in to_create:
+            recipe.last_made = None
+
+        created = iter(self.repos.recipes.create_batch(to_create))
+        results = [next(created) if isinstance(recipe, Recipe) else recipe for recipe in recipes]
+        new_recipes = [
+            (recipe, rating) for recipe, rating in zip(results, ratings, strict=True) if isinstance(recipe, Recipe)
+        ]
+
+        if user_ratings := [self._new_user_rating(recipe, rating) for recipe, rating in new_recipes if rating]:
+            self.repos.user_ratings.create_many(user_ratings)
+        if new_recipes:
+            self.repos.recipe_timeline_events.create_many(
+                [self._new_timeline_event(recipe) for recipe, _ in new_recipes]
+            )
+
+        return results
+
     def _transform_user_id(self, user_id: str) -> str:
         query = self.repos.users.get_one(user_id)
         if query:
@@ -360,6 +409,7 @@ class RecipeService(RecipeServiceBase):
                 new_service.dir_data,
                 dirs_exist_ok=True,
             )
+            new_service.update_storage()
         except Exception as e:
             self.logger.error(f"Failed to copy assets from {old_recipe.slug} to {new_recipe.slug}: {e}")
 
@@ -0,0 +1,104 @@
+"""Tracks how much storage each recipe's data directory (images, assets, etc.) uses"""
+
+import itertools
+import os
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from mealie.core.config import get_app_dirs
+from mealie.db.models.recipe.recipe import RecipeModel
+from mealie.db.models.recipe.storage import RecipeStorageModel
+from mealie.pkgs.stats import fs_stats
+
+CHUNK_SIZE = 500
+MAX_WORKERS = 8
+
+
+@dataclass
+class ReconcileResult:
+    updated: int = 0
+    """Number of recipe directories that were sized"""
+    removed: int = 0
+    """Number of rows removed, since their recipe directory no longer exists"""
+
+
+def set_recipe_storage(session: Session, sizes: dict[UUID, int]) -> None:
+    """Inserts or updates the size of each recipe. The caller is responsible for committing"""
+
+    table = RecipeStorageModel.__table__
+    insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.id], set_={"size": stmt.excluded.size, "update_at": stmt.excluded.update_at}
+    )
+    items = iter(sizes.items())
+    while chunk := list(itertools.islice(items, CHUNK_SIZE)):
+        session.execute(stmt, [{"id": recipe_id, "size": size} for recipe_id, size in chunk])
+
+
+def delete_recipe_storage(session: Session, recipe_ids: Collection[UUID]) -> None:
+    """Removes the size of each recipe. The caller is responsible for committing"""
+
+    ids = iter(recipe_ids)
+    while chunk := list(itertools.islice(ids, CHUNK_SIZE)):
+        session.execute(sa.delete(RecipeStorageModel).where(RecipeStorageModel.id.in_(chunk)))
+
+
+def get_group_storage(session: Session, group_id: UUID) -> int:
+    """The total size, in bytes, of the data directories of all of the group's recipes"""
+
+    stmt = (
+        sa.select(sa.func.coalesce(sa.func.sum(RecipeStorageModel.size), 0))
+        .join(RecipeModel, RecipeModel.id == RecipeStorageModel.id)
+        .where(RecipeModel.group_id == group_id)
+    )
+    return session.execute(stmt).scalar_one()
+
+
+def _scan_recipe_dirs() -> dict[UUID, str]:
+    """The path of every recipe directory, by recipe id"""
+
+    recipe_dirs: dict[UUID, str] = {}
+    with os.scandir(get_app_dirs().RECIPE_DATA_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+
+            try:
+                recipe_dirs[UUID(entry.name)] = entry.path
+            except ValueError:
+                continue
+
+    return recipe_dirs
+
+
+def reconcile_recipe_storage(session: Session, max_workers: int = MAX_WORKERS) -> ReconcileResult:
+    """
+    Re-sizes every recipe directory, and removes the rows of recipes whose directory no longer exists.
+
+    Directories are sized in a thread pool, since sizing is mostly spent waiting on the file system.
+    """
+
+    recipe_dirs = _scan_recipe_dirs()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recipe-storage") as pool:
+        sizes = dict(zip(recipe_dirs, pool.map(fs_stats.get_dir_size, recipe_dirs.values()), strict=True))
+
+    existing_ids = session.execute(sa.select(RecipeStorageModel.id)).scalars().all()
+    removed_ids = [recipe_id for recipe_id in existing_ids if recipe_id not in sizes]
+
+    try:
+        set_recipe_storage(session, sizes)
+        delete_recipe_storage(session, removed_ids)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return ReconcileResult(updated=len(sizes), removed=len(removed_ids))
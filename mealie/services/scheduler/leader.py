@@ -0,0 +1,189 @@
+"""Elects the single worker that runs the scheduled tasks, using a lease held in the database"""
+
+import os
+import socket
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from uuid import uuid4
+
+import sqlalchemy as sa
+from sqlalchemy import Connection
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from mealie.core import root_logger
+from mealie.core.config import get_app_settings
+from mealie.db.db_setup import engine, session_context
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.server.scheduler import SchedulerLeaseModel
+
+LEASE_NAME = "scheduler"
+ADVISORY_LOCK_KEY = 0x6D65616C6965  # "mealie"
+
+
+def _insert(session: Session):
+    return postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+
+class SchedulerLeader(ABC):
+    def __init__(self, lease_ttl: float, name: str = LEASE_NAME) -> None:
+        self.lease_ttl = lease_ttl
+        self.name = name
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        """Identifies this worker as the lease's holder"""
+
+        self.is_leader = False
+        self.logger = root_logger.get_logger()
+
+    @property
+    def renew_interval(self) -> float:
+        """How often the lease should be renewed, so it's renewed a few times before it expires"""
+        return self.lease_ttl / 3
+
+    @abstractmethod
+    def _acquire(self) -> bool:
+        """Takes the lease if it's available, or renews it if it's already held. Returns whether it's held"""
+
+    @abstractmethod
+    def _release(self) -> None: ...
+
+    def heartbeat(self) -> bool:
+        """Takes or renews the lease, returning whether this worker is the leader"""
+        try:
+            is_leader = self._acquire()
+        except Exception as e:
+            self.logger.error(f"Failed to renew the scheduler lease: {e}")
+            is_leader = False
+
+        if is_leader != self.is_leader:
+            self.logger.info(f"{self.holder} {'is now' if is_leader else 'is no longer'} running the scheduler")
+
+        self.is_leader = is_leader
+        return is_leader
+
+    def release(self) -> None:
+        """Gives up the lease, so another worker can take over right away"""
+        if not self.is_leader:
+            return
+
+        try:
+            self._release()
+        except Exception as e:
+            self.logger.error(f"Failed to release the scheduler lease: {e}")
+
+        self.is_leader = False
+
+
+class LeaseRowLeader(SchedulerLeader):
+    """Holds the lease with a row that expires unless it's renewed"""
+
+    def _acquire(self) -> bool:
+        now = get_utc_now()
+        expires_at = now + timedelta(seconds=self.lease_ttl)
+
+        with session_context() as session:
+            result = session.execute(
+                sa.update(SchedulerLeaseModel)
+                .where(
+                    SchedulerLeaseModel.id == self.name,
+                    sa.or_(SchedulerLeaseModel.holder == self.holder, SchedulerLeaseModel.expires_at < now),
+                )
+                .values(holder=self.holder, expires_at=expires_at)
+                .execution_options(synchronize_session=False)
+            )
+
+            if result.rowcount == 0:
+                # the lease is held by another worker, or has never been taken
+                result = session.execute(
+                    _insert(session)(SchedulerLeaseModel.__table__)
+                    .values(id=self.name, holder=self.holder, expires_at=expires_at)
+                    .on_conflict_do_nothing()
+                )
+
+            session.commit()
+            return result.rowcount == 1
+
+    def _release(self) -> None:
+        with session_context() as session:
+            session.execute(
+                sa.update(SchedulerLeaseModel)
+                .where(SchedulerLeaseModel.id == self.name, SchedulerLeaseModel.holder == self.holder)
+                .values(expires_at=get_utc_now())
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+
+
+class AdvisoryLockLeader(LeaseRowLeader):
+    """Holds the lease with a Postgres advisory lock, on a connection reserved for as long as it's held"""
+
+    def __init__(self, lease_ttl: float, name: str = LEASE_NAME) -> None:
+        super().__init__(lease_ttl, name)
+        self._connection: Connection | None = None
+
+    def _close_connection(self) -> None:
+        if self._connection is None:
+            return
+
+        # the connection is discarded rather than returned to the pool, in case it still holds the lock
+        self._connection.invalidate()
+        self._connection.close()
+        self._connection = None
+
+    def _acquire(self) -> bool:
+        try:
+            if self._connection is None:
+                connection = engine.connect()
+                self._connection = connection
+
+                is_locked = connection.execute(sa.select(sa.func.pg_try_advisory_lock(ADVISORY_LOCK_KEY))).scalar()
+                connection.commit()
+                if not is_locked:
+                    self._connection = None
+                    connection.close()
+                    return False
+            else:
+                # the lock is held for as long as the connection is open
+                self._connection.execute(sa.select(1))
+                self._connection.commit()
+        except Exception:
+            self._close_connection()
+            raise
+
+        self._record_lease()
+        return True
+
+    def _record_lease(self) -> None:
+        """Records this worker as the lease's holder, so other workers can see who the leader is"""
+        expires_at = get_utc_now() + timedelta(seconds=self.lease_ttl)
+
+        with session_context() as session:
+            stmt = _insert(session)(SchedulerLeaseModel.__table__).values(
+                id=self.name, holder=self.holder, expires_at=expires_at
+            )
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+                )
+            )
+            session.commit()
+
+    def _release(self) -> None:
+        try:
+            if self._connection is not None:
+                self._connection.execute(sa.select(sa.func.pg_advisory_unlock(ADVISORY_LOCK_KEY)))
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+        finally:
+            self._close_connection()
+            super()._release()
+
+
+def get_scheduler_leader() -> SchedulerLeader:
+    lease_ttl = get_app_settings().SCHEDULER_LEASE_TTL
+    if engine.dialect.name == "postgresql":
+        return AdvisoryLockLeader(lease_ttl)
+
+    return LeaseRowLeader(lease_ttl)
@@ -1,11 +1,21 @@
 import asyncio
-from datetime import UTC, datetime, timedelta
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
 from mealie.core import root_logger
 from mealie.core.config import get_app_settings
-from mealie.services.scheduler.runner import repeat_every
+from mealie.db.db_setup import session_context
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.server.scheduler import ScheduledTaskModel, SchedulerLeaseModel
+from mealie.schema.admin.scheduler import ScheduledTaskStatus, SchedulerStatus
 
+from .leader import LEASE_NAME, SchedulerLeader, get_scheduler_leader
 from .scheduler_registry import SchedulerRegistry
 
 logger = root_logger.get_logger()
@@ -16,66 +26,171 @@ MINUTES_DAY = 1440
 MINUTES_5 = 5
 MINUTES_HOUR = 60
 
+POLL_SECONDS = 15
+"""How often the leader checks for tasks that are due"""
+
 
 class SchedulerService:
+    """
+    Runs the registered tasks on their schedule. Every worker starts the scheduler, but only the worker that's
+    elected as the leader (see `leader.py`) runs tasks. Each task's next run is stored in the database, so a new
+    leader picks up where the last one left off.
+    """
+
+    _leader: SchedulerLeader | None = None
+    _loops: list[asyncio.Task] = []
+
     @staticmethod
     async def start():
-        await run_minutely()
-        await run_hourly()
+        leader = get_scheduler_leader()
 
-        # Wait to trigger our daily run until our given "daily time", so having asyncio handle it.
-        asyncio.create_task(schedule_daily())
+        SchedulerService._leader = leader
+        SchedulerService._loops = [
+            asyncio.create_task(keep_lease(leader)),
+            asyncio.create_task(run_scheduler(leader)),
+        ]
 
+    @staticmethod
+    async def stop():
+        for loop in SchedulerService._loops:
+            loop.cancel()
 
-async def schedule_daily():
-    now = datetime.now(UTC)
-    daily_schedule_time = get_app_settings().DAILY_SCHEDULE_TIME_UTC
-    logger.debug(f"Current time is {now} and DAILY_SCHEDULE_TIME (in UTC) is {daily_schedule_time}")
+        await asyncio.gather(*SchedulerService._loops, return_exceptions=True)
+        SchedulerService._loops = []
 
-    next_schedule = now.replace(
-        hour=daily_schedule_time.hour, minute=daily_schedule_time.minute, second=0, microsecond=0
-    )
-    delta = next_schedule - now
-    if delta < timedelta(0):
-        next_schedule = next_schedule + timedelta(days=1)
-        delta = next_schedule - now
+        if SchedulerService._leader is not None:
+            await run_in_threadpool(SchedulerService._leader.release)
+            SchedulerService._leader = None
 
-    hours_until, seconds_reminder = divmod(delta.total_seconds(), 3600)
-    minutes_until, seconds_reminder = divmod(seconds_reminder, 60)
-    seconds_until = round(seconds_reminder)
-    logger.debug("Time left: %02d:%02d:%02d", hours_until, minutes_until, seconds_until)
 
-    target_time = next_schedule.replace(microsecond=0, second=0)
-    logger.info("Daily tasks scheduled for %s", str(target_time))
+async def keep_lease(leader: SchedulerLeader):
+    while True:
+        await run_in_threadpool(leader.heartbeat)
+        await asyncio.sleep(leader.renew_interval)
 
-    wait_seconds = delta.total_seconds()
-    await asyncio.sleep(wait_seconds)
-    await run_daily()
 
+async def run_scheduler(leader: SchedulerLeader):
+    while True:
+        if leader.is_leader:
+            try:
+                await run_in_threadpool(run_due_tasks, leader)
+            except Exception as e:
+                logger.error(f"Error running scheduled tasks: {e}")
 
-def _scheduled_task_wrapper(callable):
-    try:
-        callable()
-    except Exception as e:
-        logger.error("Error in scheduled task func='%s': exception='%s'", callable.__name__, e)
+        await asyncio.sleep(POLL_SECONDS)
+
+
+def next_run(schedule: str, after: datetime) -> datetime:
+    """The next time a task on the given schedule should run, after `after`"""
+
+    if schedule == "daily":
+        daily_schedule_time = get_app_settings().DAILY_SCHEDULE_TIME_UTC
+        next_schedule = after.replace(
+            hour=daily_schedule_time.hour, minute=daily_schedule_time.minute, second=0, microsecond=0
+        )
+        if next_schedule <= after:
+            next_schedule = next_schedule + timedelta(days=1)
+
+        return next_schedule
+
+    minutes = MINUTES_HOUR if schedule == "hourly" else MINUTES_5
+    return after + timedelta(minutes=minutes)
 
 
-@repeat_every(minutes=MINUTES_DAY, wait_first=False, logger=logger)
-def run_daily():
-    logger.debug("Running daily callbacks")
-    for func in SchedulerRegistry._daily:
-        _scheduled_task_wrapper(func)
+def registered_tasks() -> dict[str, tuple[str, Callable]]:
+    """The schedule and callback of every registered task, by the task's name"""
 
+    tasks: dict[str, tuple[str, Callable]] = {}
+    for schedule, callbacks in [
+        ("daily", SchedulerRegistry._daily),
+        ("hourly", SchedulerRegistry._hourly),
+        ("minutely", SchedulerRegistry._minutely),
+    ]:
+        for callback in callbacks:
+            tasks[callback.__name__] = (schedule, callback)
 
-@repeat_every(minutes=MINUTES_HOUR, wait_first=True, logger=logger)
-def run_hourly():
-    logger.debug("Running hourly callbacks")
-    for func in SchedulerRegistry._hourly:
-        _scheduled_task_wrapper(func)
+    return tasks
 
 
-@repeat_every(minutes=MINUTES_5, wait_first=True, logger=logger)
-def run_minutely():
-    logger.debug("Running minutely callbacks")
-    for func in SchedulerRegistry._minutely:
-        _scheduled_task_wrapper(func)
+def run_due_tasks(leader: SchedulerLeader | None = None) -> None:
+    """
+    Runs every registered task whose next run is due, and records how it went.
+    Tasks that haven't been scheduled yet are scheduled, rather than run right away.
+    """
+
+    tasks = registered_tasks()
+    now = get_utc_now()
+
+    due_tasks: list[str] = []
+    with session_context() as session:
+        scheduled = {task.id: task for task in session.scalars(select(ScheduledTaskModel))}
+
+        for name, (schedule, _) in tasks.items():
+            task = scheduled.get(name)
+            if task is None:
+                session.add(ScheduledTaskModel(id=name, schedule=schedule, next_run_at=next_run(schedule, now)))
+            elif task.schedule != schedule:
+                task.schedule = schedule
+                task.next_run_at = next_run(schedule, now)
+            elif task.next_run_at <= now:
+                due_tasks.append(name)
+
+        session.commit()
+
+    for name in due_tasks:
+        # stop if another worker took over while the previous tasks were running
+        if leader is not None and not leader.is_leader:
+            return
+
+        schedule, callback = tasks[name]
+        run_task(name, schedule, callback)
+
+
+def run_task(name: str, schedule: str, callback: Callable) -> None:
+    started_at = get_utc_now()
+    start = time.perf_counter()
+
+    error: str | None = None
+    try:
+        callback()
+    except Exception as e:
+        logger.error("Error in scheduled task func='%s': exception='%s'", name, e)
+        error = str(e)
+
+    duration = time.perf_counter() - start
+    with session_context() as session:
+        task = session.get(ScheduledTaskModel, name)
+        if task is None:
+            task = ScheduledTaskModel(id=name, schedule=schedule)
+            session.add(task)
+
+        task.last_run_at = started_at
+        task.last_duration = duration
+        task.last_status = "failure" if error else "success"
+        task.last_error = error
+        task.next_run_at = next_run(schedule, get_utc_now())
+        session.commit()
+
+
+def get_scheduler_status(session: Session) -> SchedulerStatus:
+    lease = session.get(SchedulerLeaseModel, LEASE_NAME)
+    if lease is not None and lease.expires_at <= get_utc_now():
+        lease = None
+
+    tasks = session.scalars(select(ScheduledTaskModel).order_by(ScheduledTaskModel.id))
+    return SchedulerStatus(
+        leader=lease.holder if lease else None,
+        lease_expires_at=lease.expires_at if lease else None,
+        tasks=[
+            ScheduledTaskStatus(
+                name=task.id,
+                schedule=task.schedule,
+                next_run_at=task.next_run_at,
+                last_run_at=task.last_run_at,
+                last_duration=task.last_duration,
+                last_status=task.last_status,
+                last_error=task.last_error,
+            )
+            for task in tasks
+        ],
+    )
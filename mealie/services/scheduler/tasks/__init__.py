@@ -2,9 +2,11 @@ from .create_timeline_events import create_mealplan_timeline_events
 from .delete_old_checked_shopping_list_items import delete_old_checked_list_items
 from .post_webhooks import post_group_webhooks
 from .purge_expired_share_tokens import purge_expired_tokens
+from .purge_finished_jobs import purge_old_jobs
 from .purge_group_exports import purge_group_data_exports
 from .purge_password_reset import purge_password_reset_tokens
 from .purge_registration import purge_group_registration
+from .reconcile_recipe_storage import reconcile_group_storage
 from .reset_locked_users import locked_user_reset
 
 __all__ = [
@@ -12,9 +14,11 @@ __all__ = [
     "delete_old_checked_list_items",
     "post_group_webhooks",
     "purge_expired_tokens",
+    "purge_old_jobs",
     "purge_password_reset_tokens",
     "purge_group_data_exports",
     "purge_group_registration",
+    "reconcile_group_storage",
     "locked_user_reset",
 ]
 
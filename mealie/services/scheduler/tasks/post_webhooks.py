@@ -1,8 +1,9 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from pydantic import UUID4
 
 from mealie.db.db_setup import session_context
+from mealie.db.models.server.scheduler import ScheduledTaskModel
 from mealie.repos.all_repositories import get_repositories
 from mealie.schema.household.webhook import ReadWebhook
 from mealie.schema.response.pagination import PaginationQuery
@@ -18,7 +19,19 @@ from mealie.services.event_bus_service.event_types import (
     EventWebhookData,
 )
 
-last_ran = datetime.now(UTC)
+FIRST_RUN_WINDOW = timedelta(minutes=5)
+"""How far back the first scheduled run looks, since there's no previous run to start from"""
+
+
+def get_last_run_at() -> datetime | None:
+    """
+    When the scheduler last ran `post_group_webhooks`. This is read from the database, rather than kept in memory,
+    so the window carries over between restarts and whichever worker is running the scheduler.
+    """
+
+    with session_context() as session:
+        task = session.get(ScheduledTaskModel, post_group_webhooks.__name__)
+        return task.last_run_at if task else None
 
 
 def post_group_webhooks(
@@ -26,13 +39,11 @@ def post_group_webhooks(
 ) -> None:
     """Post webhook events to specified group, or all groups"""
 
-    global last_ran
-
-    # if not specified, start the query at the last time the service ran
-    start_dt = start_dt or last_ran
-
     # end the query at the current time
-    last_ran = end_dt = datetime.now(UTC)
+    end_dt = datetime.now(UTC)
+
+    # if not specified, start the query at the last time the scheduler ran this task
+    start_dt = start_dt or get_last_run_at() or end_dt - FIRST_RUN_WINDOW
 
     if group_id is None:
         # publish the webhook event to each group's event bus
@@ -0,0 +1,26 @@
+import datetime
+import time
+
+from mealie.core import root_logger
+from mealie.core.config import get_app_dirs
+from mealie.services.jobs.job_queue import purge_finished_jobs
+
+MAX_JOB_AGE_DAYS = 7
+
+
+def purge_old_jobs(max_days_old=MAX_JOB_AGE_DAYS):
+    """Purges finished jobs, and the files uploaded for them, after x days"""
+    logger = root_logger.get_logger()
+
+    logger.debug("purging finished jobs")
+    total_removed = purge_finished_jobs(datetime.timedelta(days=max_days_old))
+
+    # the files of jobs that failed are kept so the job can be retried, until the job itself is purged
+    limit = time.time() - datetime.timedelta(days=max_days_old).total_seconds()
+    job_dir = get_app_dirs().JOB_DIR
+    if job_dir.exists():
+        for file in job_dir.iterdir():
+            if file.is_file() and file.stat().st_mtime < limit:
+                file.unlink()
+
+    logger.info(f"finished purging finished jobs. {total_removed} jobs removed")
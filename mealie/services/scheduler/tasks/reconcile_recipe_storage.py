@@ -0,0 +1,15 @@
+from mealie.core import root_logger
+from mealie.db.db_setup import session_context
+from mealie.services.recipe.recipe_storage import reconcile_recipe_storage
+
+logger = root_logger.get_logger()
+
+
+def reconcile_group_storage():
+    """Re-sizes every recipe directory, to correct the recipe sizes used for each group's storage"""
+    logger.debug("reconciling recipe storage")
+
+    with session_context() as session:
+        result = reconcile_recipe_storage(session)
+
+    logger.info(f"recipe storage reconciled. {result.updated} recipes sized, {result.removed} removed")
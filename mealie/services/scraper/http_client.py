@@ -0,0 +1,173 @@
+"""A shared, pooled HTTP client for fetching recipe pages, with one pool per event loop"""
+
+import asyncio
+import importlib.util
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import httpx
+from fastapi import status
+
+from mealie.core.config import get_app_settings
+from mealie.core.root_logger import get_logger
+from mealie.pkgs import safehttp
+
+from .user_agents_manager import get_user_agents_manager
+
+SCRAPER_TIMEOUT = 15
+
+
+class ForceTimeoutException(Exception):
+    pass
+
+
+class ResponseTooLargeException(Exception):
+    pass
+
+
+@dataclass
+class _LoopPool:
+    client: httpx.AsyncClient
+    limit: asyncio.Semaphore
+    host_limits: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    host_requests: Counter[str] = field(default_factory=Counter)
+
+
+def decode_html(content: bytes | bytearray, encoding: str | None) -> str:
+    # =====================================
+    # Copied from requests text property
+
+    # Decode unicode from given encoding.
+    try:
+        return str(content, encoding or "utf-8", errors="replace")
+    except (LookupError, TypeError):
+        # A LookupError is raised if the encoding was not found which could
+        # indicate a misspelling or similar mistake.
+        #
+        # A TypeError can be raised if encoding is None
+        #
+        # So we try blindly encoding.
+        return str(content, errors="replace")
+
+
+class ScraperHttpClient:
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 20,
+        max_concurrency_per_host: int = 4,
+        max_response_size: int = 10 * 1024 * 1024,
+        http2: bool = True,
+        timeout: float = SCRAPER_TIMEOUT,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_concurrency_per_host = max(1, max_concurrency_per_host)
+        self.max_response_size = max_response_size
+        # HTTP/2 support is only available if the optional `h2` package is installed
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.timeout = timeout
+
+        self.logger = get_logger()
+        self._pools: dict[asyncio.AbstractEventLoop, _LoopPool] = {}
+
+    def _get_pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        if (pool := self._pools.get(loop)) is None:
+            # the pools of closed loops can't be used (or closed) anymore
+            for closed_loop in [other for other in self._pools if other.is_closed()]:
+                del self._pools[closed_loop]
+
+            limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+            client = httpx.AsyncClient(
+                transport=safehttp.AsyncSafeTransport(timeout=self.timeout, http2=self.http2, limits=limits)
+            )
+            pool = self._pools[loop] = _LoopPool(client, asyncio.Semaphore(self.max_concurrency))
+
+        return pool
+
+    @asynccontextmanager
+    async def _limit(self, pool: _LoopPool, url: str) -> AsyncIterator[None]:
+        host = httpx.URL(url).host
+        if (host_limit := pool.host_limits.get(host)) is None:
+            host_limit = pool.host_limits[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+
+        pool.host_requests[host] += 1
+        try:
+            # wait for the host first, so requests to a busy host don't hold up the others
+            async with host_limit, pool.limit:
+                yield
+        finally:
+            # only keep the limits of hosts that are being scraped
+            pool.host_requests[host] -= 1
+            if not pool.host_requests[host]:
+                del pool.host_requests[host]
+                del pool.host_limits[host]
+
+    async def _read_body(self, response: httpx.Response) -> bytearray:
+        if (content_length := response.headers.get("content-length", "")).isdigit():
+            if int(content_length) > self.max_response_size:
+                raise ResponseTooLargeException()
+
+        body = bytearray()
+        start_time = time.monotonic()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+
+            if len(body) > self.max_response_size:
+                raise ResponseTooLargeException()
+
+            if time.monotonic() - start_time > self.timeout:
+                raise ForceTimeoutException()
+
+        return body
+
+    async def fetch_html(self, url: str) -> str:
+        """
+        Fetches the html of a url, trying each user agent until one isn't forbidden. Raises a
+        `ForceTimeoutException` if reading the page takes longer than the timeout, and a
+        `ResponseTooLargeException` if the page is larger than `max_response_size` bytes.
+        """
+        user_agents_manager = get_user_agents_manager()
+        pool = self._get_pool()
+
+        self.logger.debug(f"Scraping URL: {url}")
+        async with self._limit(pool, url):
+            for user_agent in user_agents_manager.user_agents:
+                self.logger.debug(f'Trying User-Agent: "{user_agent}"')
+
+                async with pool.client.stream(
+                    "GET",
+                    url,
+                    timeout=self.timeout,
+                    headers=user_agents_manager.get_scrape_headers(user_agent),
+                    follow_redirects=True,
+                ) as response:
+                    if response.status_code == status.HTTP_403_FORBIDDEN:
+                        self.logger.debug(f'403 Forbidden with User-Agent: "{user_agent}"')
+                        continue
+
+                    body = await self._read_body(response)
+                    return decode_html(body, response.encoding) if body else ""
+
+        return ""
+
+    async def aclose(self) -> None:
+        """Closes the connection pool of the running event loop"""
+
+        if (pool := self._pools.pop(asyncio.get_running_loop(), None)) is not None:
+            await pool.client.aclose()
+
+
+@lru_cache
+def get_scraper_http_client() -> ScraperHttpClient:
+    settings = get_app_settings()
+    return ScraperHttpClient(
+        max_concurrency=settings.SCRAPER_MAX_CONCURRENCY,
+        max_concurrency_per_host=settings.SCRAPER_MAX_CONCURRENCY_PER_HOST,
+        max_response_size=settings.SCRAPER_MAX_RESPONSE_SIZE * 1024 * 1024,
+        http2=settings.SCRAPER_HTTP2,
+    )
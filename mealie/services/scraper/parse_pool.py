@@ -0,0 +1,56 @@
+"""Runs the CPU-bound stages of scraping in a bounded thread pool, off of the event loop"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import ParamSpec, TypeVar
+
+from mealie.core.config import get_app_settings
+
+from .http_client import ForceTimeoutException
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class ScraperParsePool:
+    def __init__(self, max_workers: int = 4, timeout: float = 30) -> None:
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool, created on first use"""
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper-parse")
+
+            return self._executor
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Runs `func` in the pool, raising a `ForceTimeoutException` if it takes longer than the timeout"""
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except TimeoutError as e:
+            raise ForceTimeoutException() from e
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache
+def get_scraper_parse_pool() -> ScraperParsePool:
+    settings = get_app_settings()
+    return ScraperParsePool(settings.SCRAPER_PARSE_WORKERS, settings.SCRAPER_PARSE_TIMEOUT)
@@ -1,7 +1,10 @@
 import asyncio
+from collections.abc import Callable
 
 from pydantic import UUID4
 
+from mealie.core.config import get_app_settings
+from mealie.core.exceptions import UnexpectedNone
 from mealie.lang.providers import Translator
 from mealie.repos.repository_factory import AllRepositories
 from mealie.schema.recipe.recipe import CreateRecipeByUrlBulk, Recipe
@@ -43,6 +46,14 @@ class RecipeBulkScraperService(BaseService):
         self.report = self.repos.group_reports.create(import_report)
         return self.report.id
 
+    def load_report(self, report_id: UUID4) -> None:
+        """Adds the results to an existing report, e.g. one created when the import was queued"""
+        report = self.repos.group_reports.get_one(report_id)
+        if report is None:
+            raise UnexpectedNone(f"Bulk import report {report_id} not found")
+
+        self.report = report
+
     def _add_error_entry(self, message: str, exception: str = "") -> None:
         self.report_entries.append(
             ReportEntryCreate(
@@ -79,10 +90,19 @@ class RecipeBulkScraperService(BaseService):
         self.report.entries = new_entries
         self.repos.group_reports.update(self.report.id, self.report)
 
-    async def scrape(self, urls: CreateRecipeByUrlBulk) -> None:
-        sem = asyncio.Semaphore(3)
+    async def scrape(self, urls: CreateRecipeByUrlBulk, progress: Callable[[int], None] | None = None) -> None:
+        """
+        Scrapes and saves the recipes, adding the results to the report. If given, `progress` is called with
+        the number of URLs scraped so far.
+        """
+        # pages are parsed in a thread pool, so leave room for fetching other pages while the pool is busy.
+        # The shared http client also limits the number of requests per host
+        settings = get_app_settings()
+        sem = asyncio.Semaphore(settings.SCRAPER_MAX_CONCURRENCY + settings.SCRAPER_PARSE_WORKERS)
+        scraped = 0
 
         async def _do(url: str) -> Recipe | None:
+            nonlocal scraped
             async with sem:
                 try:
                     recipe, _ = await create_from_html(url, self.translator)
@@ -92,11 +112,20 @@ class RecipeBulkScraperService(BaseService):
                     self.service.logger.exception(e)
                     self._add_error_entry(f"failed to scrape url {url}", str(e))
                     return None
+                finally:
+                    scraped += 1
+                    if progress:
+                        progress(scraped)
 
         if self.report is None:
             self.get_report_id()
         tasks = [_do(b.url) for b in urls.imports]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            # don't swallow cancellation (e.g. of the job running the import)
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
         for b, recipe in zip(urls.imports, results, strict=True):
             if not recipe or isinstance(recipe, BaseException):
                 continue
@@ -4,6 +4,7 @@ from mealie.schema.recipe.recipe import Recipe
 from mealie.services.scraper import cleaner
 from mealie.services.scraper.scraped_extras import ScrapedExtras
 
+from .parse_pool import get_scraper_parse_pool
 from .scraper_strategies import (
     ABCScraperStrategy,
     RecipeScraperOpenAI,
@@ -56,7 +57,7 @@ class RecipeScraper:
 
             recipe_result, extras = result
             try:
-                recipe = cleaner.clean(recipe_result, self.translator)
+                recipe = await get_scraper_parse_pool().run(cleaner.clean, recipe_result, self.translator)
             except Exception:
                 self.logger.exception(f"Failed to clean recipe data from {scraper.__class__.__name__}")
                 continue
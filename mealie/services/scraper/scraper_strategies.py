@@ -1,4 +1,3 @@
-import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import Any
@@ -6,7 +5,6 @@ from typing import Any
 import bs4
 import extruct
 from fastapi import HTTPException, status
-from httpx import AsyncClient, Response
 from recipe_scrapers import NoSchemaFoundInWildMode, SchemaScraperFactory, scrape_html
 from slugify import slugify
 from w3lib.html import get_base_url
@@ -14,86 +12,24 @@ from w3lib.html import get_base_url
 from mealie.core.config import get_app_settings
 from mealie.core.root_logger import get_logger
 from mealie.lang.providers import Translator
-from mealie.pkgs import safehttp
 from mealie.schema.recipe.recipe import Recipe, RecipeStep
 from mealie.services.openai import OpenAIService
 from mealie.services.scraper.scraped_extras import ScrapedExtras
 
 from . import cleaner
-from .user_agents_manager import get_user_agents_manager
+from .http_client import get_scraper_http_client
+from .parse_pool import get_scraper_parse_pool
 
-SCRAPER_TIMEOUT = 15
 logger = get_logger()
 
 
-class ForceTimeoutException(Exception):
-    pass
-
-
 async def safe_scrape_html(url: str) -> str:
     """
     Scrapes the html from a url but will cancel the request
-    if the request takes longer than 15 seconds. This is used to mitigate
+    if the request takes longer than 15 seconds, or the page is too large. This is used to mitigate
     DDOS attacks from users providing a url with arbitrary large content.
     """
-    user_agents_manager = get_user_agents_manager()
-
-    logger.debug(f"Scraping URL: {url}")
-    async with AsyncClient(transport=safehttp.AsyncSafeTransport()) as client:
-        for user_agent in user_agents_manager.user_agents:
-            logger.debug(f'Trying User-Agent: "{user_agent}"')
-
-            response: Response | None = None
-            html_bytes = b""
-            async with client.stream(
-                "GET",
-                url,
-                timeout=SCRAPER_TIMEOUT,
-                headers=user_agents_manager.get_scrape_headers(user_agent),
-                follow_redirects=True,
-            ) as resp:
-                if resp.status_code == status.HTTP_403_FORBIDDEN:
-                    logger.debug(f'403 Forbidden with User-Agent: "{user_agent}"')
-                    continue
-
-                start_time = time.time()
-
-                async for chunk in resp.aiter_bytes(chunk_size=1024):
-                    html_bytes += chunk
-
-                    if time.time() - start_time > SCRAPER_TIMEOUT:
-                        raise ForceTimeoutException()
-
-                response = resp
-                break
-
-        if not (response and html_bytes):
-            return ""
-
-        # =====================================
-        # Copied from requests text property
-
-        # Try charset from content-type
-        content = None
-        encoding = response.encoding
-
-        # Fallback to auto-detected encoding.
-        if encoding is None:
-            encoding = response.apparent_encoding
-
-        # Decode unicode from given encoding.
-        try:
-            content = str(html_bytes, encoding, errors="replace")
-        except (LookupError, TypeError):
-            # A LookupError is raised if the encoding was not found which could
-            # indicate a misspelling or similar mistake.
-            #
-            # A TypeError can be raised if encoding is None
-            #
-            # So we try blindly encoding.
-            content = str(html_bytes, errors="replace")
-
-        return content
+    return await get_scraper_http_client().fetch_html(url)
 
 
 class ABCScraperStrategy(ABC):
@@ -223,7 +159,9 @@ class RecipeScraperPackage(ABCScraperStrategy):
 
     async def scrape_url(self) -> SchemaScraperFactory.SchemaScraper | Any | None:
         recipe_html = await self.get_html(self.url)
+        return await get_scraper_parse_pool().run(self.scrape_schema, recipe_html)
 
+    def scrape_schema(self, recipe_html: str) -> SchemaScraperFactory.SchemaScraper | Any | None:
         try:
             # scrape_html requires a URL, but we might not have one, so we default to a dummy URL
             scraped_schema = scrape_html(recipe_html, org_url=self.url or "https://example.com", supported_only=False)
@@ -260,7 +198,7 @@ class RecipeScraperPackage(ABCScraperStrategy):
         if scraped_data is None:
             return None
 
-        return self.clean_scraper(scraped_data, self.url)
+        return await get_scraper_parse_pool().run(self.clean_scraper, scraped_data, self.url)
 
 
 class RecipeScraperOpenAI(RecipeScraperPackage):
@@ -333,7 +271,7 @@ class RecipeScraperOpenAI(RecipeScraperPackage):
             return ""
 
         html = self.raw_html or await safe_scrape_html(url)
-        text = self.format_html_to_text(html)
+        text = await get_scraper_parse_pool().run(self.format_html_to_text, html)
         try:
             service = OpenAIService()
             prompt = service.get_prompt("recipes.scrape-recipe")
@@ -392,7 +330,7 @@ class RecipeScraperOpenGraph(ABCScraperStrategy):
         """
         html = await self.get_html(self.url)
 
-        og_data = self.get_recipe_fields(html)
+        og_data = await get_scraper_parse_pool().run(self.get_recipe_fields, html)
 
         if og_data is None:
             return None
@@ -1,5 +1,6 @@
 from mealie.repos.repository_factory import AllRepositories
 from mealie.repos.seed.seeders import IngredientFoodsSeeder, IngredientUnitsSeeder, MultiPurposeLabelSeeder
+from mealie.schema.group.group_seeder import SeederResult
 from mealie.services._base_service import BaseService
 
 
@@ -8,14 +9,14 @@ class SeederService(BaseService):
         self.repos = repos
         super().__init__()
 
-    def seed_foods(self, locale: str) -> None:
+    def seed_foods(self, locale: str) -> SeederResult:
         seeder = IngredientFoodsSeeder(self.repos, self.logger)
-        seeder.seed(locale)
+        return seeder.seed(locale)
 
-    def seed_labels(self, locale: str) -> None:
+    def seed_labels(self, locale: str) -> SeederResult:
         seeder = MultiPurposeLabelSeeder(self.repos, self.logger)
-        seeder.seed(locale)
+        return seeder.seed(locale)
 
-    def seed_units(self, locale: str) -> None:
+    def seed_units(self, locale: str) -> SeederResult:
         seeder = IngredientUnitsSeeder(self.repos, self.logger)
-        seeder.seed(locale)
+        return seeder.seed(locale)
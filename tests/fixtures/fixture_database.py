@@ -1,6 +1,8 @@
 from collections.abc import Generator
+from contextlib import contextmanager
 
 import pytest
+from sqlalchemy import Connection, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from mealie.db.db_setup import SessionLocal
@@ -19,3 +21,50 @@ def session() -> Generator[sessionmaker[Session], None, None]:
 @pytest.fixture()
 def unfiltered_database(session: Session) -> Generator[AllRepositories, None, None]:
     yield get_repositories(session, group_id=None, household_id=None)
+
+
+class QueryCounter:
+    """Records the statements executed through an engine, and how many rows each SELECT returned"""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.rows: list[int] = []
+
+    @property
+    def query_count(self) -> int:
+        return len(self.rows)
+
+    @property
+    def row_count(self) -> int:
+        return sum(self.rows)
+
+    def before_cursor_execute(self, conn: Connection, _cursor, statement: str, parameters, _context, executemany):
+        if executemany or not statement.lstrip().upper().startswith("SELECT"):
+            return
+
+        # re-run the query on a plain DBAPI cursor (which doesn't fire any events) to count its rows
+        cursor = conn.connection.driver_connection.cursor()
+        try:
+            cursor.execute(statement, parameters)
+            self.rows.append(len(cursor.fetchall()))
+        finally:
+            cursor.close()
+
+        self.statements.append(statement)
+
+    @contextmanager
+    def count(self, session: Session):
+        engine = session.get_bind()
+        self.statements.clear()
+        self.rows.clear()
+
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "before_cursor_execute", self.before_cursor_execute)
+
+
+@pytest.fixture()
+def query_counter() -> QueryCounter:
+    return QueryCounter()
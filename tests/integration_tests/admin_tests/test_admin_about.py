@@ -4,6 +4,8 @@ from fastapi.testclient import TestClient
 from mealie.core.config import get_app_settings
 from mealie.core.settings.static import APP_VERSION
 from mealie.repos.repository_factory import AllRepositories
+from mealie.services.event_bus_service.delivery import get_notification_delivery
+from mealie.services.parser_services.alias_index import get_alias_index_cache
 from tests.utils import api_routes
 from tests.utils.fixture_schemas import TestUser
 
@@ -72,3 +74,42 @@ def test_admin_about_check_app_config(api_client: TestClient, admin_user: TestUs
     assert as_dict["ldapReady"] in [True, False]
     assert as_dict["baseUrlSet"] in [True, False]
     assert as_dict["isUpToDate"] in [True, False]
+
+
+def test_admin_about_get_user_cache_statistics(api_client: TestClient, admin_user: TestUser):
+    # the first request loads the user, the second one is cached
+    for _ in range(2):
+        response = api_client.get(api_routes.admin_about_user_cache, headers=admin_user.token)
+        assert response.status_code == 200
+
+    as_dict = response.json()
+    assert as_dict["hits"] >= 1
+    assert as_dict["misses"] >= 1
+    assert as_dict["size"] >= 1
+
+
+def test_admin_about_get_alias_index_cache_statistics(
+    api_client: TestClient, admin_user: TestUser, unique_user: TestUser
+):
+    # the first lookup loads the group's food index, the second one is cached
+    for _ in range(2):
+        get_alias_index_cache().get_food_index(unique_user.repos)
+
+    response = api_client.get(api_routes.admin_about_alias_index_cache, headers=admin_user.token)
+    assert response.status_code == 200
+
+    as_dict = response.json()
+    assert as_dict["hits"] >= 1
+    assert as_dict["misses"] >= 1
+    assert as_dict["size"] >= 1
+
+
+def test_admin_about_get_notification_delivery_statistics(api_client: TestClient, admin_user: TestUser):
+    response = api_client.get(api_routes.admin_about_notifications, headers=admin_user.token)
+    assert response.status_code == 200
+
+    as_dict = response.json()
+    metrics = get_notification_delivery().metrics.snapshot()
+    for counter in ["queued", "delivered", "retried", "failed", "dropped"]:
+        assert as_dict[counter] == metrics[counter]
+    assert "latencyP95" in as_dict
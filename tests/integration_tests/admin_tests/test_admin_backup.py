@@ -1,7 +1,10 @@
 from fastapi.testclient import TestClient
 
 from mealie.core.config import get_app_dirs
+from mealie.schema.jobs import JobStatus
+from mealie.services.jobs.job_worker import run_queued_jobs
 from tests import data
+from tests.utils import api_routes
 from tests.utils.fixture_schemas import TestUser
 
 
@@ -23,3 +26,30 @@ def test_recipe_asset_exploit(api_client: TestClient, admin_user: TestUser):
     # Ensure File was not created
     assert not (dirs.BACKUP_DIR / "test.txt").exists()
     assert not (dirs.BACKUP_DIR.parent / "test.txt").exists()
+
+
+def test_create_backup_job(api_client: TestClient, admin_user: TestUser, unique_user: TestUser):
+    response = api_client.post(api_routes.admin_backups, headers=admin_user.token)
+    assert response.status_code == 202
+
+    # backups are created by a job, which is only visible to admins
+    job_id = response.json()["id"]
+    response = api_client.get(api_routes.admin_jobs_item_id(job_id), headers=unique_user.token)
+    assert response.status_code == 403
+
+    response = api_client.get(api_routes.admin_jobs_item_id(job_id), headers=admin_user.token)
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.queued.value
+
+    run_queued_jobs()
+
+    response = api_client.get(api_routes.admin_jobs_item_id(job_id), headers=admin_user.token)
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.success.value
+
+    response = api_client.get(api_routes.admin_backups, headers=admin_user.token)
+    assert response.status_code == 200
+    backup = response.json()["imports"][0]["name"]
+
+    response = api_client.delete(api_routes.admin_backups_file_name(backup), headers=admin_user.token)
+    assert response.status_code == 200
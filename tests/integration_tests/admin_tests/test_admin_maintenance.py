@@ -0,0 +1,26 @@
+from fastapi.testclient import TestClient
+
+from mealie.services.scheduler.leader import LeaseRowLeader
+from tests.utils import api_routes
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_admin_get_scheduler_status(api_client: TestClient, admin_user: TestUser, unique_user: TestUser):
+    response = api_client.get(api_routes.admin_maintenance_scheduler, headers=unique_user.token)
+    assert response.status_code == 403
+
+    leader = LeaseRowLeader(lease_ttl=60)
+    assert leader.heartbeat()
+    try:
+        response = api_client.get(api_routes.admin_maintenance_scheduler, headers=admin_user.token)
+        assert response.status_code == 200
+        as_dict = response.json()
+        assert as_dict["leader"] == leader.holder
+        assert as_dict["leaseExpiresAt"]
+        assert isinstance(as_dict["tasks"], list)
+    finally:
+        leader.release()
+
+    response = api_client.get(api_routes.admin_maintenance_scheduler, headers=admin_user.token)
+    assert response.status_code == 200
+    assert response.json()["leader"] is None
@@ -10,6 +10,7 @@ from fastapi.testclient import TestClient
 from mealie.schema.group.group_migration import SupportedMigrations
 from mealie.schema.recipe.recipe import Recipe
 from mealie.schema.reports.reports import ReportEntryOut
+from mealie.services.jobs.job_worker import run_queued_jobs
 from tests import data as test_data
 from tests.utils import api_routes
 from tests.utils.assertion_helpers import assert_deserialize
@@ -143,7 +144,9 @@ def test_recipe_migration(api_client: TestClient, unique_user_fn_scoped: TestUse
 
     assert response.status_code == 200
 
+    # the migration is queued, and its results are added to the report once it has run
     report_id = response.json()["id"]
+    run_queued_jobs()
 
     # Validate Results
     response = api_client.get(api_routes.groups_reports_item_id(report_id), headers=unique_user.token)
@@ -221,6 +224,7 @@ def test_bad_mealie_alpha_data_is_ignored(api_client: TestClient, unique_user: T
 
         assert response.status_code == 200
         report_id = response.json()["id"]
+        run_queued_jobs()
 
     # Validate Results
     response = api_client.get(api_routes.groups_reports_item_id(report_id), headers=unique_user.token)
@@ -0,0 +1,51 @@
+from fastapi.testclient import TestClient
+
+from mealie.schema.jobs import JobName, JobStatus
+from mealie.schema.reports.reports import ReportSummaryStatus
+from mealie.services.jobs.job_worker import run_queued_jobs
+from tests.utils import api_routes
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_group_job_cancel_and_retry(api_client: TestClient, unique_user: TestUser, g2_user: TestUser):
+    response = api_client.post(api_routes.recipes_bulk_actions_export, json={"recipes": []}, headers=unique_user.token)
+    assert response.status_code == 202
+    job_id = response.json()["jobId"]
+    report_id = response.json()["reportId"]
+
+    response = api_client.get(api_routes.groups_jobs, headers=unique_user.token)
+    assert response.status_code == 200
+    job = next(job for job in response.json() if job["id"] == job_id)
+    assert job["name"] == JobName.recipe_export.value
+    assert job["status"] == JobStatus.queued.value
+    assert job["reportId"] == report_id
+
+    # jobs are only visible to their own group
+    response = api_client.get(api_routes.groups_jobs_item_id(job_id), headers=g2_user.token)
+    assert response.status_code == 404
+    response = api_client.post(api_routes.groups_jobs_item_id_cancel(job_id), headers=g2_user.token)
+    assert response.status_code == 404
+
+    # queued jobs are cancelled right away, and their report is failed
+    response = api_client.post(api_routes.groups_jobs_item_id_retry(job_id), headers=unique_user.token)
+    assert response.status_code == 400
+    response = api_client.post(api_routes.groups_jobs_item_id_cancel(job_id), headers=unique_user.token)
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.cancelled.value
+    response = api_client.post(api_routes.groups_jobs_item_id_cancel(job_id), headers=unique_user.token)
+    assert response.status_code == 400
+
+    response = api_client.get(api_routes.groups_reports_item_id(report_id), headers=unique_user.token)
+    assert response.json()["status"] == ReportSummaryStatus.failure.value
+
+    # retried jobs are queued again
+    response = api_client.post(api_routes.groups_jobs_item_id_retry(job_id), headers=unique_user.token)
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.queued.value
+
+    run_queued_jobs()
+
+    response = api_client.get(api_routes.groups_jobs_item_id(job_id), headers=unique_user.token)
+    assert response.status_code == 200
+    assert response.json()["status"] == JobStatus.success.value
+    assert response.json()["attempts"] == 1
@@ -1,6 +1,9 @@
 from fastapi.testclient import TestClient
 
+from mealie.db.models.recipe.ingredient import IngredientFoodModel
+from mealie.schema.recipe.recipe_ingredient import SaveIngredientFood
 from mealie.schema.response.pagination import PaginationQuery
+from mealie.services.parser_services.alias_index import get_alias_index_cache
 from tests.utils import api_routes
 from tests.utils.fixture_schemas import TestUser
 
@@ -21,6 +24,7 @@ def test_seed_foods(api_client: TestClient, unique_user: TestUser):
 
     resp = api_client.post(api_routes.groups_seeders_foods, json={"locale": "en-US"}, headers=unique_user.token)
     assert resp.status_code == 200
+    assert resp.json()["inserted"] == CREATED_FOODS
 
     # Check that the foods was created
     foods = database.ingredient_foods.page_all(PaginationQuery(page=1, per_page=-1)).items
@@ -37,6 +41,7 @@ def test_seed_units(api_client: TestClient, unique_user: TestUser):
 
     resp = api_client.post(api_routes.groups_seeders_units, json={"locale": "en-US"}, headers=unique_user.token)
     assert resp.status_code == 200
+    assert resp.json()["inserted"] == CREATED_UNITS
 
     # Check that the foods was created
     units = database.ingredient_units.page_all(PaginationQuery(page=1, per_page=-1)).items
@@ -53,7 +58,56 @@ def test_seed_labels(api_client: TestClient, unique_user: TestUser):
 
     resp = api_client.post(api_routes.groups_seeders_labels, json={"locale": "en-US"}, headers=unique_user.token)
     assert resp.status_code == 200
+    assert resp.json()["inserted"] == CREATED_LABELS
 
     # Check that the foods was created
     labels = database.group_multi_purpose_labels.page_all(PaginationQuery(page=1, per_page=-1)).items
     assert len(labels) == CREATED_LABELS
+
+
+def test_seed_skips_existing_items(api_client: TestClient, unique_user_fn_scoped: TestUser):
+    unique_user = unique_user_fn_scoped
+    database = unique_user.repos
+    existing_food = database.ingredient_foods.create(
+        SaveIngredientFood(group_id=unique_user.group_id, name="tomato", description="my own tomato")
+    )
+
+    resp = api_client.post(api_routes.groups_seeders_foods, json={"locale": "en-US"}, headers=unique_user.token)
+    assert resp.status_code == 200
+    seeded = resp.json()
+    assert seeded["skipped"] == 1
+
+    # the existing food is left untouched
+    foods = database.ingredient_foods.page_all(PaginationQuery(page=1, per_page=-1)).items
+    assert len(foods) == seeded["inserted"] + 1
+    tomatoes = [food for food in foods if food.name == "tomato"]
+    assert len(tomatoes) == 1 and tomatoes[0].id == existing_food.id
+    assert tomatoes[0].description == "my own tomato"
+
+    # the seeded foods can be searched by their normalized names
+    seeded_food = next(food for food in foods if food.plural_name and food.id != existing_food.id)
+    food_in_db = database.session.get(IngredientFoodModel, seeded_food.id)
+    assert food_in_db
+    assert food_in_db.name_normalized == IngredientFoodModel.normalize(seeded_food.name)
+    assert food_in_db.plural_name_normalized == IngredientFoodModel.normalize(seeded_food.plural_name)
+
+    # seeding again doesn't add duplicates
+    resp = api_client.post(api_routes.groups_seeders_foods, json={"locale": "en-US"}, headers=unique_user.token)
+    assert resp.status_code == 200
+    assert resp.json()["inserted"] == 0
+    assert resp.json()["skipped"] == seeded["inserted"] + seeded["skipped"]
+
+
+def test_seed_invalidates_alias_index_cache(api_client: TestClient, unique_user_fn_scoped: TestUser):
+    database = unique_user_fn_scoped.repos
+
+    # cache the (empty) indexes before seeding
+    assert not get_alias_index_cache().get_food_index(database).by_alias
+    assert not get_alias_index_cache().get_unit_index(database).by_alias
+
+    for route in (api_routes.groups_seeders_foods, api_routes.groups_seeders_units):
+        resp = api_client.post(route, json={"locale": "en-US"}, headers=unique_user_fn_scoped.token)
+        assert resp.status_code == 200
+
+    assert "tomato" in get_alias_index_cache().get_food_index(database).by_alias
+    assert get_alias_index_cache().get_unit_index(database).by_alias
@@ -1,4 +1,6 @@
+import zipfile
 from collections.abc import Generator
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -8,6 +10,10 @@ from fastapi.testclient import TestClient
 from mealie.core.dependencies.dependencies import validate_file_token
 from mealie.schema.recipe.recipe_bulk_actions import ExportTypes
 from mealie.schema.recipe.recipe_category import CategorySave, TagSave
+from mealie.schema.recipe.recipe_settings import RecipeSettings
+from mealie.schema.reports.reports import ReportCategory, ReportSummaryStatus
+from mealie.schema.user.user import UserRatingCreate
+from mealie.services.jobs.job_worker import run_queued_jobs
 from tests import utils
 from tests.utils import api_routes
 from tests.utils.factories import random_string
@@ -52,15 +58,72 @@ def test_bulk_tag_recipes(api_client: TestClient, unique_user: TestUser, ten_slu
         api_routes.recipes_bulk_actions_tag, json=utils.jsonify(payload), headers=unique_user.token
     )
     assert response.status_code == 200
+    assert response.json()["results"] == [{"slug": slug, "success": True, "error": None} for slug in ten_slugs]
 
     # Validate Recipes are Tagged
     for slug in ten_slugs:
         recipe = database.recipes.get_one(slug)
+        assert recipe and len(recipe.tags) == len(tags)  # type: ignore
 
         for tag in recipe.tags:  # type: ignore
             assert tag.slug in [x["slug"] for x in tags]
 
 
+def test_bulk_tag_recipes_skips_existing_tags_and_missing_recipes(
+    api_client: TestClient, unique_user: TestUser, ten_slugs: list[str]
+):
+    database = unique_user.repos
+    tags = [database.tags.create(TagSave(group_id=unique_user.group_id, name=random_string())) for _ in range(2)]
+
+    # tag a few recipes ahead of time
+    payload = {"recipes": ten_slugs[:3], "tags": [tags[0].model_dump()]}
+    response = api_client.post(
+        api_routes.recipes_bulk_actions_tag, json=utils.jsonify(payload), headers=unique_user.token
+    )
+    assert response.status_code == 200
+
+    missing_slug = random_string()
+    payload = {"recipes": [*ten_slugs, missing_slug], "tags": [tag.model_dump() for tag in tags]}
+    response = api_client.post(
+        api_routes.recipes_bulk_actions_tag, json=utils.jsonify(payload), headers=unique_user.token
+    )
+    assert response.status_code == 200
+
+    results = {result["slug"]: result for result in response.json()["results"]}
+    assert results.pop(missing_slug)["success"] is False
+    assert all(result["success"] for result in results.values())
+
+    for slug in ten_slugs:
+        recipe = database.recipes.get_one(slug)
+        assert recipe
+        assert sorted(tag.id for tag in recipe.tags) == sorted(tag.id for tag in tags)  # type: ignore
+
+
+def test_bulk_settings_recipes(api_client: TestClient, unique_user: TestUser, ten_slugs: list[str]):
+    database = unique_user.repos
+
+    locked_recipe = database.recipes.get_one(ten_slugs[0])
+    assert locked_recipe and locked_recipe.settings
+    locked_recipe.settings.locked = True
+    database.recipes.update(locked_recipe.slug, locked_recipe)
+
+    settings = RecipeSettings(public=False, show_nutrition=True, show_assets=True, landscape_view=True, locked=False)
+    payload = {"recipes": ten_slugs, "settings": settings.model_dump()}
+    response = api_client.post(
+        api_routes.recipes_bulk_actions_settings, json=utils.jsonify(payload), headers=unique_user.token
+    )
+    assert response.status_code == 200
+    assert all(result["success"] for result in response.json()["results"])
+
+    for slug in ten_slugs:
+        recipe = database.recipes.get_one(slug)
+        assert recipe and recipe.settings
+        assert recipe.settings.model_dump(exclude={"locked"}) == settings.model_dump(exclude={"locked"})
+
+        # the locked setting isn't changed by bulk actions
+        assert recipe.settings.locked is (slug == ten_slugs[0])
+
+
 def test_bulk_categorize_recipes(
     api_client: TestClient,
     unique_user: TestUser,
@@ -98,10 +161,18 @@ def test_bulk_delete_recipes(
     database = unique_user.repos
     payload = {"recipes": ten_slugs}
 
+    # favorite one of the recipes
+    recipe = database.recipes.get_one(ten_slugs[0])
+    assert recipe and recipe.id
+    database.user_ratings.create(
+        UserRatingCreate(user_id=unique_user.user_id, recipe_id=recipe.id, rating=5, is_favorite=True)
+    )
+
     response = api_client.post(api_routes.recipes_bulk_actions_delete, json=payload, headers=unique_user.token)
     assert response.status_code == 200
+    assert all(result["success"] for result in response.json()["results"])
 
-    # Validate Recipes are Tagged
+    # Validate Recipes are Deleted
     for slug in ten_slugs:
         recipe = database.recipes.get_one(slug)
         assert recipe is None
@@ -116,6 +187,18 @@ def test_bulk_export_recipes(api_client: TestClient, unique_user: TestUser, ten_
     response = api_client.post(api_routes.recipes_bulk_actions_export, json=payload, headers=unique_user.token)
     assert response.status_code == 202
 
+    # The export is queued, and reports its result once it has run
+    report_id = response.json()["reportId"]
+    assert response.json()["jobId"]
+    run_queued_jobs()
+
+    response = api_client.get(api_routes.groups_reports_item_id(report_id), headers=unique_user.token)
+    assert response.status_code == 200
+
+    report = response.json()
+    assert report["category"] == ReportCategory.export.value
+    assert report["status"] == ReportSummaryStatus.success.value
+
     # Get All Exports Available
     response = api_client.get(api_routes.recipes_bulk_actions_export, headers=unique_user.token)
     assert response.status_code == 200
@@ -144,6 +227,12 @@ def test_bulk_export_recipes(api_client: TestClient, unique_user: TestUser, ten_
     assert response.headers["Content-Type"] == "application/octet-stream"
     assert len(response.content) > 0
 
+    with zipfile.ZipFile(BytesIO(response.content)) as zip:
+        names = zip.namelist()
+
+    for slug in ten_slugs:
+        assert f"recipes/{slug}/{slug}.json" in names
+
     # Purge Export
     response = api_client.delete(api_routes.recipes_bulk_actions_export_purge, headers=unique_user.token)
     assert response.status_code == 200
@@ -154,3 +243,36 @@ def test_bulk_export_recipes(api_client: TestClient, unique_user: TestUser, ten_
 
     response_data = response.json()
     assert len(response_data) == 0
+
+
+def test_bulk_export_recipes_reports_missing_recipes(
+    api_client: TestClient, unique_user: TestUser, ten_slugs: list[str]
+):
+    missing_slug = random_string()
+    payload = {
+        "recipes": [*ten_slugs, missing_slug],
+        "export_type": ExportTypes.JSON.value,
+    }
+
+    response = api_client.post(api_routes.recipes_bulk_actions_export, json=payload, headers=unique_user.token)
+    assert response.status_code == 202
+
+    report_id = response.json()["reportId"]
+    run_queued_jobs()
+
+    response = api_client.get(api_routes.groups_reports_item_id(report_id), headers=unique_user.token)
+    assert response.status_code == 200
+
+    report = response.json()
+    assert report["status"] == ReportSummaryStatus.partial.value
+
+    failed = [entry["message"] for entry in report["entries"] if not entry["success"]]
+    assert len(failed) == 1
+    assert missing_slug in failed[0]
+
+    # The recipes that were found are still exported
+    response = api_client.get(api_routes.recipes_bulk_actions_export, headers=unique_user.token)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    api_client.delete(api_routes.recipes_bulk_actions_export_purge, headers=unique_user.token)
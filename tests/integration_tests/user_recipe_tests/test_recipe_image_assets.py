@@ -5,6 +5,7 @@ from slugify import slugify
 
 from mealie.schema.recipe.recipe import Recipe
 from tests import data
+from tests.utils import api_routes
 from tests.utils.factories import random_string
 from tests.utils.fixture_schemas import TestUser
 
@@ -106,3 +107,105 @@ def test_recipe_image_upload(api_client: TestClient, unique_user: TestUser, reci
     response = api_client.get(f"/api/recipes/{recipe_ingredient_only.slug}", headers=unique_user.token)
     recipe_respons = response.json()
     assert recipe_respons["image"] == image_version
+
+
+def test_recipe_image_caching(api_client: TestClient, unique_user: TestUser, recipe_ingredient_only: Recipe):
+    response = api_client.put(
+        f"/api/recipes/{recipe_ingredient_only.slug}/image",
+        data={"extension": "jpg"},
+        files={"image": data.images_test_image_1.read_bytes()},
+        headers=unique_user.token,
+    )
+    assert response.status_code == 200
+    image_version = response.json()["image"]
+
+    image_url = api_routes.media_recipes_recipe_id_images_file_name(recipe_ingredient_only.id, "min-original.webp")
+    response = api_client.get(image_url, params={"version": image_version})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    # without a version the client has to revalidate
+    response = api_client.get(image_url)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, no-cache"
+    assert response.headers["etag"] == etag
+
+    # a stale or made up version must not be cached as immutable
+    for version in [random_string(), f"{image_version}-old"]:
+        response = api_client.get(image_url, params={"version": version})
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, no-cache"
+
+    for headers in [
+        {"If-None-Match": etag},
+        {"If-None-Match": f'W/{etag}, "other"'},
+        {"If-Modified-Since": last_modified},
+    ]:
+        response = api_client.get(image_url, headers=headers)
+        assert response.status_code == 304
+        assert not response.content
+        assert response.headers["etag"] == etag
+
+    response = api_client.get(image_url, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert response.content
+
+
+def test_recipe_asset_range_request(api_client: TestClient, unique_user: TestUser, recipe_ingredient_only: Recipe):
+    recipe = recipe_ingredient_only
+    name = random_string(10)
+    response = api_client.post(
+        f"/api/recipes/{recipe.slug}/assets",
+        data={"name": name, "icon": random_string(10), "extension": "jpg"},
+        files={"file": data.images_test_image_1.read_bytes()},
+        headers=unique_user.token,
+    )
+    assert response.status_code == 200
+
+    asset_url = api_routes.media_recipes_recipe_id_assets_file_name(recipe.id, f"{slugify(name)}.jpg")
+    response = api_client.get(asset_url, headers={"Range": "bytes=0-99"})
+    assert response.status_code == 206
+    assert response.content == data.images_test_image_1.read_bytes()[:100]
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    # the range is only served if the client's copy is still current, otherwise the whole file is sent
+    for if_range in [etag, last_modified]:
+        response = api_client.get(asset_url, headers={"Range": "bytes=0-9", "If-Range": if_range})
+        assert response.status_code == 206
+        assert response.content == data.images_test_image_1.read_bytes()[:10]
+
+    for if_range in ['"other"', f"W/{etag}", "Mon, 01 Jan 2001 00:00:00 GMT"]:
+        response = api_client.get(asset_url, headers={"Range": "bytes=0-9", "If-Range": if_range})
+        assert response.status_code == 200
+        assert response.content == data.images_test_image_1.read_bytes()
+
+    response = api_client.get(api_routes.media_recipes_recipe_id_assets_file_name(recipe.id, "missing.jpg"))
+    assert response.status_code == 404
+
+
+def test_recipe_assets_update_group_storage(
+    api_client: TestClient, unique_user: TestUser, recipe_ingredient_only: Recipe
+):
+    def get_used_storage() -> int:
+        response = api_client.get(api_routes.groups_storage, headers=unique_user.token)
+        assert response.status_code == 200
+        return response.json()["usedStorageBytes"]
+
+    recipe = recipe_ingredient_only
+    initial_storage = get_used_storage()
+
+    image_bytes = data.images_test_image_1.read_bytes()
+    response = api_client.post(
+        api_routes.recipes_slug_assets(recipe.slug),
+        data={"name": random_string(10), "icon": random_string(10), "extension": "jpg"},
+        files={"file": image_bytes},
+        headers=unique_user.token,
+    )
+    assert response.status_code == 200
+    assert get_used_storage() >= initial_storage + len(image_bytes)
+
+    # deleting the recipe frees up its storage
+    response = api_client.delete(api_routes.recipes_slug(recipe.slug), headers=unique_user.token)
+    assert response.status_code == 200
+    assert get_used_storage() <= initial_storage
@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+
+from mealie.core.dependencies.user_cache import UserCache
+from mealie.schema.user.user import PrivateUser
+from tests.utils import api_routes
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_user_cache_hits_and_invalidation(unique_user: TestUser, g2_user: TestUser):
+    users = {
+        user.token["Authorization"]: user.repos.users.get_one(user.user_id)
+        for user in [unique_user, g2_user]  # type: ignore
+    }
+    loads: list[str] = []
+
+    def loader(token: str):
+        def load() -> PrivateUser:
+            loads.append(token)
+            return users[token]  # type: ignore
+
+        return load
+
+    cache = UserCache(maxsize=10, ttl=60)
+    tokens = list(users)
+    for i in range(3):
+        for token in tokens:
+            user = cache.get_or_load(token, loader(token))
+            assert user == users[token]
+
+            # each cache hit gets its own copy
+            assert (user is users[token]) is (i == 0)
+
+    assert loads == tokens
+    assert (cache.hits, cache.misses) == (4, 2)
+
+    # only the invalidated user is reloaded
+    cache.invalidate(unique_user.user_id)
+    for token in tokens:
+        cache.get_or_load(token, loader(token))
+
+    assert loads == [*tokens, tokens[0]]
+
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+
+def test_user_cache_skips_stale_loads(unique_user: TestUser):
+    user = unique_user.repos.users.get_one(unique_user.user_id)
+    assert user
+    cache = UserCache(maxsize=10, ttl=60)
+
+    def load_while_invalidated() -> PrivateUser:
+        cache.invalidate(user.id)
+        return user
+
+    cache.get_or_load("token", load_while_invalidated)
+    assert cache.stats()["size"] == 0
+
+    # a disabled cache always loads the user
+    cache = UserCache(maxsize=10, ttl=0)
+    cache.get_or_load("token", lambda: user)
+    assert cache.stats()["size"] == 0
+
+
+def test_user_changes_are_seen_by_the_next_request(api_client: TestClient, unique_user: TestUser):
+    response = api_client.get(api_routes.users_self, headers=unique_user.token)
+    assert response.status_code == 200
+    user = response.json()
+
+    user["fullName"] = random_string()
+    response = api_client.put(api_routes.users_item_id(unique_user.user_id), json=user, headers=unique_user.token)
+    assert response.status_code == 200
+
+    response = api_client.get(api_routes.users_self, headers=unique_user.token)
+    assert response.status_code == 200
+    assert response.json()["fullName"] == user["fullName"]
@@ -0,0 +1,110 @@
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from mealie.pkgs.img import MinifierOptions, PillowMinifier
+from mealie.schema.recipe.recipe import Recipe
+from mealie.scripts.regenerate_recipe_images import find_source_images, regenerate_image, update_image_versions
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_pillow_minifier_builds_size_ladder(tmp_path: Path):
+    image_file = tmp_path / "original.jpg"
+    Image.linear_gradient("L").resize((1600, 1200)).convert("RGB").save(image_file, "JPEG")
+
+    opts = MinifierOptions(original_max_size=1000, miniature_max_size=400, tiny_max_size=100)
+    PillowMinifier(purge=True, opts=opts).minify(image_file)
+
+    sizes = {file.name: Image.open(file).size for file in tmp_path.iterdir()}
+    assert sizes == {
+        "original.webp": (1000, 750),
+        "min-original.webp": (400, 300),
+        "tiny-original.webp": (100, 75),
+    }
+
+
+def test_pillow_minifier_doesnt_upscale(tmp_path: Path):
+    image_file = tmp_path / "original.png"
+    Image.new("RGBA", (120, 80)).save(image_file, "PNG")
+
+    PillowMinifier(purge=True).minify(image_file)
+
+    assert {file.name: Image.open(file).size for file in tmp_path.iterdir()} == {
+        "original.webp": (120, 80),
+        "min-original.webp": (120, 80),
+        "tiny-original.webp": (120, 80),
+    }
+
+
+def test_pillow_minifier_saves_each_variant_from_its_own_image(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    image_file = tmp_path / "original.png"
+    Image.new("RGBA", (120, 80)).save(image_file, "PNG")
+
+    # the variants are saved in parallel, and `Image.save` isn't safe to call on the same image from several threads
+    saved_images: list[Image.Image] = []
+    save = Image.Image.save
+
+    def record_save(self: Image.Image, *args, **kwargs):
+        saved_images.append(self)
+        return save(self, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "save", record_save)
+    PillowMinifier(purge=True).minify(image_file)
+
+    assert len(saved_images) == 3
+    assert len({id(image) for image in saved_images}) == 3
+
+
+def test_find_source_images(tmp_path: Path, test_image_jpg: Path):
+    recipe_images = tmp_path / "recipe-1" / "images"
+    timeline_images = recipe_images / "timeline" / "event-1"
+    timeline_images.mkdir(parents=True)
+
+    shutil.copy(test_image_jpg, recipe_images / "original.jpg")
+    shutil.copy(test_image_jpg, recipe_images / "original.webp")
+    shutil.copy(test_image_jpg, timeline_images / "original.webp")
+    (tmp_path / "recipe-2" / "images").mkdir(parents=True)
+
+    # the uploaded image is preferred over the converted one
+    assert sorted(find_source_images(tmp_path)) == sorted(
+        [recipe_images / "original.jpg", timeline_images / "original.webp"]
+    )
+
+
+def test_regenerate_image_keeps_the_original(tmp_path: Path):
+    image_file = tmp_path / "original.webp"
+    Image.linear_gradient("L").resize((1600, 1200)).convert("RGB").save(image_file, "WEBP")
+    original = image_file.read_bytes()
+
+    regenerate_image(image_file, MinifierOptions(original_max_size=1000, miniature_max_size=400, tiny_max_size=100))
+
+    # the original is the only full copy of the image, so it's never re-encoded
+    assert image_file.read_bytes() == original
+    sizes = {file.name: Image.open(file).size for file in tmp_path.iterdir()}
+    assert sizes == {
+        "original.webp": (1600, 1200),
+        "min-original.webp": (400, 300),
+        "tiny-original.webp": (100, 75),
+    }
+
+
+def test_update_image_versions(unique_user: TestUser):
+    database = unique_user.repos
+    with_image, without_image = (
+        database.recipes.create(
+            Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string(), image=image)
+        )
+        for image in ["abcd", None]
+    )
+
+    update_image_versions([with_image.id, without_image.id, uuid4()])
+
+    database.session.expire_all()
+    with_image_out = database.recipes.get_one(with_image.id, key="id")
+    without_image_out = database.recipes.get_one(without_image.id, key="id")
+    assert with_image_out and with_image_out.image and with_image_out.image != "abcd"
+    assert without_image_out and without_image_out.image is None
@@ -2,10 +2,12 @@ import random
 import time
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
+from math import ceil
 from random import randint
 from urllib.parse import parse_qsl, urlsplit
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from humps import camelize
 from pydantic import UUID4
@@ -31,6 +33,7 @@ from mealie.schema.recipe.recipe_tool import RecipeToolSave
 from mealie.schema.response.pagination import (
     OrderByNullPosition,
     OrderDirection,
+    PaginationMode,
     PaginationQuery,
 )
 from mealie.schema.user.user import UserRatingUpdate
@@ -176,6 +179,119 @@ def test_pagination_guides(unique_user: TestUser):
         assert source_param in prev_params
 
 
+@pytest.mark.parametrize("order_by", ["name", "created_at", "label.name:asc,name:desc"])
+def test_cursor_pagination(unique_user: TestUser, order_by: str):
+    database = unique_user.repos
+    group = database.groups.get_one(unique_user.group_id)
+    assert group
+
+    seeder = SeederService(AllRepositories(database.session, group_id=group.id))
+    seeder.seed_foods("en-US")
+
+    foods_repo = database.ingredient_foods
+    all_results = foods_repo.page_all(
+        PaginationQuery(per_page=-1, order_by=order_by, order_by_null_position=OrderByNullPosition.last)
+    )
+
+    query = PaginationQuery(per_page=25, order_by=order_by, pagination_mode=PaginationMode.cursor)
+    pages = []
+    while True:
+        results = foods_repo.page_all(query)
+        assert results.total == -1  # count is skipped unless requested
+        pages.append(results)
+        if not results.next_cursor:
+            break
+
+        assert len(results.items) == 25
+        query = query.model_copy(update={"cursor": results.next_cursor})
+
+    seen = [item.id for page in pages for item in page.items]
+    assert seen == [item.id for item in all_results.items]
+
+    # walk back to the start using the previous cursors
+    assert pages[0].prev_cursor is None
+    results = pages[-1]
+    for page in reversed(pages[:-1]):
+        assert results.prev_cursor
+        results = foods_repo.page_all(query.model_copy(update={"cursor": results.prev_cursor}))
+        assert [item.id for item in results.items] == [item.id for item in page.items]
+
+
+def test_cursor_pagination_random_order(unique_user: TestUser):
+    database = unique_user.repos
+    group = database.groups.get_one(unique_user.group_id)
+    assert group
+
+    seeder = SeederService(AllRepositories(database.session, group_id=group.id))
+    seeder.seed_foods("en-US")
+
+    foods_repo = database.ingredient_foods
+    seed = random_string()
+    all_results = foods_repo.page_all(PaginationQuery(per_page=-1, order_by="random", pagination_seed=seed))
+
+    query = PaginationQuery(per_page=30, order_by="random", pagination_seed=seed, pagination_mode=PaginationMode.cursor)
+    seen = []
+    while True:
+        results = foods_repo.page_all(query)
+        seen.extend(item.id for item in results.items)
+        if not results.next_cursor:
+            break
+
+        query = query.model_copy(update={"cursor": results.next_cursor})
+
+    assert seen == [item.id for item in all_results.items]
+
+    # a different seed gives a different order
+    other_results = foods_repo.page_all(PaginationQuery(per_page=-1, order_by="random", pagination_seed=seed + "x"))
+    assert [item.id for item in other_results.items] != seen
+
+
+def test_cursor_pagination_total_and_guides(unique_user: TestUser):
+    database = unique_user.repos
+    group = database.groups.get_one(unique_user.group_id)
+    assert group
+
+    seeder = SeederService(AllRepositories(database.session, group_id=group.id))
+    seeder.seed_foods("en-US")
+
+    foods_repo = database.ingredient_foods
+    query = PaginationQuery(per_page=10, pagination_mode=PaginationMode.cursor, include_total=True)
+    results = foods_repo.page_all(query)
+    assert results.total == foods_repo.page_all(PaginationQuery(per_page=1)).total
+    assert results.total_pages == ceil(results.total / 10)
+
+    results.set_pagination_guides("/foods", query.model_dump())
+    assert results.previous is None
+    next_params: dict = dict(parse_qsl(urlsplit(results.next).query))  # type: ignore
+    assert next_params["cursor"] == results.next_cursor
+    assert "page" not in next_params
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "eyJ2IjpbXX0"])
+def test_cursor_pagination_invalid_cursor(unique_user: TestUser, cursor: str):
+    with pytest.raises(HTTPException) as e:
+        unique_user.repos.ingredient_units.page_all(
+            PaginationQuery(pagination_mode=PaginationMode.cursor, cursor=cursor)
+        )
+
+    assert e.value.status_code == 400
+
+
+def test_cursor_pagination_mismatched_order(
+    query_units: tuple[RepositoryUnit, IngredientUnit, IngredientUnit, IngredientUnit],
+):
+    units_repo = query_units[0]
+
+    query = PaginationQuery(per_page=1, order_by="name", pagination_mode=PaginationMode.cursor)
+    results = units_repo.page_all(query)
+    assert results.next_cursor
+
+    with pytest.raises(HTTPException) as e:
+        units_repo.page_all(query.model_copy(update={"order_by": "created_at", "cursor": results.next_cursor}))
+
+    assert e.value.status_code == 400
+
+
 @pytest.fixture(scope="function")
 def query_units(unique_user: TestUser):
     database = unique_user.repos
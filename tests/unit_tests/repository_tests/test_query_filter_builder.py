@@ -1,3 +1,11 @@
+import sys
+import time
+from collections.abc import Callable
+
+import pytest
+import sqlalchemy as sa
+
+from mealie.db.models.recipe import RecipeModel
 from mealie.schema.response.query_filter import (
     LogicalOperator,
     QueryFilterBuilder,
@@ -6,6 +14,7 @@ from mealie.schema.response.query_filter import (
     RelationalKeyword,
     RelationalOperator,
 )
+from tests.utils.factories import random_string
 
 
 def test_query_filter_builder_json():
@@ -60,3 +69,72 @@ def test_query_filter_builder_json():
             ),
         ]
     )
+
+
+def test_query_filter_builder_caches_parsed_filters():
+    qf = f'name = "{random_string()}" AND tags.name CONTAINS ALL ["tag1","tag2"]'
+    parse_info = QueryFilterBuilder._parse_filter_string.cache_info
+
+    misses = parse_info().misses
+    builders = [QueryFilterBuilder(qf) for _ in range(3)]
+    assert parse_info().misses == misses + 1
+    assert builders[0].as_json_model() == builders[2].as_json_model()
+
+    # the filters are still applied in full, even though the joins are resolved from the cache
+    queries = [str(builder.filter_query(sa.select(RecipeModel), model=RecipeModel)) for builder in builders]
+    assert queries[0] == queries[2]
+    assert "JOIN tags" in queries[0]
+
+
+def test_query_filter_builder_reuses_cached_results():
+    """Repeated filters are served from the caches rather than parsed and resolved again"""
+
+    qf = (
+        f'((name = "{random_string()}") AND tags.name CONTAINS ALL ["tag1","tag2"]) '
+        'OR (name="my-other-recipe" AND (rating=1 OR user.username="test") )'
+    )
+    iterations = 50
+    parse_info = QueryFilterBuilder._parse_filter_string.cache_info
+    resolve_info = QueryFilterBuilder._resolve_attr_string.cache_info
+
+    QueryFilterBuilder(qf).filter_query(sa.select(RecipeModel), model=RecipeModel)
+    parse_before, resolve_before = parse_info(), resolve_info()
+
+    for _ in range(iterations):
+        QueryFilterBuilder(qf).filter_query(sa.select(RecipeModel), model=RecipeModel)
+
+    parse_after, resolve_after = parse_info(), resolve_info()
+    assert parse_after.misses == parse_before.misses
+    assert parse_after.hits == parse_before.hits + iterations
+    assert resolve_after.misses == resolve_before.misses
+    assert resolve_after.hits > resolve_before.hits
+
+
+@pytest.mark.benchmark
+def test_query_filter_builder_parse_throughput(record_property: Callable[[str, object], None]):
+    """
+    A microbenchmark of parsing repeated filters with and without the cache. It only reports the timings, since
+    they depend on the machine; run it with `pytest -m benchmark -rP`
+    """
+
+    qf = (
+        '(( (name = "my-recipe") AND is_active = TRUE) AND tags.name CONTAINS ALL ["tag1","tag2"]) '
+        'OR (name="my-other-recipe" AND (count=1 OR count=2) )'
+    )
+    iterations = 500
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        QueryFilterBuilder._parse_filter_string.__wrapped__(qf)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        QueryFilterBuilder(qf)
+    cached = time.perf_counter() - start
+
+    record_property("uncached_seconds", uncached)
+    record_property("cached_seconds", cached)
+    sys.stdout.write(
+        f"{iterations} parses: {uncached:.4f}s uncached, {cached:.4f}s cached ({uncached / cached:.1f}x)\n"
+    )
@@ -1,20 +1,27 @@
+import re
 from datetime import UTC, datetime, timedelta
 from typing import cast
 from uuid import UUID
 
 import pytest
+import sqlalchemy as sa
+from pydantic import UUID4
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from mealie.db.models.recipe.recipe import RecipeModel
+from mealie.db.models.recipe.search_index import postgres_search_index, sqlite_search_index_rowids
 from mealie.repos.all_repositories import get_repositories
 from mealie.repos.repository_factory import AllRepositories
 from mealie.repos.repository_recipes import RepositoryRecipes
 from mealie.schema.household.household import HouseholdCreate, HouseholdRecipeCreate
 from mealie.schema.recipe import RecipeIngredient, SaveIngredientFood
-from mealie.schema.recipe.recipe import Recipe, RecipeCategory, RecipeSummary
+from mealie.schema.recipe.recipe import Recipe, RecipeCategory, RecipeStep, RecipeSummary, RecipeTag
 from mealie.schema.recipe.recipe_category import CategoryOut, CategorySave, TagSave
 from mealie.schema.recipe.recipe_tool import RecipeToolSave
 from mealie.schema.response import OrderDirection, PaginationQuery
 from mealie.schema.user.user import GroupBase, UserRatingCreate
+from tests.fixtures.fixture_database import QueryCounter
 from tests.utils.factories import random_email, random_string
 from tests.utils.fixture_schemas import TestUser
 
@@ -641,6 +648,7 @@ def test_recipe_repo_pagination_by_foods(unique_user: TestUser):
         ("animal-sloop", ["Animal Sloop"]),
         ("ratat", ["Rátàtôuile"]),
         ("delicious horns", ["Steinbock Sloop"]),
+        ("?!", []),
     ],
     ids=[
         "no_match",
@@ -651,6 +659,7 @@ def test_recipe_repo_pagination_by_foods(unique_user: TestUser):
         "special_character_removal",
         "normalization",
         "token_separation",
+        "no_searchable_terms",
     ],
 )
 def test_basic_recipe_search(
@@ -687,6 +696,72 @@ def test_fuzzy_recipe_search(
     assert results and results[0].name == "Steinbock Sloop"
 
 
+def test_recipe_search_index_is_kept_up_to_date(unique_user: TestUser):
+    database = unique_user.repos
+    pagination = PaginationQuery(page=1, per_page=-1)
+
+    def search_ids(search: str) -> list[UUID4]:
+        return [recipe.id for recipe in database.recipes.page_all(pagination, search=search).items]
+
+    name, new_name, step_word, tag_name = (random_string(12) for _ in range(4))
+    recipe = database.recipes.create(
+        Recipe(
+            user_id=unique_user.user_id,
+            group_id=unique_user.group_id,
+            name=name,
+            recipe_instructions=[RecipeStep(text=f"whisk the {step_word}")],
+        )
+    )
+    assert search_ids(name) == [recipe.id]
+    assert search_ids(step_word) == [recipe.id]
+
+    # renaming the recipe re-indexes it
+    recipe.name = new_name
+    database.recipes.update(recipe.slug, recipe)
+    assert search_ids(new_name) == [recipe.id]
+    assert search_ids(name) == []
+
+    # tags are indexed too
+    tag = database.tags.create(TagSave(group_id=unique_user.group_id, name=tag_name, slug=tag_name))
+    recipe.tags = [RecipeTag.model_validate(tag)]
+    database.recipes.update(recipe.slug, recipe)
+    assert search_ids(tag_name) == [recipe.id]
+
+    database.recipes.delete(recipe.slug)
+    assert search_ids(new_name) == []
+    assert search_ids(step_word) == []
+
+    if database.session.get_bind().name != "postgresql":
+        # the recipe's rowid is removed along with its search index row
+        rowids = sqlite_search_index_rowids
+        stmt = sa.select(rowids.c.id).where(rowids.c.recipe_id == recipe.id)
+        assert database.session.execute(stmt).first() is None
+
+
+def test_recipe_search_index_folds_accents(unique_user: TestUser):
+    database = unique_user.repos
+    pagination = PaginationQuery(page=1, per_page=-1)
+
+    def search_ids(search: str) -> list[UUID4]:
+        return [recipe.id for recipe in database.recipes.page_all(pagination, search=search).items]
+
+    # instructions and tags have no normalized columns, so on Postgres they're unaccented when indexed
+    step_suffix, tag_suffix = random_string(8), random_string(8)
+    tag = database.tags.create(TagSave(group_id=unique_user.group_id, name=f"Crème{tag_suffix}"))
+    recipe = database.recipes.create(
+        Recipe(
+            user_id=unique_user.user_id,
+            group_id=unique_user.group_id,
+            name=random_string(),
+            recipe_instructions=[RecipeStep(text=f"Sauté{step_suffix} the onions")],
+            tags=[RecipeTag.model_validate(tag)],
+        )
+    )
+
+    for search in [f"saute{step_suffix}", f"Sauté{step_suffix}", f"creme{tag_suffix}", f"Crème{tag_suffix}"]:
+        assert search_ids(search) == [recipe.id]
+
+
 def test_random_order_recipe_search(
     unique_db: AllRepositories,
     search_recipes: list[Recipe],  # required so database is populated
@@ -885,3 +960,216 @@ def test_order_by_rating(user_tuple: tuple[TestUser, TestUser]):
     assert data[0].slug == recipe_2.slug  # global rating == 2.5 (avg of 4 and 1)
     assert data[1].slug == recipe_3.slug  # global rating == 3
     assert data[2].slug == recipe_1.slug  # global rating == 4.25 (avg of 5 and 3.5)
+
+
+def test_recipe_update_resolves_relationships_in_batches(unique_user: TestUser):
+    database = unique_user.repos
+    tags = [
+        database.tags.create(TagSave(group_id=unique_user.group_id, name=name, slug=name))
+        for name in (random_string() for _ in range(10))
+    ]
+    foods = [
+        database.ingredient_foods.create(SaveIngredientFood(group_id=unique_user.group_id, name=random_string()))
+        for _ in range(10)
+    ]
+
+    recipe = database.recipes.create(
+        Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string())
+    )
+    recipe.tags = [RecipeTag.model_validate(tag) for tag in tags]
+    recipe.recipe_ingredient = [RecipeIngredient(note=random_string(), food=food) for food in foods * 2]
+    recipe.recipe_instructions = [RecipeStep(text=random_string()) for _ in range(10)]
+
+    statements: list[str] = []
+
+    def log_statement(_conn, _cursor, statement: str, *_args):
+        statements.append(statement)
+
+    engine = database.session.get_bind()
+    event.listen(engine, "before_cursor_execute", log_statement)
+    try:
+        database.session.expunge_all()
+        database.recipes.update(recipe.slug, recipe)
+    finally:
+        event.remove(engine, "before_cursor_execute", log_statement)
+
+    def selects_from(table: str) -> int:
+        selects = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+        return sum(1 for statement in selects if re.search(rf"FROM {table}\s", statement))
+
+    # one query per related table, rather than one per tag, ingredient food, or step
+    assert selects_from("tags") <= 2
+    assert selects_from("ingredient_foods") <= 2
+    assert selects_from("recipe_instructions") <= 2
+
+    updated = database.recipes.get_one(recipe.slug)
+    assert updated
+    assert {tag.id for tag in updated.tags} == {tag.id for tag in tags}
+    assert [ingredient.food.id for ingredient in updated.recipe_ingredient] == [food.id for food in foods * 2]
+    assert len(updated.recipe_instructions) == 10
+
+
+@pytest.mark.parametrize("lean", [False, True])
+def test_recipe_repo_pagination_loads_collections_separately(
+    unique_user: TestUser, query_counter: QueryCounter, lean: bool
+):
+    database = unique_user.repos
+    categories = [
+        database.categories.create(CategorySave(group_id=unique_user.group_id, name=random_string())) for _ in range(4)
+    ]
+    tags = [database.tags.create(TagSave(group_id=unique_user.group_id, name=random_string())) for _ in range(5)]
+    tools = [
+        database.tools.create(RecipeToolSave(group_id=unique_user.group_id, name=random_string())) for _ in range(3)
+    ]
+
+    recipe_count = 10
+    for _ in range(recipe_count):
+        database.recipes.create(
+            Recipe(
+                user_id=unique_user.user_id,
+                group_id=unique_user.group_id,
+                name=random_string(),
+                recipe_category=categories,
+                tags=tags,
+                tools=tools,
+            )
+        )
+
+    database.session.expunge_all()
+    with query_counter.count(database.session):
+        pagination = database.recipes.page_all(PaginationQuery(page=1, per_page=recipe_count), lean=lean)
+
+    assert len(pagination.items) == recipe_count
+    for recipe in pagination.items:
+        assert recipe.household_id == UUID(str(unique_user.household_id))
+        assert {category.id for category in recipe.recipe_category or []} == {category.id for category in categories}
+        assert {tag.id for tag in recipe.tags or []} == {tag.id for tag in tags}
+        assert {tool.id for tool in recipe.tools} == {tool.id for tool in tools}
+
+    # the count, the page itself, and one query per collection (including the households that have each tool)
+    assert query_counter.query_count == 6
+
+    # one row per recipe and per related item, rather than categories × tags × tools rows per recipe
+    assert query_counter.row_count == 1 + recipe_count * (1 + len(categories) + len(tags) + len(tools))
+
+    page_query = next(statement for statement in query_counter.statements if "LIMIT" in statement)
+    assert ("recipes.name_normalized" in page_query) is not lean
+
+
+def test_recipe_repo_add_tags_in_bulk(unique_user: TestUser, g2_user: TestUser, query_counter: QueryCounter):
+    database = unique_user.repos
+    tags = [database.tags.create(TagSave(group_id=unique_user.group_id, name=random_string())) for _ in range(3)]
+    other_group_tag = g2_user.repos.tags.create(TagSave(group_id=g2_user.group_id, name=random_string()))
+
+    recipes = [
+        database.recipes.create(
+            Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string(), tags=tags[:1])
+        )
+        for _ in range(20)
+    ]
+    recipe_ids = list(database.recipes.get_ids_by_slugs([recipe.slug for recipe in recipes]).values())
+    assert len(recipe_ids) == len(recipes)
+
+    with query_counter.count(database.session):
+        database.recipes.add_tags(recipe_ids, [tag.id for tag in tags] + [other_group_tag.id])
+
+    # the links are inserted straight from a select, without loading any recipes
+    assert query_counter.query_count == 0
+
+    database.session.expire_all()
+    for recipe in recipes:
+        recipe_in_db = database.recipes.get_one(recipe.slug)
+        assert recipe_in_db
+        assert sorted(tag.id for tag in recipe_in_db.tags or []) == sorted(tag.id for tag in tags)
+
+
+def test_recipe_repo_add_tags_in_bulk_updates_search_index(unique_user: TestUser):
+    database = unique_user.repos
+    tag_name = random_string(12)
+    tag = database.tags.create(TagSave(group_id=unique_user.group_id, name=tag_name))
+    recipe = database.recipes.create(
+        Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string())
+    )
+
+    pagination = PaginationQuery(page=1, per_page=-1)
+    assert database.recipes.page_all(pagination, search=tag_name).items == []
+
+    database.recipes.add_tags([recipe.id], [tag.id])
+
+    results = database.recipes.page_all(pagination, search=tag_name).items
+    assert [result.id for result in results] == [recipe.id]
+
+
+def test_recipe_repo_create_batch(unique_user: TestUser, monkeypatch: pytest.MonkeyPatch):
+    database = unique_user.repos
+    existing = database.recipes.create(
+        Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string())
+    )
+    bad_name = random_string()
+
+    create_recipe_model = RecipeModel.__init__
+
+    def create_or_fail(self, *args, **kwargs):
+        if kwargs.get("name") == bad_name:
+            raise ValueError("invalid recipe")
+        create_recipe_model(self, *args, **kwargs)
+
+    monkeypatch.setattr(RecipeModel, "__init__", create_or_fail)
+
+    names = [existing.name, bad_name, random_string()]
+    results = database.recipes.create_batch(
+        [Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=name) for name in names]
+    )
+    duplicate, failed, new = results
+
+    # the duplicate name is renamed, and the failed recipe doesn't affect the rest of the batch
+    assert isinstance(duplicate, Recipe) and duplicate.name == f"{existing.name} (1)"
+    assert isinstance(failed, ValueError)
+    assert isinstance(new, Recipe) and new.name == names[2]
+
+    database.session.expire_all()
+    for recipe in [duplicate, new]:
+        recipe_in_db = database.recipes.get_one(recipe.slug)
+        assert recipe_in_db and recipe_in_db.id == recipe.id
+
+
+def test_recipe_repo_delete_many_updates_search_index(unique_user: TestUser):
+    database = unique_user.repos
+    name = random_string(12)
+    recipes = [
+        database.recipes.create(Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=name))
+        for _ in range(3)
+    ]
+    recipe_ids = [recipe.id for recipe in recipes]
+
+    database.recipes.delete_many(recipe_ids)
+
+    pagination = PaginationQuery(page=1, per_page=-1)
+    assert database.recipes.page_all(pagination, search=name).items == []
+
+    if database.session.get_bind().name == "postgresql":
+        stmt = sa.select(postgres_search_index.c.recipe_id).where(postgres_search_index.c.recipe_id.in_(recipe_ids))
+    else:
+        rowids = sqlite_search_index_rowids
+        stmt = sa.select(rowids.c.id).where(rowids.c.recipe_id.in_(recipe_ids))
+    assert database.session.execute(stmt).first() is None
+
+
+def test_recipe_search_index_is_updated_by_bulk_deletes(unique_user: TestUser):
+    database = unique_user.repos
+    name = random_string(12)
+    recipe = database.recipes.create(Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=name))
+
+    pagination = PaginationQuery(page=1, per_page=-1)
+    assert [result.id for result in database.recipes.page_all(pagination, search=name).items] == [recipe.id]
+
+    # a set-based delete bypasses the flush listeners
+    database.session.execute(sa.delete(RecipeModel).where(RecipeModel.id == recipe.id))
+    database.session.commit()
+
+    if database.session.get_bind().name == "postgresql":
+        stmt = sa.select(postgres_search_index.c.recipe_id).where(postgres_search_index.c.recipe_id == recipe.id)
+    else:
+        rowids = sqlite_search_index_rowids
+        stmt = sa.select(rowids.c.id).where(rowids.c.recipe_id == recipe.id)
+    assert database.session.execute(stmt).first() is None
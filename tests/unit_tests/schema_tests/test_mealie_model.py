@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from mealie.schema._mealie.mealie_model import MealieModel
 
 
@@ -59,3 +62,10 @@ def test_map_from():
     assert model2.long_int == 50
     assert model2.long_float == 1.5
     assert model2.another_str == "World"
+
+
+def test_schemas_import_before_models_are_configured():
+    # loader options configure the mappers, so they must not be built while the models are still being defined
+    code = "import mealie.schema.recipe, mealie.services.scraper.cleaner"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -1,7 +1,14 @@
+import datetime
+import io
 import json
+import uuid
+from collections import Counter
+
+from sqlalchemy import CHAR, JSON, Column, Date, DateTime, ForeignKey, Integer, MetaData, String, Table, Time, Uuid
 
 from mealie.core.config import get_app_settings
-from mealie.services.backups_v2.alchemy_exporter import AlchemyExporter
+from mealie.db.models._model_utils.guid import GUID
+from mealie.services.backups_v2.alchemy_exporter import AlchemyExporter, ForeignKeyIndex
 from tests.utils.alembic_reader import alembic_versions
 
 
@@ -12,3 +19,115 @@ def test_alchemy_exporter():
 
     assert data["alembic_version"] == alembic_versions()
     assert json.dumps(data, indent=4)  # Make sure data is json-serializable
+
+
+def test_alchemy_exporter_dump_to_stream():
+    settings = get_app_settings()
+    exporter = AlchemyExporter(settings.DB_URL)
+    data = exporter.dump()
+
+    stream = io.BytesIO()
+    exporter.dump_to_stream(stream, chunk_size=2)
+
+    chunks = [json.loads(line) for line in stream.getvalue().decode("utf-8").splitlines()]
+    assert chunks[0]["table"] == "alembic_version"
+    assert all(len(chunk["rows"]) <= 2 for chunk in chunks)
+
+    streamed_data: dict[str, list[dict]] = {}
+    for chunk in chunks:
+        streamed_data.setdefault(chunk["table"], []).extend(chunk["rows"])
+
+    assert streamed_data == data
+
+
+class IterationCountingList(list):
+    """A list that counts how many times it's iterated over"""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+def test_alchemy_exporter_clean_rows_large_dump():
+    meta = MetaData()
+    parents = Table("parents", meta, Column("id", Integer, primary_key=True))
+    children = Table(
+        "children",
+        meta,
+        Column("id", Integer, primary_key=True),
+        Column("parent_id", Integer, ForeignKey("parents.id")),
+        Column("other_parent_id", Integer, ForeignKey("parents.id")),
+    )
+
+    # every 10th child points to a parent that doesn't exist
+    parent_count, child_count = 5_000, 20_000
+    parent_rows = IterationCountingList({"id": i} for i in range(1, parent_count + 1))
+    db_dump = {
+        "parents": parent_rows,
+        "children": [
+            {
+                "id": i,
+                "parent_id": i % parent_count + 1 if i % 10 else parent_count + 1 + i,
+                "other_parent_id": None,
+            }
+            for i in range(child_count)
+        ],
+    }
+
+    exporter = AlchemyExporter(get_app_settings().DB_URL)
+    removed_rows: Counter[tuple[str, str]] = Counter()
+
+    fk_index = ForeignKeyIndex.from_dump(meta.sorted_tables, db_dump)
+    valid_rows = exporter.clean_rows(fk_index, children, db_dump["children"], removed_rows=removed_rows)
+
+    assert len(valid_rows) == child_count - child_count // 10
+    assert removed_rows == {("children", "parent_id"): child_count // 10}
+
+    # the parents are only read once to build the index, rather than scanned for each foreign key
+    assert parent_rows.iterations == 1
+
+    assert exporter.clean_rows(fk_index, parents, db_dump["parents"]) == db_dump["parents"]
+
+
+def test_alchemy_exporter_row_converter():
+    exporter = AlchemyExporter(get_app_settings().DB_URL)
+    guid_type = Uuid() if exporter.engine.dialect.name == "postgresql" else CHAR(32)
+    table = Table(
+        "converted",
+        MetaData(),
+        Column("id", guid_type, primary_key=True),
+        Column("name", String),
+        Column("created_at", DateTime),
+        Column("date", Date),
+        Column("scheduled_time", Time),
+        Column("extras", JSON),
+    )
+
+    convert_row = exporter.get_row_converter(table)
+
+    value = uuid.uuid4()
+    row = convert_row(
+        {
+            "id": str(value),
+            "name": str(value),
+            "created_at": "2024-01-02T03:04:05.000006+00:00",
+            "date": "2024-01-02",
+            "scheduled_time": "03:04:05",
+            "extras": {"id": str(value)},
+        }
+    )
+
+    assert row == {
+        "id": GUID.convert_value_to_guid(value, exporter.engine.dialect),
+        # only the columns that need converting are touched
+        "name": str(value),
+        "created_at": datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.UTC),
+        "date": datetime.date(2024, 1, 2),
+        "scheduled_time": datetime.time(3, 4, 5),
+        "extras": {"id": str(value)},
+    }
+
+    # missing and null columns are left alone
+    assert convert_row({"created_at": None}) == {"created_at": None}
@@ -54,3 +54,30 @@ def test_backup_file_valid_zip(tmp_path: Path):
 
         assert content.read_tables() == dummy_dict
         assert content.data_directory.joinpath("test.txt").is_file()
+
+
+def test_backup_file_valid_stream_zip(tmp_path: Path):
+    chunks = [
+        {"table": "alembic_version", "rows": [{"version_num": "abc123"}]},
+        {"table": "hello", "rows": [{"id": 1}, {"id": 2}]},
+        {"table": "hello", "rows": [{"id": 3}]},
+    ]
+
+    temp_zip = zip_factory(tmp_path)
+
+    # Add contents
+    with ZipFile(temp_zip, "a") as zip_file:
+        zip_file.writestr("data/test.txt", "test")
+        zip_file.writestr("database.ndjson", "\n".join(json.dumps(chunk) for chunk in chunks))
+
+    backup_file = BackupFile(temp_zip)
+
+    with backup_file as content:
+        assert content.validate()
+
+        assert content.schema_version() == "abc123"
+        assert list(content.iter_tables()) == [(chunk["table"], chunk["rows"]) for chunk in chunks]
+        assert content.read_tables() == {
+            "alembic_version": [{"version_num": "abc123"}],
+            "hello": [{"id": 1}, {"id": 2}, {"id": 3}],
+        }
@@ -1,10 +1,15 @@
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+import pytest
 from pydantic import UUID4
+from sqlalchemy.orm import Session
 
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.server.scheduler import ScheduledTaskModel
 from mealie.schema.household.webhook import SaveWebhook, WebhookType
 from mealie.services.event_bus_service.event_bus_listeners import WebhookEventListener
+from mealie.services.event_bus_service.event_bus_service import EventBusService
 from mealie.services.event_bus_service.event_types import (
     Event,
     EventBusMessage,
@@ -12,6 +17,7 @@ from mealie.services.event_bus_service.event_types import (
     EventTypes,
     EventWebhookData,
 )
+from mealie.services.scheduler.tasks.post_webhooks import post_group_webhooks
 from tests.utils import random_string
 from tests.utils.factories import random_bool
 from tests.utils.fixture_schemas import TestUser
@@ -295,3 +301,31 @@ def test_get_meals_by_date_range_invalid_date_range(unique_user: TestUser):
     meals_in_range = meal_repo.get_meals_by_date_range(start_date, end_date)
 
     assert len(meals_in_range) == 0
+
+
+def test_post_group_webhooks_starts_at_last_scheduled_run(
+    session: Session, unique_user: TestUser, monkeypatch: pytest.MonkeyPatch
+):
+    dispatched: list[EventWebhookData] = []
+    monkeypatch.setattr(
+        EventBusService, "dispatch", lambda self, *args, **kwargs: dispatched.append(kwargs["document_data"])
+    )
+
+    task = session.get(ScheduledTaskModel, post_group_webhooks.__name__)
+    if task is None:
+        task = ScheduledTaskModel(id=post_group_webhooks.__name__, schedule="minutely", next_run_at=get_utc_now())
+        session.add(task)
+
+    last_run_at = get_utc_now() - timedelta(minutes=7)
+    task.last_run_at = last_run_at
+    session.commit()
+
+    post_group_webhooks(group_id=UUID(unique_user.group_id), household_id=UUID(unique_user.household_id))
+    assert len(dispatched) == 1
+    assert dispatched[0].webhook_start_dt == last_run_at
+    assert dispatched[0].webhook_end_dt > last_run_at
+
+    # an explicit start overrides the last run
+    start_dt = get_utc_now() - timedelta(hours=1)
+    post_group_webhooks(start_dt, group_id=UUID(unique_user.group_id), household_id=UUID(unique_user.household_id))
+    assert dispatched[1].webhook_start_dt == start_dt
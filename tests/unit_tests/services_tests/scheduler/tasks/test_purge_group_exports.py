@@ -1,7 +1,7 @@
-import tempfile
 from pathlib import Path
 from uuid import UUID
 
+from mealie.core.dependencies.dependencies import get_temporary_zip_path
 from mealie.schema.recipe.recipe import Recipe
 from mealie.services.recipe.recipe_bulk_service import RecipeBulkActionsService
 from mealie.services.scheduler.tasks.purge_group_exports import purge_group_data_exports
@@ -29,8 +29,8 @@ def test_purge_group_exports(unique_user: TestUser):
         for _ in range(random_int(2, 5))
     ]
 
-    with tempfile.NamedTemporaryFile() as tmpfile:
-        recipe_exporter.export_recipes(Path(tmpfile.name), [recipe.slug for recipe in recipes])
+    with get_temporary_zip_path() as temp_path:
+        recipe_exporter.export_recipes(temp_path, [recipe.slug for recipe in recipes])
 
     exports = recipe_exporter.get_exports()
     assert len(exports) == 1
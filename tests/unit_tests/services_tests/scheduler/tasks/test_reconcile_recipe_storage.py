@@ -0,0 +1,38 @@
+import shutil
+from uuid import UUID
+
+from mealie.pkgs.stats import fs_stats
+from mealie.schema.recipe.recipe import Recipe
+from mealie.services.group_services.group_service import GroupService
+from mealie.services.scheduler.tasks.reconcile_recipe_storage import reconcile_group_storage
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_reconcile_group_storage(unique_user_fn_scoped: TestUser):
+    unique_user = unique_user_fn_scoped
+    database = unique_user.repos
+    group_service = GroupService(UUID(unique_user.group_id), database)
+
+    recipes = [
+        database.recipes.create(
+            Recipe(name=random_string(), group_id=UUID(unique_user.group_id), user_id=unique_user.user_id)
+        )
+        for _ in range(3)
+    ]
+    assert group_service.calculate_group_storage().used_storage_bytes == 0
+
+    # write files outside of the recipe data service, so the storage is only picked up by the reconciliation
+    for i, recipe in enumerate(recipes):
+        recipe.asset_dir.joinpath("asset.txt").write_bytes(b"0" * 1024 * (i + 1))
+
+    reconcile_group_storage()
+    expected_size = sum(fs_stats.get_dir_size(recipe.directory) for recipe in recipes)
+    assert expected_size > 1024 * 6
+    assert group_service.calculate_group_storage().used_storage_bytes == expected_size
+
+    # removed recipe directories are removed from the storage
+    shutil.rmtree(recipes[0].directory)
+    reconcile_group_storage()
+    expected_size = sum(fs_stats.get_dir_size(recipe.directory) for recipe in recipes[1:])
+    assert group_service.calculate_group_storage().used_storage_bytes == expected_size
@@ -0,0 +1,38 @@
+import time
+
+from mealie.services.scheduler.leader import LeaseRowLeader
+from tests.utils.factories import random_string
+
+
+def test_scheduler_lease_elects_one_leader():
+    name = random_string()
+    leader = LeaseRowLeader(lease_ttl=60, name=name)
+    follower = LeaseRowLeader(lease_ttl=60, name=name)
+
+    assert leader.heartbeat()
+    assert not follower.heartbeat()
+
+    # renewing the lease keeps the same leader
+    assert leader.heartbeat()
+    assert not follower.heartbeat()
+    assert leader.is_leader and not follower.is_leader
+
+    # releasing the lease lets another worker take over right away
+    leader.release()
+    assert not leader.is_leader
+    assert follower.heartbeat()
+    assert not leader.heartbeat()
+
+
+def test_scheduler_lease_fails_over_when_it_expires():
+    name = random_string()
+    leader = LeaseRowLeader(lease_ttl=0.5, name=name)
+    follower = LeaseRowLeader(lease_ttl=0.5, name=name)
+
+    assert leader.heartbeat()
+    assert not follower.heartbeat()
+
+    # the leader stops renewing the lease, e.g. because its worker crashed
+    time.sleep(0.6)
+    assert follower.heartbeat()
+    assert not leader.heartbeat()
@@ -0,0 +1,94 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.server.scheduler import ScheduledTaskModel
+from mealie.services.scheduler import SchedulerRegistry, SchedulerService
+from mealie.services.scheduler.scheduler_service import get_scheduler_status, run_due_tasks
+from tests.utils.factories import random_string
+
+
+def _set_next_run(session: Session, name: str, minutes: int) -> None:
+    task = session.get(ScheduledTaskModel, name)
+    assert task
+    task.next_run_at = get_utc_now() + timedelta(minutes=minutes)
+    session.commit()
+
+
+def test_run_due_tasks(session: Session):
+    calls: list[str] = []
+
+    def succeeding_task():
+        calls.append("success")
+
+    def failing_task():
+        calls.append("failure")
+        raise ValueError("task failed")
+
+    succeeding_task.__name__ = f"succeeding_task_{random_string()}"
+    failing_task.__name__ = f"failing_task_{random_string()}"
+    SchedulerRegistry.register_minutely(succeeding_task)
+    SchedulerRegistry.register_daily(failing_task)
+
+    try:
+        # new tasks are scheduled, rather than run right away
+        run_due_tasks()
+        assert calls == []
+
+        tasks = {task.name: task for task in get_scheduler_status(session).tasks}
+        task = tasks[succeeding_task.__name__]
+        assert task.schedule == "minutely"
+        assert task.last_run_at is None
+        assert task.next_run_at > get_utc_now()
+        assert tasks[failing_task.__name__].schedule == "daily"
+
+        # only tasks that are due are run
+        _set_next_run(session, succeeding_task.__name__, -1)
+        run_due_tasks()
+        assert calls == ["success"]
+
+        _set_next_run(session, failing_task.__name__, -1)
+        run_due_tasks()
+        assert calls == ["success", "failure"]
+
+        session.expire_all()
+        tasks = {task.name: task for task in get_scheduler_status(session).tasks}
+        task = tasks[succeeding_task.__name__]
+        assert task.last_status == "success"
+        assert task.last_error is None
+        assert task.last_run_at and task.last_duration is not None
+        assert task.next_run_at > get_utc_now()
+
+        task = tasks[failing_task.__name__]
+        assert task.last_status == "failure"
+        assert task.last_error == "task failed"
+        assert task.next_run_at > get_utc_now()
+    finally:
+        SchedulerRegistry.remove_minutely(succeeding_task)
+        SchedulerRegistry.remove_daily(failing_task)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_service_start_and_stop(session: Session):
+    await SchedulerService.start()
+    try:
+        leader = SchedulerService._leader
+        assert leader
+
+        for _ in range(50):
+            if leader.is_leader:
+                break
+            await asyncio.sleep(0.1)
+
+        assert leader.is_leader
+        assert get_scheduler_status(session).leader == leader.holder
+    finally:
+        await SchedulerService.stop()
+
+    # stopping the scheduler gives up the lease
+    assert not leader.is_leader
+    session.expire_all()
+    assert get_scheduler_status(session).leader is None
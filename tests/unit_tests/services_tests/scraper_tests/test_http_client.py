@@ -0,0 +1,99 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+from pytest import MonkeyPatch
+
+from mealie.pkgs.safehttp.transport import AsyncSafeTransport
+from mealie.services.scraper.http_client import ResponseTooLargeException, ScraperHttpClient
+
+
+def use_handler(monkeypatch: MonkeyPatch, handler) -> None:
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await handler(request)
+
+    monkeypatch.setattr(AsyncSafeTransport, "handle_async_request", handle_async_request)
+
+
+@pytest.mark.asyncio
+async def test_scraper_http_client_reuses_its_client(monkeypatch: MonkeyPatch):
+    user_agents: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        user_agents.append(request.headers["User-Agent"])
+        if len(user_agents) == 1:
+            return httpx.Response(403)
+        return httpx.Response(200, content="<html>Crème brûlée</html>".encode())
+
+    use_handler(monkeypatch, handler)
+    client = ScraperHttpClient()
+
+    assert await client.fetch_html("https://example.com/recipe") == "<html>Crème brûlée</html>"
+    pool = client._get_pool()
+    assert await client.fetch_html("https://example.com/recipe") == "<html>Crème brûlée</html>"
+    assert client._get_pool() is pool
+
+    # a forbidden request is retried with the next user agent
+    assert len(user_agents) == 3
+    assert user_agents[0] != user_agents[1]
+
+    await client.aclose()
+    assert pool.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_scraper_http_client_rejects_large_responses(monkeypatch: MonkeyPatch):
+    async def chunks():
+        for _ in range(10):
+            yield b"x" * 100
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/declared":
+            return httpx.Response(200, headers={"content-length": "1001"}, content=b"")
+        if request.url.path == "/streamed":
+            return httpx.Response(200, content=chunks())
+        return httpx.Response(200, content=b"x" * 1000)
+
+    use_handler(monkeypatch, handler)
+    client = ScraperHttpClient(max_response_size=999)
+
+    for path in ["/declared", "/streamed", "/content"]:
+        with pytest.raises(ResponseTooLargeException):
+            await client.fetch_html(f"https://example.com{path}")
+
+    client.max_response_size = 1000
+    assert await client.fetch_html("https://example.com/streamed") == "x" * 1000
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scraper_http_client_limits_concurrency(monkeypatch: MonkeyPatch):
+    in_flight: Counter[str] = Counter()
+    max_in_flight: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        for key in [request.url.host, "*"]:
+            in_flight[key] += 1
+            max_in_flight[key] = max(max_in_flight[key], in_flight[key])
+
+        await asyncio.sleep(0.01)
+
+        for key in [request.url.host, "*"]:
+            in_flight[key] -= 1
+        return httpx.Response(200, content=b"<html></html>")
+
+    use_handler(monkeypatch, handler)
+    client = ScraperHttpClient(max_concurrency=3, max_concurrency_per_host=2)
+
+    urls = [f"https://{host}.example.com/{i}" for host in ["a", "b", "c"] for i in range(6)]
+    assert await asyncio.gather(*[client.fetch_html(url) for url in urls]) == ["<html></html>"] * len(urls)
+
+    assert max_in_flight["*"] == 3
+    assert all(max_in_flight[host] <= 2 for host in ["a.example.com", "b.example.com", "c.example.com"])
+
+    # the limits of idle hosts aren't kept around
+    assert not client._get_pool().host_limits
+
+    await client.aclose()
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mealie.services.scraper.http_client import ForceTimeoutException
+from mealie.services.scraper.parse_pool import ScraperParsePool
+
+
+@pytest.mark.asyncio
+async def test_scraper_parse_pool_runs_off_the_event_loop():
+    pool = ScraperParsePool(max_workers=2, timeout=5)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    def parse(html: str, *, suffix: str) -> tuple[str, str]:
+        # stand-in for a slow, blocking parse
+        time.sleep(0.2)
+        return html + suffix, threading.current_thread().name
+
+    ticker = asyncio.create_task(tick())
+    try:
+        results = await asyncio.gather(*[pool.run(parse, "<html>", suffix=str(i)) for i in range(2)])
+    finally:
+        ticker.cancel()
+
+    assert [html for html, _ in results] == ["<html>0", "<html>1"]
+    assert all(thread_name.startswith("scraper-parse") for _, thread_name in results)
+
+    # the event loop kept running while the pages were parsed
+    assert ticks > 5
+
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scraper_parse_pool_times_out():
+    pool = ScraperParsePool(max_workers=1, timeout=0.05)
+
+    with pytest.raises(ForceTimeoutException):
+        await pool.run(time.sleep, 0.5)
+
+    pool.shutdown()
@@ -0,0 +1,212 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from mealie.db.db_setup import session_context
+from mealie.db.models._model_utils.datetime import get_utc_now
+from mealie.db.models.server.job import JobModel
+from mealie.schema.jobs import JobName, JobStatus
+from mealie.schema.reports.reports import ReportCategory, ReportCreate, ReportSummaryStatus
+from mealie.services.jobs.job_queue import (
+    cancel_job,
+    claim_next_job,
+    enqueue_job,
+    fail_stale_jobs,
+    finish_job,
+    get_job,
+    retry_job,
+)
+from mealie.services.jobs.job_worker import JobContext, JobWorker
+from tests.utils.fixture_schemas import TestUser
+
+
+def run_or_fail(ctx: JobContext) -> None:
+    if ctx.payload.get("fail"):
+        raise ValueError("job failed")
+
+    ctx.progress(1, 1)
+
+
+def cancel_itself(ctx: JobContext) -> None:
+    with session_context() as session:
+        cancel_job(session, ctx.job_id)
+
+    # the job is stopped at its next checkpoint
+    ctx.progress(1)
+    raise AssertionError("the job should have been cancelled")
+
+
+async def cancel_itself_async(ctx: JobContext) -> None:
+    ctx.cancel()
+    await asyncio.sleep(10)
+
+
+def _get_job(session: Session, job_id):
+    session.expire_all()
+    job = get_job(session, job_id)
+    assert job
+    return job
+
+
+def test_run_queued_jobs(session: Session):
+    worker = JobWorker(handlers={JobName.backup: run_or_fail})
+    succeeding = enqueue_job(session, JobName.backup, {})
+    failing = enqueue_job(session, JobName.backup, {"fail": True})
+    assert succeeding.status == JobStatus.queued
+
+    assert worker.run_queued_jobs() == 2
+    assert worker.run_queued_jobs() == 0
+
+    job = _get_job(session, succeeding.id)
+    assert job.status == JobStatus.success
+    assert job.progress == 1 and job.total == 1
+    assert job.attempts == 1
+    assert job.started_at and job.finished_at
+
+    job = _get_job(session, failing.id)
+    assert job.status == JobStatus.failure
+    assert job.error == "job failed"
+
+
+def test_failed_job_fails_its_report_and_can_be_retried(session: Session, unique_user: TestUser):
+    report = unique_user.repos.group_reports.create(
+        ReportCreate(name="Test", category=ReportCategory.export, group_id=unique_user.group_id)
+    )
+    job = enqueue_job(session, JobName.backup, {"fail": True}, group_id=unique_user.group_id, report_id=report.id)
+
+    JobWorker(handlers={JobName.backup: run_or_fail}).run_queued_jobs()
+    assert _get_job(session, job.id).status == JobStatus.failure
+
+    report_out = unique_user.repos.group_reports.get_one(report.id)
+    assert report_out and report_out.status == ReportSummaryStatus.failure
+    assert report_out.entries[-1].message == "Failed: job failed"
+
+    # jobs can only be retried once they've failed or been cancelled
+    retried = retry_job(session, job.id)
+    assert retried and retried.status == JobStatus.queued
+    assert retried.attempts == 0 and retried.error is None
+    assert retry_job(session, job.id) is None
+
+    report_out = unique_user.repos.group_reports.get_one(report.id)
+    assert report_out and report_out.status == ReportSummaryStatus.in_progress
+
+    # jobs can only be retrieved from their own group
+    assert get_job(session, job.id, group_id=unique_user.group_id)
+    assert get_job(session, job.id, group_id=report.id) is None
+
+    JobWorker(handlers={JobName.backup: lambda _: None}).run_queued_jobs()
+    assert _get_job(session, job.id).status == JobStatus.success
+
+
+def test_cancel_queued_job(session: Session):
+    job = enqueue_job(session, JobName.backup, {})
+
+    cancelled = cancel_job(session, job.id)
+    assert cancelled and cancelled.status == JobStatus.cancelled
+    assert cancel_job(session, job.id) is None
+
+    # cancelled jobs aren't run
+    assert JobWorker(handlers={JobName.backup: run_or_fail}).run_queued_jobs() == 0
+
+
+@pytest.mark.parametrize("handler", [cancel_itself, cancel_itself_async], ids=["sync", "async"])
+def test_cancel_running_job(session: Session, handler):
+    job = enqueue_job(session, JobName.backup, {})
+
+    JobWorker(handlers={JobName.backup: handler}).run_queued_jobs()
+
+    job = _get_job(session, job.id)
+    assert job.status == JobStatus.cancelled
+    assert job.finished_at
+
+
+def test_fail_stale_jobs(session: Session, unique_user: TestUser):
+    report = unique_user.repos.group_reports.create(
+        ReportCreate(name="Test", category=ReportCategory.export, group_id=unique_user.group_id)
+    )
+    job = enqueue_job(session, JobName.backup, {}, group_id=unique_user.group_id, report_id=report.id)
+
+    claimed = claim_next_job("stopped-worker")
+    assert claimed and claimed[0].id == job.id
+
+    # the worker stops without finishing the job, so its heartbeat isn't updated anymore
+    model = session.get(JobModel, job.id)
+    assert model
+    model.heartbeat_at = get_utc_now() - timedelta(minutes=5)
+    session.commit()
+
+    # the job isn't run again, since it may have been partway through
+    assert fail_stale_jobs() == 1
+    job = _get_job(session, job.id)
+    assert job.status == JobStatus.failure and job.error
+    assert JobWorker(handlers={JobName.backup: run_or_fail}).run_queued_jobs() == 0
+
+    report_out = unique_user.repos.group_reports.get_one(report.id)
+    assert report_out and report_out.status == ReportSummaryStatus.failure
+
+    # the worker can't record a result for a job it no longer runs
+    assert not finish_job(job.id, "stopped-worker", JobStatus.success)
+    assert _get_job(session, job.id).status == JobStatus.failure
+
+    # it can still be retried by the user
+    assert retry_job(session, job.id)
+    assert JobWorker(handlers={JobName.backup: run_or_fail}).run_queued_jobs() == 1
+    assert _get_job(session, job.id).status == JobStatus.success
+
+
+def test_finish_job_only_from_its_worker(session: Session):
+    job = enqueue_job(session, JobName.backup, {})
+    claimed = claim_next_job("worker-1")
+    assert claimed and claimed[0].id == job.id
+
+    assert not finish_job(job.id, "worker-2", JobStatus.failure, "not my job")
+    assert _get_job(session, job.id).status == JobStatus.running
+
+    assert finish_job(job.id, "worker-1", JobStatus.success)
+    assert _get_job(session, job.id).status == JobStatus.success
+    assert not finish_job(job.id, "worker-1", JobStatus.failure)
+
+
+def wait_until_stopped(ctx: JobContext) -> None:
+    while True:
+        ctx.check_cancelled()
+        time.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_job_worker_fails_interrupted_jobs(session: Session):
+    worker = JobWorker(handlers={JobName.backup: wait_until_stopped})
+    job = enqueue_job(session, JobName.backup, {})
+
+    await worker.start()
+    try:
+        for _ in range(50):
+            if _get_job(session, job.id).status == JobStatus.running:
+                break
+            await asyncio.sleep(0.1)
+    finally:
+        await worker.stop()
+
+    job = _get_job(session, job.id)
+    assert job.status == JobStatus.failure
+    assert job.error and "interrupted" in job.error
+
+
+@pytest.mark.asyncio
+async def test_job_worker_runs_jobs_in_the_background(session: Session):
+    worker = JobWorker(handlers={JobName.backup: run_or_fail})
+    job = enqueue_job(session, JobName.backup, {})
+
+    await worker.start()
+    try:
+        for _ in range(50):
+            if _get_job(session, job.id).status == JobStatus.success:
+                break
+            await asyncio.sleep(0.1)
+
+        assert _get_job(session, job.id).status == JobStatus.success
+    finally:
+        await worker.stop()
@@ -0,0 +1,26 @@
+from mealie.schema.recipe.recipe_category import TagSave
+from mealie.services.migrations.utils.database_helpers import DatabaseMigrationHelpers
+from tests.fixtures.fixture_database import QueryCounter
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_migration_helpers_resolve_each_name_once(unique_user: TestUser, query_counter: QueryCounter):
+    database = unique_user.repos
+    existing = database.tags.create(TagSave(group_id=unique_user.group_id, name=random_string()))
+    helpers = DatabaseMigrationHelpers(database, database.session)
+
+    names = [existing.name, random_string(), random_string()]
+    tags = helpers.get_or_set_tags([*names, names[1]])
+
+    assert [tag.name for tag in tags] == [*names, names[1]]
+    assert tags[0].id == existing.id
+    assert tags[1] == tags[3]
+    for tag in tags:
+        assert database.tags.get_one(tag.id)
+
+    # known names are resolved without querying the database again
+    with query_counter.count(database.session):
+        assert helpers.get_or_set_tags(reversed(names)) == list(reversed(tags[:3]))
+
+    assert query_counter.query_count == 0
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import threading
+from collections import Counter
+
+import httpx
+import pytest
+
+from mealie.services.event_bus_service.delivery import DeliveryDropped, NotificationDelivery
+from mealie.services.event_bus_service.event_types import (
+    Event,
+    EventBusMessage,
+    EventDocumentDataBase,
+    EventDocumentType,
+    EventOperation,
+    EventTypes,
+)
+from mealie.services.event_bus_service.publisher import WebhookPublisher, _wait_for_deliveries
+
+
+@pytest.fixture()
+def delivery_factory():
+    deliveries: list[NotificationDelivery] = []
+
+    def factory(handler, **kwargs) -> NotificationDelivery:
+        delivery = NotificationDelivery(transport=httpx.MockTransport(handler), backoff=0.01, **kwargs)
+        deliveries.append(delivery)
+        return delivery
+
+    yield factory
+
+    for delivery in deliveries:
+        delivery.shutdown()
+
+
+def test_notification_delivery_retries_failures(delivery_factory):
+    attempts: Counter[str] = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts[request.url.path] += 1
+        if request.url.path == "/flaky" and attempts[request.url.path] < 3:
+            return httpx.Response(503)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200)
+
+    delivery = delivery_factory(handler, max_retries=3)
+
+    async def post(client: httpx.AsyncClient, url: str) -> None:
+        (await client.post(url)).raise_for_status()
+
+    flaky = delivery.submit("https://example.com/flaky", lambda client: post(client, "https://example.com/flaky"))
+    missing = delivery.submit("https://example.com/missing", lambda client: post(client, "https://example.com/missing"))
+    delivery.join(timeout=5)
+
+    assert flaky.result() is None
+    with pytest.raises(httpx.HTTPStatusError):
+        missing.result()
+
+    # client errors aren't retried
+    assert attempts == {"/flaky": 3, "/missing": 1}
+
+    metrics = delivery.metrics.snapshot()
+    assert metrics["queued"] == 2
+    assert metrics["delivered"] == 1
+    assert metrics["retried"] == 2
+    assert metrics["failed"] == 1
+    assert metrics["latency_max"] is not None
+
+
+def test_notification_delivery_limits_concurrency_per_host(delivery_factory):
+    in_flight: Counter[str] = Counter()
+    max_in_flight: Counter[str] = Counter()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    delivery = delivery_factory(handler, max_concurrency=10, max_concurrency_per_host=2)
+
+    async def post(client: httpx.AsyncClient, url: str) -> None:
+        (await client.post(url)).raise_for_status()
+
+    futures = [
+        delivery.submit(url, lambda client, url=url: post(client, url))
+        for url in ["https://a.example.com/", "https://b.example.com/"] * 6
+    ]
+    delivery.join(timeout=5)
+
+    assert all(future.result() is None for future in futures)
+    assert max_in_flight == {"a.example.com": 2, "b.example.com": 2}
+
+
+def test_notification_delivery_drops_when_queue_is_full(delivery_factory):
+    release = threading.Event()
+
+    async def blocked(_: httpx.AsyncClient) -> None:
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+
+    delivery = delivery_factory(lambda _: httpx.Response(200), queue_size=1, max_concurrency=1, queue_timeout=0.1)
+
+    sending = delivery.submit("https://example.com", blocked)
+    # wait until the first delivery is picked up by the worker, so the next one stays in the queue
+    while not delivery.metrics.queued or delivery._queue.qsize():
+        threading.Event().wait(0.01)
+
+    queued = delivery.submit("https://example.com", blocked)
+    dropped = delivery.submit("https://example.com", blocked)
+
+    with pytest.raises(DeliveryDropped):
+        dropped.result()
+
+    release.set()
+    delivery.join(timeout=5)
+
+    assert sending.result() is None
+    assert queued.result() is None
+    assert delivery.metrics.dropped == 1
+
+
+def test_webhook_publisher_posts_event(delivery_factory):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    delivery = delivery_factory(handler)
+    event = Event(
+        message=EventBusMessage.from_type(EventTypes.test_message, "test message"),
+        event_type=EventTypes.test_message,
+        integration_id="test_event",
+        document_data=EventDocumentDataBase(document_type=EventDocumentType.generic, operation=EventOperation.info),
+    )
+
+    urls = ["https://example.com/hook-1", "https://example.com/hook-2"]
+    WebhookPublisher(hard_fail=True, delivery=delivery).publish(event, urls)
+
+    assert sorted(str(request.url) for request in requests) == urls
+    assert all(json.loads(request.content)["eventId"] == str(event.event_id) for request in requests)
+
+
+def test_webhook_publisher_hard_fail_times_out(delivery_factory):
+    release = threading.Event()
+
+    async def blocked(_: httpx.AsyncClient) -> None:
+        await asyncio.to_thread(release.wait)
+
+    delivery = delivery_factory(lambda _: httpx.Response(200), max_retries=0, request_timeout=0.1)
+    futures = [delivery.submit("https://example.com", blocked)]
+
+    try:
+        with pytest.raises(TimeoutError):
+            _wait_for_deliveries(futures, delivery.max_delivery_time)
+    finally:
+        release.set()
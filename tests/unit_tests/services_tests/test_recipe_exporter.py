@@ -0,0 +1,59 @@
+import zipfile
+from pathlib import Path
+
+from mealie.db.models.group.group import Group
+from mealie.db.models.recipe.recipe import RecipeModel
+from mealie.schema.recipe.recipe import Recipe
+from mealie.services.exporter import RecipeExporter
+from tests.utils.factories import random_string
+from tests.utils.fixture_schemas import TestUser
+
+
+def test_recipe_exporter_writes_all_recipe_files(unique_user: TestUser, tmp_path: Path):
+    db = unique_user.repos
+    recipes = [
+        db.recipes.create(Recipe(user_id=unique_user.user_id, group_id=unique_user.group_id, name=random_string(20)))
+        for _ in range(5)
+    ]
+
+    expected: dict[str, bytes] = {}
+    for i, recipe in enumerate(recipes):
+        files = {
+            "images/original.webp": random_string(100).encode(),
+            "assets/notes.txt": random_string(10).encode(),
+            # streamed instead of being read by a thread
+            "assets/large.bin": random_string(5000).encode() * i,
+        }
+        for name, data in files.items():
+            path = recipe.directory / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            expected[f"recipes/{recipe.slug}/{name}"] = data
+
+    slugs = [recipe.slug for recipe in recipes]
+    exporter = RecipeExporter(db, unique_user.group_id, [*slugs, "not-a-recipe"])
+    exporter.batch_size = 2
+    exporter.max_pending_files = 3
+    exporter.max_buffered_file_size = 4096
+
+    group = db.session.get(Group, unique_user.group_id)
+    assert group is not None
+
+    progress: list[int] = []
+    with zipfile.ZipFile(tmp_path / "export.zip", "w") as zip:
+        assert exporter.export(zip, progress.append) == len(recipes)
+
+    assert progress == [1, 2, 3, 4, 5]
+    assert exporter.missing == ["not-a-recipe"]
+
+    # only the exported recipes are expunged, the rest of the caller's session is left alone
+    assert group in db.session
+    exported_ids = {recipe.id for recipe in recipes}
+    assert not any(isinstance(obj, RecipeModel) and obj.id in exported_ids for obj in db.session)
+
+    with zipfile.ZipFile(tmp_path / "export.zip") as zip:
+        for name, data in expected.items():
+            assert zip.read(name) == data
+
+        for slug in slugs:
+            assert Recipe.model_validate_json(zip.read(f"recipes/{slug}/{slug}.json")).slug == slug
@@ -5,6 +5,7 @@ from typing import cast
 
 import pytest
 from pydantic import UUID4
+from rapidfuzz import fuzz, process
 from sqlalchemy.orm import Session
 
 from mealie.db.db_setup import session_context
@@ -26,7 +27,10 @@ from mealie.schema.recipe.recipe_ingredient import (
 )
 from mealie.schema.user.user import GroupBase
 from mealie.services.openai import OpenAIService
-from mealie.services.parser_services import RegisteredParser, get_parser
+from mealie.services.parser_services import RegisteredParser, get_parser, nlp_pool
+from mealie.services.parser_services._base import DataMatcher
+from mealie.services.parser_services.alias_index import get_alias_index_cache
+from mealie.services.parser_services.fuzzy_match_index import FuzzyMatchIndex
 from tests.utils.factories import random_int, random_string
 from tests.utils.fixture_schemas import TestUser
 
@@ -413,6 +417,84 @@ def test_parser_ingredient_match(
             )
 
 
+def test_data_matcher_alias_cache(
+    unique_db: AllRepositories,
+    unique_local_group_id: UUID4,
+    parsed_ingredient_data: tuple[list[IngredientFood], list[IngredientUnit]],  # required so database is populated
+):
+    assert "potatoes" in DataMatcher(unique_db).foods_by_alias
+    assert "cups" in DataMatcher(unique_db).units_by_alias
+
+    # new matchers for the same group reuse the cached maps
+    hits = get_alias_index_cache().hits
+    assert DataMatcher(unique_db).foods_by_alias is DataMatcher(unique_db).foods_by_alias
+    assert get_alias_index_cache().hits == hits + 2
+
+    # creating, updating, and deleting foods invalidates the cache
+    food = unique_db.ingredient_foods.create(SaveIngredientFood(name="dragonfruit", group_id=unique_local_group_id))
+    assert "dragonfruit" in DataMatcher(unique_db).foods_by_alias
+
+    unique_db.ingredient_foods.update(
+        food.id,
+        SaveIngredientFood(
+            id=food.id,
+            name="dragonfruit",
+            group_id=unique_local_group_id,
+            aliases=[CreateIngredientFoodAlias(name="pitaya")],
+        ),
+    )
+    assert DataMatcher(unique_db).foods_by_alias["pitaya"].id == food.id
+
+    unique_db.ingredient_foods.delete(food.id)
+    assert "dragonfruit" not in DataMatcher(unique_db).foods_by_alias
+    assert "pitaya" not in DataMatcher(unique_db).foods_by_alias
+
+    unit = unique_db.ingredient_units.create(SaveIngredientUnit(name="smidgen", group_id=unique_local_group_id))
+    assert DataMatcher(unique_db).units_by_alias["smidgen"].id == unit.id
+
+
+@pytest.mark.parametrize("score_cutoff", [0, 50, 70, 85, 100])
+def test_fuzzy_match_index_matches_extract_one(score_cutoff: int):
+    choices = list({random_string(random_int(1, 16)) for _ in range(500)})
+    choices.extend(choice[:-1] + "x" for choice in choices[:50])  # near-duplicates, to produce ties
+    choices = list(dict.fromkeys(choices))
+    values = [choice[: random_int(1, len(choice))] + random_string(random_int(0, 3)) for choice in choices[:100]]
+    values.extend(random_string(random_int(1, 16)) for _ in range(50))
+
+    expected = []
+    for value in values:
+        result = process.extractOne(value, choices, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+        expected.append(result[0] if result else None)
+
+    index = FuzzyMatchIndex(choices)
+    assert [index.extract_one(value, score_cutoff) for value in values] == expected
+    assert index.extract_one_batch(values, score_cutoff) == expected
+
+
+@pytest.mark.asyncio
+async def test_nlp_parser_pool_dedupes_and_caches(monkeypatch: pytest.MonkeyPatch):
+    parsed_lines: list[str] = []
+
+    def fake_parse_ingredient(line: str):
+        parsed_lines.append(line)
+        return f"parsed {line}"
+
+    monkeypatch.setattr(nlp_pool, "parse_ingredient", fake_parse_ingredient)
+    pool = nlp_pool.NLPParserPool(max_workers=0, cache_size=2)
+
+    results = await pool.parse(["1 cup flour", " 1 cup  flour ", "2 eggs", "1 cup flour"])
+    assert results == ["parsed 1 cup flour", "parsed 1 cup flour", "parsed 2 eggs", "parsed 1 cup flour"]
+    assert parsed_lines == ["1 cup flour", "2 eggs"]
+
+    # cached lines aren't parsed again, and the least recently used line is evicted
+    results = await pool.parse(["2 eggs", "salt"])
+    assert results == ["parsed 2 eggs", "parsed salt"]
+    assert parsed_lines == ["1 cup flour", "2 eggs", "salt"]
+
+    await pool.parse(["1 cup flour"])
+    assert parsed_lines == ["1 cup flour", "2 eggs", "salt", "1 cup flour"]
+
+
 def test_openai_parser(
     unique_local_group_id: UUID4,
     parsed_ingredient_data: tuple[list[IngredientFood], list[IngredientUnit]],  # required so database is populated
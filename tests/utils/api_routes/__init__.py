@@ -3,10 +3,16 @@ prefix = "/api"
 
 admin_about = "/api/admin/about"
 """`/api/admin/about`"""
+admin_about_alias_index_cache = "/api/admin/about/alias-index-cache"
+"""`/api/admin/about/alias-index-cache`"""
 admin_about_check = "/api/admin/about/check"
 """`/api/admin/about/check`"""
+admin_about_notifications = "/api/admin/about/notifications"
+"""`/api/admin/about/notifications`"""
 admin_about_statistics = "/api/admin/about/statistics"
 """`/api/admin/about/statistics`"""
+admin_about_user_cache = "/api/admin/about/user-cache"
+"""`/api/admin/about/user-cache`"""
 admin_backups = "/api/admin/backups"
 """`/api/admin/backups`"""
 admin_backups_upload = "/api/admin/backups/upload"
@@ -19,6 +25,8 @@ admin_groups = "/api/admin/groups"
 """`/api/admin/groups`"""
 admin_households = "/api/admin/households"
 """`/api/admin/households`"""
+admin_jobs = "/api/admin/jobs"
+"""`/api/admin/jobs`"""
 admin_maintenance = "/api/admin/maintenance"
 """`/api/admin/maintenance`"""
 admin_maintenance_clean_images = "/api/admin/maintenance/clean/images"
@@ -27,6 +35,8 @@ admin_maintenance_clean_recipe_folders = "/api/admin/maintenance/clean/recipe-fo
 """`/api/admin/maintenance/clean/recipe-folders`"""
 admin_maintenance_clean_temp = "/api/admin/maintenance/clean/temp"
 """`/api/admin/maintenance/clean/temp`"""
+admin_maintenance_scheduler = "/api/admin/maintenance/scheduler"
+"""`/api/admin/maintenance/scheduler`"""
 admin_maintenance_storage = "/api/admin/maintenance/storage"
 """`/api/admin/maintenance/storage`"""
 admin_users = "/api/admin/users"
@@ -59,6 +69,8 @@ foods_merge = "/api/foods/merge"
 """`/api/foods/merge`"""
 groups_households = "/api/groups/households"
 """`/api/groups/households`"""
+groups_jobs = "/api/groups/jobs"
+"""`/api/groups/jobs`"""
 groups_labels = "/api/groups/labels"
 """`/api/groups/labels`"""
 groups_members = "/api/groups/members"
@@ -225,6 +237,21 @@ def admin_households_item_id(item_id):
     return f"{prefix}/admin/households/{item_id}"
 
 
+def admin_jobs_item_id(item_id):
+    """`/api/admin/jobs/{item_id}`"""
+    return f"{prefix}/admin/jobs/{item_id}"
+
+
+def admin_jobs_item_id_cancel(item_id):
+    """`/api/admin/jobs/{item_id}/cancel`"""
+    return f"{prefix}/admin/jobs/{item_id}/cancel"
+
+
+def admin_jobs_item_id_retry(item_id):
+    """`/api/admin/jobs/{item_id}/retry`"""
+    return f"{prefix}/admin/jobs/{item_id}/retry"
+
+
 def admin_users_item_id(item_id):
     """`/api/admin/users/{item_id}`"""
     return f"{prefix}/admin/users/{item_id}"
@@ -320,6 +347,21 @@ def groups_households_household_slug(household_slug):
     return f"{prefix}/groups/households/{household_slug}"
 
 
+def groups_jobs_item_id(item_id):
+    """`/api/groups/jobs/{item_id}`"""
+    return f"{prefix}/groups/jobs/{item_id}"
+
+
+def groups_jobs_item_id_cancel(item_id):
+    """`/api/groups/jobs/{item_id}/cancel`"""
+    return f"{prefix}/groups/jobs/{item_id}/cancel"
+
+
+def groups_jobs_item_id_retry(item_id):
+    """`/api/groups/jobs/{item_id}/retry`"""
+    return f"{prefix}/groups/jobs/{item_id}/retry"
+
+
 def groups_labels_item_id(item_id):
     """`/api/groups/labels/{item_id}`"""
     return f"{prefix}/groups/labels/{item_id}"